@@ -0,0 +1,109 @@
+"""Add metric_daily_rollups table (latest snapshot per entity per day)
+
+Revision ID: 20261016_000001
+Revises: 20260205_000001
+Create Date: 2026-10-16
+
+WHAT:
+    Creates metric_daily_rollups: one row per (entity_id, provider, metrics_date)
+    holding the latest cumulative snapshot values for that day, and backfills it
+    from metric_snapshots.
+
+WHY:
+    Every daily read in UnifiedMetricService rebuilds a
+    max(captured_at) GROUP BY entity_id, metrics_date subquery over the raw
+    15-min rows. The rollup is maintained incrementally by the snapshot sync
+    so reads become an indexed range scan.
+
+REFERENCES:
+    - app/models.py:MetricDailyRollup
+    - app/services/metric_rollup_service.py (incremental upsert, rebuild, check)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_000001'
+down_revision = '20260205_000001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'metric_daily_rollups',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            'entity_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('entities.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column(
+            'workspace_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('workspaces.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column('provider', sa.String(20), nullable=False),
+        sa.Column('metrics_date', sa.Date(), nullable=False),
+        sa.Column('captured_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('spend', sa.Numeric(18, 4), nullable=True),
+        sa.Column('impressions', sa.BigInteger(), nullable=True),
+        sa.Column('clicks', sa.BigInteger(), nullable=True),
+        sa.Column('conversions', sa.Numeric(18, 4), nullable=True),
+        sa.Column('revenue', sa.Numeric(18, 4), nullable=True),
+        sa.Column('leads', sa.Numeric(18, 4), nullable=True),
+        sa.Column('purchases', sa.Integer(), nullable=True),
+        sa.Column('installs', sa.Integer(), nullable=True),
+        sa.Column('visitors', sa.Integer(), nullable=True),
+        sa.Column('profit', sa.Numeric(18, 4), nullable=True),
+        sa.Column('currency', sa.String(10), nullable=True, server_default='USD'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('NOW()')),
+        sa.UniqueConstraint(
+            'entity_id', 'provider', 'metrics_date',
+            name='uq_metric_daily_rollups_entity_provider_date',
+        ),
+    )
+
+    # Workspace + date range scans (dashboard reads, rebuilds, consistency checks)
+    op.create_index(
+        'idx_metric_daily_rollups_workspace_date',
+        'metric_daily_rollups',
+        ['workspace_id', 'metrics_date'],
+    )
+    op.create_index(
+        'ix_metric_daily_rollups_metrics_date',
+        'metric_daily_rollups',
+        ['metrics_date'],
+    )
+
+    # =========================================================================
+    # Backfill from existing snapshots (latest captured_at per entity per day)
+    # =========================================================================
+    op.execute("""
+        INSERT INTO metric_daily_rollups (
+            id, entity_id, workspace_id, provider, metrics_date, captured_at,
+            spend, impressions, clicks, conversions, revenue,
+            leads, purchases, installs, visitors, profit, currency, updated_at
+        )
+        SELECT DISTINCT ON (s.entity_id, s.provider, s.metrics_date)
+            gen_random_uuid(), s.entity_id, e.workspace_id, s.provider,
+            s.metrics_date, s.captured_at,
+            s.spend, s.impressions, s.clicks, s.conversions, s.revenue,
+            s.leads, s.purchases, s.installs, s.visitors, s.profit, s.currency,
+            NOW()
+        FROM metric_snapshots s
+        JOIN entities e ON e.id = s.entity_id
+        WHERE s.metrics_date IS NOT NULL
+        ORDER BY s.entity_id, s.provider, s.metrics_date, s.captured_at DESC
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_metric_daily_rollups_metrics_date', 'metric_daily_rollups')
+    op.drop_index('idx_metric_daily_rollups_workspace_date', 'metric_daily_rollups')
+    op.drop_table('metric_daily_rollups')
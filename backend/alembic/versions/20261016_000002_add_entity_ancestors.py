@@ -0,0 +1,104 @@
+"""Add entity_ancestors closure table for the entity hierarchy
+
+Revision ID: 20261016_000002
+Revises: 20261016_000001
+Create Date: 2026-10-16
+
+WHAT:
+    Creates entity_ancestors: one row per (leaf_id, ancestor_id) pair of the
+    parent_id hierarchy, including each entity itself at depth 0, and
+    backfills it from entities.
+
+WHY:
+    dsl/hierarchy.campaign_ancestor_cte / adset_ancestor_cte recursed over the
+    entire entities table (every workspace) and then DISTINCT ON'd the result
+    on every breakdown. The closure table makes "leaves under ancestor X" and
+    "campaign of leaf Y" indexed, workspace-scoped lookups.
+
+REFERENCES:
+    - app/models.py:EntityAncestor
+    - app/services/entity_hierarchy_service.py (incremental maintenance, rebuild)
+    - app/dsl/hierarchy.py (readers)
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_000002'
+down_revision = '20261016_000001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'entity_ancestors',
+        sa.Column(
+            'leaf_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('entities.id', ondelete='CASCADE'),
+            primary_key=True,
+        ),
+        sa.Column(
+            'ancestor_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('entities.id', ondelete='CASCADE'),
+            primary_key=True,
+        ),
+        sa.Column(
+            'ancestor_level',
+            postgresql.ENUM(name='levelenum', create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            'workspace_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('workspaces.id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column('depth', sa.Integer(), nullable=False),
+    )
+
+    # Descendants of an ancestor (entity_name rollups, adset trend rollups)
+    op.create_index(
+        'idx_entity_ancestors_ancestor',
+        'entity_ancestors',
+        ['ancestor_id', 'leaf_id'],
+    )
+    # Leaf -> campaign/adset mapping for one workspace (hierarchy breakdowns)
+    op.create_index(
+        'idx_entity_ancestors_workspace_level',
+        'entity_ancestors',
+        ['workspace_id', 'ancestor_level', 'leaf_id'],
+    )
+
+    # =========================================================================
+    # Backfill from the parent_id chains (one-time recursive walk)
+    # =========================================================================
+    op.execute("""
+        WITH RECURSIVE chain AS (
+            SELECT e.id AS leaf_id, e.id AS ancestor_id, e.level AS ancestor_level,
+                   e.parent_id, e.workspace_id, 0 AS depth
+            FROM entities e
+
+            UNION ALL
+
+            SELECT c.leaf_id, p.id, p.level, p.parent_id, c.workspace_id, c.depth + 1
+            FROM chain c
+            JOIN entities p ON p.id = c.parent_id
+            WHERE c.depth < 16
+        )
+        INSERT INTO entity_ancestors (leaf_id, ancestor_id, ancestor_level, workspace_id, depth)
+        SELECT leaf_id, ancestor_id, ancestor_level, workspace_id, depth
+        FROM chain
+        ON CONFLICT (leaf_id, ancestor_id) DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_entity_ancestors_workspace_level', 'entity_ancestors')
+    op.drop_index('idx_entity_ancestors_ancestor', 'entity_ancestors')
+    op.drop_table('entity_ancestors')
@@ -0,0 +1,131 @@
+"""Partition metric_snapshots by month on captured_at
+
+Revision ID: 20261016_000003
+Revises: 20261016_000002
+Create Date: 2026-10-16
+
+WHAT:
+    Rebuilds metric_snapshots as a range-partitioned table (PARTITION BY
+    RANGE (captured_at)) with one partition per calendar month
+    (metric_snapshots_pYYYY_MM) from the oldest snapshot through three
+    months ahead, plus a default partition as a safety net. Existing rows
+    are copied over, then the indexes are rebuilt on the partitioned parent.
+
+WHY:
+    "Last 7 days" reads scanned indexes spanning years of history. With
+    monthly partitions, queries carrying a captured_at range only touch the
+    relevant months, and old months can be detached and archived.
+
+    Partitioned on captured_at rather than metrics_date: unique constraints
+    must contain the partition key, and (entity_id, provider, captured_at)
+    already does - every snapshot upsert keeps its conflict target. The
+    primary key becomes (id, captured_at) for the same reason.
+
+NOTE:
+    Copies the whole table inside the migration transaction; run it in a
+    maintenance window. Upcoming partitions are then created daily by
+    scheduled_snapshot_partitions.
+
+REFERENCES:
+    - app/services/snapshot_partition_service.py
+    - app/models.py:MetricSnapshot
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_000003'
+down_revision = '20261016_000002'
+branch_labels = None
+depends_on = None
+
+
+# Indexes of metric_snapshots (recreated on whichever table shape is current)
+SNAPSHOT_INDEXES = [
+    "CREATE INDEX ix_metric_snapshots_entity_id ON metric_snapshots (entity_id)",
+    "CREATE INDEX ix_metric_snapshots_metrics_date ON metric_snapshots (metrics_date)",
+    "CREATE INDEX idx_snapshots_entity_captured_desc ON metric_snapshots (entity_id, captured_at DESC)",
+    "CREATE INDEX idx_snapshots_captured_date ON metric_snapshots (((captured_at AT TIME ZONE 'UTC')::date))",
+    "CREATE INDEX idx_snapshots_provider ON metric_snapshots (provider)",
+    "CREATE INDEX idx_snapshots_entity_date_range ON metric_snapshots (entity_id, captured_at)",
+    "CREATE INDEX idx_snapshots_entity_provider_time ON metric_snapshots (entity_id, provider, captured_at DESC)",
+    "CREATE INDEX idx_snapshots_captured_brin ON metric_snapshots USING BRIN (captured_at) WITH (pages_per_range = 128)",
+]
+
+
+def _add_constraints(primary_key: str) -> None:
+    op.execute(f"ALTER TABLE metric_snapshots ADD CONSTRAINT metric_snapshots_pkey PRIMARY KEY ({primary_key})")
+    op.execute("""
+        ALTER TABLE metric_snapshots
+        ADD CONSTRAINT uq_metric_snapshots_entity_provider_time
+        UNIQUE (entity_id, provider, captured_at)
+    """)
+    op.execute("""
+        ALTER TABLE metric_snapshots
+        ADD CONSTRAINT metric_snapshots_entity_id_fkey
+        FOREIGN KEY (entity_id) REFERENCES entities (id) ON DELETE CASCADE
+    """)
+    for statement in SNAPSHOT_INDEXES:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    # =========================================================================
+    # STEP 1: Partitioned table with the same columns and defaults
+    # =========================================================================
+    op.execute("ALTER TABLE metric_snapshots RENAME TO metric_snapshots_legacy")
+    op.execute("""
+        CREATE TABLE metric_snapshots (LIKE metric_snapshots_legacy INCLUDING DEFAULTS)
+        PARTITION BY RANGE (captured_at)
+    """)
+
+    # =========================================================================
+    # STEP 2: Monthly partitions (oldest data -> 3 months ahead) + default
+    # =========================================================================
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start date;
+            last_month date;
+        BEGIN
+            SELECT date_trunc('month', COALESCE(MIN(captured_at), NOW()) AT TIME ZONE 'UTC')::date
+            INTO month_start
+            FROM metric_snapshots_legacy;
+
+            last_month := (date_trunc('month', NOW() AT TIME ZONE 'UTC') + interval '3 months')::date;
+
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE metric_snapshots_p%s PARTITION OF metric_snapshots '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month_start, 'YYYY_MM'),
+                    month_start::text || ' 00:00:00+00',
+                    (month_start + interval '1 month')::date::text || ' 00:00:00+00'
+                );
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+        END $$;
+    """)
+    op.execute("CREATE TABLE metric_snapshots_default PARTITION OF metric_snapshots DEFAULT")
+
+    # =========================================================================
+    # STEP 3: Copy rows, drop the old heap, build constraints + indexes
+    # =========================================================================
+    # Indexes are built after the copy (faster than maintaining them per row)
+    op.execute("INSERT INTO metric_snapshots SELECT * FROM metric_snapshots_legacy")
+    op.execute("DROP TABLE metric_snapshots_legacy")
+
+    _add_constraints("id, captured_at")
+
+
+def downgrade() -> None:
+    # Back to a single heap; archived (detached) partitions are not copied back
+    op.execute("ALTER TABLE metric_snapshots RENAME TO metric_snapshots_partitioned")
+    op.execute("""
+        CREATE TABLE metric_snapshots (LIKE metric_snapshots_partitioned INCLUDING DEFAULTS)
+    """)
+    op.execute("INSERT INTO metric_snapshots SELECT * FROM metric_snapshots_partitioned")
+    op.execute("DROP TABLE metric_snapshots_partitioned CASCADE")
+
+    _add_constraints("id")
@@ -0,0 +1,61 @@
+"""Add Shopify order sync checkpoint and unique line item key
+
+Revision ID: 20261016_000004
+Revises: 20261016_000003
+Create Date: 2026-10-16
+
+WHAT:
+    - shopify_shops.orders_sync_cursor / orders_sync_since: page cursor of an
+      in-progress order sync and the `since` filter it belongs to
+    - uq_shopify_line_item (order_id, external_line_item_id) on
+      shopify_order_line_items (duplicates removed first)
+
+WHY:
+    Order sync now streams pages and upserts each one with multi-row
+    INSERT ... ON CONFLICT, committing the cursor with the page so an
+    interrupted sync resumes from the last committed page. Line item upserts
+    need a unique key to conflict on.
+
+REFERENCES:
+    - app/services/shopify_sync_service.py (sync_shopify_orders)
+    - app/models.py:ShopifyShop, ShopifyOrderLineItem
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_000004'
+down_revision = '20261016_000003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('shopify_shops', sa.Column('orders_sync_cursor', sa.String(), nullable=True))
+    op.add_column('shopify_shops', sa.Column('orders_sync_since', sa.DateTime(), nullable=True))
+
+    # Keep the newest copy of any duplicated line item before adding the key
+    op.execute("""
+        DELETE FROM shopify_order_line_items li
+        USING (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY order_id, external_line_item_id
+                ORDER BY created_at DESC NULLS LAST, id
+            ) AS rn
+            FROM shopify_order_line_items
+        ) dup
+        WHERE li.id = dup.id AND dup.rn > 1
+    """)
+    op.create_unique_constraint(
+        'uq_shopify_line_item',
+        'shopify_order_line_items',
+        ['order_id', 'external_line_item_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_shopify_line_item', 'shopify_order_line_items', type_='unique')
+    op.drop_column('shopify_shops', 'orders_sync_since')
+    op.drop_column('shopify_shops', 'orders_sync_cursor')
@@ -0,0 +1,53 @@
+"""Add covering index for latest-snapshot-per-day reads
+
+Revision ID: 20261016_000005
+Revises: 20261016_000004
+Create Date: 2026-10-16
+
+WHAT:
+    idx_snapshots_entity_day_latest on metric_snapshots
+    (entity_id, metrics_date, captured_at DESC) INCLUDE (provider, base
+    measures, currency). Created on the partitioned parent, so every monthly
+    partition gets its own copy (and new partitions inherit it).
+
+WHY:
+    Entity performance (_base_query, _fetch_trend), the dashboard sections
+    and UnifiedMetricService all read "latest snapshot per entity per
+    metrics_date", via DISTINCT ON (entity_id, metrics_date) ORDER BY
+    captured_at DESC or a max(captured_at) join. The existing indexes are
+    keyed by captured_at or by metrics_date alone, so Postgres had to sort
+    every 15-min row of the range. This index is already in DISTINCT ON
+    order, and the INCLUDE columns let it answer with an index-only scan.
+
+NOTE:
+    A plain CREATE INDEX locks writes to metric_snapshots while it builds
+    (CONCURRENTLY is not supported on partitioned parents). Run it outside
+    sync peaks. Measure with scripts/benchmark_snapshot_reads.py.
+
+REFERENCES:
+    - app/routers/entity_performance.py (_base_query, _fetch_trend)
+    - app/routers/dashboard.py (DISTINCT ON sections)
+    - app/services/unified_metric_service.py (_restrict_to_latest_daily)
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_000005'
+down_revision = '20261016_000004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_snapshots_entity_day_latest
+        ON metric_snapshots (entity_id, metrics_date, captured_at DESC)
+        INCLUDE (provider, spend, revenue, clicks, impressions, conversions, leads, purchases, currency)
+    """)
+    op.execute("ANALYZE metric_snapshots")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_snapshots_entity_day_latest")
@@ -38,9 +38,11 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.models import Connection, Token, ProviderEnum
+from app.agent.tools import get_active_providers
 from app.security import decrypt_secret
 from app.services.google_ads_client import GAdsClient
 from app.services.meta_ads_client import MetaAdsClient
+from app.services.rate_limit_backend import MAX_RATE_LIMIT_WAIT_SECONDS
 from app.agent.exceptions import (
     ProviderNotConnectedError,
     TokenExpiredError,
@@ -95,6 +97,7 @@ class ConnectionResolver:
 
         # Cache connections on first access
         self._connections_cache: Optional[List[Connection]] = None
+        self._providers_cache: Optional[List[str]] = None
 
     def _get_workspace_connections(self) -> List[Connection]:
         """
@@ -144,12 +147,15 @@ class ConnectionResolver:
         RETURNS:
             List of provider strings (e.g., ["google", "meta"])
         """
-        connections = self._get_workspace_connections()
+        if self._providers_cache is None:
+            # Memoized per agent job, shared with SemanticTools
+            self._providers_cache = get_active_providers(self.db, self.workspace_id)
+
         providers = set()
 
-        for conn in connections:
-            if conn.provider in (ProviderEnum.google, ProviderEnum.meta):
-                providers.add(conn.provider.value)
+        for provider in self._providers_cache:
+            if provider in (ProviderEnum.google.value, ProviderEnum.meta.value):
+                providers.add(provider)
 
         return sorted(list(providers))
 
@@ -177,6 +183,13 @@ class ConnectionResolver:
         RAISES:
             ProviderNotConnectedError: If no connection exists for provider
         """
+        # Answer "not connected" from the memoized provider list (no query)
+        if provider not in self.get_available_providers():
+            logger.warning(
+                f"[CONNECTION_RESOLVER] No {provider} connection found for workspace {self.workspace_id}"
+            )
+            raise ProviderNotConnectedError(provider=provider)
+
         connections = self._get_workspace_connections()
 
         # Filter by provider
@@ -320,7 +333,12 @@ class ConnectionResolver:
                 context=f"meta:{connection.id}:access:live_api",
             )
 
-            return MetaAdsClient(access_token=access_token)
+            # Charge the account's shared budget; long waits raise instead
+            return MetaAdsClient(
+                access_token=access_token,
+                account_id=connection.external_account_id,
+                max_rate_limit_wait=MAX_RATE_LIMIT_WAIT_SECONDS,
+            )
 
         except Exception as e:
             logger.error(
@@ -67,6 +67,7 @@ from sqlalchemy.orm import Session
 from app.agent.state import AgentState, create_initial_state
 from app.agent.nodes import agent_loop_node
 from app.agent.stream import StreamPublisher
+from app.agent.request_memo import request_memo_scope
 
 logger = logging.getLogger(__name__)
 
@@ -233,6 +234,7 @@ async def run_agent_async(
             - answer: Full answer text
             - tool_calls_made: List of tools the LLM decided to call
             - iterations: Number of agent loop iterations
+            - memo: Memoized lookup hits/misses ({"hits", "misses", "by_name"})
             - error: Error message if failed
     """
     logger.info(f"[AGENT] Running free agent: {question[:50]}...")
@@ -267,6 +269,8 @@ async def run_agent_async(
             # Legacy fields for backwards compatibility
             "visuals": final_state.get("visuals"),
             "data": final_state.get("data"),
+            # Memoized lookup hits/misses of this job
+            "memo": final_state.get("memo"),
         }
 
         if final_state.get("error"):
@@ -279,7 +283,8 @@ async def run_agent_async(
         logger.info(
             f"[AGENT] Complete: success={result['success']}, "
             f"iterations={result['iterations']}, "
-            f"tools_called={len(result['tool_calls_made'])}"
+            f"tools_called={len(result['tool_calls_made'])}, "
+            f"memo_hits={(result['memo'] or {}).get('hits', 0)}"
         )
         return result
 
@@ -325,9 +330,11 @@ async def _run_graph_async(
     # Import here to avoid circular imports
     from app.agent.nodes import agent_loop_node
 
-    # Run the agent loop directly (it's async)
-    result = await agent_loop_node(state, db, publisher)
+    # Run the agent loop directly (it's async), memoizing repeated lookups
+    # (workspace context, snapshot time, providers) for this job only
+    with request_memo_scope() as memo:
+        result = await agent_loop_node(state, db, publisher)
 
     # Merge result into state
-    final_state = {**state, **result}
+    final_state = {**state, **result, "memo": memo.stats()}
     return final_state
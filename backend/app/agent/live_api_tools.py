@@ -55,6 +55,7 @@ from app.agent.exceptions import (
 )
 from app.services.google_ads_client import GAdsClient, QuotaExhaustedError as GoogleQuotaError
 from app.services.meta_ads_client import MetaAdsClient, MetaAdsClientError
+from app.services.rate_limit_backend import RateLimitExceededError
 
 logger = logging.getLogger(__name__)
 
@@ -289,14 +290,8 @@ class LiveApiTools:
         if metrics is None:
             metrics = ["spend", "impressions", "clicks", "conversions", "revenue"]
 
-        # Check rate limit BEFORE making the call
-        if not self.rate_limiter.can_make_call(provider):
-            retry_after = self.rate_limiter.get_retry_after(provider)
-            raise WorkspaceRateLimitError(
-                retry_after=retry_after,
-                workspace_id=self.workspace_id,
-                provider=provider,
-            )
+        # Reserve a rate limit slot BEFORE making the call (atomic check + record)
+        self.rate_limiter.check_and_record(provider)
 
         try:
             # Calculate date range
@@ -324,9 +319,6 @@ class LiveApiTools:
                     entity_type, entity_ids, start_date, end_date
                 )
 
-            # Record the API call
-            self.rate_limiter.record_call(provider)
-
             latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             self._log_api_call(provider, "get_metrics", True, latency_ms)
 
@@ -354,6 +346,12 @@ class LiveApiTools:
                 retry_after=getattr(e, "retry_seconds", None),
             )
 
+        except RateLimitExceededError as e:
+            # Meta account budget (shared with the sync workers) used up
+            latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            self._log_api_call(provider, "get_metrics", False, latency_ms, str(e))
+            raise QuotaExhaustedError(provider="meta", retry_after=int(e.retry_seconds) + 1)
+
         except MetaAdsClientError as e:
             latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             self._log_api_call(provider, "get_metrics", False, latency_ms, str(e))
@@ -587,14 +585,8 @@ class LiveApiTools:
         if fields is None:
             fields = ["budget", "status", "objective", "name"]
 
-        # Check rate limit
-        if not self.rate_limiter.can_make_call(provider):
-            retry_after = self.rate_limiter.get_retry_after(provider)
-            raise WorkspaceRateLimitError(
-                retry_after=retry_after,
-                workspace_id=self.workspace_id,
-                provider=provider,
-            )
+        # Reserve a rate limit slot BEFORE making the call (atomic check + record)
+        self.rate_limiter.check_and_record(provider)
 
         try:
             if provider == "google":
@@ -602,9 +594,6 @@ class LiveApiTools:
             else:
                 data = self._fetch_meta_entity(entity_type, entity_id)
 
-            # Record the API call
-            self.rate_limiter.record_call(provider)
-
             latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             self._log_api_call(provider, f"get_{entity_type}", True, latency_ms)
 
@@ -619,6 +608,12 @@ class LiveApiTools:
         except (ProviderNotConnectedError, TokenExpiredError, WorkspaceRateLimitError):
             raise
 
+        except RateLimitExceededError as e:
+            # Meta account budget (shared with the sync workers) used up
+            latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            self._log_api_call(provider, f"get_{entity_type}", False, latency_ms, str(e))
+            raise QuotaExhaustedError(provider="meta", retry_after=int(e.retry_seconds) + 1)
+
         except Exception as e:
             latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             self._log_api_call(provider, f"get_{entity_type}", False, latency_ms, str(e))
@@ -761,14 +756,8 @@ class LiveApiTools:
         """
         start_time = datetime.now()
 
-        # Check rate limit
-        if not self.rate_limiter.can_make_call(provider):
-            retry_after = self.rate_limiter.get_retry_after(provider)
-            raise WorkspaceRateLimitError(
-                retry_after=retry_after,
-                workspace_id=self.workspace_id,
-                provider=provider,
-            )
+        # Reserve a rate limit slot BEFORE making the call (atomic check + record)
+        self.rate_limiter.check_and_record(provider)
 
         try:
             if provider == "google":
@@ -784,9 +773,6 @@ class LiveApiTools:
                     if name_lower in (e.get("name") or "").lower()
                 ]
 
-            # Record the API call
-            self.rate_limiter.record_call(provider)
-
             total = len(entities)
             entities = entities[:limit]
 
@@ -808,6 +794,12 @@ class LiveApiTools:
         except (ProviderNotConnectedError, TokenExpiredError, WorkspaceRateLimitError):
             raise
 
+        except RateLimitExceededError as e:
+            # Meta account budget (shared with the sync workers) used up
+            latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            self._log_api_call(provider, f"list_{entity_type}s", False, latency_ms, str(e))
+            raise QuotaExhaustedError(provider="meta", retry_after=int(e.retry_seconds) + 1)
+
         except Exception as e:
             latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             self._log_api_call(provider, f"list_{entity_type}s", False, latency_ms, str(e))
@@ -41,7 +41,9 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Optional, Dict, Any, List, Literal
+import time
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Literal, Tuple
 
 from openai import OpenAI, AsyncOpenAI
 from sqlalchemy.orm import Session
@@ -50,12 +52,14 @@ from app.agent.state import AgentState, Message, MessageRole
 from app.agent.tools import (
     SemanticTools,
     AgentManagementTools,
+    get_active_providers,
     get_tool_schemas,
     get_tools_description,
     get_agent_tools,
     AGENT_TOOLS,
 )
 from app.agent.stream import StreamPublisher, AsyncQueuePublisher
+from app.agent.request_memo import memoized
 from app.agent.live_api_tools import LiveApiTools
 from app.agent.rate_limiter import WorkspaceRateLimiter
 from app.agent.exceptions import (
@@ -65,7 +69,7 @@ from app.agent.exceptions import (
     WorkspaceRateLimitError,
     ProviderNotConnectedError,
 )
-from app.models import Workspace, Connection
+from app.models import Workspace
 
 logger = logging.getLogger(__name__)
 
@@ -86,49 +90,54 @@ def _fetch_workspace_context(
 
     RETURNS:
         Dict with business context or None if no profile data
+
+    Memoized for the current agent job (see app/agent/request_memo.py).
     """
     try:
-        workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
-        if not workspace:
-            return None
+        return memoized(
+            "workspace_context",
+            workspace_id,
+            lambda: _load_workspace_context(db, workspace_id),
+        )
 
-        # Only return context if we have meaningful data
-        context = {}
+    except Exception as e:
+        logger.warning(f"[CONTEXT] Failed to fetch workspace context: {e}")
+        return None
 
-        if workspace.name:
-            context["company_name"] = workspace.name
 
-        if workspace.niche:
-            context["industry"] = workspace.niche
+def _load_workspace_context(
+    db: Session, workspace_id: str
+) -> Optional[Dict[str, Any]]:
+    """Query the workspace profile and active providers (uncached)."""
+    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    if not workspace:
+        return None
 
-        if workspace.target_markets:
-            context["markets"] = workspace.target_markets
+    # Only return context if we have meaningful data
+    context = {}
 
-        if workspace.domain_description:
-            context["about"] = workspace.domain_description
+    if workspace.name:
+        context["company_name"] = workspace.name
 
-        if workspace.brand_voice:
-            context["brand_voice"] = workspace.brand_voice
+    if workspace.niche:
+        context["industry"] = workspace.niche
 
-        # Add connected ad platforms
-        connections = (
-            db.query(Connection)
-            .filter(
-                Connection.workspace_id == workspace_id, Connection.status == "active"
-            )
-            .all()
-        )
-        if connections:
-            context["connected_providers"] = list(
-                set(c.provider.value for c in connections)
-            )
+    if workspace.target_markets:
+        context["markets"] = workspace.target_markets
 
-        # Return context if we have any useful info
-        return context if context else None
+    if workspace.domain_description:
+        context["about"] = workspace.domain_description
 
-    except Exception as e:
-        logger.warning(f"[CONTEXT] Failed to fetch workspace context: {e}")
-        return None
+    if workspace.brand_voice:
+        context["brand_voice"] = workspace.brand_voice
+
+    # Add connected ad platforms
+    providers = get_active_providers(db, workspace_id)
+    if providers:
+        context["connected_providers"] = list(set(providers))
+
+    # Return context if we have any useful info
+    return context if context else None
 
 
 def _build_business_context_prompt(context: Optional[Dict[str, Any]]) -> str:
@@ -1487,6 +1496,25 @@ MAX_ITERATIONS = 5
 MAX_TOOL_CALLS_PER_ITERATION = 3
 TOOL_EXECUTION_TIMEOUT = 30  # seconds
 
+# Tool calls of one LLM turn executed at the same time
+MAX_CONCURRENT_TOOL_CALLS = int(os.getenv("AGENT_MAX_CONCURRENT_TOOL_CALLS", "3"))
+
+# Tools that only read: safe to run concurrently, each on its own session.
+# Anything else (create/pause/resume agent) writes through the request
+# session, one call at a time.
+READ_ONLY_TOOLS = frozenset(
+    {
+        "query_metrics",
+        "google_ads_query",
+        "meta_ads_query",
+        "list_entities",
+        "get_business_context",
+        "list_agents",
+        "get_agent_status",
+        "explain_agent_behavior",
+    }
+)
+
 
 import asyncio
 
@@ -1512,7 +1540,7 @@ async def agent_loop_node(
 
     GUARDRAILS:
         - Max 5 iterations
-        - Max 3 tool calls per iteration
+        - Max 3 tool calls per iteration, run concurrently (own session each)
         - 30s timeout per tool execution
         - Rate limits enforced per tool
 
@@ -1634,128 +1662,39 @@ async def agent_loop_node(
                 }
             )
 
-            for tool_call in message.tool_calls[:MAX_TOOL_CALLS_PER_ITERATION]:
-                tool_name = tool_call.function.name
-                tool_args_str = tool_call.function.arguments
-
-                try:
-                    tool_args = json.loads(tool_args_str)
-                except json.JSONDecodeError:
-                    tool_args = {}
-
-                logger.info(f"[AGENT] Executing tool: {tool_name}({tool_args})")
-
-                # Emit tool_start event
-                if publisher:
-                    publisher.tool_start(tool_name, tool_args)
-
-                # Track execution time
-                import time
-
-                start_time = time.time()
-
-                # Execute the tool
-                try:
-                    result = await execute_tool_async(
-                        tool_name=tool_name,
-                        tool_args=tool_args,
-                        db=db,
-                        workspace_id=workspace_id,
-                        user_id=user_id,
+            # Tool calls of one turn are independent: run them concurrently
+            # (capped per turn) and feed results back in call order
+            calls = message.tool_calls[:MAX_TOOL_CALLS_PER_ITERATION]
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+            write_lock = asyncio.Lock()
+            outcomes = await asyncio.gather(
+                *[
+                    _run_tool_call(
+                        tool_call, db, workspace_id, user_id, publisher, semaphore, write_lock
                     )
+                    for tool_call in calls
+                ]
+            )
 
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    data_source = result.get("data_source", "snapshots")
-                    success = result.get("success", not result.get("error"))
+            for tool_call, (tool_name, tool_args, result, call_record) in zip(calls, outcomes):
+                tool_calls_made.append(call_record)
+                success = call_record["success"]
 
-                    tool_calls_made.append(
-                        {
-                            "tool": tool_name,
-                            "args": tool_args,
-                            "success": success,
-                            "duration_ms": duration_ms,
-                            "data_source": data_source,
-                        }
+                # Collect data from query_metrics for building visuals
+                if tool_name == "query_metrics" and success and result.get("data"):
+                    collected_data = result.get("data", {})
+                    collected_semantic_query = (
+                        tool_args  # Store the query args for visual building
                     )
-
-                    # Collect data from query_metrics for building visuals
-                    if tool_name == "query_metrics" and success and result.get("data"):
-                        collected_data = result.get("data", {})
-                        collected_semantic_query = (
-                            tool_args  # Store the query args for visual building
-                        )
-                        logger.info(
-                            f"[AGENT] Collected data for visuals: {list(collected_data.keys())}"
-                        )
-
-                    # Collect agent preview for UI rendering
-                    if tool_name == "create_agent" and success and result.get("preview"):
-                        collected_data["agent_preview"] = result.get("agent_preview")
-                        collected_data["confirmation_prompt"] = result.get("confirmation_prompt")
-                        logger.info("[AGENT] Collected agent preview for visuals")
-
-                    # Emit tool_end event with timing and data source
-                    if publisher:
-                        if success:
-                            preview = _get_tool_result_preview(tool_name, result)
-                            publisher.tool_end(
-                                tool_name,
-                                preview,
-                                success=True,
-                                duration_ms=duration_ms,
-                                data_source=data_source,
-                            )
-                        else:
-                            publisher.tool_end(
-                                tool_name,
-                                f"Error: {result.get('error', 'Unknown error')}",
-                                success=False,
-                                duration_ms=duration_ms,
-                            )
-
-                except asyncio.TimeoutError:
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    logger.warning(f"[AGENT] Tool {tool_name} timed out")
-                    result = {
-                        "error": f"Tool {tool_name} timed out after {TOOL_EXECUTION_TIMEOUT}s"
-                    }
-                    tool_calls_made.append(
-                        {
-                            "tool": tool_name,
-                            "args": tool_args,
-                            "success": False,
-                            "error": "timeout",
-                            "duration_ms": duration_ms,
-                        }
+                    logger.info(
+                        f"[AGENT] Collected data for visuals: {list(collected_data.keys())}"
                     )
-                    if publisher:
-                        publisher.tool_end(
-                            tool_name,
-                            "Timed out",
-                            success=False,
-                            duration_ms=duration_ms,
-                        )
 
-                except Exception as e:
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    logger.exception(f"[AGENT] Tool {tool_name} failed: {e}")
-                    result = {"error": str(e)}
-                    tool_calls_made.append(
-                        {
-                            "tool": tool_name,
-                            "args": tool_args,
-                            "success": False,
-                            "error": str(e),
-                            "duration_ms": duration_ms,
-                        }
-                    )
-                    if publisher:
-                        publisher.tool_end(
-                            tool_name,
-                            f"Error: {str(e)}",
-                            success=False,
-                            duration_ms=duration_ms,
-                        )
+                # Collect agent preview for UI rendering
+                if tool_name == "create_agent" and success and result.get("preview"):
+                    collected_data["agent_preview"] = result.get("agent_preview")
+                    collected_data["confirmation_prompt"] = result.get("confirmation_prompt")
+                    logger.info("[AGENT] Collected agent preview for visuals")
 
                 # Add tool result to messages (summarized for LLM, not full data)
                 # We summarize timeseries data to prevent LLM from listing individual values
@@ -1768,6 +1707,22 @@ async def agent_loop_node(
                     }
                 )
 
+            # Every tool call needs a response message, including the ones
+            # over the per-turn limit
+            for tool_call in message.tool_calls[MAX_TOOL_CALLS_PER_ITERATION:]:
+                messages.append(
+                    {
+                        "role": "tool",
+                        "tool_call_id": tool_call.id,
+                        "content": json.dumps(
+                            {
+                                "error": f"Skipped: at most {MAX_TOOL_CALLS_PER_ITERATION} "
+                                "tool calls per turn"
+                            }
+                        ),
+                    }
+                )
+
         except Exception as e:
             logger.exception(f"[AGENT] LLM call failed: {e}")
             return {
@@ -1801,6 +1756,158 @@ async def agent_loop_node(
     }
 
 
+@contextmanager
+def _tool_session(db: Session):
+    """Own session for one concurrent tool call, from the request engine's pool.
+
+    WHY: A Session is not thread-safe; concurrent tool threads must not share
+         the request session.
+    """
+    session = Session(bind=db.get_bind(), autoflush=False)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+async def _run_tool_call(
+    tool_call: Any,
+    db: Session,
+    workspace_id: str,
+    user_id: str,
+    publisher: Optional[StreamPublisher | AsyncQueuePublisher],
+    semaphore: asyncio.Semaphore,
+    write_lock: asyncio.Lock,
+) -> Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Execute one tool call of an LLM turn.
+
+    WHAT: Runs the tool (read-only tools on their own session, writing tools
+          on the request session one at a time) and emits tool_start /
+          tool_end tagged with the call id.
+
+    WHY: agent_loop_node gathers the calls of a turn concurrently; the
+         semaphore caps how many run at once.
+
+    RETURNS:
+        (tool_name, tool_args, result, call record for tool_calls_made)
+    """
+    tool_name = tool_call.function.name
+
+    try:
+        tool_args = json.loads(tool_call.function.arguments)
+    except json.JSONDecodeError:
+        tool_args = {}
+
+    async with semaphore:
+        logger.info(f"[AGENT] Executing tool: {tool_name}({tool_args})")
+
+        # Emit tool_start event
+        if publisher:
+            publisher.tool_start(tool_name, tool_args, call_id=tool_call.id)
+
+        # Track execution time
+        start_time = time.time()
+
+        # Execute the tool
+        try:
+            if tool_name in READ_ONLY_TOOLS:
+                with _tool_session(db) as tool_db:
+                    result = await execute_tool_async(
+                        tool_name=tool_name,
+                        tool_args=tool_args,
+                        db=tool_db,
+                        workspace_id=workspace_id,
+                        user_id=user_id,
+                    )
+            else:
+                async with write_lock:
+                    result = await execute_tool_async(
+                        tool_name=tool_name,
+                        tool_args=tool_args,
+                        db=db,
+                        workspace_id=workspace_id,
+                        user_id=user_id,
+                    )
+
+            duration_ms = int((time.time() - start_time) * 1000)
+            data_source = result.get("data_source", "snapshots")
+            success = result.get("success", not result.get("error"))
+
+            call_record = {
+                "tool": tool_name,
+                "args": tool_args,
+                "success": success,
+                "duration_ms": duration_ms,
+                "data_source": data_source,
+            }
+
+            # Emit tool_end event with timing and data source
+            if publisher:
+                if success:
+                    preview = _get_tool_result_preview(tool_name, result)
+                    publisher.tool_end(
+                        tool_name,
+                        preview,
+                        success=True,
+                        duration_ms=duration_ms,
+                        data_source=data_source,
+                        call_id=tool_call.id,
+                    )
+                else:
+                    publisher.tool_end(
+                        tool_name,
+                        f"Error: {result.get('error', 'Unknown error')}",
+                        success=False,
+                        duration_ms=duration_ms,
+                        call_id=tool_call.id,
+                    )
+
+        except asyncio.TimeoutError:
+            duration_ms = int((time.time() - start_time) * 1000)
+            logger.warning(f"[AGENT] Tool {tool_name} timed out")
+            result = {
+                "error": f"Tool {tool_name} timed out after {TOOL_EXECUTION_TIMEOUT}s"
+            }
+            call_record = {
+                "tool": tool_name,
+                "args": tool_args,
+                "success": False,
+                "error": "timeout",
+                "duration_ms": duration_ms,
+            }
+            if publisher:
+                publisher.tool_end(
+                    tool_name,
+                    "Timed out",
+                    success=False,
+                    duration_ms=duration_ms,
+                    call_id=tool_call.id,
+                )
+
+        except Exception as e:
+            duration_ms = int((time.time() - start_time) * 1000)
+            logger.exception(f"[AGENT] Tool {tool_name} failed: {e}")
+            result = {"error": str(e)}
+            call_record = {
+                "tool": tool_name,
+                "args": tool_args,
+                "success": False,
+                "error": str(e),
+                "duration_ms": duration_ms,
+            }
+            if publisher:
+                publisher.tool_end(
+                    tool_name,
+                    f"Error: {str(e)}",
+                    success=False,
+                    duration_ms=duration_ms,
+                    call_id=tool_call.id,
+                )
+
+    return tool_name, tool_args, result, call_record
+
+
 async def execute_tool_async(
     tool_name: str,
     tool_args: Dict[str, Any],
@@ -1975,18 +2082,23 @@ def _get_latest_snapshot_time(db: Session, workspace_id: str):
     Get the most recent snapshot time for this workspace.
 
     WHY: So we can tell the user how fresh their data is.
+
+    Memoized for the current agent job (see app/agent/request_memo.py).
     """
     from sqlalchemy import func
     from app.models import MetricSnapshot, Entity
 
     try:
-        result = (
-            db.query(func.max(MetricSnapshot.metrics_date))
-            .join(Entity)
-            .filter(Entity.workspace_id == workspace_id)
-            .scalar()
+        return memoized(
+            "snapshot_time",
+            workspace_id,
+            lambda: (
+                db.query(func.max(MetricSnapshot.metrics_date))
+                .join(Entity)
+                .filter(Entity.workspace_id == workspace_id)
+                .scalar()
+            ),
         )
-        return result
     except Exception as e:
         logger.warning(f"[AGENT] Failed to get snapshot time: {e}")
         return None
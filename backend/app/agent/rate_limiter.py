@@ -27,6 +27,7 @@ headroom for sync jobs and other background processes.
 RELATED FILES
 -------------
 - app/agent/live_api_tools.py: Uses this limiter before API calls
+- app/services/rate_limit_backend.py: Atomic Redis sliding window (reserve)
 - app/agent/exceptions.py: WorkspaceRateLimitError
 - app/state.py: Shared Redis client
 """
@@ -38,6 +39,11 @@ from typing import Optional, Dict, Literal
 from redis import Redis
 
 from app.agent.exceptions import WorkspaceRateLimitError
+from app.services.rate_limit_backend import (
+    RateLimitReservation,
+    RedisRateLimitBackend,
+    local_rate_limit_backend,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -74,15 +80,21 @@ class WorkspaceRateLimiter:
     USAGE:
         limiter = WorkspaceRateLimiter(redis_client, workspace_id)
 
-        # Check before making call
-        if not limiter.can_make_call("google"):
-            raise WorkspaceRateLimitError(...)
+        # Reserve a slot before making the call (raises WorkspaceRateLimitError)
+        limiter.check_and_record("google")
 
-        # Record the call after making it
-        limiter.record_call("google")
+        # Or reserve without raising
+        reservation = limiter.reserve("google")
+        if not reservation.allowed:
+            reschedule(reservation.retry_after)
+
+        # can_make_call()/record_call() are not atomic together: concurrent
+        # requests can both pass the check; prefer reserve()
 
     THREAD SAFETY:
-        Redis operations are atomic. Multiple concurrent requests are safe.
+        reserve()/check_and_record() check and record in one Lua script, so
+        concurrent requests can't both take the last slot. On Redis errors
+        they fall back to process-local limits.
     """
 
     def __init__(
@@ -99,6 +111,7 @@ class WorkspaceRateLimiter:
         """
         self.redis = redis_client
         self.workspace_id = str(workspace_id)
+        self._backend: Optional[RedisRateLimitBackend] = None
 
         if not self.redis:
             logger.warning(
@@ -271,6 +284,49 @@ class WorkspaceRateLimiter:
         retry_after = int(expires_at - time.time())
         return max(1, retry_after)  # At least 1 second
 
+    def reserve(self, provider: Literal["google", "meta"]) -> RateLimitReservation:
+        """
+        Reserve a call slot, or report how long until one frees up.
+
+        WHAT:
+            Atomic check + record on the same sorted set as can_make_call/
+            record_call (rate_limit_backend sliding window script).
+
+        WHY:
+            Non-blocking: callers reschedule on retry_after instead of sleeping,
+            and concurrent requests can't overshoot the limit.
+
+        PARAMETERS:
+            provider: Which API ("google" or "meta")
+
+        RETURNS:
+            RateLimitReservation (allowed, retry_after seconds, remaining)
+        """
+        limit = RATE_LIMITS.get(provider, 15)
+
+        if not self.redis:
+            # No Redis = no rate limiting (development mode)
+            return RateLimitReservation(True, 0.0, limit)
+
+        if self._backend is None:
+            # Keys are already namespaced by _get_key; Redis errors fall back
+            # to process-local limits instead of failing the call
+            self._backend = RedisRateLimitBackend(
+                self.redis, fallback=local_rate_limit_backend, key_prefix=""
+            )
+
+        reservation = self._backend.reserve(
+            self._get_key(provider), limit, WINDOW_SIZE_SECONDS
+        )
+
+        if not reservation.allowed:
+            logger.warning(
+                f"[RATE_LIMITER] Workspace {self.workspace_id} hit {provider} rate limit "
+                f"({limit} calls/min, retry in {reservation.retry_after:.0f}s)"
+            )
+
+        return reservation
+
     def check_and_record(
         self,
         provider: Literal["google", "meta"],
@@ -279,8 +335,8 @@ class WorkspaceRateLimiter:
         Check rate limit and record call in one operation.
 
         WHAT:
-            Convenience method that checks limit, raises if exceeded,
-            otherwise records the call.
+            Convenience method that reserves a slot atomically (reserve),
+            raising if the limit is exceeded.
 
         WHY:
             Simplifies the common pattern of check-then-record.
@@ -291,16 +347,14 @@ class WorkspaceRateLimiter:
         RAISES:
             WorkspaceRateLimitError: If rate limit exceeded
         """
-        if not self.can_make_call(provider):
-            retry_after = self.get_retry_after(provider)
+        reservation = self.reserve(provider)
+        if not reservation.allowed:
             raise WorkspaceRateLimitError(
-                retry_after=retry_after,
+                retry_after=max(1, int(reservation.retry_after + 0.999)),
                 workspace_id=self.workspace_id,
                 provider=provider,
             )
 
-        self.record_call(provider)
-
     def get_status(self) -> Dict[str, Dict[str, int]]:
         """
         Get current rate limit status for all providers.
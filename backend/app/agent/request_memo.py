@@ -0,0 +1,133 @@
+"""
+Agent Request Memo
+==================
+
+**Version**: 1.0.0
+**Created**: 2026-10-16
+
+Per-job memoization of read-only lookups made by agent tools.
+
+WHY THIS FILE EXISTS
+--------------------
+Within one agent job, tools keep asking the same questions: every
+query_metrics call looks up the latest snapshot time, get_business_context
+re-reads the workspace profile the loop already loaded, and every tool
+re-lists the workspace's active connections. A 6-tool turn hit the same
+tables six times.
+
+HOW IT WORKS
+------------
+- run_agent_async opens a memo scope for the job (request_memo_scope)
+- Lookups go through memoized(name, workspace_id, compute): the first call
+  computes, later calls in the same job return a copy of the stored value
+- The scope lives in a ContextVar, so it is visible in asyncio tasks and
+  asyncio.to_thread workers of the job, and gone when the job ends
+- Outside a scope (sync jobs, tests), memoized() just computes
+
+Only plain data is memoized (dicts, lists, dates). Concurrent tool calls
+use separate sessions, so ORM objects must never be shared through here.
+Failures are not cached: compute() exceptions propagate.
+
+RELATED FILES
+-------------
+- app/agent/graph.py: Opens the scope, adds hit counts to the done event
+- app/agent/nodes.py: _fetch_workspace_context, _get_latest_snapshot_time
+- app/agent/tools.py: SemanticTools (active providers)
+- app/agent/connection_resolver.py: get_available_providers
+"""
+
+import copy
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMemo:
+    """
+    Memo store for one agent job.
+
+    WHAT: (name, workspace_id) -> value, plus hit/miss counters per name.
+
+    WHY: Thread-safe because tool calls run concurrently in worker threads.
+    """
+
+    def __init__(self):
+        self._values: Dict[Tuple[str, str], Any] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, name: str, workspace_id: str, compute: Callable[[], Any]) -> Any:
+        """Return the stored value for (name, workspace_id), computing it once."""
+        key = (name, str(workspace_id))
+
+        with self._lock:
+            found = key in self._values
+            value = self._values.get(key)
+            self._count(name, "hits" if found else "misses")
+
+        if not found:
+            # Compute outside the lock: concurrent misses may both compute,
+            # which is cheaper than serializing every lookup
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+
+        return copy.deepcopy(value)
+
+    def _count(self, name: str, outcome: str) -> None:
+        counts = self._counts.setdefault(name, {"hits": 0, "misses": 0})
+        counts[outcome] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss totals and per-lookup counts (for the done event)."""
+        with self._lock:
+            by_name = {name: dict(counts) for name, counts in self._counts.items()}
+
+        return {
+            "hits": sum(c["hits"] for c in by_name.values()),
+            "misses": sum(c["misses"] for c in by_name.values()),
+            "by_name": by_name,
+        }
+
+
+_current_memo: ContextVar[Optional[RequestMemo]] = ContextVar("agent_request_memo", default=None)
+
+
+@contextmanager
+def request_memo_scope() -> Iterator[RequestMemo]:
+    """
+    Open a memo scope for one agent job.
+
+    USAGE:
+        with request_memo_scope() as memo:
+            result = await agent_loop_node(state, db, publisher)
+            result["memo"] = memo.stats()
+    """
+    memo = RequestMemo()
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _current_memo.reset(token)
+
+
+def memoized(name: str, workspace_id: str, compute: Callable[[], Any]) -> Any:
+    """
+    Memoize a read-only lookup for the current agent job.
+
+    PARAMETERS:
+        name: Lookup name (e.g. "snapshot_time")
+        workspace_id: Workspace the value belongs to
+        compute: Zero-argument function returning plain data
+
+    RETURNS:
+        compute()'s value (a copy when served from the memo)
+    """
+    memo = _current_memo.get()
+    if memo is None:
+        return compute()
+    return memo.get_or_compute(name, workspace_id, compute)
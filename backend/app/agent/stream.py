@@ -30,13 +30,25 @@ Worker (agent)           Redis Pub/Sub         API (SSE)            Frontend
 EVENT TYPES
 -----------
 - thinking: Agent is processing ("Analyzing your question...")
-- tool_call: Agent is calling a tool (show spinner)
-- tool_result: Tool returned data (can show preview)
+- tool_start: Agent is calling a tool (show spinner)
+- tool_end: Tool returned data (can show preview)
+- tool_call / tool_result: Legacy aliases of tool_start / tool_end
 - answer: Answer token (typing effect)
 - visual: Chart/table spec (render progressively)
 - done: Complete, final result
 - error: Something went wrong
 
+TRANSPORTS
+----------
+AGENT_STREAM_TRANSPORT selects how events travel through Redis:
+- streams (default): XADD to `qa:{job_id}:events`. Answer tokens are
+  coalesced into micro-batches (time/size window), the stream is capped at
+  STREAM_MAX_LEN entries and expires after STREAM_TTL_SECONDS. Subscribers
+  read with XREAD from any entry id, so late subscribers replay from the
+  start and reconnecting clients resume after the last id they saw.
+- pubsub: PUBLISH per event to `qa:{job_id}:stream` (fire-and-forget; late
+  subscribers miss earlier events).
+
 RELATED FILES
 -------------
 - app/agent/graph.py: Publishes events
@@ -48,14 +60,26 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+import time
 from dataclasses import dataclass
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 from enum import Enum
 
 import redis
 
 logger = logging.getLogger(__name__)
 
+# Transport for agent events: "streams" (Redis Streams) or "pubsub"
+STREAM_TRANSPORT = os.getenv("AGENT_STREAM_TRANSPORT", "streams").lower()
+
+# Redis Streams transport: answer-token batching window and stream bounds
+TOKEN_BATCH_WINDOW_MS = int(os.getenv("AGENT_STREAM_BATCH_WINDOW_MS", "50"))
+TOKEN_BATCH_MAX_CHARS = int(os.getenv("AGENT_STREAM_BATCH_MAX_CHARS", "256"))
+STREAM_MAX_LEN = int(os.getenv("AGENT_STREAM_MAX_LEN", "2000"))
+STREAM_TTL_SECONDS = 3600
+
 
 class EventType(str, Enum):
     """Types of streaming events."""
@@ -86,11 +110,13 @@ class StreamEvent:
         type: Event type (thinking, answer, etc.)
         data: Event payload (depends on type)
         is_final: True if this is the last event
+        event_id: Stream entry id (streams transport only, not serialized)
     """
 
     type: EventType
     data: Any
     is_final: bool = False
+    event_id: Optional[str] = None  # Redis Streams entry id (resume offset)
 
     def to_json(self) -> str:
         """Serialize to JSON for Redis."""
@@ -189,6 +215,53 @@ class StreamPublisher:
             )
         )
 
+    def tool_start(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        call_id: Optional[str] = None,
+    ) -> None:
+        """Publish tool start event.
+
+        call_id identifies the call when several tools run concurrently
+        (pairs tool_start with its tool_end).
+        """
+        self.publish(
+            StreamEvent(
+                type=EventType.TOOL_START,
+                data={
+                    "tool": tool_name,
+                    "args": args,
+                    "description": _get_tool_description(tool_name, args),
+                    "call_id": call_id,
+                },
+            )
+        )
+
+    def tool_end(
+        self,
+        tool_name: str,
+        preview: str,
+        success: bool = True,
+        duration_ms: Optional[int] = None,
+        data_source: Optional[str] = None,
+        call_id: Optional[str] = None,
+    ) -> None:
+        """Publish tool end event with result preview and timing."""
+        self.publish(
+            StreamEvent(
+                type=EventType.TOOL_END,
+                data={
+                    "tool": tool_name,
+                    "preview": preview,
+                    "success": success,
+                    "duration_ms": duration_ms,
+                    "data_source": data_source,
+                    "call_id": call_id,
+                },
+            )
+        )
+
     def answer_token(self, token: str) -> None:
         """Publish single answer token (for typing effect)."""
         self.publish(
@@ -328,6 +401,222 @@ class StreamSubscriber:
             self.pubsub.close()
 
 
+class RedisStreamPublisher(StreamPublisher):
+    """
+    Publishes streaming events to a Redis Stream.
+
+    WHAT: Same interface as StreamPublisher, but events are appended with
+          XADD (capped with MAXLEN ~) and answer tokens are coalesced.
+
+    WHY: PUBLISH per token meant hundreds of round trips per answer, and
+         subscribers that connected late missed everything.
+
+    BATCHING:
+        answer_token() buffers text. The buffer is written as one ANSWER
+        event once it is TOKEN_BATCH_WINDOW_MS old or TOKEN_BATCH_MAX_CHARS
+        long, and before any other event (so order is preserved). done() and
+        error() flush, so nothing is left behind at the end of a job.
+        The age limit is enforced by a timer started with each batch, so
+        buffered tokens still go out when the LLM stream stalls.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        job_id: str,
+        channel_prefix: str = "qa",
+        batch_window_ms: Optional[int] = None,
+        batch_max_chars: Optional[int] = None,
+        max_len: Optional[int] = None,
+    ):
+        """
+        Initialize publisher.
+
+        PARAMETERS:
+            redis_client: Redis connection
+            job_id: Unique job ID (used in stream key)
+            channel_prefix: Prefix for stream key
+            batch_window_ms: Max age of a token batch (default TOKEN_BATCH_WINDOW_MS)
+            batch_max_chars: Max characters per batch (default TOKEN_BATCH_MAX_CHARS)
+            max_len: Approximate cap on stream entries (default STREAM_MAX_LEN)
+        """
+        self.redis = redis_client
+        self.job_id = job_id
+        self.stream_key = stream_key(job_id, channel_prefix)
+        self.batch_window = (TOKEN_BATCH_WINDOW_MS if batch_window_ms is None else batch_window_ms) / 1000
+        self.batch_max_chars = TOKEN_BATCH_MAX_CHARS if batch_max_chars is None else batch_max_chars
+        self.max_len = STREAM_MAX_LEN if max_len is None else max_len
+
+        self._tokens: List[str] = []
+        self._token_chars = 0
+        self._batch_started = 0.0
+        # Flushes the batch at its deadline; the lock orders its writes with
+        # the producer's
+        self._batch_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        logger.info(f"[STREAM] Stream publisher created for: {self.stream_key}")
+
+    def publish(self, event: StreamEvent) -> None:
+        """
+        Append an event to the stream (flushing buffered tokens first).
+
+        PARAMETERS:
+            event: StreamEvent to publish
+        """
+        with self._lock:
+            self._flush_tokens()
+            self._append(event)
+
+    def answer_token(self, token: str) -> None:
+        """Buffer an answer token; written in micro-batches."""
+        with self._lock:
+            if not self._tokens:
+                self._batch_started = time.monotonic()
+                self._start_batch_timer()
+            self._tokens.append(token)
+            self._token_chars += len(token)
+
+            if (
+                self._token_chars >= self.batch_max_chars
+                or time.monotonic() - self._batch_started >= self.batch_window
+            ):
+                self._flush_tokens()
+
+    def flush(self) -> None:
+        """Write buffered answer tokens as one ANSWER event."""
+        with self._lock:
+            self._flush_tokens()
+
+    def _start_batch_timer(self) -> None:
+        if self.batch_window <= 0:
+            return  # Every token is flushed on arrival
+        self._batch_timer = threading.Timer(self.batch_window, self.flush)
+        self._batch_timer.daemon = True
+        self._batch_timer.start()
+
+    def _flush_tokens(self) -> None:
+        """Write the token batch (caller holds the lock)."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if not self._tokens:
+            return
+
+        text = "".join(self._tokens)
+        self._tokens = []
+        self._token_chars = 0
+        self._append(StreamEvent(type=EventType.ANSWER, data={"token": text}))
+
+    def _append(self, event: StreamEvent) -> None:
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.xadd(
+                self.stream_key,
+                {"event": event.to_json()},
+                maxlen=self.max_len,
+                approximate=True,
+            )
+            pipe.expire(self.stream_key, STREAM_TTL_SECONDS)
+            pipe.execute()
+            logger.debug(f"[STREAM] Appended: {event.type.value}")
+        except Exception as e:
+            logger.error(f"[STREAM] Failed to append: {e}")
+
+
+class RedisStreamSubscriber:
+    """
+    Reads streaming events from a Redis Stream.
+
+    WHAT: XREAD loop over the job's stream starting after `offset`.
+
+    WHY: Unlike Pub/Sub, events are kept in the stream: a subscriber that
+         connects late replays from the beginning, and a reconnecting client
+         resumes after the last entry id it received (SSE Last-Event-ID).
+
+    USAGE:
+        subscriber = RedisStreamSubscriber(redis_client, job_id, offset=last_id)
+        for event in subscriber.listen():
+            yield f"id: {event.event_id}\ndata: {event.to_json()}\n\n"
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        job_id: str,
+        channel_prefix: str = "qa",
+        timeout: float = 60.0,
+        offset: Optional[str] = None,
+    ):
+        """
+        Initialize subscriber.
+
+        PARAMETERS:
+            redis_client: Redis connection
+            job_id: Unique job ID
+            channel_prefix: Prefix for stream key
+            timeout: Block timeout per XREAD (seconds)
+            offset: Entry id to resume after (None: from the first entry)
+        """
+        self.redis = redis_client
+        self.job_id = job_id
+        self.stream_key = stream_key(job_id, channel_prefix)
+        self.timeout = timeout
+        self.last_id = offset or "0-0"
+        logger.info(f"[STREAM] Stream subscriber created for: {self.stream_key} (after {self.last_id})")
+
+    def listen(self):
+        """
+        Listen for events.
+
+        YIELDS:
+            StreamEvent objects (with event_id set) in stream order
+
+        NOTE:
+            This is a generator that blocks until events arrive.
+            Use in an async context or separate thread.
+        """
+        while True:
+            response = self.redis.xread(
+                {self.stream_key: self.last_id},
+                count=100,
+                block=int(self.timeout * 1000),
+            )
+
+            if not response:
+                # Timeout - keep waiting for the job
+                continue
+
+            for _key, entries in response:
+                for entry_id, fields in entries:
+                    self.last_id = _decode(entry_id)
+                    payload = fields.get(b"event", fields.get("event"))
+
+                    try:
+                        event = StreamEvent.from_json(_decode(payload))
+                    except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+                        logger.error(f"[STREAM] Failed to parse event {self.last_id}: {e}")
+                        continue
+
+                    event.event_id = self.last_id
+                    yield event
+
+                    if event.is_final:
+                        logger.info(f"[STREAM] Received final event, closing")
+                        return
+
+    def close(self) -> None:
+        """Nothing to release (XREAD holds no subscription)."""
+
+
+def stream_key(job_id: str, channel_prefix: str = "qa") -> str:
+    """Redis Stream key holding a job's events."""
+    return f"{channel_prefix}:{job_id}:events"
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
 def create_publisher(job_id: str, redis_url: Optional[str] = None) -> StreamPublisher:
     """
     Factory function to create a publisher.
@@ -337,31 +626,38 @@ def create_publisher(job_id: str, redis_url: Optional[str] = None) -> StreamPubl
         redis_url: Redis URL (defaults to localhost)
 
     RETURNS:
-        StreamPublisher ready to use
+        RedisStreamPublisher, or StreamPublisher when
+        AGENT_STREAM_TRANSPORT=pubsub
     """
-    import os
-
     url = redis_url or os.environ.get("REDIS_URL", "redis://localhost:6379")
     client = redis.from_url(url)
-    return StreamPublisher(client, job_id)
+    if STREAM_TRANSPORT == "pubsub":
+        return StreamPublisher(client, job_id)
+    return RedisStreamPublisher(client, job_id)
 
 
-def create_subscriber(job_id: str, redis_url: Optional[str] = None) -> StreamSubscriber:
+def create_subscriber(
+    job_id: str,
+    redis_url: Optional[str] = None,
+    offset: Optional[str] = None,
+) -> StreamSubscriber | RedisStreamSubscriber:
     """
     Factory function to create a subscriber.
 
     PARAMETERS:
         job_id: Job ID for channel name
         redis_url: Redis URL (defaults to localhost)
+        offset: Stream entry id to resume after (streams transport only)
 
     RETURNS:
-        StreamSubscriber ready to use
+        RedisStreamSubscriber, or StreamSubscriber when
+        AGENT_STREAM_TRANSPORT=pubsub
     """
-    import os
-
     url = redis_url or os.environ.get("REDIS_URL", "redis://localhost:6379")
     client = redis.from_url(url)
-    return StreamSubscriber(client, job_id)
+    if STREAM_TRANSPORT == "pubsub":
+        return StreamSubscriber(client, job_id)
+    return RedisStreamSubscriber(client, job_id, offset=offset)
 
 
 # =============================================================================
@@ -498,11 +794,22 @@ class AsyncQueuePublisher:
         """Publish tool result event (legacy - use tool_end)."""
         self.tool_end(tool_name, preview, success=success)
 
-    def tool_start(self, tool_name: str, args: Dict[str, Any]) -> None:
+    def tool_start(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        call_id: Optional[str] = None,
+    ) -> None:
         """Publish tool start event with arguments.
 
         WHAT: Emits when a tool begins execution
         WHY: Shows user what the agent is doing in real-time
+
+        PARAMETERS:
+            tool_name: Name of the tool
+            args: Tool arguments
+            call_id: LLM tool call id; pairs tool_start with its tool_end when
+                several calls of one turn run concurrently
         """
         self._put_event(
             {
@@ -511,6 +818,7 @@ class AsyncQueuePublisher:
                     "tool": tool_name,
                     "args": args,
                     "description": _get_tool_description(tool_name, args),
+                    "call_id": call_id,
                 },
             }
         )
@@ -522,6 +830,7 @@ class AsyncQueuePublisher:
         success: bool = True,
         duration_ms: Optional[int] = None,
         data_source: Optional[str] = None,
+        call_id: Optional[str] = None,
     ) -> None:
         """Publish tool end event with result preview and timing.
 
@@ -534,6 +843,7 @@ class AsyncQueuePublisher:
             success: Whether the tool succeeded
             duration_ms: How long the tool took in milliseconds
             data_source: Where the data came from (e.g., "snapshots", "live_google_ads")
+            call_id: LLM tool call id (same as the matching tool_start)
         """
         self._put_event(
             {
@@ -544,6 +854,7 @@ class AsyncQueuePublisher:
                     "success": success,
                     "duration_ms": duration_ms,
                     "data_source": data_source,
+                    "call_id": call_id,
                 },
             }
         )
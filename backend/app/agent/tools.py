@@ -52,6 +52,8 @@ from app.semantic import (
     Filter,
 )
 from app.semantic.model import get_all_metric_names, METRICS
+from app.semantic.plan_cache import plan_cache
+from app.agent.request_memo import memoized
 
 logger = logging.getLogger(__name__)
 
@@ -678,6 +680,32 @@ def get_agent_tools() -> List[Dict[str, Any]]:
 # =============================================================================
 
 
+def get_active_providers(db: Session, workspace_id: str) -> List[str]:
+    """
+    Providers of the workspace's active connections (one entry per connection).
+
+    WHAT: Shared lookup for SemanticTools, ConnectionResolver and the
+          workspace context.
+
+    WHY: Memoized for the current agent job (see app/agent/request_memo.py),
+         so a multi-tool turn lists connections once.
+    """
+    from app.models import Connection
+
+    def load() -> List[str]:
+        connections = (
+            db.query(Connection)
+            .filter(
+                Connection.workspace_id == workspace_id,
+                Connection.status == "active",
+            )
+            .all()
+        )
+        return [c.provider.value for c in connections]
+
+    return memoized("active_providers", workspace_id, load)
+
+
 @dataclass
 class ToolContext:
     """Context passed to all tools."""
@@ -821,12 +849,12 @@ class SemanticTools:
                 # These are metric values, not filter fields
 
             # Validate
-            validation = self.validator.validate(query)
+            validation = plan_cache.validate(self.validator, query)
             if not validation.valid:
                 return {"error": validation.to_user_message()}
 
             # Compile and execute
-            result = self.compiler.compile(self.workspace_id, query)
+            result = plan_cache.compile(self.compiler, self.workspace_id, query)
 
             # Determine which providers contributed to this data
             # This helps the LLM correctly attribute data
@@ -834,18 +862,8 @@ class SemanticTools:
             if provider_filter:
                 data_providers = [provider_filter]
             else:
-                # Query which providers have active connections
-                from app.models import Connection
-
-                connections = (
-                    self.db.query(Connection)
-                    .filter(
-                        Connection.workspace_id == self.workspace_id,
-                        Connection.status == "active",
-                    )
-                    .all()
-                )
-                data_providers = [c.provider.value for c in connections]
+                # Providers with active connections
+                data_providers = get_active_providers(self.db, self.workspace_id)
 
             # Convert to dict
             result_dict = result.to_dict()
@@ -916,7 +934,7 @@ class SemanticTools:
                     )
                 )
 
-            result = self.compiler.compile(self.workspace_id, query)
+            result = plan_cache.compile(self.compiler, self.workspace_id, query)
 
             entities = []
             for item in result.breakdown:
@@ -982,7 +1000,7 @@ class SemanticTools:
                 breakdown=Breakdown(dimension="entity", level="campaign", limit=10),
             )
 
-            result = self.compiler.compile(self.workspace_id, query)
+            result = plan_cache.compile(self.compiler, self.workspace_id, query)
             result_dict = result.to_dict()
 
             # Extract change info
@@ -117,6 +117,9 @@ ASYNC_DATABASE_URL = _get_async_database_url(DATABASE_URL)
 # - pool_pre_ping: Check connection health before use (small overhead but prevents errors)
 #
 # NOTE: SQLite engines (used in some tests/dev) do not support pool_size/max_overflow.
+SYNC_POOL_SIZE = 10         # Base pool size
+SYNC_MAX_OVERFLOW = 20      # Allow up to 30 total connections under load
+
 if DATABASE_URL.startswith("sqlite"):
     engine = create_engine(
         DATABASE_URL,
@@ -125,8 +128,8 @@ if DATABASE_URL.startswith("sqlite"):
 else:
     engine = create_engine(
         DATABASE_URL,
-        pool_size=10,           # Base pool size
-        max_overflow=20,        # Allow up to 30 total connections under load
+        pool_size=SYNC_POOL_SIZE,
+        max_overflow=SYNC_MAX_OVERFLOW,
         pool_recycle=3600,      # Recycle connections every hour
         pool_pre_ping=True,     # Validate connections before use
     )
@@ -166,8 +166,8 @@ def create_app() -> FastAPI:
         3. Any Shopify store should be able to send pixel events
         """
         async def dispatch(self, request, call_next):
-            # Only handle /v1/pixel-events
-            if request.url.path == "/v1/pixel-events":
+            # Only handle /v1/pixel-events and /v1/pixel-events/batch
+            if request.url.path in ("/v1/pixel-events", "/v1/pixel-events/batch"):
                 # ALWAYS use wildcard for sandboxed iframe compatibility
                 cors_headers = {
                     "Access-Control-Allow-Origin": "*",
@@ -269,7 +269,11 @@ def create_app() -> FastAPI:
 
     @app.on_event("shutdown")
     async def shutdown_event():
-        """Clean shutdown of observability tools."""
+        """Flush buffered pixel events, then shut down observability tools."""
+        from .services.pixel_event_buffer import pixel_event_buffer
+        await pixel_event_buffer.close()
+        logging.info("[SHUTDOWN] Pixel event buffer flushed")
+
         logging.info("[SHUTDOWN] Flushing observability events...")
         shutdown_observability()
         logging.info("[SHUTDOWN] Observability shutdown complete")
@@ -22,6 +22,7 @@ from sqlalchemy import (
     JSON,
     Text,
     Boolean,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -655,6 +656,58 @@ class Entity(Base):
         return f"{self.name} ({self.level.value})"
 
 
+class EntityAncestor(Base):
+    """EntityAncestor is the closure table of the entity hierarchy.
+
+    WHAT:
+        One row per (leaf, ancestor) pair, including the entity itself at
+        depth 0. An ad under adset B under campaign C has three rows:
+        (ad, ad, 0), (ad, B, 1), (ad, C, 2).
+
+    WHY:
+        Rolling leaf metrics up to their campaign/adset used recursive CTEs
+        over the whole entities table (all tenants) on every query. The
+        closure table turns that into an indexed, workspace-scoped join.
+
+    MAINTENANCE:
+        Kept in sync by the Meta/Google entity upserts
+        (app/services/entity_hierarchy_service.py:sync_entity_ancestors).
+
+    Related:
+        - Migration: alembic/versions/20261016_000002_add_entity_ancestors.py
+        - Readers: app/dsl/hierarchy.py (campaign_ancestors, adset_ancestors)
+    """
+
+    __tablename__ = "entity_ancestors"
+
+    leaf_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("entities.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    ancestor_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("entities.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    ancestor_level = Column(
+        Enum(LevelEnum, values_callable=lambda obj: [e.value for e in obj]),
+        nullable=False,
+    )
+    # Denormalized from Entity so lookups never touch other tenants' rows
+    workspace_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    depth = Column(Integer, nullable=False)  # 0 = self, 1 = parent, ...
+
+    # Indexes (ancestor_id -> leaves, workspace + level) live in the migration
+
+    def __str__(self):
+        return f"{self.leaf_id} -> {self.ancestor_id} ({self.depth})"
+
+
 class MetricFact(Base):
     """MetricFact stores RAW BASE MEASURES from ad platforms.
 
@@ -753,7 +806,14 @@ class MetricSnapshot(Base):
     LIFECYCLE:
         - Today/Yesterday: 15-min granularity (96 snapshots/day)
         - Day 2+: Hourly granularity (24 snapshots/day, compacted)
-        - All data retained (no deletion)
+        - All data retained (no deletion); old months can be detached to
+          the archive schema
+
+    PARTITIONING:
+        Range-partitioned by captured_at, one partition per month (created by
+        the 20261016_000003 migration and scheduled_snapshot_partitions).
+        The database primary key is (id, captured_at); queries filtering on
+        metrics_date add snapshot_pruning_clause() so Postgres can prune.
 
     SYNC SCHEDULE:
         - Every 15 min: Sync today's data
@@ -763,6 +823,7 @@ class MetricSnapshot(Base):
     Related:
         - Migration: alembic/versions/20251207_000001_add_metric_snapshots.py
         - Service: app/services/snapshot_sync_service.py
+        - Partitions: app/services/snapshot_partition_service.py
     """
 
     __tablename__ = "metric_snapshots"
@@ -819,6 +880,81 @@ class MetricSnapshot(Base):
         return f"{self.captured_at.strftime('%Y-%m-%d %H:%M')} - {self.provider} - ${self.spend}"
 
 
+class MetricDailyRollup(Base):
+    """MetricDailyRollup stores the latest cumulative snapshot per entity per day.
+
+    WHAT:
+        One row per (entity_id, provider, metrics_date) holding the values of the
+        most recent MetricSnapshot for that day. Written incrementally by the
+        snapshot sync alongside every snapshot upsert.
+
+    WHY:
+        Daily reads (summaries, timeseries, breakdowns) otherwise rebuild a
+        max(captured_at) GROUP BY entity_id, metrics_date subquery over all
+        15-min rows. Reading the rollup is a plain indexed range scan.
+
+    INVARIANT:
+        A row is only overwritten by a snapshot with captured_at >= the stored
+        captured_at, so late/out-of-order writes never regress the day's values.
+
+    Related:
+        - Migration: alembic/versions/20261016_000001_add_metric_daily_rollups.py
+        - Service: app/services/metric_rollup_service.py
+    """
+
+    __tablename__ = "metric_daily_rollups"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    entity_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("entities.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Denormalized from Entity for workspace-scoped rebuilds and consistency checks
+    workspace_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    provider = Column(String(20), nullable=False)
+    metrics_date = Column(Date, nullable=False, index=True)
+
+    # captured_at of the snapshot these values were taken from
+    captured_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Base measures (same as MetricSnapshot)
+    spend = Column(Numeric(18, 4), nullable=True)
+    impressions = Column(BigInteger, nullable=True)
+    clicks = Column(BigInteger, nullable=True)
+    conversions = Column(Numeric(18, 4), nullable=True)
+    revenue = Column(Numeric(18, 4), nullable=True)
+    leads = Column(Numeric(18, 4), nullable=True)
+    purchases = Column(Integer, nullable=True)
+    installs = Column(Integer, nullable=True)
+    visitors = Column(Integer, nullable=True)
+    profit = Column(Numeric(18, 4), nullable=True)
+
+    currency = Column(String(10), default="USD")
+
+    updated_at = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "entity_id",
+            "provider",
+            "metrics_date",
+            name="uq_metric_daily_rollups_entity_provider_date",
+        ),
+        # Workspace + date range scans (dashboard reads, rebuilds)
+        Index("idx_metric_daily_rollups_workspace_date", "workspace_id", "metrics_date"),
+    )
+
+    def __str__(self):
+        return f"{self.metrics_date} - {self.provider} - ${self.spend}"
+
+
 class ComputeRun(Base):
     __tablename__ = "compute_runs"
 
@@ -1175,6 +1311,12 @@ class ShopifyShop(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_synced_at = Column(DateTime, nullable=True)
 
+    # Order sync checkpoint (set while a paginated order sync is in progress)
+    # WHAT: Cursor after the last committed page + the `since` filter it belongs to
+    # WHY: An interrupted sync resumes from the last committed page
+    orders_sync_cursor = Column(String, nullable=True)
+    orders_sync_since = Column(DateTime, nullable=True)
+
     # Relationships
     connection = relationship("Connection", backref="shopify_shop")
     products = relationship(
@@ -1461,6 +1603,9 @@ class ShopifyOrderLineItem(Base):
     """
 
     __tablename__ = "shopify_order_line_items"
+    __table_args__ = (
+        UniqueConstraint("order_id", "external_line_item_id", name="uq_shopify_line_item"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -13,7 +13,7 @@ import logging
 from typing import List, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Header, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -48,6 +48,9 @@ from ..schemas import (
     AdminUserWorkspace,
 )
 from ..services.clerk_admin_service import delete_clerk_user
+from ..services.workspace_cache import workspace_cache
+from ..semantic.telemetry import get_telemetry, read_merged_cache_stats, read_merged_latency
+from .. import state
 
 logger = logging.getLogger(__name__)
 
@@ -205,6 +208,7 @@ async def delete_user(
 
     clerk_deleted = False
     workspaces_deleted = 0
+    deleted_workspace_ids = []
 
     # Step 1: Delete from Clerk
     if user.clerk_id:
@@ -253,6 +257,7 @@ async def delete_user(
 
             # Delete the workspace (cascade handles invites)
             db.delete(workspace)
+            deleted_workspace_ids.append(workspace.id)
             workspaces_deleted += 1
 
     # Step 3: Remove any remaining memberships (where user is member, not owner)
@@ -277,6 +282,10 @@ async def delete_user(
     db.delete(user)
     db.commit()
 
+    # After commit: a concurrent lookup can't re-cache a deleted workspace
+    for workspace_id in deleted_workspace_ids:
+        workspace_cache.invalidate(workspace_id)
+
     logger.info(
         f"[ADMIN] Deleted user {user_id} (clerk_deleted={clerk_deleted}, "
         f"workspaces_deleted={workspaces_deleted})"
@@ -696,3 +705,37 @@ async def get_workspace_details(
             for m in members
         ],
     }
+
+
+# =============================================================================
+# TELEMETRY ENDPOINTS
+# =============================================================================
+
+
+@router.get(
+    "/telemetry/latency",
+    summary="Semantic query latency across replicas",
+    description=(
+        "Merged per-stage latency histograms (p50/p95/p99) and plan cache "
+        "hits/saved time of all API replicas."
+    ),
+)
+async def get_semantic_latency(
+    hours: int = Query(1, ge=1, le=48),
+    _: User = Depends(require_admin_access),
+):
+    """Merge the latency sketches every replica flushed to Redis.
+
+    WHAT: Flushes this replica first, then sums the hourly per-stage hashes
+          (latency sketches and plan cache counters)
+    WHY: Each process only sees its own queries; percentiles need them all
+    """
+    if not state.redis_client:
+        raise HTTPException(status_code=503, detail="Redis not available")
+
+    get_telemetry().flush_to_redis()
+    return {
+        "hours": hours,
+        "stages": read_merged_latency(state.redis_client, hours=hours),
+        "cache": read_merged_cache_stats(state.redis_client, hours=hours),
+    }
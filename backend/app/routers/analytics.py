@@ -35,7 +35,7 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from sqlalchemy import text, func
@@ -43,6 +43,7 @@ from sqlalchemy import text, func
 from app.database import get_db
 from app.models import Entity, MetricSnapshot, Connection, User, LevelEnum
 from app.deps import get_current_user
+from app.services.response_cache import cached_response
 
 logger = logging.getLogger(__name__)
 
@@ -519,6 +520,8 @@ def _rows_to_series(
 
 @router.get("/chart", response_model=AnalyticsChartResponse)
 def get_analytics_chart(
+    request: Request,
+    response: Response,
     workspace_id: UUID = Query(..., description="Workspace UUID"),
     timeframe: str = Query("last_7_days", description="Preset: today, yesterday, last_7_days, last_30_days, custom"),
     start_date: Optional[date] = Query(None, description="Start date for custom timeframe"),
@@ -536,6 +539,7 @@ def get_analytics_chart(
         - All filtering happens server-side
         - Response is series-based for easy chart rendering
         - Granularity auto-detected based on date range
+        - Served from the workspace response cache (app/services/response_cache.py)
 
     PARAMETERS:
         - workspace_id: Required workspace UUID
@@ -565,6 +569,38 @@ def get_analytics_chart(
     if current_user.workspace_id != workspace_id:
         raise HTTPException(status_code=403, detail="Access denied to this workspace")
 
+    params = {
+        "timeframe": timeframe,
+        "start_date": start_date,
+        "end_date": end_date,
+        "platforms": platforms,
+        "campaign_ids": campaign_ids,
+        "group_by": group_by,
+    }
+    return cached_response(
+        workspace_id,
+        "analytics_chart",
+        params,
+        lambda session: _build_analytics_chart(
+            session, workspace_id, timeframe, start_date, end_date, platforms, campaign_ids, group_by
+        ),
+        db,
+        request,
+        response,
+    )
+
+
+def _build_analytics_chart(
+    db: Session,
+    workspace_id: UUID,
+    timeframe: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    platforms: Optional[str],
+    campaign_ids: Optional[str],
+    group_by: str,
+) -> AnalyticsChartResponse:
+    """Compute chart data (uncached); see get_analytics_chart."""
     # Parse timeframe
     start, end, granularity = _parse_timeframe(timeframe, start_date, end_date)
 
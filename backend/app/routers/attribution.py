@@ -30,9 +30,10 @@ from ..database import get_db
 from ..deps import get_current_user
 from ..models import (
     User, Connection, ProviderEnum, WorkspaceMember, RoleEnum,
-    PixelEvent, CustomerJourney, JourneyTouchpoint, Attribution,
+    PixelEvent, Attribution,
     ShopifyOrder, Entity, LevelEnum
 )
+from ..services.journey_flow_service import FLOW_STAGE_NODES, aggregate_journey_flow
 from ..services.pixel_activation_service import PixelActivationService
 from ..security import decrypt_secret
 
@@ -1129,14 +1130,7 @@ _SOURCE_LABELS = {
     "unknown": "Unknown",
 }
 
-# Map pixel event types to flow stage labels
-_STAGE_MAP = {
-    "page_viewed": ("stage_page_view", "Page View", 1),
-    "product_viewed": ("stage_product_view", "Product View", 1),
-    "product_added_to_cart": ("stage_atc", "Add to Cart", 2),
-    "checkout_started": ("stage_checkout", "Checkout", 2),
-    "checkout_completed": ("stage_purchase", "Purchase", 3),
-}
+# Stage node ids, labels and columns: journey_flow_service.FLOW_STAGE_NODES
 
 
 # =============================================================================
@@ -1171,11 +1165,10 @@ def get_journey_flow(
          Triple Whale.
 
     DESIGN:
-        1. Fetch all journeys with touchpoints for the period
-        2. For each journey, determine the first-touch source channel
-        3. Walk touchpoints to build transitions between stages
-        4. Group by source → stage and stage → stage transitions
-        5. Separate purchased vs dropped-off outcomes
+        Nodes and links are aggregated by app/services/journey_flow_service.py:
+        in SQL on Postgres (window functions over de-duplicated stages), or by
+        streaming journeys over a server-side cursor elsewhere. Memory use does
+        not grow with the number of journeys.
 
     Args:
         workspace_id: Workspace UUID
@@ -1191,98 +1184,15 @@ def get_journey_flow(
     now = datetime.utcnow()
     period_start = now - timedelta(days=days)
 
-    # Fetch journeys with their touchpoints
-    journeys = (
-        db.query(CustomerJourney)
-        .filter(
-            CustomerJourney.workspace_id == workspace_id,
-            CustomerJourney.first_seen_at >= period_start,
-        )
-        .all()
-    )
+    flow = aggregate_journey_flow(db, workspace_id, period_start)
 
-    if not journeys:
+    if not flow.total_journeys:
         return JourneyFlowResponse(
             nodes=[], links=[], total_journeys=0, total_revenue=0,
         )
 
-    journey_ids = [j.id for j in journeys]
-
-    # Fetch all touchpoints for these journeys, ordered by time
-    touchpoints = (
-        db.query(JourneyTouchpoint)
-        .filter(JourneyTouchpoint.journey_id.in_(journey_ids))
-        .order_by(JourneyTouchpoint.journey_id, JourneyTouchpoint.touched_at)
-        .all()
-    )
-
-    # Group touchpoints by journey
-    tp_by_journey = {}
-    for tp in touchpoints:
-        tp_by_journey.setdefault(tp.journey_id, []).append(tp)
-
-    # Build flow data
-    node_counts = {}   # node_id → { count: int, revenue: float }
-    link_counts = {}   # (source_id, target_id) → { value: int, revenue: float }
-    total_revenue = 0.0
-
-    for journey in journeys:
-        journey_revenue = float(journey.total_revenue or 0)
-        total_revenue += journey_revenue
-        has_purchased = (journey.total_orders or 0) > 0
-
-        # Determine source channel from first touch
-        # WHY: journey.first_touch_source can be empty if attribution service
-        # hasn't backfilled it yet. Fall back to the first touchpoint's utm_source.
-        tps = tp_by_journey.get(journey.id, [])
-        first_tp = tps[0] if tps else None
-        source = _resolve_source(journey, first_tp)
-        source_id = f"source_{source}"
-
-        # Track source node
-        if source_id not in node_counts:
-            node_counts[source_id] = {"count": 0, "revenue": 0}
-        node_counts[source_id]["count"] += 1
-        node_counts[source_id]["revenue"] += journey_revenue
-
-        # Touchpoints already fetched above (tps variable)
-
-        if not tps:
-            # No touchpoints — link source directly to outcome
-            outcome_id = "outcome_purchased" if has_purchased else "outcome_dropped"
-            _increment_link(link_counts, source_id, outcome_id, journey_revenue)
-            _increment_node(node_counts, outcome_id, journey_revenue)
-            continue
-
-        # Walk touchpoints and build stage transitions
-        prev_node_id = source_id
-        seen_stages = set()
-
-        for tp in tps:
-            stage_info = _STAGE_MAP.get(tp.event_type)
-            if not stage_info:
-                continue
-
-            stage_id, _, _ = stage_info
-
-            # Avoid duplicate transitions within same journey (e.g. multiple page views)
-            if stage_id in seen_stages:
-                continue
-            seen_stages.add(stage_id)
-
-            # Track node
-            _increment_node(node_counts, stage_id, journey_revenue)
-
-            # Track link from previous node to this stage
-            if prev_node_id != stage_id:
-                _increment_link(link_counts, prev_node_id, stage_id, journey_revenue)
-
-            prev_node_id = stage_id
-
-        # Link final stage to outcome
-        outcome_id = "outcome_purchased" if has_purchased else "outcome_dropped"
-        _increment_node(node_counts, outcome_id, journey_revenue)
-        _increment_link(link_counts, prev_node_id, outcome_id, journey_revenue)
+    node_counts = flow.node_counts
+    link_counts = flow.link_counts
 
     # Build response nodes
     nodes = []
@@ -1308,90 +1218,17 @@ def get_journey_flow(
 
     logger.info(
         f"[JOURNEY_FLOW] workspace={workspace_id} days={days} "
-        f"journeys={len(journeys)} nodes={len(nodes)} links={len(links)}"
+        f"journeys={flow.total_journeys} nodes={len(nodes)} links={len(links)}"
     )
 
     return JourneyFlowResponse(
         nodes=nodes,
         links=links,
-        total_journeys=len(journeys),
-        total_revenue=round(total_revenue, 2),
+        total_journeys=flow.total_journeys,
+        total_revenue=round(flow.total_revenue, 2),
     )
 
 
-def _resolve_source(journey: CustomerJourney, first_touchpoint=None) -> str:
-    """Determine the source channel from a journey's first touch data.
-
-    WHAT: Maps first_touch_source / first_touch_medium to a channel key.
-          Falls back to the first touchpoint's utm_source/utm_medium when
-          journey-level fields are empty.
-    WHY: The Sankey source column groups journeys by acquisition channel.
-         Journey first_touch_source can be empty if attribution service
-         hasn't backfilled it yet, but touchpoints capture raw UTM params.
-
-    Args:
-        journey: CustomerJourney with first_touch_* fields
-        first_touchpoint: Optional JourneyTouchpoint to fall back to
-
-    Returns:
-        Channel key string (meta, google, direct, organic, etc.)
-    """
-    source = (journey.first_touch_source or "").lower()
-    medium = (journey.first_touch_medium or "").lower()
-
-    # Fall back to first touchpoint if journey-level fields are empty
-    if not source and first_touchpoint:
-        source = (first_touchpoint.utm_source or "").lower()
-        medium = medium or (first_touchpoint.utm_medium or "").lower()
-
-    # Match ad platforms
-    if source in ("facebook", "fb", "meta", "instagram", "ig") or "facebook" in source:
-        return "meta"
-    if source in ("google", "googleads", "adwords") or "google" in source:
-        return "google"
-    if source in ("tiktok",) or "tiktok" in source:
-        return "tiktok"
-    if source in ("email", "newsletter", "mailchimp", "klaviyo"):
-        return "email"
-
-    # Match by medium
-    if medium in ("cpc", "ppc", "paid", "cpm"):
-        if "facebook" in source or "meta" in source:
-            return "meta"
-        if "google" in source:
-            return "google"
-        return "unknown"
-    if medium in ("organic", "seo"):
-        return "organic"
-    if medium in ("referral",):
-        return "referral"
-    if medium in ("email",):
-        return "email"
-
-    # Direct or unknown
-    if not source or source in ("direct", "(direct)", "(none)"):
-        return "direct"
-
-    return "unknown"
-
-
-def _increment_node(node_counts: dict, node_id: str, revenue: float):
-    """Increment count and revenue for a node."""
-    if node_id not in node_counts:
-        node_counts[node_id] = {"count": 0, "revenue": 0}
-    node_counts[node_id]["count"] += 1
-    node_counts[node_id]["revenue"] += revenue
-
-
-def _increment_link(link_counts: dict, source: str, target: str, revenue: float):
-    """Increment value and revenue for a link."""
-    key = (source, target)
-    if key not in link_counts:
-        link_counts[key] = {"value": 0, "revenue": 0}
-    link_counts[key]["value"] += 1
-    link_counts[key]["revenue"] += revenue
-
-
 def _build_flow_node(node_id: str, count: int, revenue: float) -> Optional[FlowNode]:
     """Build a FlowNode from its ID and aggregated data.
 
@@ -1416,7 +1253,7 @@ def _build_flow_node(node_id: str, count: int, revenue: float) -> Optional[FlowN
 
     if node_id.startswith("stage_"):
         # Find matching stage info
-        for event_type, (stage_id, label, col) in _STAGE_MAP.items():
+        for stage_id, label, col in FLOW_STAGE_NODES.values():
             if stage_id == node_id:
                 return FlowNode(
                     id=node_id,
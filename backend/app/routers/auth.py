@@ -11,6 +11,7 @@ from ..deps import get_current_user, get_settings
 from ..models import User, Workspace, WorkspaceMember, WorkspaceInvite, AuthCredential, RoleEnum, InviteStatusEnum
 from ..security import create_access_token, get_password_hash, verify_password
 from ..services.workspace_factory import create_workspace_with_trial, generate_workspace_name
+from ..services.workspace_cache import workspace_cache
 from ..telemetry import (
     track_user_signed_up,
     track_user_logged_in,
@@ -705,6 +706,9 @@ def delete_account(
             db.query(User).filter(User.id == user_id).delete()
         
         db.commit()
+        if delete_workspace:
+            # After commit: a concurrent lookup can't re-cache the workspace
+            workspace_cache.invalidate(workspace_id)
         logger.info(f"[DELETE_ACCOUNT] Successfully deleted user {user_id}")
         
         # Clear the authentication cookie
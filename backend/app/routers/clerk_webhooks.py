@@ -25,6 +25,7 @@ from ..database import get_db
 from ..deps import get_settings
 from ..models import RoleEnum, User, Workspace, WorkspaceMember
 from ..services.workspace_factory import create_workspace_with_trial, generate_workspace_name
+from ..services.workspace_cache import workspace_cache
 
 logger = logging.getLogger(__name__)
 
@@ -477,6 +478,9 @@ async def _handle_user_deleted(db: Session, data: dict[str, Any]) -> dict:
             db.query(User).filter(User.id == user_id).delete()
 
         db.commit()
+        if delete_workspace:
+            # After commit: a concurrent lookup can't re-cache the workspace
+            workspace_cache.invalidate(workspace_id)
 
         logger.info(f"[CLERK_WEBHOOK] Successfully deleted user {user_id}")
         return {"status": "deleted", "user_id": str(user_id)}
@@ -29,28 +29,75 @@ REFERENCES:
 """
 
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, text
 
-from app.database import get_db
+from app.database import SYNC_POOL_SIZE, SessionLocal, get_db
 from app.models import (
     Connection, ShopifyOrder, Attribution, MetricSnapshot, Entity,
     ProviderEnum, User, LevelEnum, Workspace, ShopifyShop, ShopifyFinancialStatusEnum
 )
 from app.deps import get_current_user
 from app.schemas import SparkPoint
+from app.services.response_cache import cached_response
+from app.services.unified_metric_service import (
+    UnifiedMetricService,
+    MetricFilters,
+    SummaryRequest,
+)
+from app.dsl.schema import TimeRange as DslTimeRange
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/workspaces", tags=["dashboard"])
 
+# Platform base measures behind the KPI cards (derived KPIs are computed below)
+KPI_BASE_MEASURES = ("spend", "revenue", "conversions", "clicks", "impressions")
+
+# Load dashboard sections concurrently, each on its own pooled session
+DASHBOARD_CONCURRENT_SECTIONS = os.getenv("DASHBOARD_CONCURRENT_SECTIONS", "true").lower() == "true"
+
+# Time budget per section (seconds); a section that misses it is returned empty.
+# Override per section with e.g. DASHBOARD_SECTION_TIMEOUTS="kpis=15,attribution=5"
+DASHBOARD_SECTION_TIMEOUT_SECONDS = float(os.getenv("DASHBOARD_SECTION_TIMEOUT_SECONDS", "10"))
+
+# Threads shared by all dashboard requests (bounds extra DB connections).
+# Capped at the base pool size so section fan-out can't use up the overflow
+# connections other requests need.
+DASHBOARD_SECTION_WORKERS = min(int(os.getenv("DASHBOARD_SECTION_WORKERS", "8")), SYNC_POOL_SIZE)
+
+DASHBOARD_SECTIONS = ("kpis", "top_campaigns", "spend_mix", "provider_totals", "attribution")
+
+
+def _parse_section_timeouts(raw: str) -> Dict[str, float]:
+    """Parse "section=seconds,..." overrides on top of the default budget."""
+    timeouts = {name: DASHBOARD_SECTION_TIMEOUT_SECONDS for name in DASHBOARD_SECTIONS}
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        name, _, seconds = item.partition("=")
+        try:
+            timeouts[name.strip()] = float(seconds)
+        except ValueError:
+            logger.warning("[DASHBOARD] Ignoring invalid section timeout: %s", item)
+    return timeouts
+
+
+SECTION_TIMEOUTS = _parse_section_timeouts(os.getenv("DASHBOARD_SECTION_TIMEOUTS", ""))
+
+_section_executor = ThreadPoolExecutor(
+    max_workers=DASHBOARD_SECTION_WORKERS,
+    thread_name_prefix="dashboard-section",
+)
+
 
 # =============================================================================
 # RESPONSE MODELS
@@ -147,6 +194,11 @@ class UnifiedDashboardResponse(BaseModel):
     # Sync status - ISO timestamp of last successful sync for this workspace
     last_synced_at: Optional[str] = None
 
+    # Latency per section (ms) and sections returned empty (timeout/error)
+    # WHY: Feeds the dashboard latency panels; the UI can flag partial data
+    section_timings_ms: Dict[str, float] = {}
+    incomplete_sections: List[str] = []
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -295,68 +347,34 @@ def _get_kpis_and_chart_data(
     prev_start_date = prev_start.astimezone(tz).date()
     prev_end_date = prev_end.astimezone(tz).date()
 
-    # Current period metrics - get latest snapshot per CAMPAIGN entity per day, then sum
+    # Current + previous period totals - latest snapshot per CAMPAIGN entity per day, summed.
     # WHY: Campaign-level metrics are SOURCE OF TRUTH for KPI totals.
     # PMax campaigns don't attribute all spend to asset_groups, Shopping campaigns
     # may have spend not fully attributed to ads. Campaign-level ensures accuracy.
-    # Using raw SQL with DISTINCT ON for efficiency
+    #
+    # Both periods come from ONE batched query (SUM ... FILTER per period) via
+    # UnifiedMetricService.get_summaries_batch instead of two DISTINCT ON scans.
     #
     # NOTE: Uses metrics_date (the date from ad platform in account timezone) for
-    # accurate day filtering. captured_at is only used for ordering to get freshest data.
-    # Build platform filter clause if specified
-    platform_filter = ""
-    if platform:
-        platform_filter = "AND provider = :platform"
-
-    current_metrics_sql = text(f"""
-        SELECT
-            COALESCE(SUM(spend), 0) as spend,
-            COALESCE(SUM(revenue), 0) as revenue,
-            COALESCE(SUM(conversions), 0) as conversions,
-            COALESCE(SUM(clicks), 0) as clicks,
-            COALESCE(SUM(impressions), 0) as impressions
-        FROM (
-            SELECT DISTINCT ON (entity_id, metrics_date)
-                entity_id,
-                spend,
-                revenue,
-                conversions,
-                clicks,
-                impressions
-            FROM metric_snapshots
-            WHERE entity_id IN (
-                SELECT id FROM entities
-                WHERE workspace_id = :workspace_id
-                AND level = 'campaign'
+    # accurate day filtering. captured_at is only used to pick the freshest snapshot.
+    kpi_filters = MetricFilters(provider=platform, level="campaign")
+    current_summary, prev_summary = UnifiedMetricService(db).get_summaries_batch(
+        workspace_id=str(workspace_id),
+        requests=[
+            SummaryRequest(
+                metrics=list(KPI_BASE_MEASURES),
+                time_range=DslTimeRange(start=period_start, end=period_end),
+                filters=kpi_filters,
+                include_workspace_avg=False,
             )
-              AND metrics_date >= :start_date
-              AND metrics_date <= :end_date
-              {platform_filter}
-            ORDER BY entity_id, metrics_date, captured_at DESC
-        ) latest_snapshots
-    """)
-
-    # Build params dict, conditionally including platform
-    current_params = {
-        "workspace_id": str(workspace_id),
-        "start_date": start_date,
-        "end_date": end_date
-    }
-    if platform:
-        current_params["platform"] = platform
-
-    current_metrics = db.execute(current_metrics_sql, current_params).first()
-
-    # Previous period metrics
-    prev_params = {
-        "workspace_id": str(workspace_id),
-        "start_date": prev_start_date,
-        "end_date": prev_end_date
-    }
-    if platform:
-        prev_params["platform"] = platform
-
-    prev_metrics = db.execute(current_metrics_sql, prev_params).first()
+            for period_start, period_end in (
+                (start_date, end_date),
+                (prev_start_date, prev_end_date),
+            )
+        ],
+    )
+    current_metrics = {k: v.value for k, v in current_summary.metrics.items()}
+    prev_metrics = {k: v.value for k, v in prev_summary.metrics.items()}
 
     # Determine granularity: 15-min for today/yesterday (matches sync frequency), daily for longer periods
     intraday_requested = timeframe in ("today", "yesterday")
@@ -685,8 +703,8 @@ def _get_kpis_and_chart_data(
                 for r in rows
             ]
     else:
-        revenue_current = float(current_metrics.revenue or 0)
-        revenue_prev = float(prev_metrics.revenue or 0)
+        revenue_current = float(current_metrics["revenue"] or 0)
+        revenue_prev = float(prev_metrics["revenue"] or 0)
         if use_intraday:
             revenue_sparkline = [
                 SparkPoint(date=d.time_bucket.isoformat(), value=float(d.revenue or 0))
@@ -695,8 +713,8 @@ def _get_kpis_and_chart_data(
         else:
             revenue_sparkline = [SparkPoint(date=str(d.time_bucket), value=float(d.revenue or 0)) for d in chart_data_result]
 
-    conversion_value_current = float(current_metrics.revenue or 0)
-    conversion_value_prev = float(prev_metrics.revenue or 0)
+    conversion_value_current = float(current_metrics["revenue"] or 0)
+    conversion_value_prev = float(prev_metrics["revenue"] or 0)
     if has_shopify:
         # Platform conversion value sparkline (in the same granularity as chart_data_result).
         if use_intraday:
@@ -710,14 +728,14 @@ def _get_kpis_and_chart_data(
         conversion_value_sparkline = revenue_sparkline
 
     # Calculate ROAS
-    spend_current = float(current_metrics.spend or 0)
-    spend_prev = float(prev_metrics.spend or 0)
-    conversions_current = float(current_metrics.conversions or 0)
-    conversions_prev = float(prev_metrics.conversions or 0)
-    clicks_current = float(current_metrics.clicks or 0)
-    clicks_prev = float(prev_metrics.clicks or 0)
-    impressions_current = float(current_metrics.impressions or 0)
-    impressions_prev = float(prev_metrics.impressions or 0)
+    spend_current = float(current_metrics["spend"] or 0)
+    spend_prev = float(prev_metrics["spend"] or 0)
+    conversions_current = float(current_metrics["conversions"] or 0)
+    conversions_prev = float(prev_metrics["conversions"] or 0)
+    clicks_current = float(current_metrics["clicks"] or 0)
+    clicks_prev = float(prev_metrics["clicks"] or 0)
+    impressions_current = float(current_metrics["impressions"] or 0)
+    impressions_prev = float(prev_metrics["impressions"] or 0)
 
     roas_current = revenue_current / spend_current if spend_current > 0 else 0
     roas_prev = revenue_prev / spend_prev if spend_prev > 0 else 0
@@ -1093,6 +1111,175 @@ def _get_attribution_data(
     return summary, feed
 
 
+def _get_provider_totals(
+    db: Session,
+    workspace_id: UUID,
+    start: datetime,
+    end: datetime,
+    reporting_timezone: Optional[str],
+) -> Optional[Dict[str, Dict[str, float]]]:
+    """Provider totals (platform metrics) for reconciliation with ad dashboards.
+
+    NOTE: Uses metrics_date (platform day) and latest snapshot per entity/day.
+    Returns None when the query fails (the field is optional).
+    """
+    try:
+        from zoneinfo import ZoneInfo
+
+        try:
+            tz = ZoneInfo(reporting_timezone) if reporting_timezone else timezone.utc
+        except Exception:
+            tz = timezone.utc
+
+        range_start_date = start.astimezone(tz).date()
+        range_end_date = end.astimezone(tz).date()
+
+        provider_totals_sql = text("""
+            SELECT
+              provider,
+              COALESCE(SUM(spend), 0) AS spend,
+              COALESCE(SUM(conversions), 0) AS conversions,
+              COALESCE(SUM(revenue), 0) AS conversion_value
+            FROM (
+              SELECT DISTINCT ON (entity_id, metrics_date)
+                provider,
+                entity_id,
+                metrics_date,
+                spend,
+                conversions,
+                revenue
+              FROM metric_snapshots
+              WHERE entity_id IN (
+                SELECT id FROM entities
+                WHERE workspace_id = :workspace_id
+                  AND level = 'campaign'
+              )
+              AND metrics_date >= :start_date
+              AND metrics_date <= :end_date
+              ORDER BY entity_id, metrics_date, captured_at DESC
+            ) latest
+            GROUP BY provider
+        """)
+
+        rows = db.execute(provider_totals_sql, {
+            "workspace_id": str(workspace_id),
+            "start_date": range_start_date,
+            "end_date": range_end_date,
+        }).fetchall()
+
+        return {
+            (r.provider or "unknown"): {
+                "spend": float(r.spend or 0),
+                "conversions": float(r.conversions or 0),
+                "conversion_value": float(r.conversion_value or 0),
+            }
+            for r in rows
+        }
+    except Exception as e:
+        logger.warning("[DASHBOARD] Failed to compute provider_totals: %s", e)
+        return None
+
+
+def _run_section_in_own_session(
+    section: Callable[[Session], Any],
+    deadline: float,
+) -> Tuple[Any, float]:
+    """Run one section on a fresh pooled session; returns (value, elapsed ms).
+
+    deadline is the time.perf_counter() value by which the request stops
+    waiting. A section still queued at its deadline is skipped without taking
+    a connection. On Postgres the section's statements get a statement_timeout
+    of the time left, so a timed-out section releases its connection when the
+    request moves on.
+    """
+    started = time.perf_counter()
+    remaining_ms = int((deadline - started) * 1000)
+    if remaining_ms <= 0:
+        raise FutureTimeoutError("section deadline passed before it started")
+
+    with SessionLocal() as session:
+        if session.get_bind().dialect.name == "postgresql":
+            # SET LOCAL: reset when the session's transaction ends on close
+            session.execute(text(f"SET LOCAL statement_timeout = {remaining_ms}"))
+        value = section(session)
+    return value, (time.perf_counter() - started) * 1000
+
+
+def _load_dashboard_sections(
+    db: Session,
+    sections: Dict[str, Callable[[Session], Any]],
+    fallbacks: Dict[str, Any],
+    concurrent: bool = DASHBOARD_CONCURRENT_SECTIONS,
+) -> Tuple[Dict[str, Any], Dict[str, float], List[str]]:
+    """Load independent dashboard sections, concurrently or one after another.
+
+    WHAT:
+        Concurrent mode submits every section to a shared thread pool, each
+        with its own session from the sync pool, and waits for each up to
+        its SECTION_TIMEOUTS budget. The request session is closed first so
+        the request holds only the section connections (objects it already
+        loaded stay readable). Sequential mode runs them on the
+        request session. In both modes a section that fails or times out
+        yields its fallback value and is listed as incomplete.
+
+    WHY:
+        Sections are independent query groups; run serially, endpoint latency
+        was the sum of all of them instead of the slowest one.
+
+    Returns:
+        (values by section, elapsed ms by section, incomplete section names)
+    """
+    values: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    incomplete: List[str] = []
+
+    if not concurrent:
+        for name, section in sections.items():
+            started = time.perf_counter()
+            try:
+                values[name] = section(db)
+            except Exception as e:
+                logger.exception("[DASHBOARD] Section %s failed: %s", name, e)
+                db.rollback()
+                values[name] = fallbacks[name]
+                incomplete.append(name)
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+        return values, timings, incomplete
+
+    # Return the request's connection to the pool during the fan-out
+    db.close()
+
+    submitted_at = time.perf_counter()
+    deadlines = {
+        name: submitted_at + SECTION_TIMEOUTS.get(name, DASHBOARD_SECTION_TIMEOUT_SECONDS)
+        for name in sections
+    }
+    futures = {
+        name: _section_executor.submit(_run_section_in_own_session, section, deadlines[name])
+        for name, section in sections.items()
+    }
+
+    for name, future in futures.items():
+        budget = SECTION_TIMEOUTS.get(name, DASHBOARD_SECTION_TIMEOUT_SECONDS)
+        try:
+            values[name], elapsed_ms = future.result(
+                timeout=max(0.0, deadlines[name] - time.perf_counter())
+            )
+        except FutureTimeoutError:
+            logger.warning("[DASHBOARD] Section %s exceeded %.1fs budget", name, budget)
+            values[name] = fallbacks[name]
+            elapsed_ms = (time.perf_counter() - submitted_at) * 1000
+            incomplete.append(name)
+        except Exception as e:
+            logger.exception("[DASHBOARD] Section %s failed: %s", name, e)
+            values[name] = fallbacks[name]
+            elapsed_ms = (time.perf_counter() - submitted_at) * 1000
+            incomplete.append(name)
+        timings[name] = round(elapsed_ms, 1)
+
+    return values, timings, incomplete
+
+
 # =============================================================================
 # MAIN ENDPOINT
 # =============================================================================
@@ -1116,6 +1303,8 @@ def _get_attribution_data(
 )
 def get_unified_dashboard(
     workspace_id: UUID,
+    request: Request,
+    response: Response,
     timeframe: str = Query(
         default="last_7_days",
         description="Time period: today, yesterday, last_7_days, last_30_days, last_90_days"
@@ -1139,12 +1328,82 @@ def get_unified_dashboard(
     Get unified dashboard data.
 
     NOTE: This is a sync endpoint (not async) to prevent blocking the event loop.
-    FastAPI runs it in a thread pool automatically.
+    FastAPI runs it in a thread pool automatically. The independent sections
+    (KPIs/chart, top campaigns, spend mix, provider totals, attribution) run
+    concurrently on their own sessions (see _load_dashboard_sections).
+
+    Served from the workspace response cache (app/services/response_cache.py);
+    responses with incomplete sections are never cached.
     """
     # Verify workspace access
     if current_user.workspace_id != workspace_id:
         raise HTTPException(status_code=403, detail="Access denied to this workspace")
 
+    params = {
+        "timeframe": timeframe,
+        "start_date": start_date,
+        "end_date": end_date,
+        "platform": platform,
+    }
+    return cached_response(
+        workspace_id,
+        "dashboard_unified",
+        params,
+        lambda session: _build_unified_dashboard(
+            session, workspace_id, timeframe, start_date, end_date, platform
+        ),
+        db,
+        request,
+        response,
+        should_cache=lambda body: not body.incomplete_sections,
+        # Presets resolve in the reporting timezone: roll over at its midnight
+        reporting_timezone=_get_reporting_timezone(db, workspace_id),
+    )
+
+
+def _pick_reporting_timezone(
+    shopify_shop: Optional[ShopifyShop],
+    ad_connections: List[Connection],
+) -> str:
+    """Reporting timezone: the Shopify shop's, else the first ad account's, else UTC."""
+    if shopify_shop and shopify_shop.timezone:
+        return shopify_shop.timezone
+    for conn in ad_connections:
+        if conn.timezone:
+            logger.debug("[DASHBOARD] Using account timezone: %s", conn.timezone)
+            return conn.timezone
+    return "UTC"
+
+
+def _get_reporting_timezone(db: Session, workspace_id: UUID) -> str:
+    """Reporting timezone of a workspace (same choice as _build_unified_dashboard)."""
+    shopify_shop = (
+        db.query(ShopifyShop)
+        .join(Connection, ShopifyShop.connection_id == Connection.id)
+        .filter(
+            Connection.workspace_id == workspace_id,
+            Connection.provider == ProviderEnum.shopify,
+            Connection.status == "active",
+        )
+        .first()
+    )
+    ad_connections = db.query(Connection).filter(
+        Connection.workspace_id == workspace_id,
+        Connection.status == "active",
+        Connection.provider != ProviderEnum.shopify,
+    ).all()
+    return _pick_reporting_timezone(shopify_shop, ad_connections)
+
+
+def _build_unified_dashboard(
+    db: Session,
+    workspace_id: UUID,
+    timeframe: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    platform: Optional[str],
+) -> UnifiedDashboardResponse:
+    """Compute the unified dashboard (uncached); see get_unified_dashboard."""
     # Fetch workspace for last_synced_at
     workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
 
@@ -1172,15 +1431,11 @@ def get_unified_dashboard(
     # Determine reporting currency/timezone.
     # Shopify-first: if Shopify connected, use shop settings for consistent reporting.
     primary_currency = "USD"
-    primary_timezone = None  # Ad account timezone (fallback)
     for conn in ad_connections:
         if conn.currency_code and primary_currency == "USD":
             primary_currency = conn.currency_code
-        if conn.timezone and not primary_timezone:
-            primary_timezone = conn.timezone
-            logger.debug("[DASHBOARD] Using account timezone: %s", primary_timezone)
 
-    reporting_timezone = (shopify_shop.timezone if shopify_shop and shopify_shop.timezone else None) or primary_timezone or "UTC"
+    reporting_timezone = _pick_reporting_timezone(shopify_shop, ad_connections)
     reporting_currency = (shopify_shop.currency if shopify_shop and shopify_shop.currency else None) or primary_currency
 
     # Get date ranges - use custom dates if provided, else use timeframe preset
@@ -1223,7 +1478,36 @@ def get_unified_dashboard(
 
     prev_start, prev_end = _get_previous_period(start, end)
 
-    # Fetch all data
+    # Fetch all sections (independent query groups)
+    sections: Dict[str, Callable[[Session], Any]] = {
+        "kpis": lambda session: _get_kpis_and_chart_data(
+            session, workspace_id, start, end, prev_start, prev_end,
+            has_shopify, timeframe, reporting_timezone, platform,
+        ),
+        "top_campaigns": lambda session: _get_top_campaigns(session, workspace_id),
+        "spend_mix": lambda session: _get_spend_mix(session, workspace_id, start, end),
+        "provider_totals": lambda session: _get_provider_totals(
+            session, workspace_id, start, end, reporting_timezone
+        ),
+    }
+    # Attribution only if Shopify connected
+    if has_shopify:
+        sections["attribution"] = lambda session: _get_attribution_data(
+            session, workspace_id, start, end
+        )
+
+    fallbacks: Dict[str, Any] = {
+        "kpis": ([], [], "shopify" if has_shopify else "platform", "daily", None, None, None),
+        "top_campaigns": [],
+        "spend_mix": [],
+        "provider_totals": None,
+        "attribution": (None, None),
+    }
+
+    results, section_timings, incomplete_sections = _load_dashboard_sections(
+        db, sections, fallbacks
+    )
+
     (
         kpis,
         chart_data,
@@ -1232,84 +1516,17 @@ def get_unified_dashboard(
         data_as_of,
         intraday_available_from,
         intraday_reason_unavailable,
-    ) = _get_kpis_and_chart_data(
-        db, workspace_id, start, end, prev_start, prev_end, has_shopify, timeframe, reporting_timezone, platform
-    )
-
-    top_campaigns = _get_top_campaigns(db, workspace_id)
-    spend_mix = _get_spend_mix(db, workspace_id, start, end)
-
-    # Provider totals (platform metrics) for reconciliation with ad dashboards.
-    # NOTE: Uses metrics_date (platform day) and latest snapshot per entity/day.
-    provider_totals: Optional[Dict[str, Dict[str, float]]] = None
-    try:
-        from sqlalchemy import text
-        from zoneinfo import ZoneInfo
-
-        try:
-            tz = ZoneInfo(reporting_timezone) if reporting_timezone else timezone.utc
-        except Exception:
-            tz = timezone.utc
-
-        range_start_date = start.astimezone(tz).date()
-        range_end_date = end.astimezone(tz).date()
-
-        provider_totals_sql = text("""
-            SELECT
-              provider,
-              COALESCE(SUM(spend), 0) AS spend,
-              COALESCE(SUM(conversions), 0) AS conversions,
-              COALESCE(SUM(revenue), 0) AS conversion_value
-            FROM (
-              SELECT DISTINCT ON (entity_id, metrics_date)
-                provider,
-                entity_id,
-                metrics_date,
-                spend,
-                conversions,
-                revenue
-              FROM metric_snapshots
-              WHERE entity_id IN (
-                SELECT id FROM entities
-                WHERE workspace_id = :workspace_id
-                  AND level = 'campaign'
-              )
-              AND metrics_date >= :start_date
-              AND metrics_date <= :end_date
-              ORDER BY entity_id, metrics_date, captured_at DESC
-            ) latest
-            GROUP BY provider
-        """)
-
-        rows = db.execute(provider_totals_sql, {
-            "workspace_id": str(workspace_id),
-            "start_date": range_start_date,
-            "end_date": range_end_date,
-        }).fetchall()
-
-        provider_totals = {
-            (r.provider or "unknown"): {
-                "spend": float(r.spend or 0),
-                "conversions": float(r.conversions or 0),
-                "conversion_value": float(r.conversion_value or 0),
-            }
-            for r in rows
-        }
-    except Exception as e:
-        logger.warning("[DASHBOARD] Failed to compute provider_totals: %s", e)
-
-    # Attribution only if Shopify connected
-    attribution_summary = None
-    attribution_feed = None
-    if has_shopify:
-        attribution_summary, attribution_feed = _get_attribution_data(
-            db, workspace_id, start, end
-        )
+    ) = results["kpis"]
+    top_campaigns = results["top_campaigns"]
+    spend_mix = results["spend_mix"]
+    provider_totals = results["provider_totals"]
+    attribution_summary, attribution_feed = results.get("attribution", (None, None))
 
     logger.info(
         f"[DASHBOARD_UNIFIED] workspace={workspace_id} timeframe={timeframe} "
         f"kpis={len(kpis)} campaigns={len(top_campaigns)} "
-        f"spend_mix={len(spend_mix)} has_shopify={has_shopify}"
+        f"spend_mix={len(spend_mix)} has_shopify={has_shopify} "
+        f"timings_ms={section_timings} incomplete={incomplete_sections}"
     )
 
     # Format last_synced_at as ISO string
@@ -1346,5 +1563,7 @@ def get_unified_dashboard(
         provider_totals=provider_totals,
         attribution_summary=attribution_summary,
         attribution_feed=attribution_feed,
-        last_synced_at=last_synced_at_str
+        last_synced_at=last_synced_at_str,
+        section_timings_ms=section_timings,
+        incomplete_sections=incomplete_sections,
     )
@@ -30,7 +30,7 @@ from decimal import Decimal
 from typing import Optional, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
@@ -42,6 +42,7 @@ from app.models import (
 )
 from app.deps import get_current_user
 from app.schemas import KpiValue, SparkPoint
+from app.services.response_cache import cached_response
 
 logger = logging.getLogger(__name__)
 
@@ -340,6 +341,8 @@ def _get_platform_sparkline(
 )
 def get_dashboard_kpis(
     workspace_id: UUID,
+    request: Request,
+    response: Response,
     timeframe: str = Query(
         default="last_7_days",
         description="Time period: today, yesterday, last_7_days, last_30_days"
@@ -356,16 +359,34 @@ def get_dashboard_kpis(
     WHY: Sync SQLAlchemy in async endpoints blocks ALL concurrent requests.
     When User A runs a slow query, User B's requests are queued → crashes.
 
+    Served from the workspace response cache (see app/services/response_cache.py);
+    the cache is invalidated when snapshot or Shopify sync commits new data.
+    """
+    # Verify workspace access
+    if current_user.workspace_id != workspace_id:
+        raise HTTPException(status_code=403, detail="Access denied to this workspace")
+
+    return cached_response(
+        workspace_id,
+        "dashboard_kpis",
+        {"timeframe": timeframe},
+        lambda session: _build_dashboard_kpis(session, workspace_id, timeframe),
+        db,
+        request,
+        response,
+    )
+
+
+def _build_dashboard_kpis(db: Session, workspace_id: UUID, timeframe: str) -> DashboardKpisResponse:
+    """
+    Compute dashboard KPIs (uncached).
+
     Logic:
     1. Check if workspace has Shopify connection
     2. If YES: Revenue/Conversions from Shopify, Spend from platforms
     3. If NO: All metrics from platform data (fallback)
     4. ROAS computed from revenue/spend regardless of source
     """
-    # Verify workspace access
-    if current_user.workspace_id != workspace_id:
-        raise HTTPException(status_code=403, detail="Access denied to this workspace")
-
     # Get date range
     start, end = _get_date_range(timeframe)
     prev_start, prev_end = _get_previous_period(start, end)
@@ -10,6 +10,8 @@ from .. import schemas
 from ..database import get_db
 from ..deps import get_current_user
 from ..models import User, Entity, Connection
+from ..services.entity_hierarchy_service import sync_entity_ancestors
+from ..services.response_cache import bump_data_version
 
 
 router = APIRouter(
@@ -159,7 +161,13 @@ def create_entity(
     )
     
     db.add(entity)
+    db.flush()
+    # Closure rows for hierarchy rollups (descendant_ids, *_ancestors)
+    sync_entity_ancestors(
+        db, entity.id, entity.parent_id, entity.level, entity.workspace_id
+    )
     db.commit()
+    bump_data_version(entity.workspace_id)
     db.refresh(entity)
     return entity
 
@@ -231,8 +239,14 @@ def update_entity(
     update_data = payload.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(entity, field, value)
-    
+
+    # No-op unless parent_id/level changed
+    db.flush()
+    sync_entity_ancestors(
+        db, entity.id, entity.parent_id, entity.level, entity.workspace_id
+    )
     db.commit()
+    bump_data_version(entity.workspace_id)
     db.refresh(entity)
     return entity
 
@@ -321,5 +335,6 @@ def delete_entity(
     
     db.delete(entity)
     db.commit()
+    bump_data_version(current_user.workspace_id)
     
     return schemas.SuccessResponse(detail="Entity deleted successfully")
@@ -26,13 +26,14 @@ import uuid
 from datetime import datetime, date, timedelta
 from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session, aliased
 from sqlalchemy import func, literal_column, desc, asc, text
 
 from app.deps import get_current_user, get_db
 from app import models
-from app.dsl.hierarchy import adset_ancestor_cte
+from app.dsl.hierarchy import adset_ancestors
+from app.services.response_cache import cached_response
 from app.schemas import (
     EntityPerformanceResponse,
     EntityPerformanceMeta,
@@ -269,7 +270,7 @@ def _base_query(
         leaf = aliased(models.Entity)
         ancestor = aliased(models.Entity)
         connection_alias = aliased(models.Connection)
-        mapping = adset_ancestor_cte(db)
+        mapping = adset_ancestors(db, workspace_id)
         MS = models.MetricSnapshot
 
         # For adsets, we still need DISTINCT ON but it's more complex
@@ -548,6 +549,7 @@ def _fetch_trend(
     start: date,
     end: date,
     level: models.LevelEnum,
+    workspace_id: Optional[str] = None,
 ) -> dict[str, List[EntityTrendPoint]]:
     """
     Build trend series for entities.
@@ -614,7 +616,7 @@ def _fetch_trend(
         # For adsets, use hierarchy CTEs to roll up from leaf entities
         # This is more complex - use a subquery approach
         leaf = aliased(models.Entity)
-        mapping = adset_ancestor_cte(db)
+        mapping = adset_ancestors(db, workspace_id)
         MS = models.MetricSnapshot
 
         # Create subquery for latest snapshots per leaf entity per day
@@ -712,6 +714,8 @@ def _connection_platform_map(db: Session, workspace_id: str) -> dict[str, str]:
 @router.get("/list", response_model=EntityPerformanceResponse)
 def list_entities_performance(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
     entity_level: str = Query(..., description="campaign|adset"),
@@ -732,12 +736,68 @@ def list_entities_performance(
     WHAT: Returns paginated performance rows for campaigns/ad sets.
 
     WHY: Frontend campaigns list and detail pages use this data source exclusively.
+    Served from the workspace response cache (app/services/response_cache.py).
     """
 
     workspace_id = str(current_user.workspace_id)
     level = _resolve_entity_level(entity_level)
     # Allow campaign, adset, and ad levels
 
+    params = {
+        "entity_level": level.value,
+        "parent_id": parent_id,
+        "date_start": date_start,
+        "date_end": date_end,
+        "timeframe": timeframe,
+        "platform": platform,
+        "status": status,
+        "sort_by": sort_by,
+        "sort_dir": sort_dir,
+        "page": page,
+        "page_size": page_size,
+    }
+    return cached_response(
+        workspace_id,
+        "entity_performance_list",
+        params,
+        lambda session: _build_entities_performance(
+            session,
+            workspace_id,
+            level,
+            parent_id=parent_id,
+            date_start=date_start,
+            date_end=date_end,
+            timeframe=timeframe,
+            platform=platform,
+            status=status,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            page=page,
+            page_size=page_size,
+        ),
+        db,
+        request,
+        response,
+    )
+
+
+def _build_entities_performance(
+    db: Session,
+    workspace_id: str,
+    level: models.LevelEnum,
+    *,
+    parent_id: Optional[str],
+    date_start: Optional[date],
+    date_end: Optional[date],
+    timeframe: Optional[str],
+    platform: Optional[str],
+    status: Optional[str],
+    sort_by: str,
+    sort_dir: str,
+    page: int,
+    page_size: int,
+) -> EntityPerformanceResponse:
+    """Compute one page of entity performance rows (uncached)."""
     start, end = _date_range(date_start, date_end, timeframe)
     base = _base_query(
         db=db,
@@ -768,7 +828,9 @@ def list_entities_performance(
 
     trend_metric = "revenue" if sort_by == "revenue" else "roas"
     entity_ids = [row.entity_id for row in rows]
-    trend_series = _fetch_trend(db, entity_ids, trend_metric, start, end, level)
+    trend_series = _fetch_trend(
+        db, entity_ids, trend_metric, start, end, level, workspace_id
+    )
 
     response_rows: List[EntityPerformanceRow] = []
     # For campaign rows, determine a simple kind label (e.g., PMax) based on children
@@ -903,7 +965,10 @@ def list_child_entities(
 
     trend_metric = "revenue" if sort_by == "revenue" else "roas"
     entity_ids = [row.entity_id for row in rows]
-    trend_series = _fetch_trend(db, entity_ids, trend_metric, start, end, child_level)
+    trend_series = _fetch_trend(
+        db, entity_ids, trend_metric, start, end, child_level,
+        str(current_user.workspace_id),
+    )
 
     response_rows = []
     for row in rows:
@@ -33,8 +33,11 @@ import logging
 from ..database import get_db
 from ..deps import get_current_user
 from ..schemas import MetricFactCreate, MetricFactIngestResponse, UserOut
-from ..models import MetricFact, Entity, Import, Fetch, Connection, Workspace
+from ..models import MetricFact, Entity, Import, Fetch, Connection
 from app.services.sync_comparison import has_metrics_changed
+from app.services.workspace_cache import workspace_cache
+from app.services.entity_hierarchy_service import sync_entity_ancestors
+from app.services.response_cache import bump_data_version
 
 logger = logging.getLogger(__name__)
 
@@ -73,9 +76,8 @@ def ingest_metrics_internal(
     Returns:
         Dict with ingested/skipped/errors counts
     """
-    # Verify workspace exists
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
-    if not workspace:
+    # Verify workspace exists (cached)
+    if not workspace_cache.exists(db, workspace_id):
         raise ValueError(f"Workspace {workspace_id} not found")
 
     ingested = 0
@@ -223,6 +225,10 @@ def ingest_metrics_internal(
             logger.error(f"[INGEST] Final commit failed: {e}")
             errors.append(f"Final commit failed: {str(e)}")
 
+    if ingested:
+        # New facts are committed: refresh cached dashboard/KPIs
+        bump_data_version(workspace_id)
+
     logger.info(f"[INGEST] Complete: {ingested} ingested, {skipped} skipped, {len(errors)} errors")
     
     return {
@@ -277,6 +283,9 @@ def _get_or_create_entity(
     
     db.add(entity)
     db.flush()  # Get ID without committing
+
+    # Self row in entity_ancestors so hierarchy rollups see the placeholder
+    sync_entity_ancestors(db, entity.id, None, level, workspace_id)
     
     logger.info(f"[INGEST] Created placeholder entity: {entity.id} ({external_id})")
     
@@ -406,9 +415,8 @@ def ingest_metrics(
     - Can be used for manual testing/backfills
     """
     
-    # Verify workspace exists and user has access
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
-    if not workspace:
+    # Verify workspace exists (cached) and user has access
+    if not workspace_cache.exists(db, workspace_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workspace {workspace_id} not found"
@@ -529,6 +537,10 @@ def ingest_metrics(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to commit ingestion: {str(e)}"
         )
+
+    if ingested:
+        # New facts are committed: refresh cached dashboard/KPIs
+        bump_data_version(workspace_id)
     
     return MetricFactIngestResponse(
         success=len(errors) == 0,
@@ -15,14 +15,15 @@ Design choices:
 from datetime import date, timedelta
 from typing import Optional, List, Union
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from app.database import get_db
 from app import models
 from app.schemas import KpiRequest, KpiValue, TimeRange, SparkPoint
 from app.metrics.registry import compute_metric, get_required_bases, is_base_measure
-from app.dsl.hierarchy import campaign_ancestor_cte
+from app.dsl.hierarchy import descendant_ids
+from app.services.response_cache import cached_response
 
 router = APIRouter(prefix="/workspaces", tags=["kpis"])
 
@@ -67,30 +68,15 @@ def _resolve_campaign_descendants(db: Session, workspace_id: str, campaign_id: s
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found in workspace")
 
-    mapping = campaign_ancestor_cte(db)
-    descendants = (
-        db.query(mapping.c.leaf_id)
-        .filter(mapping.c.ancestor_id == campaign_uuid)
-        .all()
-    )
-
-    ids = [str(row.leaf_id) for row in descendants]
-    # Include the campaign itself in case it has direct metric facts
-    ids.append(str(campaign_uuid))
-
-    # Remove duplicates while preserving order
-    seen = set()
-    ordered_ids = []
-    for entity_id in ids:
-        if entity_id not in seen:
-            seen.add(entity_id)
-            ordered_ids.append(entity_id)
-    return ordered_ids
+    # Campaign itself (depth 0) included in case it has direct metric facts
+    return descendant_ids(db, campaign_uuid, include_self=True)
 
 @router.post("/{workspace_id}/kpis", response_model=List[KpiValue])
 def get_workspace_kpis(
     workspace_id: str,
     req: KpiRequest,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     provider: Optional[str] = Query(default=None, description="Optional provider filter (google/meta/tiktok/other/mock)"),
     level: Optional[str] = Query(default=None, description="Optional entity level filter (campaign/adset/ad/...)"),
@@ -100,6 +86,45 @@ def get_workspace_kpis(
 ):
     """
     Aggregate KPI metrics across a workspace using UnifiedMetricService.
+
+    Served from the workspace response cache (app/services/response_cache.py),
+    keyed by the request body, filters and the resolved date range (relative
+    ranges roll over with the date they resolve against).
+    """
+    params = {
+        "req": req.model_dump(mode="json"),
+        "range": _daterange(req.time_range),
+        "provider": provider,
+        "level": level,
+        "entity_name": entity_name,
+        "only_active": only_active,
+        "campaign_id": campaign_id,
+    }
+    return cached_response(
+        workspace_id,
+        "kpis",
+        params,
+        lambda session: _compute_workspace_kpis(
+            session, workspace_id, req, provider, level, entity_name, only_active, campaign_id
+        ),
+        db,
+        request,
+        response,
+    )
+
+
+def _compute_workspace_kpis(
+    db: Session,
+    workspace_id: str,
+    req: KpiRequest,
+    provider: Optional[str],
+    level: Optional[str],
+    entity_name: Optional[str],
+    only_active: bool,
+    campaign_id: Optional[str],
+) -> List[KpiValue]:
+    """
+    Compute workspace KPIs (uncached).
     
     REFACTORED: Now uses UnifiedMetricService for consistent calculations
     across all endpoints (QA, KPI, entity performance, finance).
@@ -113,7 +138,11 @@ def get_workspace_kpis(
       - PnL remains for EOD locks & heavy reports later.
     """
     # Import UnifiedMetricService
-    from app.services.unified_metric_service import UnifiedMetricService, MetricFilters
+    from app.services.unified_metric_service import (
+        UnifiedMetricService,
+        MetricFilters,
+        SummaryRequest,
+    )
     from app.dsl.schema import TimeRange as DSLTimeRange
     
     # Initialize service
@@ -145,14 +174,19 @@ def get_workspace_kpis(
         metric_filters=None
     )
     
-    # Get summary metrics
-    summary_result = service.get_summary(
+    # Get summary metrics (current + previous period in a single query)
+    summary_result = service.get_summaries_batch(
         workspace_id=workspace_id,
-        metrics=req.metrics,
-        time_range=time_range,
-        filters=filters,
-        compare_to_previous=req.compare_to_previous
-    )
+        requests=[
+            SummaryRequest(
+                metrics=req.metrics,
+                time_range=time_range,
+                filters=filters,
+                compare_to_previous=req.compare_to_previous,
+                include_workspace_avg=False,  # Not part of the KPI response
+            )
+        ],
+    )[0]
     
     # Get sparkline data if requested
     sparklines = {}
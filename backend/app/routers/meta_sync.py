@@ -18,7 +18,7 @@ from __future__ import annotations
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -34,6 +34,7 @@ from app.services.meta_sync_service import (
     sync_meta_entities,
     sync_meta_metrics,
 )
+from app.services.rate_limit_backend import RateLimitExceededError
 from app.services.snapshot_sync_service import sync_snapshots_for_connection
 
 logger = logging.getLogger(__name__)
@@ -111,11 +112,14 @@ async def sync_entities(
         workspace_id,
         connection_id,
     )
-    return sync_meta_entities(
-                    db=db,
-        workspace_id=workspace_id,
-        connection_id=connection_id,
-    )
+    try:
+        return sync_meta_entities(
+            db=db,
+            workspace_id=workspace_id,
+            connection_id=connection_id,
+        )
+    except RateLimitExceededError as e:
+        raise _rate_limited(e) from e
 
 
 @router.post("/sync-metrics", response_model=MetricsSyncResponse)
@@ -132,10 +136,23 @@ async def sync_metrics(
         workspace_id,
         connection_id,
     )
-    return sync_meta_metrics(
-        db=db,
-                                workspace_id=workspace_id,
-        connection_id=connection_id,
-        request=request,
+    try:
+        return sync_meta_metrics(
+            db=db,
+            workspace_id=workspace_id,
+            connection_id=connection_id,
+            request=request,
         )
+    except RateLimitExceededError as e:
+        raise _rate_limited(e) from e
+
+
+def _rate_limited(error: RateLimitExceededError) -> HTTPException:
+    """429 for an exhausted Meta account budget, with Retry-After."""
+    retry_seconds = int(error.retry_seconds) + 1
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=f"Meta rate limit reached. Retry in {retry_seconds}s",
+        headers={"Retry-After": str(retry_seconds)},
+    )
 
@@ -10,18 +10,24 @@ WHY:
     that we use to attribute orders to marketing campaigns.
     Real-time streaming lets merchants see customer activity as it happens.
 
+    POST /v1/pixel-events/batch accepts many events per request and hands them
+    to the write-behind buffer (services/pixel_event_buffer.py), which stores
+    them with multi-row inserts instead of one transaction per event.
+
 REFERENCES:
     - docs/living-docs/ATTRIBUTION_ENGINE.md
     - Shopify Web Pixels API: https://shopify.dev/docs/api/web-pixels-api
     - backend/app/services/pixel_websocket_manager.py (WebSocket manager)
+    - backend/app/services/pixel_event_buffer.py (batched write-behind ingestion)
     - ui/hooks/usePixelStream.js (frontend consumer)
 """
 
 import asyncio
 import json
 import logging
+import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, WebSocket, WebSocketDisconnect, status
@@ -33,12 +39,18 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.deps import authenticate_websocket
 from app.models import (
-    Workspace,
     PixelEvent,
     CustomerJourney,
     JourneyTouchpoint,
 )
+from app.services.pixel_event_buffer import (
+    PIXEL_BUFFER_MAX_EVENTS,
+    TOUCHPOINT_EVENT_TYPES,
+    broadcast_payload,
+    pixel_event_buffer,
+)
 from app.services.pixel_websocket_manager import pixel_ws_manager
+from app.services.workspace_cache import workspace_cache
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +145,29 @@ class PixelEventResponse(BaseModel):
     journey_id: Optional[str] = Field(None, description="Associated journey ID")
 
 
+class PixelEventBatchRequest(BaseModel):
+    """Request body for batched pixel events.
+
+    WHAT: Up to PIXEL_BUFFER_MAX_EVENTS events, in the order they happened
+    WHY: Lets the pixel flush its queue in one request during traffic spikes
+    """
+    events: List[PixelEventRequest] = Field(
+        ..., min_length=1, max_length=PIXEL_BUFFER_MAX_EVENTS,
+        description="Pixel events in occurrence order",
+    )
+
+
+class PixelEventBatchResponse(BaseModel):
+    """Response for batched pixel events.
+
+    WHAT: How many events were queued for storage and how many were rejected
+    WHY: Events are written behind, so per-event dedup status isn't known yet
+    """
+    status: str = Field(..., description="accepted")
+    accepted: int = Field(..., description="Events queued for storage")
+    rejected: int = Field(0, description="Events with an unknown or invalid workspace_id")
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -162,11 +197,52 @@ def _is_touchpoint_event(event_type: str) -> bool:
     WHY: We track attribution at key conversion points, not every page view
     """
     # Create touchpoint for page_viewed (first visit captures UTMs) and checkout events
-    return event_type in [
-        "page_viewed",
-        "checkout_started",
-        "checkout_completed",
-    ]
+    return event_type in TOUCHPOINT_EVENT_TYPES
+
+
+def _parse_event_ts(ts: Optional[str]) -> datetime:
+    """Parse the pixel's ISO 8601 timestamp, falling back to now."""
+    if ts:
+        try:
+            return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    return datetime.utcnow()
+
+
+def _pixel_event_values(payload: PixelEventRequest, workspace_id: UUID) -> Dict[str, Any]:
+    """Build PixelEvent column values for a request payload.
+
+    WHAT: Flattens attribution/context into columns and assigns the event id
+    WHY: Shared by the single-event path (ORM insert) and the batch buffer
+         (multi-row insert, which matches stored rows back by pre-assigned id)
+    """
+    attr = payload.attribution
+    ctx = payload.context
+
+    return {
+        "id": uuid.uuid4(),
+        "workspace_id": workspace_id,
+        "visitor_id": payload.visitor_id,
+        "event_id": payload.event_id,
+        "event_type": payload.event,
+        "event_data": payload.data or {},
+        # Attribution fields
+        "utm_source": attr.utm_source if attr else None,
+        "utm_medium": attr.utm_medium if attr else None,
+        "utm_campaign": attr.utm_campaign if attr else None,
+        "utm_content": attr.utm_content if attr else None,
+        "utm_term": attr.utm_term if attr else None,
+        "fbclid": attr.fbclid if attr else None,
+        "gclid": attr.gclid if attr else None,
+        "ttclid": attr.ttclid if attr else None,
+        "landing_page": attr.landing_page if attr else None,
+        # Context
+        "url": ctx.url if ctx else None,
+        "referrer": ctx.referrer if ctx else None,
+        # Timestamp
+        "created_at": _parse_event_ts(payload.ts),
+    }
 
 
 def _get_or_create_journey(
@@ -291,8 +367,8 @@ async def receive_pixel_event(
             detail="Invalid workspace_id format"
         )
 
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
-    if not workspace:
+    # Cached: workspaces rarely change, and unknown ids are negative-cached
+    if not workspace_cache.exists(db, workspace_id):
         logger.warning(f"[PIXEL] Unknown workspace_id: {payload.workspace_id}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -318,42 +394,14 @@ async def receive_pixel_event(
             )
             return add_cors_headers(response, origin)
 
-    # 3. Parse timestamp
-    event_ts = None
-    if payload.ts:
-        try:
-            event_ts = datetime.fromisoformat(payload.ts.replace("Z", "+00:00"))
-        except ValueError:
-            event_ts = datetime.utcnow()
-    else:
-        event_ts = datetime.utcnow()
-
-    # 4. Store PixelEvent (immutable log for event sourcing)
+    # 3-4. Parse timestamp and store PixelEvent (immutable log for event sourcing)
     attr = payload.attribution
     ctx = payload.context
 
-    pixel_event = PixelEvent(
-        workspace_id=workspace_id,
-        visitor_id=payload.visitor_id,
-        event_id=payload.event_id,
-        event_type=payload.event,
-        event_data=payload.data or {},
-        # Attribution fields
-        utm_source=attr.utm_source if attr else None,
-        utm_medium=attr.utm_medium if attr else None,
-        utm_campaign=attr.utm_campaign if attr else None,
-        utm_content=attr.utm_content if attr else None,
-        utm_term=attr.utm_term if attr else None,
-        fbclid=attr.fbclid if attr else None,
-        gclid=attr.gclid if attr else None,
-        ttclid=attr.ttclid if attr else None,
-        landing_page=attr.landing_page if attr else None,
-        # Context
-        url=ctx.url if ctx else None,
-        referrer=ctx.referrer if ctx else None,
-        # Timestamp
-        created_at=event_ts,
-    )
+    event_values = _pixel_event_values(payload, workspace_id)
+    event_ts = event_values["created_at"]
+
+    pixel_event = PixelEvent(**event_values)
     db.add(pixel_event)
     db.flush()  # Get ID
 
@@ -436,17 +484,7 @@ async def receive_pixel_event(
     # 9. Broadcast to connected WebSocket clients (fire-and-forget)
     # WHY: Real-time feed on attribution page — viewers see events as they arrive
     try:
-        await pixel_ws_manager.broadcast(workspace_id, {
-            "type": "pixel_event",
-            "id": str(pixel_event.id),
-            "event_type": pixel_event.event_type,
-            "visitor_id": pixel_event.visitor_id,
-            "url": pixel_event.url,
-            "utm_source": pixel_event.utm_source,
-            "utm_medium": pixel_event.utm_medium,
-            "utm_campaign": pixel_event.utm_campaign,
-            "created_at": pixel_event.created_at.isoformat(),
-        })
+        await pixel_ws_manager.broadcast(workspace_id, broadcast_payload(event_values))
     except Exception as e:
         # Never let broadcast failure affect pixel ingestion
         logger.warning(f"[PIXEL] WebSocket broadcast failed: {e}")
@@ -464,6 +502,78 @@ async def receive_pixel_event(
     return add_cors_headers(response, origin)
 
 
+@router.options("/pixel-events/batch")
+async def pixel_events_batch_preflight(request: Request):
+    """Handle CORS preflight for batched pixel events."""
+    response = Response(status_code=200)
+    origin = request.headers.get("origin", "*")
+    return add_cors_headers(response, origin)
+
+
+@router.post("/pixel-events/batch", response_model=PixelEventBatchResponse)
+async def receive_pixel_event_batch(
+    request: Request,
+    payload: PixelEventBatchRequest,
+    db: Session = Depends(get_db),
+):
+    """Receive a batch of events from the Shopify Web Pixel Extension.
+
+    WHAT:
+        Validates the batch's workspaces with one query and queues the events
+        on the write-behind buffer. Dedup, journey updates, touchpoints and
+        the WebSocket broadcast happen when the buffer flushes (size or time
+        threshold), in the order the events appear in the batch.
+
+    WHY:
+        Per-event transactions on /pixel-events don't keep up during flash
+        sales; the buffer stores hundreds of events per transaction.
+
+    Args:
+        payload: PixelEventBatchRequest with events in occurrence order
+        db: Database session
+
+    Returns:
+        PixelEventBatchResponse with accepted/rejected counts
+    """
+    # 1. Validate workspaces (cached; one query for all cache misses)
+    workspace_ids: Dict[str, Optional[UUID]] = {}
+    for event in payload.events:
+        if event.workspace_id not in workspace_ids:
+            try:
+                workspace_ids[event.workspace_id] = UUID(event.workspace_id)
+            except ValueError:
+                logger.warning(f"[PIXEL] Invalid workspace_id format: {event.workspace_id}")
+                workspace_ids[event.workspace_id] = None
+
+    known_ids = workspace_cache.filter_existing(
+        db, [ws_id for ws_id in workspace_ids.values() if ws_id]
+    )
+
+    # 2. Queue valid events in arrival order
+    events = []
+    for event in payload.events:
+        workspace_id = workspace_ids[event.workspace_id]
+        if workspace_id in known_ids:
+            events.append(_pixel_event_values(event, workspace_id))
+
+    rejected = len(payload.events) - len(events)
+    if rejected:
+        logger.warning(f"[PIXEL] Rejected {rejected} batched events with unknown workspace")
+
+    await pixel_event_buffer.add(events)
+
+    from fastapi.responses import JSONResponse
+    origin = request.headers.get("origin", "*")
+    response = JSONResponse(
+        content={
+            "status": "accepted",
+            "accepted": len(events),
+            "rejected": rejected,
+        }
+    )
+    return add_cors_headers(response, origin)
+
+
 # =============================================================================
 # WEBSOCKET ENDPOINT — Real-Time Pixel Event Stream
 # =============================================================================
@@ -33,7 +33,7 @@ from datetime import timedelta
 
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -838,17 +838,26 @@ def ask_question_agent(
 @router.get("/agent/stream/{job_id}")
 async def stream_agent_response(
     job_id: str,
+    offset: Optional[str] = Query(None, description="Stream entry id to resume after"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
     current_user=Depends(get_current_user),
 ):
     """
     GET /qa/agent/stream/{job_id}
 
-    SSE endpoint for streaming agent responses via Redis Pub/Sub.
+    SSE endpoint for streaming agent responses via Redis Streams (or Pub/Sub
+    when AGENT_STREAM_TRANSPORT=pubsub).
 
     WHAT:
-        Subscribes to Redis Pub/Sub channel for the job and forwards events.
+        Reads the job's event stream and forwards events.
         Provides real-time typing effect for agent answers.
 
+    RESUME:
+        Each event carries an SSE `id:` (its stream entry id). A reconnecting
+        EventSource sends it back as Last-Event-ID, and `?offset=` does the
+        same for plain fetch clients; events after that id are replayed.
+        Without either, a late subscriber replays the job from the start.
+
     Events:
         - {"type": "thinking", "data": {"text": "..."}}        - Agent is processing
         - {"type": "tool_call", "data": {"tool": "...", ...}}  - Tool being called
@@ -872,10 +881,10 @@ async def stream_agent_response(
 
     async def event_generator():
         """
-        Async generator that yields SSE events from Redis Pub/Sub.
+        Async generator that yields SSE events from Redis.
 
         Flow:
-        1. Subscribe to Redis channel for this job
+        1. Read the job's Redis stream (or subscribe to its channel)
         2. Also poll job.meta as fallback (if pub/sub fails)
         3. Forward events to client
         4. Close when done/error received
@@ -888,17 +897,20 @@ async def stream_agent_response(
             # Try to subscribe to Redis pub/sub channel
             subscriber = None
             try:
-                subscriber = create_subscriber(job_id)
+                subscriber = create_subscriber(job_id, offset=last_event_id or offset)
                 logger.info(f"[QA_AGENT] SSE subscriber created for job {job_id}")
             except Exception as e:
                 logger.warning(f"[QA_AGENT] Failed to create subscriber: {e}")
 
             # Fallback: poll job meta if no subscriber
             if subscriber:
-                # Use Redis Pub/Sub for real-time streaming
+                # Use Redis Streams / Pub/Sub for real-time streaming
                 for event in subscriber.listen():
-                    # Forward event to SSE
-                    yield f"data: {event.to_json()}\n\n"
+                    # Forward event to SSE (with its resume id, if any)
+                    if event.event_id:
+                        yield f"id: {event.event_id}\ndata: {event.to_json()}\n\n"
+                    else:
+                        yield f"data: {event.to_json()}\n\n"
 
                     if event.is_final:
                         break
@@ -1166,6 +1178,7 @@ async def ask_question_agent_sse(
                             "data": result.get("data"),
                             "tool_calls_made": result.get("tool_calls_made", []),
                             "iterations": result.get("iterations", 1),
+                            "memo": result.get("memo"),
                         }
 
                         if result.get("error"):
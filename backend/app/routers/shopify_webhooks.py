@@ -30,11 +30,13 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, status, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.database import get_db
+from app.services.response_cache import bump_data_version
 from app.models import (
     Connection,
     ProviderEnum,
@@ -330,6 +332,7 @@ async def handle_customer_redact(
             # Delete the customer record
             db.delete(customer)
             db.commit()
+            await run_in_threadpool(bump_data_version, shop.workspace_id)
 
             logger.info(
                 f"[SHOPIFY_WEBHOOK] Deleted customer record for customer_id={customer_id}"
@@ -450,6 +453,7 @@ async def handle_shop_redact(
             logger.info(f"[SHOPIFY_WEBHOOK] Deleted Connection record")
 
         db.commit()
+        await run_in_threadpool(bump_data_version, workspace_id)
 
         logger.info(
             f"[SHOPIFY_WEBHOOK] Successfully redacted all data for shop={shop_domain}"
@@ -649,6 +653,10 @@ async def handle_orders_paid(
         referring_site=referring_site,
     )
 
+    # New order + attribution are committed: refresh cached dashboard/KPIs
+    # (sync Redis call, kept off the event loop)
+    await run_in_threadpool(bump_data_version, workspace_id)
+
     # Convert to dict for CAPI/Conversions and response
     attribution_result = {
         "provider": attr_result.provider,
@@ -30,6 +30,7 @@ from ..models import (
     BillingPlanEnum,
 )
 from ..services.workspace_factory import create_workspace_with_trial, generate_workspace_name
+from ..services.workspace_cache import workspace_cache
 
 # =============================================================================
 # BILLING CAPS CONFIGURATION
@@ -1303,6 +1304,8 @@ def delete_workspace(
         db.delete(workspace)
 
         db.commit()
+        # Stop pixel/ingest validation from accepting the deleted workspace
+        workspace_cache.invalidate(workspace_id)
     except IntegrityError as exc:
         db.rollback()
         raise HTTPException(
@@ -30,6 +30,7 @@ from sqlalchemy.dialects.postgresql import insert
 
 from app.database import SessionLocal
 from app import models
+from app.services.entity_hierarchy_service import rebuild_entity_ancestors
 
 
 # =============================================================================
@@ -1480,6 +1481,9 @@ def seed_demo():
             print("\n9. Committing to database...")
             db.commit()
 
+            # Hierarchy closure rows (entities are added directly, not via the sync upserts)
+            rebuild_entity_ancestors(db, workspace.id)
+
             print("\n" + "=" * 70)
             print(" SEED COMPLETE!")
             print("=" * 70)
@@ -22,6 +22,7 @@ from app import models
 from app.security import get_password_hash
 from app.services.token_service import store_connection_token
 from app.services.compute_service import run_compute_snapshot
+from app.services.entity_hierarchy_service import rebuild_entity_ancestors
 
 
 def generate_hourly_curve(hour: int) -> float:
@@ -364,6 +365,9 @@ def seed():
                 db.add(ad)
         
         db.flush()
+
+        # Hierarchy closure rows (entities are added directly, not via the sync upserts)
+        rebuild_entity_ancestors(db, workspace.id)
         
         # 6. Generate MetricFact data
         print("📊 Generating metric facts...")
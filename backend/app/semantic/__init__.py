@@ -82,6 +82,7 @@ COMPONENTS
 - validator.py: Multi-layer validation pipeline
 - compiler.py: Query to data compilation
 - telemetry.py: Pipeline observability
+- plan_cache.py: Validation/plan/result cache for repeated question shapes
 - errors.py: Error classification and user-friendly messages
 
 USAGE
@@ -169,6 +170,7 @@ from app.semantic.model import (
 from app.semantic.compiler import (
     SemanticCompiler,
     CompilationResult,
+    CompiledPlan,
     EntityComparisonItem,
     EntityTimeseriesItem,
     compile_query,
@@ -180,8 +182,16 @@ from app.semantic.telemetry import (
     QueryMetrics,
     TelemetryEvent,
     EventType,
+    LatencySketch,
     get_telemetry,
     set_telemetry,
+    read_merged_latency,
+    read_merged_cache_stats,
+)
+
+from app.semantic.plan_cache import (
+    SemanticPlanCache,
+    query_fingerprint,
 )
 
 from app.semantic.prompts import (
@@ -224,6 +234,7 @@ __all__ = [
     # Compiler components (compiler.py)
     "SemanticCompiler",
     "CompilationResult",
+    "CompiledPlan",
     "EntityComparisonItem",
     "EntityTimeseriesItem",
     "compile_query",
@@ -233,8 +244,14 @@ __all__ = [
     "QueryMetrics",
     "TelemetryEvent",
     "EventType",
+    "LatencySketch",
     "get_telemetry",
     "set_telemetry",
+    "read_merged_latency",
+    "read_merged_cache_stats",
+    # Plan cache (plan_cache.py)
+    "SemanticPlanCache",
+    "query_fingerprint",
     # Prompt components (prompts.py)
     "build_semantic_system_prompt",
     "build_semantic_few_shot_prompt",
@@ -36,9 +36,9 @@ COMPILATION STRATEGIES
 ----------------------
 The compiler uses different strategies based on query composition:
 
-1. Summary: Just metrics → get_summary()
+1. Summary: Just metrics → get_summaries_batch()
 2. Breakdown: Metrics + breakdown → get_breakdown()
-3. Comparison: Metrics + comparison → get_summary(compare=True)
+3. Comparison: Metrics + comparison → get_summaries_batch(compare_to_previous=True)
 4. Entity Comparison: Breakdown + comparison → get_entity_comparison() [KEY!]
 5. Timeseries: Metrics + timeseries → get_timeseries()
 6. Entity Timeseries: Breakdown + timeseries → get_entity_timeseries()
@@ -58,7 +58,7 @@ RELATED FILES
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field as dataclass_field
+from dataclasses import dataclass, field as dataclass_field, replace
 from datetime import date, timedelta
 from typing import Dict, List, Optional, Any
 
@@ -78,6 +78,7 @@ from app.services.unified_metric_service import (
     MetricSummary,
     MetricBreakdownItem,
     MetricTimePoint,
+    SummaryRequest,
 )
 from app.dsl.schema import TimeRange as DslTimeRange
 
@@ -313,6 +314,27 @@ class CompilationResult:
         return result
 
 
+@dataclass
+class CompiledPlan:
+    """
+    Execution plan for a SemanticQuery.
+
+    WHAT: Everything compile() derives from the query before touching the
+    database: the strategy, the service filters and the resolved time range.
+
+    WHY: The plan depends only on the query and today's date, so it can be
+    reused for repeated question shapes (app/semantic/plan_cache.py).
+
+    PARAMETERS:
+        strategy: Compilation strategy (entity_comparison, summary, ...)
+        filters: MetricFilters for UnifiedMetricService calls
+        time_range_resolved: Actual dates (after resolving relative ranges)
+    """
+    strategy: str
+    filters: MetricFilters
+    time_range_resolved: Dict[str, str]
+
+
 # =============================================================================
 # COMPILER IMPLEMENTATION
 # =============================================================================
@@ -365,7 +387,12 @@ class SemanticCompiler:
         self.db = db
         self.service = UnifiedMetricService(db)
 
-    def compile(self, workspace_id: str, query: SemanticQuery) -> CompilationResult:
+    def compile(
+        self,
+        workspace_id: str,
+        query: SemanticQuery,
+        plan: Optional[CompiledPlan] = None,
+    ) -> CompilationResult:
         """
         Compile and execute a SemanticQuery.
 
@@ -376,6 +403,7 @@ class SemanticCompiler:
         PARAMETERS:
             workspace_id: UUID of the workspace (security scope)
             query: Validated SemanticQuery object
+            plan: Plan from plan(query), e.g. a cached one (built when omitted)
 
         RETURNS:
             CompilationResult with all requested data
@@ -405,84 +433,102 @@ class SemanticCompiler:
         """
         logger.info(f"[COMPILER] Compiling query: {query.describe()}")
 
-        # Resolve time range for metadata
-        time_range_resolved = self._resolve_time_range_dict(query.time_range)
+        if plan is None:
+            plan = self.plan(query)
+        logger.info(f"[COMPILER] Strategy: {plan.strategy}")
 
         # Initialize result
         result = CompilationResult(
             query=query,
-            time_range_resolved=time_range_resolved,
+            compilation_strategy=plan.strategy,
+            time_range_resolved=dict(plan.time_range_resolved),
         )
 
-        # Convert semantic filters to MetricFilters
-        filters = self._build_filters(query)
+        # Strategies may adjust filters; keep the (possibly cached) plan intact
+        strategy = getattr(self, f"_compile_{plan.strategy}")
+        strategy(workspace_id, query, replace(plan.filters), result)
 
-        # Choose compilation strategy based on query composition
-        # Order matters: most specific first
+        # Workspace average for context is filled in by _fetch_summary, from the
+        # same batched query as the summary itself (no extra round trip).
 
-        if query.needs_entity_comparison():
-            # THE KEY FEATURE: breakdown + comparison
-            logger.info("[COMPILER] Strategy: entity_comparison (breakdown + comparison)")
-            result.compilation_strategy = "entity_comparison"
-            self._compile_entity_comparison(workspace_id, query, filters, result)
+        logger.info(f"[COMPILER] Compilation complete: strategy={result.compilation_strategy}")
+        return result
 
-        elif query.needs_entity_timeseries():
-            # breakdown + timeseries = multi-line chart
-            logger.info("[COMPILER] Strategy: entity_timeseries (breakdown + timeseries)")
-            result.compilation_strategy = "entity_timeseries"
-            self._compile_entity_timeseries(workspace_id, query, filters, result)
+    def plan(self, query: SemanticQuery) -> CompiledPlan:
+        """
+        Build the execution plan for a query without running it.
 
-        elif query.needs_provider_breakdown():
-            # breakdown by provider
-            logger.info("[COMPILER] Strategy: provider_breakdown")
-            result.compilation_strategy = "provider_breakdown"
-            self._compile_provider_breakdown(workspace_id, query, filters, result)
+        WHAT: Resolves the time range, converts filters and selects the
+        compilation strategy (see STRATEGY SELECTION in compile()).
 
-        elif query.needs_time_breakdown():
-            # breakdown by time (day/week/month)
-            logger.info("[COMPILER] Strategy: time_breakdown")
-            result.compilation_strategy = "time_breakdown"
-            self._compile_time_breakdown(workspace_id, query, filters, result)
+        WHY: Separating planning from execution lets callers cache plans
+        for repeated question shapes.
 
-        elif query.has_breakdown():
-            # Entity breakdown without comparison/timeseries
-            logger.info("[COMPILER] Strategy: entity_breakdown")
-            result.compilation_strategy = "entity_breakdown"
-            self._compile_entity_breakdown(workspace_id, query, filters, result)
+        PARAMETERS:
+            query: Validated SemanticQuery object
 
+        RETURNS:
+            CompiledPlan for compile(workspace_id, query, plan=...)
+        """
+        # Order matters: most specific first
+        if query.needs_entity_comparison():
+            strategy = "entity_comparison"  # THE KEY FEATURE: breakdown + comparison
+        elif query.needs_entity_timeseries():
+            strategy = "entity_timeseries"  # breakdown + timeseries = multi-line chart
+        elif query.needs_provider_breakdown():
+            strategy = "provider_breakdown"
+        elif query.needs_time_breakdown():
+            strategy = "time_breakdown"  # breakdown by time (day/week/month)
+        elif query.has_breakdown():
+            strategy = "entity_breakdown"  # without comparison/timeseries
         elif query.has_comparison():
-            # Comparison without breakdown
-            logger.info("[COMPILER] Strategy: comparison")
-            result.compilation_strategy = "comparison"
-            self._compile_comparison(workspace_id, query, filters, result)
-
+            strategy = "comparison"  # without breakdown
         elif query.include_timeseries:
-            # Timeseries without breakdown
-            logger.info("[COMPILER] Strategy: timeseries")
-            result.compilation_strategy = "timeseries"
-            self._compile_timeseries(workspace_id, query, filters, result)
-
+            strategy = "timeseries"  # without breakdown
         else:
-            # Simple summary
-            logger.info("[COMPILER] Strategy: summary")
-            result.compilation_strategy = "summary"
-            self._compile_summary(workspace_id, query, filters, result)
-
-        # Get workspace average for context (always useful)
-        if query.metrics:
-            result.workspace_avg = self.service.get_workspace_average(
-                workspace_id=workspace_id,
-                metric=query.get_primary_metric(),
-                time_range=self._to_dsl_time_range(query.time_range),
-            )
+            strategy = "summary"
 
-        logger.info(f"[COMPILER] Compilation complete: strategy={result.compilation_strategy}")
-        return result
+        return CompiledPlan(
+            strategy=strategy,
+            filters=self._build_filters(query),
+            time_range_resolved=self._resolve_time_range_dict(query.time_range),
+        )
 
     # -------------------------------------------------------------------------
     # Compilation Strategies
     # -------------------------------------------------------------------------
 
+    def _fetch_summary(
+        self,
+        workspace_id: str,
+        query: SemanticQuery,
+        filters: MetricFilters,
+        compare_to_previous: bool,
+        result: CompilationResult,
+    ) -> MetricSummary:
+        """
+        Fetch the overall summary and workspace average in one batched query.
+
+        WHAT: Current period, optional previous period and the workspace average
+        for the primary metric, via UnifiedMetricService.get_summaries_batch.
+
+        WHY: get_summary + get_workspace_average cost up to three round trips
+        for every compiled query.
+        """
+        summary = self.service.get_summaries_batch(
+            workspace_id=workspace_id,
+            requests=[
+                SummaryRequest(
+                    metrics=query.metrics,
+                    time_range=self._to_dsl_time_range(query.time_range),
+                    filters=filters,
+                    compare_to_previous=compare_to_previous,
+                )
+            ],
+        )[0]
+        result.workspace_avg = summary.workspace_avg
+        return summary
+
     def _compile_summary(
         self,
         workspace_id: str,
@@ -503,12 +549,8 @@ class SemanticCompiler:
         """
         logger.info(f"[COMPILER] Compiling summary for metrics: {query.metrics}")
 
-        summary = self.service.get_summary(
-            workspace_id=workspace_id,
-            metrics=query.metrics,
-            time_range=self._to_dsl_time_range(query.time_range),
-            filters=filters,
-            compare_to_previous=False,
+        summary = self._fetch_summary(
+            workspace_id, query, filters, False, result
         )
 
         result.summary = summary.metrics
@@ -533,12 +575,8 @@ class SemanticCompiler:
         """
         logger.info(f"[COMPILER] Compiling comparison for metrics: {query.metrics}")
 
-        summary = self.service.get_summary(
-            workspace_id=workspace_id,
-            metrics=query.metrics,
-            time_range=self._to_dsl_time_range(query.time_range),
-            filters=filters,
-            compare_to_previous=True,
+        summary = self._fetch_summary(
+            workspace_id, query, filters, True, result
         )
 
         result.summary = summary.metrics
@@ -589,12 +627,8 @@ class SemanticCompiler:
         logger.info(f"[COMPILER] Compiling entity breakdown: level={query.breakdown.level}")
 
         # First get summary
-        summary = self.service.get_summary(
-            workspace_id=workspace_id,
-            metrics=query.metrics,
-            time_range=self._to_dsl_time_range(query.time_range),
-            filters=filters,
-            compare_to_previous=query.has_comparison(),
+        summary = self._fetch_summary(
+            workspace_id, query, filters, query.has_comparison(), result
         )
         result.summary = summary.metrics
 
@@ -628,9 +662,10 @@ class SemanticCompiler:
         Answers questions like "Compare CPC for top 3 ads this week vs last week"
 
         ALGORITHM:
-            1. Get top N entities for CURRENT period (ranked by metric)
-            2. Get the SAME entities' data for PREVIOUS period
-            3. Combine into EntityComparisonItem objects with delta calculation
+            1. Rank top N entities on the CURRENT period and fetch the SAME
+               entities' PREVIOUS period values in one statement
+               (UnifiedMetricService.get_ranked_comparison)
+            2. Combine into EntityComparisonItem objects with delta calculation
 
         EXAMPLE:
             Query: metrics=["cpc"], breakdown={entity, ad, limit=3}, comparison=previous_period
@@ -646,18 +681,14 @@ class SemanticCompiler:
         primary_metric = query.get_primary_metric()
 
         # Step 1: Get overall summary with comparison
-        summary = self.service.get_summary(
-            workspace_id=workspace_id,
-            metrics=query.metrics,
-            time_range=self._to_dsl_time_range(query.time_range),
-            filters=filters,
-            compare_to_previous=True,
+        summary = self._fetch_summary(
+            workspace_id, query, filters, True, result
         )
         result.summary = summary.metrics
         result.comparison = summary.metrics
 
-        # Step 2: Get top N entities for CURRENT period
-        current_breakdown = self.service.get_breakdown(
+        # Step 2: Top N entities for the CURRENT period with their PREVIOUS period values
+        ranked = self.service.get_ranked_comparison(
             workspace_id=workspace_id,
             metric=primary_metric,
             time_range=self._to_dsl_time_range(query.time_range),
@@ -666,95 +697,44 @@ class SemanticCompiler:
             top_n=query.breakdown.limit,
             sort_order=query.breakdown.sort_order,
         )
-        result.breakdown = current_breakdown
+        result.breakdown = [item.current for item in ranked]
 
-        if not current_breakdown:
+        if not ranked:
             logger.warning("[COMPILER] No entities found for current period")
             result.entity_comparison = []
             return
 
-        # Step 3: Calculate previous period dates
-        current_start, current_end = self._resolve_time_range(query.time_range)
-        period_days = (current_end - current_start).days + 1
-        prev_end = current_start - timedelta(days=1)
-        prev_start = prev_end - timedelta(days=period_days - 1)
-
-        logger.info(f"[COMPILER] Current period: {current_start} to {current_end}")
-        logger.info(f"[COMPILER] Previous period: {prev_start} to {prev_end}")
-
-        # Step 4: Get the SAME entities' data for previous period
-        entity_ids = [item.entity_id for item in current_breakdown if item.entity_id]
-        entity_labels = {item.entity_id: item.label for item in current_breakdown if item.entity_id}
-
-        if not entity_ids:
-            logger.warning("[COMPILER] No entity IDs in breakdown, cannot get previous period")
-            result.entity_comparison = []
-            return
-
-        # Create filters for specific entities
-        prev_filters = MetricFilters(
-            provider=filters.provider,
-            status=filters.status,
-            entity_ids=entity_ids,  # Only these specific entities
-        )
-
-        prev_time_range = DslTimeRange(start=prev_start, end=prev_end)
-
-        # Get previous period breakdown for the same entities
-        prev_breakdown = self.service.get_breakdown(
-            workspace_id=workspace_id,
-            metric=primary_metric,
-            time_range=prev_time_range,
-            filters=prev_filters,
-            breakdown_dimension=query.breakdown.level,
-            top_n=len(entity_ids),  # Get all of them
-            sort_order=query.breakdown.sort_order,
-        )
-
-        # Step 5: Build lookup for previous values
-        prev_by_id = {item.entity_id: item for item in prev_breakdown if item.entity_id}
-
-        # Step 6: Combine into EntityComparisonItem objects
+        # Step 3: Combine into EntityComparisonItem objects
         entity_comparison = []
-        for current_item in current_breakdown:
-            entity_id = current_item.entity_id
-            if not entity_id:
+        for item in ranked:
+            current_item, prev_item = item.current, item.previous
+            if not current_item.entity_id:
                 continue
 
-            prev_item = prev_by_id.get(entity_id)
-            current_value = current_item.value
-            previous_value = prev_item.value if prev_item else None
-
-            # Calculate delta percentage
-            delta_pct = None
-            if previous_value is not None and previous_value != 0 and current_value is not None:
-                delta_pct = (current_value - previous_value) / previous_value
-
             entity_comparison.append(EntityComparisonItem(
-                entity_id=entity_id,
+                entity_id=current_item.entity_id,
                 entity_name=current_item.label,
-                current_value=current_value,
-                previous_value=previous_value,
-                delta_pct=delta_pct,
-                current_bases={
-                    "spend": current_item.spend,
-                    "revenue": current_item.revenue,
-                    "clicks": current_item.clicks,
-                    "impressions": current_item.impressions,
-                    "conversions": current_item.conversions,
-                },
-                previous_bases={
-                    "spend": prev_item.spend if prev_item else None,
-                    "revenue": prev_item.revenue if prev_item else None,
-                    "clicks": prev_item.clicks if prev_item else None,
-                    "impressions": prev_item.impressions if prev_item else None,
-                    "conversions": prev_item.conversions if prev_item else None,
-                } if prev_item else {},
+                current_value=current_item.value,
+                previous_value=prev_item.value if prev_item else None,
+                delta_pct=item.delta_pct,
+                current_bases=self._base_values(current_item),
+                previous_bases=self._base_values(prev_item) if prev_item else {},
             ))
 
         result.entity_comparison = entity_comparison
         logger.info(f"[COMPILER] Built {len(entity_comparison)} entity comparison items")
 
+    @staticmethod
+    def _base_values(item) -> Dict[str, Any]:
+        """Base measures of a breakdown item, as carried by EntityComparisonItem."""
+        return {
+            "spend": item.spend,
+            "revenue": item.revenue,
+            "clicks": item.clicks,
+            "impressions": item.impressions,
+            "conversions": item.conversions,
+        }
+
     def _compile_entity_timeseries(
         self,
         workspace_id: str,
@@ -788,17 +768,13 @@ class SemanticCompiler:
         primary_metric = query.get_primary_metric()
 
         # Step 1: Get summary
-        summary = self.service.get_summary(
-            workspace_id=workspace_id,
-            metrics=query.metrics,
-            time_range=self._to_dsl_time_range(query.time_range),
-            filters=filters,
-            compare_to_previous=query.has_comparison(),
+        summary = self._fetch_summary(
+            workspace_id, query, filters, query.has_comparison(), result
         )
         result.summary = summary.metrics
 
-        # Step 2: Get top N entities
-        breakdown = self.service.get_breakdown(
+        # Step 2: Get top N entities (ranking only, no previous window)
+        ranked = self.service.get_ranked_comparison(
             workspace_id=workspace_id,
             metric=primary_metric,
             time_range=self._to_dsl_time_range(query.time_range),
@@ -806,7 +782,9 @@ class SemanticCompiler:
             breakdown_dimension=query.breakdown.level,
             top_n=query.breakdown.limit,
             sort_order=query.breakdown.sort_order,
+            compare_to_previous=False,
         )
+        breakdown = [item.current for item in ranked]
         result.breakdown = breakdown
 
         if not breakdown:
@@ -870,12 +848,8 @@ class SemanticCompiler:
         logger.info("[COMPILER] Compiling provider breakdown")
 
         # Get summary
-        summary = self.service.get_summary(
-            workspace_id=workspace_id,
-            metrics=query.metrics,
-            time_range=self._to_dsl_time_range(query.time_range),
-            filters=filters,
-            compare_to_previous=query.has_comparison(),
+        summary = self._fetch_summary(
+            workspace_id, query, filters, query.has_comparison(), result
         )
         result.summary = summary.metrics
 
@@ -918,12 +892,8 @@ class SemanticCompiler:
         logger.info(f"[COMPILER] Compiling time breakdown: granularity={query.breakdown.granularity}")
 
         # Get summary
-        summary = self.service.get_summary(
-            workspace_id=workspace_id,
-            metrics=query.metrics,
-            time_range=self._to_dsl_time_range(query.time_range),
-            filters=filters,
-            compare_to_previous=query.has_comparison(),
+        summary = self._fetch_summary(
+            workspace_id, query, filters, query.has_comparison(), result
         )
         result.summary = summary.metrics
 
@@ -971,12 +941,8 @@ class SemanticCompiler:
         logger.info(f"[COMPILER] Metrics: {query.metrics}, time_range: {query.time_range.to_dict()}")
 
         # Get summary with comparison if requested
-        summary = self.service.get_summary(
-            workspace_id=workspace_id,
-            metrics=query.metrics,
-            time_range=self._to_dsl_time_range(query.time_range),
-            filters=filters,
-            compare_to_previous=query.has_comparison(),
+        summary = self._fetch_summary(
+            workspace_id, query, filters, query.has_comparison(), result
         )
         result.summary = summary.metrics
         logger.info(f"[COMPILER] Summary retrieved: {list(summary.metrics.keys())}")
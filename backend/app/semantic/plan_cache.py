@@ -0,0 +1,280 @@
+"""
+Semantic Plan Cache
+===================
+
+**Version**: 1.0.0
+**Created**: 2026-10-16
+**Status**: Active
+
+Caches the work the semantic pipeline repeats for identical question shapes.
+
+WHY THIS FILE EXISTS
+--------------------
+Every QA request re-ran SemanticValidator (including SecurityValidator) and
+SemanticCompiler from scratch: time-range resolution, filter building,
+strategy selection and the metric queries. Most traffic is the same few
+dozen question shapes per workspace, so most of that work is repeated.
+
+CACHE STAGES
+------------
+All stages are keyed by query_fingerprint(query), a hash of the canonical
+SemanticQuery.to_dict(), plus today's date (relative ranges and the "no
+future dates" validation resolve against it):
+
+1. validation - ValidationResult (workspace-independent)
+2. plan       - CompiledPlan: strategy, filters, resolved time range
+                (workspace-independent)
+3. result     - CompilationResult, additionally keyed by workspace and the
+                workspace's data version (app/services/response_cache.py).
+                A snapshot or Shopify sync bumps the version, so results
+                are never served across new data. Without Redis the version
+                is unknown and results are not cached.
+
+Each stage is a bounded in-process LRU. Entries remember how long they took
+to compute; hits report that as saved time to telemetry (record_cache).
+
+USAGE
+-----
+```python
+from app.semantic.plan_cache import plan_cache
+
+validation = plan_cache.validate(validator, query, ctx=ctx)
+if validation.valid:
+    result = plan_cache.compile(compiler, workspace_id, query, ctx=ctx)
+```
+
+CONFIGURATION
+-------------
+- SEMANTIC_PLAN_CACHE_ENABLED: true/false (default true)
+- SEMANTIC_PLAN_CACHE_SIZE: validation and plan entries per process
+- SEMANTIC_RESULT_CACHE_SIZE: result entries per process
+- SEMANTIC_RESULT_CACHE_TTL_SECONDS: upper bound on result age, in case a
+  data version bump was missed
+
+RELATED FILES
+-------------
+- app/semantic/compiler.py: SemanticCompiler.plan / compile(plan=...)
+- app/semantic/validator.py: SemanticValidator
+- app/semantic/telemetry.py: Cache stage hits and saved time
+- app/services/response_cache.py: Workspace data versions
+- app/services/semantic_qa_service.py, app/agent/tools.py: Callers
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+
+from app.semantic.compiler import CompilationResult, CompiledPlan, SemanticCompiler
+from app.semantic.query import SemanticQuery
+from app.semantic.validator import SemanticValidator, ValidationResult
+from app.services.response_cache import current_data_version
+
+if TYPE_CHECKING:
+    from app.semantic.telemetry import QueryContext
+
+logger = logging.getLogger(__name__)
+
+
+SEMANTIC_PLAN_CACHE_ENABLED = os.getenv("SEMANTIC_PLAN_CACHE_ENABLED", "true").lower() == "true"
+SEMANTIC_PLAN_CACHE_SIZE = int(os.getenv("SEMANTIC_PLAN_CACHE_SIZE", "1024"))
+SEMANTIC_RESULT_CACHE_SIZE = int(os.getenv("SEMANTIC_RESULT_CACHE_SIZE", "256"))
+SEMANTIC_RESULT_CACHE_TTL_SECONDS = float(os.getenv("SEMANTIC_RESULT_CACHE_TTL_SECONDS", "900"))
+
+# Cache stage names (as reported to telemetry)
+VALIDATION_STAGE = "validation"
+PLAN_STAGE = "plan"
+RESULT_STAGE = "result"
+
+
+def query_fingerprint(query: SemanticQuery) -> str:
+    """
+    Stable hash of a SemanticQuery.
+
+    WHAT: sha256 of to_dict() serialized with sorted keys. Queries that
+    differ only in field order or in unset optional components hash equal.
+
+    RETURNS:
+        32-character hex digest
+    """
+    payload = json.dumps(query.to_dict(), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+@dataclass
+class CacheEntry:
+    """Cached value with the time it took to compute (reported on hits)."""
+    value: Any
+    cost_ms: float
+    expires_at: Optional[float] = None
+
+
+class LRUCache:
+    """
+    Thread-safe bounded LRU with an optional TTL.
+
+    WHAT: get() refreshes recency, put() evicts the least recently used
+    entry beyond max_size. Sync endpoints run in FastAPI's threadpool, so
+    access is guarded by a lock.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Entry for key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, value: Any, cost_ms: float) -> None:
+        """Store value, evicting the least recently used entries beyond max_size."""
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._entries[key] = CacheEntry(value, cost_ms, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticPlanCache:
+    """
+    Validation, plan and result caches for the semantic pipeline.
+
+    WHAT: validate() and compile() mirror SemanticValidator.validate and
+    SemanticCompiler.compile, serving repeated question shapes from cache.
+    Cached values are deep-copied on the way out, so callers may mutate
+    what they get.
+
+    PARAMETERS:
+        enabled: When False every call is computed (and reported as a miss)
+        max_plans: Validation and plan entries
+        max_results: Result entries
+        result_ttl_seconds: Upper bound on result age
+    """
+
+    def __init__(
+        self,
+        enabled: bool = SEMANTIC_PLAN_CACHE_ENABLED,
+        max_plans: int = SEMANTIC_PLAN_CACHE_SIZE,
+        max_results: int = SEMANTIC_RESULT_CACHE_SIZE,
+        result_ttl_seconds: float = SEMANTIC_RESULT_CACHE_TTL_SECONDS,
+    ):
+        self.enabled = enabled
+        self.validations = LRUCache(max_plans)
+        self.plans = LRUCache(max_plans)
+        self.results = LRUCache(max_results, ttl_seconds=result_ttl_seconds)
+
+    def validate(
+        self,
+        validator: SemanticValidator,
+        query: SemanticQuery,
+        fingerprint: Optional[str] = None,
+        ctx: Optional["QueryContext"] = None,
+    ) -> ValidationResult:
+        """Validate a query (SecurityValidator included), cached per fingerprint and day."""
+        key = (fingerprint or query_fingerprint(query), date.today())
+        return self._get_or_compute(
+            self.validations, key, VALIDATION_STAGE, lambda: validator.validate(query), ctx
+        )
+
+    def plan(
+        self,
+        compiler: SemanticCompiler,
+        query: SemanticQuery,
+        fingerprint: Optional[str] = None,
+        ctx: Optional["QueryContext"] = None,
+    ) -> CompiledPlan:
+        """Execution plan for a query, cached per fingerprint and day."""
+        key = (fingerprint or query_fingerprint(query), date.today())
+        return self._get_or_compute(
+            self.plans, key, PLAN_STAGE, lambda: compiler.plan(query), ctx
+        )
+
+    def compile(
+        self,
+        compiler: SemanticCompiler,
+        workspace_id: str,
+        query: SemanticQuery,
+        fingerprint: Optional[str] = None,
+        ctx: Optional["QueryContext"] = None,
+    ) -> CompilationResult:
+        """
+        Compile and execute a query through the plan and result caches.
+
+        WHAT: Results are keyed by (workspace, fingerprint, day, data version).
+        When the data version is unavailable the result is computed without
+        caching; the plan is still served from cache.
+        """
+        fingerprint = fingerprint or query_fingerprint(query)
+
+        def execute() -> CompilationResult:
+            plan = self.plan(compiler, query, fingerprint, ctx)
+            return compiler.compile(workspace_id, query, plan=plan)
+
+        data_version = current_data_version(workspace_id) if self.enabled else None
+        if data_version is None:
+            return execute()
+
+        key = (str(workspace_id), fingerprint, date.today(), data_version)
+        result = self._get_or_compute(self.results, key, RESULT_STAGE, execute, ctx)
+        result.query = query
+        return result
+
+    def clear(self) -> None:
+        """Drop every cached entry (for testing)."""
+        self.validations.clear()
+        self.plans.clear()
+        self.results.clear()
+
+    def _get_or_compute(
+        self,
+        cache: LRUCache,
+        key: Hashable,
+        stage: str,
+        compute: Callable[[], Any],
+        ctx: Optional["QueryContext"],
+    ) -> Any:
+        entry = cache.get(key) if self.enabled else None
+        if entry is not None:
+            logger.debug(f"[PLAN_CACHE] {stage} hit (saved {entry.cost_ms:.1f}ms)")
+            if ctx is not None:
+                ctx.record_cache(stage, hit=True, saved_ms=entry.cost_ms)
+            return copy.deepcopy(entry.value)
+
+        if ctx is not None:
+            ctx.record_cache(stage, hit=False)
+        start = time.perf_counter()
+        value = compute()
+        if self.enabled:
+            cache.put(key, copy.deepcopy(value), (time.perf_counter() - start) * 1000)
+        return value
+
+
+# Global cache instance (one per process)
+plan_cache = SemanticPlanCache()
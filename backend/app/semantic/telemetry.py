@@ -77,8 +77,25 @@ INTEGRATION
 -----------
 The telemetry collector integrates with:
 - Python logging (structured JSON)
+- Redis: per-stage latency sketches are flushed every
+  SEMANTIC_TELEMETRY_FLUSH_SECONDS into hourly hashes, so the latencies of
+  all API replicas can be merged (GET /admin/telemetry/latency)
 - Future: DataDog, NewRelic, OpenTelemetry
-- Future: Custom metrics dashboards
+
+LATENCY PERCENTILES
+-------------------
+Every stage duration (and the end-to-end "total") goes into a LatencySketch:
+a log-bucketed histogram with 1% relative accuracy. Sketches are mergeable by
+adding bucket counts, which is what makes cross-replica p50/p95/p99 possible
+without shipping raw samples.
+
+CACHE STAGES
+------------
+The plan cache (app/semantic/plan_cache.py) reports a hit or miss per cache
+stage (validation, plan, result) via QueryContext.record_cache. A hit carries
+the time the cached entry originally took to compute, so hits, misses and
+saved milliseconds per stage are aggregated next to the latencies (and
+flushed to Redis alongside them).
 
 RELATED FILES
 -------------
@@ -91,18 +108,36 @@ RELATED FILES
 from __future__ import annotations
 
 import logging
+import math
+import os
 import time
 import uuid
+from collections import Counter
 from contextlib import contextmanager
 from dataclasses import dataclass, field as dataclass_field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Generator
+from typing import Any, Dict, Generic, Iterator, List, Optional, Generator, TypeVar
 
 from app.semantic.query import SemanticQuery
 
 logger = logging.getLogger(__name__)
 
+# How often aggregated latency sketches are pushed to Redis
+TELEMETRY_FLUSH_SECONDS = float(os.getenv("SEMANTIC_TELEMETRY_FLUSH_SECONDS", "30"))
+
+# Redis keys: one hash per (hour, stage); kept for two days
+LATENCY_KEY_PREFIX = "semantic:latency"
+LATENCY_KEY_TTL_SECONDS = 48 * 3600
+
+# Latency bucket for end-to-end query duration (alongside Stage values)
+TOTAL_STAGE = "total"
+
+# Redis keys for plan cache counters: one hash per (hour, cache stage)
+CACHE_KEY_PREFIX = "semantic:cache"
+
+T = TypeVar("T")
+
 
 # =============================================================================
 # ENUMS
@@ -227,6 +262,8 @@ class QueryMetrics:
         compilation_strategy: Which strategy was used
         row_count: Number of data rows returned
         success: Whether query succeeded
+        cache_hits: Saved milliseconds per cache stage that hit
+        cache_misses: Cache stages that missed
     """
     query_id: str
     start_time: float
@@ -237,6 +274,8 @@ class QueryMetrics:
     compilation_strategy: Optional[str] = None
     row_count: int = 0
     success: bool = True
+    cache_hits: Dict[str, float] = dataclass_field(default_factory=dict)
+    cache_misses: List[str] = dataclass_field(default_factory=list)
 
     @property
     def total_duration_ms(self) -> Optional[float]:
@@ -256,9 +295,167 @@ class QueryMetrics:
             "compilation_strategy": self.compilation_strategy,
             "row_count": self.row_count,
             "success": self.success,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
         }
 
 
+class RingBuffer(Generic[T]):
+    """
+    Fixed-capacity ring buffer.
+
+    WHAT: Preallocated slots plus a write index; append overwrites the oldest
+          item once full.
+
+    WHY: The collector appends on every event. list.pop(0) on a full list
+         shifted the whole buffer each time; here append is O(1).
+
+    No lock: under the GIL a slot write and an index bump never corrupt the
+    buffer; two racing appends can at worst overwrite each other's slot,
+    which is acceptable for telemetry.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be at least 1")
+        self.capacity = capacity
+        self._slots: List[Optional[T]] = [None] * capacity
+        self._next = 0
+        self._size = 0
+
+    def append(self, item: T) -> None:
+        """Add an item, overwriting the oldest one when full."""
+        self._slots[self._next] = item
+        self._next = (self._next + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def recent(self, limit: int) -> List[T]:
+        """Up to `limit` items, most recent first."""
+        count = min(max(limit, 0), self._size)
+        return [self._slots[(self._next - 1 - i) % self.capacity] for i in range(count)]
+
+    def clear(self) -> None:
+        """Drop all items (slots stay allocated)."""
+        self._slots = [None] * self.capacity
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate oldest to newest."""
+        start = (self._next - self._size) % self.capacity
+        for i in range(self._size):
+            yield self._slots[(start + i) % self.capacity]
+
+
+class LatencySketch:
+    """
+    Mergeable latency histogram with bounded relative error.
+
+    WHAT: Counts values in logarithmic buckets (bucket k covers
+          (gamma^(k-1), gamma^k] ms). Quantiles are read by walking the
+          cumulative counts.
+
+    WHY: Percentiles can't be averaged across replicas, but bucket counts can
+         be summed. With RELATIVE_ACCURACY = 1% a p95 of 812ms is reported
+         within +/-8ms, in a few dozen buckets per stage.
+
+    USAGE:
+        sketch = LatencySketch()
+        sketch.add(12.5)
+        sketch.merge(other_replica_sketch)
+        sketch.quantile(0.95)
+    """
+
+    RELATIVE_ACCURACY = 0.01
+    MIN_VALUE_MS = 0.001
+    GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(GAMMA)
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+
+    @classmethod
+    def bucket_index(cls, value_ms: float) -> int:
+        """Bucket holding `value_ms`."""
+        return math.ceil(math.log(max(value_ms, cls.MIN_VALUE_MS)) / cls._LOG_GAMMA)
+
+    @classmethod
+    def bucket_value(cls, index: int) -> float:
+        """Representative value of a bucket (within RELATIVE_ACCURACY)."""
+        return 2 * cls.GAMMA ** index / (cls.GAMMA + 1)
+
+    def add(self, value_ms: float, count: int = 1) -> None:
+        """Record a duration in milliseconds."""
+        index = self.bucket_index(value_ms)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.sum += value_ms * count
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Add another sketch's counts into this one."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0..1, nearest rank) in ms, None when empty."""
+        if self.count == 0:
+            return None
+
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return self.bucket_value(index)
+        return self.bucket_value(max(self.buckets))
+
+    def summary(self, include_buckets: bool = False) -> Dict[str, Any]:
+        """Count, mean and p50/p95/p99 (optionally the histogram)."""
+        result: Dict[str, Any] = {
+            "count": self.count,
+            "avg_ms": self.sum / self.count if self.count else None,
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+        }
+        if include_buckets:
+            result["histogram"] = [
+                {"le_ms": round(self.GAMMA ** index, 3), "count": self.buckets[index]}
+                for index in sorted(self.buckets)
+            ]
+        return result
+
+    def to_redis_fields(self) -> Dict[str, float]:
+        """Hash increments for HINCRBY/HINCRBYFLOAT (b:<index>, count, sum)."""
+        fields: Dict[str, float] = {f"b:{index}": count for index, count in self.buckets.items()}
+        fields["count"] = self.count
+        fields["sum"] = self.sum
+        return fields
+
+    @classmethod
+    def from_redis_fields(cls, fields: Dict[Any, Any]) -> "LatencySketch":
+        """Rebuild a sketch from a Redis hash written by to_redis_fields."""
+        sketch = cls()
+        for raw_key, raw_value in fields.items():
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            value = raw_value.decode() if isinstance(raw_value, bytes) else raw_value
+            if key.startswith("b:"):
+                sketch.buckets[int(key[2:])] = int(value)
+            elif key == "count":
+                sketch.count = int(value)
+            elif key == "sum":
+                sketch.sum = float(value)
+        return sketch
+
+
 # =============================================================================
 # QUERY CONTEXT
 # =============================================================================
@@ -409,6 +606,20 @@ class QueryContext:
         self.metrics.compilation_strategy = strategy
         self.metrics.row_count = row_count
 
+    def record_cache(self, stage: str, hit: bool, saved_ms: float = 0.0) -> None:
+        """
+        Record a plan cache lookup.
+
+        PARAMETERS:
+            stage: Cache stage (validation, plan, result)
+            hit: Whether the entry was served from cache
+            saved_ms: On a hit, how long computing the entry originally took
+        """
+        if hit:
+            self.metrics.cache_hits[stage] = saved_ms
+        else:
+            self.metrics.cache_misses.append(stage)
+
     def fail(
         self,
         error_code: str,
@@ -515,6 +726,13 @@ class TelemetryCollector:
         - SEMANTIC_TELEMETRY_ENABLED: true/false
         - SEMANTIC_TELEMETRY_LOG_LEVEL: DEBUG/INFO/WARNING
         - SEMANTIC_TELEMETRY_BUFFER_SIZE: Number of events to keep
+        - SEMANTIC_TELEMETRY_FLUSH_SECONDS: Redis flush interval
+
+    LATENCY:
+        Stage and total durations feed per-stage LatencySketches. The
+        local sketches back get_stats()["latency"]; the increments since the
+        last flush are pushed to Redis (flush_to_redis) so the admin
+        endpoint can merge every replica.
 
     FUTURE INTEGRATIONS:
         - DataDog: metrics.timing(), metrics.count()
@@ -527,6 +745,8 @@ class TelemetryCollector:
         enabled: bool = True,
         log_level: str = "INFO",
         buffer_size: int = 1000,
+        redis_client: Optional[Any] = None,
+        flush_interval: float = TELEMETRY_FLUSH_SECONDS,
     ):
         """
         Initialize telemetry collector.
@@ -535,14 +755,27 @@ class TelemetryCollector:
             enabled: Whether to collect telemetry
             log_level: Minimum log level to emit
             buffer_size: Number of events/metrics to keep in memory
+            redis_client: Redis connection for latency flushes (None: local only)
+            flush_interval: Seconds between Redis flushes
         """
         self.enabled = enabled
         self.log_level = log_level
         self.buffer_size = buffer_size
+        self.redis_client = redis_client
+        self.flush_interval = flush_interval
+
+        # In-memory ring buffers (fixed capacity, O(1) append)
+        self._events: RingBuffer[TelemetryEvent] = RingBuffer(buffer_size)
+        self._metrics: RingBuffer[QueryMetrics] = RingBuffer(buffer_size)
+
+        # Latency sketches: since start (local stats) and since last flush
+        self._latency: Dict[str, LatencySketch] = {}
+        self._pending_latency: Dict[str, LatencySketch] = {}
 
-        # In-memory buffers (could be replaced with Redis/external store)
-        self._events: List[TelemetryEvent] = []
-        self._metrics: List[QueryMetrics] = []
+        # Plan cache counters per stage ({"hits", "misses", "saved_ms"}), same split
+        self._cache: Dict[str, Counter] = {}
+        self._pending_cache: Dict[str, Counter] = {}
+        self._last_flush = time.monotonic()
 
         # Counters for quick stats
         self._query_count = 0
@@ -600,8 +833,6 @@ class TelemetryCollector:
 
         # Buffer the event
         self._events.append(event)
-        if len(self._events) > self.buffer_size:
-            self._events.pop(0)
 
         # Update counters
         if event.event_type == EventType.QUERY_COMPLETED:
@@ -624,8 +855,77 @@ class TelemetryCollector:
             return
 
         self._metrics.append(metrics)
-        if len(self._metrics) > self.buffer_size:
-            self._metrics.pop(0)
+
+        for stage, duration_ms in metrics.stages.items():
+            self._record_latency(stage, duration_ms)
+        if metrics.total_duration_ms is not None:
+            self._record_latency(TOTAL_STAGE, metrics.total_duration_ms)
+        for stage, saved_ms in metrics.cache_hits.items():
+            self._record_cache(stage, Counter(hits=1, saved_ms=saved_ms))
+        for stage in metrics.cache_misses:
+            self._record_cache(stage, Counter(misses=1))
+
+        if self.redis_client is not None and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush_to_redis()
+
+    def _record_latency(self, stage: str, duration_ms: float) -> None:
+        self._latency.setdefault(stage, LatencySketch()).add(duration_ms)
+        if self.redis_client is not None:
+            self._pending_latency.setdefault(stage, LatencySketch()).add(duration_ms)
+
+    def _record_cache(self, stage: str, counts: Counter) -> None:
+        self._cache.setdefault(stage, Counter()).update(counts)
+        if self.redis_client is not None:
+            self._pending_cache.setdefault(stage, Counter()).update(counts)
+
+    def flush_to_redis(self) -> int:
+        """
+        Push latency and cache increments since the last flush to Redis.
+
+        WHAT: HINCRBY bucket counts into `semantic:latency:<hour>:<stage>`
+              and cache counters into `semantic:cache:<hour>:<stage>`
+              (one pipeline for all stages).
+
+        WHY: Each replica only sees its own queries. Summing bucket counts
+             in shared hashes gives the merged distribution.
+
+        RETURNS:
+            Number of stages flushed (0 when nothing was pending)
+        """
+        self._last_flush = time.monotonic()
+        pending, self._pending_latency = self._pending_latency, {}
+        pending_cache, self._pending_cache = self._pending_cache, {}
+        if not (pending or pending_cache) or self.redis_client is None:
+            return 0
+
+        hour = datetime.utcnow().strftime("%Y%m%d%H")
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for stage, sketch in pending.items():
+                key = f"{LATENCY_KEY_PREFIX}:{hour}:{stage}"
+                for field, value in sketch.to_redis_fields().items():
+                    if field == "sum":
+                        pipe.hincrbyfloat(key, field, value)
+                    else:
+                        pipe.hincrby(key, field, int(value))
+                pipe.expire(key, LATENCY_KEY_TTL_SECONDS)
+            for stage, counts in pending_cache.items():
+                key = f"{CACHE_KEY_PREFIX}:{hour}:{stage}"
+                pipe.hincrby(key, "hits", int(counts["hits"]))
+                pipe.hincrby(key, "misses", int(counts["misses"]))
+                pipe.hincrbyfloat(key, "saved_ms", float(counts["saved_ms"]))
+                pipe.expire(key, LATENCY_KEY_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            # Re-queue so the next flush retries
+            for stage, sketch in pending.items():
+                self._pending_latency.setdefault(stage, LatencySketch()).merge(sketch)
+            for stage, counts in pending_cache.items():
+                self._pending_cache.setdefault(stage, Counter()).update(counts)
+            logger.warning(f"[SEMANTIC] Latency flush failed: {e}")
+            return 0
+
+        return len(pending) + len(pending_cache)
 
     def get_recent_events(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -637,7 +937,7 @@ class TelemetryCollector:
         RETURNS:
             List of event dictionaries (most recent first)
         """
-        return [e.to_dict() for e in self._events[-limit:][::-1]]
+        return [e.to_dict() for e in self._events.recent(limit)]
 
     def get_recent_metrics(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -649,14 +949,15 @@ class TelemetryCollector:
         RETURNS:
             List of metrics dictionaries (most recent first)
         """
-        return [m.to_dict() for m in self._metrics[-limit:][::-1]]
+        return [m.to_dict() for m in self._metrics.recent(limit)]
 
     def get_stats(self) -> Dict[str, Any]:
         """
         Get aggregated statistics.
 
         RETURNS:
-            Dict with query count, error rate, avg duration
+            Dict with query count, error rate, avg duration, per-stage
+            p50/p95/p99 latency and plan cache hits (this process only)
         """
         avg_duration = 0.0
         if self._query_count > 0:
@@ -680,12 +981,22 @@ class TelemetryCollector:
             "error_rate": error_rate,
             "avg_duration_ms": avg_duration,
             "strategy_distribution": strategy_counts,
+            "latency": {
+                stage: sketch.summary() for stage, sketch in self._latency.items()
+            },
+            "cache": {
+                stage: _cache_summary(counts) for stage, counts in self._cache.items()
+            },
         }
 
     def reset(self) -> None:
         """Reset all telemetry data (for testing)."""
         self._events.clear()
         self._metrics.clear()
+        self._latency.clear()
+        self._pending_latency.clear()
+        self._cache.clear()
+        self._pending_cache.clear()
         self._query_count = 0
         self._error_count = 0
         self._total_duration_ms = 0.0
@@ -722,10 +1033,22 @@ def get_telemetry() -> TelemetryCollector:
     """
     global _default_collector
     if _default_collector is None:
-        _default_collector = TelemetryCollector()
+        _default_collector = TelemetryCollector(
+            buffer_size=int(os.getenv("SEMANTIC_TELEMETRY_BUFFER_SIZE", "1000")),
+            redis_client=_shared_redis_client(),
+        )
     return _default_collector
 
 
+def _shared_redis_client() -> Optional[Any]:
+    """App-wide Redis client, if configured (imported lazily: app.state pulls in settings)."""
+    try:
+        from app import state
+        return state.redis_client
+    except Exception:
+        return None
+
+
 def set_telemetry(collector: TelemetryCollector) -> None:
     """
     Set the default telemetry collector.
@@ -739,3 +1062,73 @@ def set_telemetry(collector: TelemetryCollector) -> None:
     """
     global _default_collector
     _default_collector = collector
+
+
+def read_merged_latency(
+    redis_client: Any,
+    hours: int = 1,
+    include_buckets: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge the latency sketches flushed by all replicas.
+
+    WHAT: Reads `semantic:latency:<hour>:<stage>` for the last `hours` hours
+          and sums them per stage.
+
+    PARAMETERS:
+        redis_client: Redis connection
+        hours: Window size in hours (current hour included)
+        include_buckets: Include the histogram buckets in each summary
+
+    RETURNS:
+        {stage: {"count", "avg_ms", "p50_ms", "p95_ms", "p99_ms", "histogram"?}}
+    """
+    now = datetime.utcnow()
+    merged: Dict[str, LatencySketch] = {}
+
+    for offset in range(max(hours, 1)):
+        hour = (now - timedelta(hours=offset)).strftime("%Y%m%d%H")
+        prefix = f"{LATENCY_KEY_PREFIX}:{hour}:"
+        for raw_key in redis_client.scan_iter(match=f"{prefix}*"):
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            stage = key[len(prefix):]
+            sketch = LatencySketch.from_redis_fields(redis_client.hgetall(key))
+            merged.setdefault(stage, LatencySketch()).merge(sketch)
+
+    return {stage: sketch.summary(include_buckets) for stage, sketch in sorted(merged.items())}
+
+
+def read_merged_cache_stats(redis_client: Any, hours: int = 1) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge the plan cache counters flushed by all replicas.
+
+    WHAT: Reads `semantic:cache:<hour>:<stage>` for the last `hours` hours
+          and sums them per cache stage.
+
+    RETURNS:
+        {stage: {"hits", "misses", "hit_rate", "saved_ms"}}
+    """
+    now = datetime.utcnow()
+    merged: Dict[str, Counter] = {}
+
+    for offset in range(max(hours, 1)):
+        hour = (now - timedelta(hours=offset)).strftime("%Y%m%d%H")
+        prefix = f"{CACHE_KEY_PREFIX}:{hour}:"
+        for raw_key in redis_client.scan_iter(match=f"{prefix}*"):
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            counts = merged.setdefault(key[len(prefix):], Counter())
+            for field, value in redis_client.hgetall(key).items():
+                field = field.decode() if isinstance(field, bytes) else field
+                counts[field] += float(value)
+
+    return {stage: _cache_summary(counts) for stage, counts in sorted(merged.items())}
+
+
+def _cache_summary(counts: Counter) -> Dict[str, Any]:
+    hits, misses = int(counts["hits"]), int(counts["misses"])
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        "saved_ms": round(counts["saved_ms"], 3),
+    }
@@ -0,0 +1,199 @@
+"""Entity Hierarchy Service - maintains the entity_ancestors closure table.
+
+WHAT:
+    Keeps entity_ancestors (leaf_id, ancestor_id, ancestor_level, workspace_id,
+    depth) in sync with the parent_id chains of entities.
+
+    - sync_entity_ancestors: incremental write, called by the entity upserts
+      of the Meta/Google sync services
+    - rebuild_entity_ancestors: full rebuild (seeds, repairs)
+
+WHY:
+    Hierarchy rollups (leaf -> campaign/adset) used recursive CTEs over every
+    tenant's entities on each query. With the closure table they become
+    indexed joins scoped to one workspace.
+
+REFERENCES:
+    - app/models.py:EntityAncestor
+    - app/dsl/hierarchy.py (campaign_ancestors, adset_ancestors, descendant_ids)
+    - app/services/meta_sync_service.py, app/services/google_sync_service.py (_upsert_entity)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import EntityAncestor, LevelEnum
+
+logger = logging.getLogger(__name__)
+
+
+# Guard against parent_id cycles in bad data (real trees are 2-4 levels deep)
+MAX_HIERARCHY_DEPTH = 16
+
+
+# Drop every link from the entity's subtree to the entity's current ancestors
+_DETACH_SUBTREE_SQL = text("""
+    DELETE FROM entity_ancestors ea
+    USING entity_ancestors sub
+    WHERE sub.ancestor_id = :entity_id
+      AND ea.leaf_id = sub.leaf_id
+      AND ea.depth > sub.depth
+""")
+
+# Re-link the subtree (entity included) to the entity itself and to the
+# ancestors of its (new) parent
+_ATTACH_SUBTREE_SQL = text("""
+    WITH subtree AS (
+        SELECT leaf_id, depth FROM entity_ancestors WHERE ancestor_id = :entity_id
+        UNION
+        SELECT CAST(:entity_id AS uuid), 0
+    ),
+    chain AS (
+        SELECT e.id AS ancestor_id, e.level AS ancestor_level, 0 AS depth
+        FROM entities e
+        WHERE e.id = :entity_id
+        UNION ALL
+        SELECT a.ancestor_id, a.ancestor_level, a.depth + 1
+        FROM entity_ancestors a
+        WHERE a.leaf_id = :parent_id
+    )
+    INSERT INTO entity_ancestors (leaf_id, ancestor_id, ancestor_level, workspace_id, depth)
+    SELECT s.leaf_id, c.ancestor_id, c.ancestor_level, :workspace_id, s.depth + c.depth
+    FROM subtree s
+    CROSS JOIN chain c
+    ON CONFLICT (leaf_id, ancestor_id) DO UPDATE
+    SET ancestor_level = EXCLUDED.ancestor_level,
+        depth = EXCLUDED.depth
+""")
+
+
+def sync_entity_ancestors(
+    db: Session,
+    entity_id: UUID,
+    parent_id: Optional[UUID],
+    level: LevelEnum,
+    workspace_id: UUID,
+) -> bool:
+    """Bring an upserted entity's closure rows in line with its parent_id.
+
+    WHAT:
+        Cheap no-op check first: if the entity's self row (with the same level)
+        and its depth-1 link already match, nothing changed. Otherwise the
+        entity's whole subtree is detached from its old ancestors and
+        re-attached under the new parent, so a reparented adset carries its
+        ads along.
+
+    WHY:
+        Called for every entity in every sync; steady-state syncs cost a single
+        indexed SELECT per entity.
+
+    NOTE:
+        Parents must be synced before children (the sync services already
+        walk campaign -> adset -> ad). Runs in the caller's transaction.
+
+    Args:
+        db: Database session
+        entity_id: Upserted entity
+        parent_id: Its parent (None for campaigns)
+        level: Its level
+        workspace_id: Its workspace
+
+    Returns:
+        True if closure rows were written, False if already up to date
+    """
+    existing = (
+        db.query(
+            EntityAncestor.ancestor_id,
+            EntityAncestor.ancestor_level,
+            EntityAncestor.depth,
+        )
+        .filter(EntityAncestor.leaf_id == entity_id)
+        .filter(EntityAncestor.depth <= 1)
+        .all()
+    )
+    current = {row.depth: row for row in existing}
+    self_row = current.get(0)
+    parent_row = current.get(1)
+
+    up_to_date = (
+        self_row is not None
+        and LevelEnum(self_row.ancestor_level) == LevelEnum(level)
+        and (parent_row.ancestor_id if parent_row else None) == parent_id
+    )
+    if up_to_date:
+        return False
+
+    params = {
+        "entity_id": entity_id,
+        "parent_id": parent_id,
+        "workspace_id": workspace_id,
+    }
+    db.execute(_DETACH_SUBTREE_SQL, params)
+    db.execute(_ATTACH_SUBTREE_SQL, params)
+
+    logger.debug(
+        "[HIERARCHY] Re-linked entity %s under parent %s", entity_id, parent_id
+    )
+    return True
+
+
+def rebuild_entity_ancestors(
+    db: Session,
+    workspace_id: Optional[UUID] = None,
+) -> int:
+    """Rebuild closure rows from the parent_id chains.
+
+    WHEN:
+        - After seeding entities directly through the ORM (seed scripts)
+        - Repair after manual parent_id edits
+
+    Args:
+        db: Database session
+        workspace_id: Restrict to one workspace (None = all workspaces)
+
+    Returns:
+        Number of closure rows inserted
+    """
+    scope = "WHERE e.workspace_id = :workspace_id" if workspace_id else ""
+    delete_scope = "WHERE workspace_id = :workspace_id" if workspace_id else ""
+
+    rebuild_sql = text(f"""
+        WITH RECURSIVE chain AS (
+            SELECT e.id AS leaf_id, e.id AS ancestor_id, e.level AS ancestor_level,
+                   e.parent_id, e.workspace_id, 0 AS depth
+            FROM entities e
+            {scope}
+
+            UNION ALL
+
+            SELECT c.leaf_id, p.id, p.level, p.parent_id, c.workspace_id, c.depth + 1
+            FROM chain c
+            JOIN entities p ON p.id = c.parent_id
+            WHERE c.depth < :max_depth
+        )
+        INSERT INTO entity_ancestors (leaf_id, ancestor_id, ancestor_level, workspace_id, depth)
+        SELECT leaf_id, ancestor_id, ancestor_level, workspace_id, depth
+        FROM chain
+        ON CONFLICT (leaf_id, ancestor_id) DO NOTHING
+    """)
+
+    params = {"workspace_id": workspace_id, "max_depth": MAX_HIERARCHY_DEPTH}
+    try:
+        db.execute(text(f"DELETE FROM entity_ancestors {delete_scope}"), params)
+        inserted = db.execute(rebuild_sql, params).rowcount or 0
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        "[HIERARCHY] Rebuilt entity_ancestors (workspace=%s): %d rows",
+        workspace_id or "all", inserted,
+    )
+    return inserted
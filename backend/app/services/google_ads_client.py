@@ -28,6 +28,12 @@ from datetime import date
 from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 from app.models import GoalEnum
+from app.services.rate_limit_backend import (
+    RateLimitBackend,
+    RateLimitReservation,
+    get_rate_limit_backend,
+    local_rate_limit_backend,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -98,17 +104,40 @@ class GoogleAdsRateLimiter:
 
     WHAT:
         Guard outgoing requests to honor QPS/quota. Defaults are conservative.
+        With a backend (rate_limit_backend), the bucket is keyed per customer
+        and shared by every worker process; without one it is per instance.
     WHY:
         Avoid RESOURCE_EXHAUSTED errors and smooth out bursts.
     """
 
-    def __init__(self, capacity: int = 15, refill_per_sec: float = 5.0) -> None:
+    def __init__(
+        self,
+        capacity: int = 15,
+        refill_per_sec: float = 5.0,
+        backend: Optional[RateLimitBackend] = None,
+    ) -> None:
         self.capacity = capacity
         self.tokens = capacity
         self.refill_per_sec = refill_per_sec
         self.last = time.monotonic()
+        self.backend = backend
+
+    def reserve(self, key: str) -> RateLimitReservation:
+        """Take a token for `key` without waiting (retry_after when empty)."""
+        backend = self.backend or local_rate_limit_backend
+        return backend.reserve_token(
+            f"google:{key}", self.capacity, self.refill_per_sec
+        )
+
+    def acquire(self, key: Optional[str] = None) -> None:
+        if key is not None and self.backend is not None:
+            # Shared bucket: waits are sub-second (QPS smoothing), so sleep
+            while True:
+                reservation = self.reserve(key)
+                if reservation.allowed:
+                    return
+                time.sleep(reservation.retry_after)
 
-    def acquire(self) -> None:
         now = time.monotonic()
         elapsed = now - self.last
         self.last = now
@@ -234,7 +263,7 @@ class GAdsClient:
     def __init__(self, client: Optional[Any] = None, rate_limiter: Optional[GoogleAdsRateLimiter] = None) -> None:
         self._client = client or self._build_client_from_env()
         self._ga_service = None
-        self._rate = rate_limiter or GoogleAdsRateLimiter()
+        self._rate = rate_limiter or GoogleAdsRateLimiter(backend=get_rate_limit_backend())
 
     # --- Client factory -------------------------------------------------
     @staticmethod
@@ -325,13 +354,13 @@ class GAdsClient:
         Note: Some client versions don't accept page_size as a kwarg; we
         intentionally omit it and rely on server defaults.
         """
-        self._rate.acquire()
+        self._rate.acquire(f"customer:{customer_id}")
         return self._service().search(customer_id=customer_id, query=query)
 
     @_with_retries
     def search_stream(self, customer_id: str, query: str) -> Generator[Any, None, None]:
         """Streaming GAQL results."""
-        self._rate.acquire()
+        self._rate.acquire(f"customer:{customer_id}")
         stream = self._service().search_stream(customer_id=customer_id, query=query)
         for batch in stream:
             yield from getattr(batch, 'results', [])
@@ -38,6 +38,7 @@ from app.schemas import (
     MetricFactCreate,
 )
 from app.routers.ingest import ingest_metrics_internal
+from app.services.entity_hierarchy_service import sync_entity_ancestors
 from app.services.google_ads_client import GAdsClient, map_channel_to_goal
 from app.security import decrypt_secret
 
@@ -161,6 +162,9 @@ def _upsert_entity(
     # Fetch the entity from session to return proper ORM object
     entity = db.query(Entity).filter(Entity.id == row.id).first()
 
+    # Keep the hierarchy closure table in step (no-op when parent/level unchanged)
+    sync_entity_ancestors(db, entity.id, parent_id, level, entity.workspace_id)
+
     # Determine if this was a create or update
     # If created_at matches our 'now' value (within tolerance), it was created
     created = abs((entity.created_at - now).total_seconds()) < 1
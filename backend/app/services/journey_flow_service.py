@@ -0,0 +1,364 @@
+"""Journey Flow Service — Sankey aggregation of customer journeys.
+
+WHAT:
+    Counts journeys per node (source channel, funnel stage, outcome) and per
+    link (transition between nodes) for the journey-flow Sankey endpoint.
+
+    - Postgres: one SQL statement. Touchpoints are reduced to the first
+      occurrence of each stage per journey, ordered with window functions
+      (LAG / ROW_NUMBER), and grouped into pre-aggregated node/link rows.
+      Sources are grouped by raw (utm source, medium) and classified in
+      Python afterwards, so the result size depends on the number of
+      distinct sources and stages, not on the number of journeys.
+    - Other databases: streams (journey, touchpoint) rows ordered by journey
+      over a server-side cursor and walks one journey at a time.
+
+WHY:
+    The endpoint used to load every CustomerJourney and JourneyTouchpoint of
+    up to 365 days as ORM objects - millions of objects on big stores and
+    multi-second responses.
+
+RULES (identical in both paths):
+    - Source: journey first_touch_source/medium, falling back to the first
+      touchpoint's utm_source/utm_medium when the journey source is empty
+    - Stages: touchpoints mapped through FLOW_STAGES, each stage counted once
+      per journey at its first occurrence
+    - Links: source -> first stage -> ... -> last stage -> outcome
+      (source -> outcome when the journey has no stage touchpoints)
+    - Outcome: purchased when total_orders > 0, dropped otherwise
+
+REFERENCES:
+    - app/routers/attribution.py (get_journey_flow, node labels from FLOW_STAGE_NODES)
+    - app/models.py (CustomerJourney, JourneyTouchpoint)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import CustomerJourney, JourneyTouchpoint
+
+logger = logging.getLogger(__name__)
+
+
+# Pixel event type -> (flow stage node id, label, Sankey column)
+FLOW_STAGE_NODES = {
+    "page_viewed": ("stage_page_view", "Page View", 1),
+    "product_viewed": ("stage_product_view", "Product View", 1),
+    "product_added_to_cart": ("stage_atc", "Add to Cart", 2),
+    "checkout_started": ("stage_checkout", "Checkout", 2),
+    "checkout_completed": ("stage_purchase", "Purchase", 3),
+}
+
+# Pixel event type -> flow stage node id
+FLOW_STAGES = {event_type: node[0] for event_type, node in FLOW_STAGE_NODES.items()}
+
+OUTCOME_PURCHASED = "outcome_purchased"
+OUTCOME_DROPPED = "outcome_dropped"
+
+# Rows fetched per round trip by the streaming fallback
+STREAM_BATCH_SIZE = 2000
+
+
+@dataclass
+class JourneyFlowAggregate:
+    """Aggregated Sankey data.
+
+    node_counts: node_id -> {"count": int, "revenue": float}
+    link_counts: (source_id, target_id) -> {"value": int, "revenue": float}
+    """
+
+    node_counts: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    link_counts: Dict[Tuple[str, str], Dict[str, float]] = field(default_factory=dict)
+    total_journeys: int = 0
+    total_revenue: float = 0.0
+
+    def add_node(self, node_id: str, count: int, revenue: float) -> None:
+        data = self.node_counts.setdefault(node_id, {"count": 0, "revenue": 0})
+        data["count"] += count
+        data["revenue"] += revenue
+
+    def add_link(self, source: str, target: str, value: int, revenue: float) -> None:
+        data = self.link_counts.setdefault((source, target), {"value": 0, "revenue": 0})
+        data["value"] += value
+        data["revenue"] += revenue
+
+
+def aggregate_journey_flow(
+    db: Session,
+    workspace_id: UUID,
+    period_start: datetime,
+) -> JourneyFlowAggregate:
+    """Aggregate journeys first seen since period_start into Sankey nodes/links.
+
+    Uses the SQL aggregation on Postgres and the streaming walk elsewhere.
+    """
+    bind = db.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        return _aggregate_in_sql(db, workspace_id, period_start)
+    return _aggregate_streaming(db, workspace_id, period_start)
+
+
+def classify_source(source: Optional[str], medium: Optional[str]) -> str:
+    """Map a first-touch source/medium pair to a channel key.
+
+    Returns:
+        Channel key string (meta, google, tiktok, email, organic, referral,
+        direct or unknown)
+    """
+    source = (source or "").lower()
+    medium = (medium or "").lower()
+
+    # Match ad platforms
+    if source in ("facebook", "fb", "meta", "instagram", "ig") or "facebook" in source:
+        return "meta"
+    if source in ("google", "googleads", "adwords") or "google" in source:
+        return "google"
+    if source in ("tiktok",) or "tiktok" in source:
+        return "tiktok"
+    if source in ("email", "newsletter", "mailchimp", "klaviyo"):
+        return "email"
+
+    # Match by medium
+    if medium in ("cpc", "ppc", "paid", "cpm"):
+        if "facebook" in source or "meta" in source:
+            return "meta"
+        if "google" in source:
+            return "google"
+        return "unknown"
+    if medium in ("organic", "seo"):
+        return "organic"
+    if medium in ("referral",):
+        return "referral"
+    if medium in ("email",):
+        return "email"
+
+    # Direct or unknown
+    if not source or source in ("direct", "(direct)", "(none)"):
+        return "direct"
+
+    return "unknown"
+
+
+# =============================================================================
+# SQL AGGREGATION (POSTGRES)
+# =============================================================================
+
+def _stage_case(column: str) -> str:
+    """CASE expression mapping event_type to its stage node id."""
+    branches = " ".join(
+        f"WHEN '{event_type}' THEN '{stage_id}'" for event_type, stage_id in FLOW_STAGES.items()
+    )
+    return f"CASE {column} {branches} END"
+
+
+_FLOW_SQL = f"""
+WITH journeys AS (
+    SELECT
+        j.id,
+        COALESCE(j.total_revenue, 0) AS revenue,
+        COALESCE(j.total_orders, 0) > 0 AS purchased,
+        LOWER(COALESCE(j.first_touch_source, '')) AS source,
+        LOWER(COALESCE(j.first_touch_medium, '')) AS medium
+    FROM customer_journeys j
+    WHERE j.workspace_id = CAST(:workspace_id AS uuid)
+      AND j.first_seen_at >= :period_start
+),
+first_touch AS (
+    SELECT DISTINCT ON (t.journey_id)
+        t.journey_id,
+        LOWER(COALESCE(t.utm_source, '')) AS source,
+        LOWER(COALESCE(t.utm_medium, '')) AS medium
+    FROM journey_touchpoints t
+    JOIN journeys j ON j.id = t.journey_id
+    WHERE j.source = ''
+    ORDER BY t.journey_id, t.touched_at
+),
+sourced AS (
+    SELECT
+        j.id,
+        j.revenue,
+        j.purchased,
+        CASE WHEN j.source = '' THEN COALESCE(f.source, '') ELSE j.source END AS source,
+        CASE WHEN j.source = '' AND j.medium = '' THEN COALESCE(f.medium, '') ELSE j.medium END AS medium
+    FROM journeys j
+    LEFT JOIN first_touch f ON f.journey_id = j.id
+),
+stages AS (
+    -- First occurrence of each stage per journey (de-duplicated stages)
+    SELECT t.journey_id, {_stage_case("t.event_type")} AS stage, MIN(t.touched_at) AS first_at
+    FROM journey_touchpoints t
+    JOIN journeys j ON j.id = t.journey_id
+    WHERE t.event_type IN ({", ".join(f"'{e}'" for e in FLOW_STAGES)})
+    GROUP BY t.journey_id, stage
+),
+steps AS (
+    SELECT
+        s.journey_id,
+        s.stage,
+        LAG(s.stage) OVER w AS prev_stage,
+        ROW_NUMBER() OVER (PARTITION BY s.journey_id ORDER BY s.first_at DESC, s.stage DESC) = 1 AS is_last,
+        j.revenue,
+        j.purchased
+    FROM stages s
+    JOIN journeys j ON j.id = s.journey_id
+    WINDOW w AS (PARTITION BY s.journey_id ORDER BY s.first_at, s.stage)
+),
+entries AS (
+    -- Where each journey goes after its source: first stage, or the outcome
+    SELECT
+        src.source,
+        src.medium,
+        COALESCE(
+            st.stage,
+            CASE WHEN src.purchased THEN '{OUTCOME_PURCHASED}' ELSE '{OUTCOME_DROPPED}' END
+        ) AS target,
+        src.revenue
+    FROM sourced src
+    LEFT JOIN steps st ON st.journey_id = src.id AND st.prev_stage IS NULL
+),
+exits AS (
+    -- Last stage -> outcome (journeys without stages link from the source)
+    SELECT
+        stage,
+        CASE WHEN purchased THEN '{OUTCOME_PURCHASED}' ELSE '{OUTCOME_DROPPED}' END AS outcome,
+        revenue
+    FROM steps
+    WHERE is_last
+)
+SELECT 'source_link' AS kind, source AS a, medium AS b, target AS c,
+       COUNT(*) AS value, SUM(revenue) AS revenue
+FROM entries GROUP BY source, medium, target
+UNION ALL
+SELECT 'stage_link', prev_stage, stage, NULL, COUNT(*), SUM(revenue)
+FROM steps WHERE prev_stage IS NOT NULL GROUP BY prev_stage, stage
+UNION ALL
+SELECT 'stage', stage, NULL, NULL, COUNT(*), SUM(revenue)
+FROM steps GROUP BY stage
+UNION ALL
+SELECT 'exit_link', stage, outcome, NULL, COUNT(*), SUM(revenue)
+FROM exits GROUP BY stage, outcome
+UNION ALL
+SELECT 'outcome', CASE WHEN purchased THEN '{OUTCOME_PURCHASED}' ELSE '{OUTCOME_DROPPED}' END,
+       NULL, NULL, COUNT(*), SUM(revenue)
+FROM sourced GROUP BY purchased
+"""
+
+
+def _aggregate_in_sql(db: Session, workspace_id: UUID, period_start: datetime) -> JourneyFlowAggregate:
+    rows = db.execute(
+        text(_FLOW_SQL),
+        {"workspace_id": str(workspace_id), "period_start": period_start},
+    ).fetchall()
+    return _aggregate_from_rows(rows)
+
+
+def _aggregate_from_rows(rows: Iterable) -> JourneyFlowAggregate:
+    """Fold pre-aggregated (kind, a, b, c, value, revenue) rows into an aggregate."""
+    result = JourneyFlowAggregate()
+
+    for kind, a, b, c, value, revenue in rows:
+        value = int(value or 0)
+        revenue = float(revenue or 0)
+
+        if kind == "source_link":
+            source_id = f"source_{classify_source(a, b)}"
+            result.add_node(source_id, value, revenue)
+            result.add_link(source_id, c, value, revenue)
+        elif kind == "stage_link":
+            result.add_link(a, b, value, revenue)
+        elif kind == "stage":
+            result.add_node(a, value, revenue)
+        elif kind == "exit_link":
+            result.add_link(a, b, value, revenue)
+        elif kind == "outcome":
+            result.add_node(a, value, revenue)
+            result.total_journeys += value
+            result.total_revenue += revenue
+
+    return result
+
+
+# =============================================================================
+# STREAMING FALLBACK
+# =============================================================================
+
+def _aggregate_streaming(db: Session, workspace_id: UUID, period_start: datetime) -> JourneyFlowAggregate:
+    """Walk journeys one at a time over a server-side cursor.
+
+    WHAT: Selects plain columns of journeys LEFT JOIN touchpoints ordered by
+          (journey, touched_at) with stream_results, so only one journey's
+          touchpoints are held at a time.
+    """
+    rows = (
+        db.query(
+            CustomerJourney.id,
+            CustomerJourney.total_revenue,
+            CustomerJourney.total_orders,
+            CustomerJourney.first_touch_source,
+            CustomerJourney.first_touch_medium,
+            JourneyTouchpoint.event_type,
+            JourneyTouchpoint.utm_source,
+            JourneyTouchpoint.utm_medium,
+        )
+        .outerjoin(JourneyTouchpoint, JourneyTouchpoint.journey_id == CustomerJourney.id)
+        .filter(
+            CustomerJourney.workspace_id == workspace_id,
+            CustomerJourney.first_seen_at >= period_start,
+        )
+        .order_by(CustomerJourney.id, JourneyTouchpoint.touched_at)
+        .execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE)
+    )
+
+    result = JourneyFlowAggregate()
+    current_id = None
+    journey_rows: List = []
+
+    for row in rows:
+        if row.id != current_id and journey_rows:
+            _walk_journey(result, journey_rows)
+            journey_rows = []
+        current_id = row.id
+        journey_rows.append(row)
+
+    if journey_rows:
+        _walk_journey(result, journey_rows)
+
+    return result
+
+
+def _walk_journey(result: JourneyFlowAggregate, rows: List) -> None:
+    """Add one journey (its rows ordered by touched_at) to the aggregate."""
+    journey = rows[0]
+    revenue = float(journey.total_revenue or 0)
+    outcome_id = OUTCOME_PURCHASED if (journey.total_orders or 0) > 0 else OUTCOME_DROPPED
+    has_touchpoints = journey.event_type is not None
+
+    source, medium = journey.first_touch_source, journey.first_touch_medium
+    if not source and has_touchpoints:
+        source = journey.utm_source
+        medium = medium or journey.utm_medium
+    source_id = f"source_{classify_source(source, medium)}"
+
+    result.total_journeys += 1
+    result.total_revenue += revenue
+    result.add_node(source_id, 1, revenue)
+
+    prev_node_id = source_id
+    seen_stages = set()
+    for row in rows if has_touchpoints else []:
+        stage_id = FLOW_STAGES.get(row.event_type)
+        if not stage_id or stage_id in seen_stages:
+            continue
+        seen_stages.add(stage_id)
+        result.add_node(stage_id, 1, revenue)
+        result.add_link(prev_node_id, stage_id, 1, revenue)
+        prev_node_id = stage_id
+
+    result.add_node(outcome_id, 1, revenue)
+    result.add_link(prev_node_id, outcome_id, 1, revenue)
@@ -21,6 +21,7 @@ DEPENDENCIES:
 RATE LIMITS:
     - 200 API calls per hour per ad account
     - Implements decorator: @rate_limit(calls_per_hour=200)
+    - Budget shared across workers via app/services/rate_limit_backend.py
 
 REFERENCES:
     - backend/test_meta_api.py (test patterns)
@@ -28,11 +29,10 @@ REFERENCES:
     - https://developers.facebook.com/docs/marketing-api
 """
 
+import hashlib
 import logging
 from functools import wraps
 from time import time, sleep
-from collections import deque
-from threading import Lock
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -45,6 +45,11 @@ from facebook_business.adobjects.adcreative import AdCreative
 from facebook_business.adobjects.adsinsights import AdsInsights
 from facebook_business.exceptions import FacebookRequestError
 
+from app.services.rate_limit_backend import (
+    RateLimitExceededError,
+    get_rate_limit_backend,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,22 +79,50 @@ def ensure_act_prefix(account_id: str) -> str:
     return account_id
 
 
-# Shared in-process limiter state.
-# Keyed by (scope, calls_per_hour), where scope is usually client token.
-_rate_limit_call_times: Dict[tuple[str, int], deque] = {}
-_rate_limit_lock = Lock()
+# Meta budget window (calls_per_hour)
+RATE_LIMIT_WINDOW_SECONDS = 3600
+
+
+def _rate_limit_scope(func, args, kwargs) -> str:
+    """Resolve the budget a call draws from.
+
+    WHAT:
+        - Ad account (account_id argument, else the client's account_id)
+        - Else the client's access token (hashed, never stored in Redis)
+        - Plain functions get their own scope (unit tests)
+    WHY:
+        Meta's budget is per ad account; all decorated API methods and all
+        workers syncing that account share it.
+    """
+    client = args[0] if args and hasattr(args[0], "access_token") else None
+    if client is None:
+        return f"func:{func.__module__}.{func.__qualname__}"
+
+    account_id = kwargs.get("account_id")
+    if account_id is None and len(args) > 1 and func.__code__.co_varnames[1:2] == ("account_id",):
+        account_id = args[1]
+    account_id = account_id or getattr(client, "account_id", None)
+    if account_id:
+        return f"account:{ensure_act_prefix(account_id)}"
+
+    token_hash = hashlib.sha256(str(client.access_token).encode()).hexdigest()[:16]
+    return f"token:{token_hash}"
 
 
 def rate_limit(calls_per_hour: int):
     """Decorator to enforce rate limiting using sliding window algorithm.
     
     WHAT:
-        Tracks API call timestamps in a deque and enforces maximum calls per hour.
-        Sleeps if rate limit would be exceeded.
+        Reserves a slot in the shared sliding window (rate_limit_backend) of
+        the ad account before each call. When the window is full it sleeps
+        until a slot frees up, or - if the client set max_rate_limit_wait and
+        the wait is longer - raises RateLimitExceededError so the job can be
+        rescheduled.
     
     WHY:
         Meta enforces 200 calls/hour per ad account. Exceeding this causes 429 errors.
         Proactive rate limiting prevents API throttling and ensures reliable syncs.
+        The window lives in Redis so every worker process shares one budget.
     
     Args:
         calls_per_hour: Maximum number of calls allowed per hour
@@ -100,41 +133,31 @@ def rate_limit(calls_per_hour: int):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            now = time()
-
-            # For MetaAdsClient instance methods, scope by client token so
-            # all decorated API methods share one budget per client.
-            if args and hasattr(args[0], "access_token"):
-                scope = f"token:{getattr(args[0], 'access_token')}"
-            else:
-                # Keep plain function usage deterministic for unit tests.
-                scope = f"func:{func.__module__}.{func.__qualname__}"
-            key = (scope, calls_per_hour)
+            key = f"meta:{_rate_limit_scope(func, args, kwargs)}:{calls_per_hour}"
+            max_wait = getattr(args[0], "max_rate_limit_wait", None) if args else None
+            backend = get_rate_limit_backend()
 
             while True:
-                with _rate_limit_lock:
-                    call_times = _rate_limit_call_times.get(key)
-                    if call_times is None:
-                        call_times = deque(maxlen=calls_per_hour)
-                        _rate_limit_call_times[key] = call_times
-
-                    # Remove calls older than 1 hour (3600 seconds)
-                    while call_times and call_times[0] < now - 3600:
-                        call_times.popleft()
-
-                    # Reserve a slot if available.
-                    if len(call_times) < calls_per_hour:
-                        call_times.append(now)
-                        break
-
-                    sleep_time = max(0.0, 3600 - (now - call_times[0]) + 1)
+                reservation = backend.reserve(
+                    key, calls_per_hour, RATE_LIMIT_WINDOW_SECONDS, now=time()
+                )
+                if reservation.allowed:
+                    break
+
+                sleep_time = reservation.retry_after + 1
+                if max_wait is not None and sleep_time > max_wait:
+                    raise RateLimitExceededError(
+                        f"Meta rate limit reached ({calls_per_hour} calls/hour). "
+                        f"Retry in {sleep_time:.0f}s",
+                        retry_seconds=sleep_time,
+                        key=key,
+                    )
 
                 logger.warning(
                     f"[META_CLIENT] Rate limit reached ({calls_per_hour} calls/hour). "
                     f"Sleeping for {sleep_time:.1f}s"
                 )
                 sleep(sleep_time)
-                now = time()
 
             return func(*args, **kwargs)
         return wrapper
@@ -180,7 +203,14 @@ class MetaAdsClient:
         ```
     """
     
-    def __init__(self, access_token: str, app_id: Optional[str] = None, app_secret: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: str,
+        app_id: Optional[str] = None,
+        app_secret: Optional[str] = None,
+        account_id: Optional[str] = None,
+        max_rate_limit_wait: Optional[float] = None,
+    ):
         """Initialize Meta Ads client with access token.
         
         WHAT:
@@ -195,8 +225,14 @@ class MetaAdsClient:
             access_token: Meta access token (system user or OAuth)
             app_id: Optional Meta app ID
             app_secret: Optional Meta app secret
+            account_id: Ad account this client works on; calls without an
+                        account_id argument are charged to its budget
+            max_rate_limit_wait: Longest rate-limit sleep (seconds); longer
+                                 waits raise RateLimitExceededError. None = always wait
         """
         self.access_token = access_token
+        self.account_id = account_id
+        self.max_rate_limit_wait = max_rate_limit_wait
         
         # Initialize Facebook Ads API
         FacebookAdsApi.init(
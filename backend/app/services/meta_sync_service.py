@@ -45,6 +45,7 @@ from app.schemas import (
     MetricFactCreate,
 )
 from app.security import decrypt_secret
+from app.services.entity_hierarchy_service import sync_entity_ancestors
 from app.services.meta_ads_client import (
     MetaAdsClient,
     MetaAdsClientError,
@@ -52,6 +53,7 @@ from app.services.meta_ads_client import (
     MetaAdsPermissionError,
     ensure_act_prefix,
 )
+from app.services.rate_limit_backend import MAX_RATE_LIMIT_WAIT_SECONDS, RateLimitExceededError
 
 logger = logging.getLogger(__name__)
 
@@ -202,7 +204,12 @@ def sync_meta_entities(
             )
 
         access_token = _get_access_token(connection)
-        client = MetaAdsClient(access_token=access_token)
+        # Charge the account's shared budget; defer long waits to the caller
+        client = MetaAdsClient(
+            access_token=access_token,
+            account_id=connection.external_account_id,
+            max_rate_limit_wait=MAX_RATE_LIMIT_WAIT_SECONDS,
+        )
         account_id = ensure_act_prefix(connection.external_account_id)
 
         # =====================================================================
@@ -374,7 +381,8 @@ def sync_meta_entities(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Meta authentication failed. Refresh access token.",
         ) from e
-    except HTTPException:
+    except (HTTPException, RateLimitExceededError):
+        # Rate limits carry retry_seconds: callers reschedule or answer 429
         raise
     except Exception as e:
         logger.exception("[META_SYNC] Unexpected error during entity sync: %s", e)
@@ -475,7 +483,12 @@ def sync_meta_metrics(
             )
 
         access_token = _get_access_token(connection)
-        client = MetaAdsClient(access_token=access_token)
+        # Charge the account's shared budget; defer long waits to the caller
+        client = MetaAdsClient(
+            access_token=access_token,
+            account_id=connection.external_account_id,
+            max_rate_limit_wait=MAX_RATE_LIMIT_WAIT_SECONDS,
+        )
 
         date_chunks = _chunk_date_range(start_date, end_date, chunk_size_days=7)
 
@@ -573,7 +586,8 @@ def sync_meta_metrics(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Meta authentication failed. Refresh access token.",
         ) from e
-    except HTTPException:
+    except (HTTPException, RateLimitExceededError):
+        # Rate limits carry retry_seconds: callers reschedule or answer 429
         raise
     except Exception as e:
         logger.exception("[META_SYNC] Unexpected error during metrics sync: %s", e)
@@ -715,6 +729,9 @@ def _upsert_entity(
     # Fetch the entity from session to return proper ORM object
     entity = db.query(Entity).filter(Entity.id == row.id).first()
 
+    # Keep the hierarchy closure table in step (no-op when parent/level unchanged)
+    sync_entity_ancestors(db, entity.id, parent_id, level, entity.workspace_id)
+
     # Determine if this was a create or update
     # If created_at matches our 'now' value (within tolerance), it was created
     was_created = abs((entity.created_at - now).total_seconds()) < 1
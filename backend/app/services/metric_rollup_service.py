@@ -0,0 +1,377 @@
+"""Metric Daily Rollup Service - latest snapshot per entity per day.
+
+WHAT:
+    Maintains the metric_daily_rollups table, which holds one row per
+    (entity_id, provider, metrics_date) with the values of the latest
+    MetricSnapshot for that day.
+
+    - upsert_daily_rollup(s): incremental write, called by the snapshot sync
+    - rebuild_daily_rollups: backfill/rebuild from raw snapshots
+    - check_rollup_consistency: diff rollups against raw snapshots
+
+WHY:
+    Every daily read in UnifiedMetricService used to rebuild a
+    max(captured_at) GROUP BY entity_id, metrics_date subquery over the raw
+    15-min rows. Maintaining the result at write time makes dashboard tiles
+    read a few hundred rows instead of hundreds of thousands.
+
+REFERENCES:
+    - app/models.py:MetricDailyRollup
+    - app/services/snapshot_sync_service.py (_SnapshotBatchWriter)
+    - app/services/unified_metric_service.py (rollup read path)
+    - scripts/rebuild_metric_rollups.py (CLI)
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import MetricDailyRollup
+
+logger = logging.getLogger(__name__)
+
+
+# Base measures copied from a snapshot into its daily rollup row
+ROLLUP_MEASURES = (
+    "spend",
+    "impressions",
+    "clicks",
+    "conversions",
+    "revenue",
+    "leads",
+    "purchases",
+    "installs",
+    "visitors",
+    "profit",
+)
+
+# Measures compared by the consistency checker
+CHECKED_MEASURES = ("spend", "revenue", "clicks", "impressions", "conversions")
+
+
+# =============================================================================
+# INCREMENTAL WRITE PATH
+# =============================================================================
+
+def _rollup_row(snapshot_data: Dict[str, Any], workspace_id: UUID, now: datetime) -> Dict[str, Any]:
+    row = {
+        "entity_id": snapshot_data["entity_id"],
+        "workspace_id": workspace_id,
+        "provider": snapshot_data["provider"],
+        "metrics_date": snapshot_data["metrics_date"],
+        "captured_at": snapshot_data["captured_at"],
+        "currency": snapshot_data.get("currency", "USD"),
+        "updated_at": now,
+    }
+    for measure in ROLLUP_MEASURES:
+        if measure in snapshot_data:
+            row[measure] = snapshot_data[measure]
+    return row
+
+
+def build_rollup_upsert(snapshot_data: Dict[str, Any], workspace_id: UUID):
+    """Build the INSERT ... ON CONFLICT statement for one snapshot's rollup row.
+
+    Only the measures present in `snapshot_data` are updated on conflict, which
+    mirrors how the snapshot upsert itself treats provider-specific fields.
+    The WHERE guard keeps the row pinned to the latest captured_at, so an
+    older snapshot (e.g. attribution re-fetch anchored to end-of-day) written
+    after a newer one never overwrites it.
+    """
+    return build_rollup_upsert_many([snapshot_data], workspace_id)
+
+
+def build_rollup_upsert_many(snapshots: List[Dict[str, Any]], workspace_id: UUID):
+    """Build one multi-row rollup upsert (same rules as build_rollup_upsert).
+
+    All snapshots must carry the same measures (one provider per batch) and
+    distinct (entity_id, provider, metrics_date) keys: Postgres rejects an
+    ON CONFLICT DO UPDATE that hits the same row twice.
+    """
+    now = datetime.now(timezone.utc)
+    rows = [_rollup_row(snapshot_data, workspace_id, now) for snapshot_data in snapshots]
+
+    stmt = insert(MetricDailyRollup).values(rows)
+    update_cols = [k for k in rows[0] if k not in ("entity_id", "provider", "metrics_date")]
+    return stmt.on_conflict_do_update(
+        constraint="uq_metric_daily_rollups_entity_provider_date",
+        set_={col: getattr(stmt.excluded, col) for col in update_cols},
+        where=MetricDailyRollup.captured_at <= stmt.excluded.captured_at,
+    )
+
+
+def upsert_daily_rollup(
+    db: Session,
+    snapshot_data: Dict[str, Any],
+    workspace_id: UUID,
+) -> bool:
+    """Apply a freshly written snapshot to its daily rollup row.
+
+    Runs in the caller's transaction so the snapshot and its rollup commit
+    (or roll back) together.
+
+    Args:
+        db: Database session
+        snapshot_data: The values just upserted into metric_snapshots
+        workspace_id: Workspace of the snapshot's entity
+
+    Returns:
+        True if a rollup write was issued, False if the snapshot has no metrics_date
+    """
+    if snapshot_data.get("metrics_date") is None:
+        return False
+
+    db.execute(build_rollup_upsert(snapshot_data, workspace_id))
+    return True
+
+
+def upsert_daily_rollups(
+    db: Session,
+    snapshots: List[Dict[str, Any]],
+    workspace_id: UUID,
+) -> int:
+    """Apply a batch of freshly written snapshots with one rollup statement.
+
+    Snapshots without metrics_date are skipped. When a batch holds several
+    snapshots of the same entity and day, only the latest captured_at is
+    written (the one the WHERE guard would keep anyway).
+
+    Args:
+        db: Database session (caller's transaction)
+        snapshots: Values just upserted into metric_snapshots (one provider)
+        workspace_id: Workspace of the snapshots' entities
+
+    Returns:
+        Number of rollup rows written
+    """
+    latest: Dict[Any, Dict[str, Any]] = {}
+    for snapshot_data in snapshots:
+        if snapshot_data.get("metrics_date") is None:
+            continue
+        key = (snapshot_data["entity_id"], snapshot_data["provider"], snapshot_data["metrics_date"])
+        current = latest.get(key)
+        if current is None or current["captured_at"] <= snapshot_data["captured_at"]:
+            latest[key] = snapshot_data
+
+    if not latest:
+        return 0
+
+    db.execute(build_rollup_upsert_many(list(latest.values()), workspace_id))
+    return len(latest)
+
+
+# =============================================================================
+# BACKFILL / REBUILD
+# =============================================================================
+
+def _scope_clause(
+    alias: str,
+    workspace_id: Optional[UUID],
+    start_date: Optional[date],
+    end_date: Optional[date],
+) -> str:
+    """Build the WHERE fragment restricting a rebuild/check to a scope."""
+    clauses = []
+    if workspace_id is not None:
+        clauses.append("e.workspace_id = :workspace_id")
+    if start_date is not None:
+        clauses.append(f"{alias}.metrics_date >= :start_date")
+    if end_date is not None:
+        clauses.append(f"{alias}.metrics_date <= :end_date")
+    return (" AND " + " AND ".join(clauses)) if clauses else ""
+
+
+def rebuild_daily_rollups(
+    db: Session,
+    workspace_id: Optional[UUID] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> Dict[str, int]:
+    """Rebuild rollup rows from raw snapshots for a scope.
+
+    WHAT:
+        Deletes rollup rows in scope, then re-derives them with
+        DISTINCT ON (entity_id, provider, metrics_date) ORDER BY captured_at DESC.
+        Runs as a single transaction so readers never see a half-built scope.
+
+    WHEN:
+        - Initial backfill after deploying the rollup table
+        - Repair after check_rollup_consistency reports drift
+        - After manual snapshot deletes/corrections
+
+    Args:
+        db: Database session
+        workspace_id: Restrict to one workspace (None = all workspaces)
+        start_date: First metrics_date to rebuild (inclusive)
+        end_date: Last metrics_date to rebuild (inclusive)
+
+    Returns:
+        Dict with deleted/inserted row counts
+    """
+    params = {
+        "workspace_id": workspace_id,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+
+    delete_sql = text(f"""
+        DELETE FROM metric_daily_rollups r
+        USING entities e
+        WHERE e.id = r.entity_id
+        {_scope_clause("r", workspace_id, start_date, end_date)}
+    """)
+
+    insert_sql = text(f"""
+        INSERT INTO metric_daily_rollups (
+            id, entity_id, workspace_id, provider, metrics_date, captured_at,
+            spend, impressions, clicks, conversions, revenue,
+            leads, purchases, installs, visitors, profit, currency, updated_at
+        )
+        SELECT DISTINCT ON (s.entity_id, s.provider, s.metrics_date)
+            gen_random_uuid(), s.entity_id, e.workspace_id, s.provider,
+            s.metrics_date, s.captured_at,
+            s.spend, s.impressions, s.clicks, s.conversions, s.revenue,
+            s.leads, s.purchases, s.installs, s.visitors, s.profit, s.currency,
+            NOW()
+        FROM metric_snapshots s
+        JOIN entities e ON e.id = s.entity_id
+        WHERE s.metrics_date IS NOT NULL
+        {_scope_clause("s", workspace_id, start_date, end_date)}
+        ORDER BY s.entity_id, s.provider, s.metrics_date, s.captured_at DESC
+    """)
+
+    try:
+        deleted = db.execute(delete_sql, params).rowcount or 0
+        inserted = db.execute(insert_sql, params).rowcount or 0
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        "[ROLLUP] Rebuilt daily rollups (workspace=%s, %s to %s): deleted=%d, inserted=%d",
+        workspace_id or "all", start_date or "-inf", end_date or "+inf", deleted, inserted,
+    )
+    return {"deleted": deleted, "inserted": inserted}
+
+
+# =============================================================================
+# CONSISTENCY CHECK
+# =============================================================================
+
+@dataclass
+class RollupConsistencyReport:
+    """Result of comparing rollups against raw snapshots."""
+
+    checked: int = 0
+    missing: int = 0      # latest snapshot exists, rollup row does not
+    orphaned: int = 0     # rollup row exists, no snapshot for that day
+    mismatched: int = 0   # both exist but values differ
+    samples: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def consistent(self) -> bool:
+        return self.missing == 0 and self.orphaned == 0 and self.mismatched == 0
+
+
+def check_rollup_consistency(
+    db: Session,
+    workspace_id: Optional[UUID] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    sample_limit: int = 20,
+) -> RollupConsistencyReport:
+    """Diff metric_daily_rollups against the latest raw snapshot per day.
+
+    WHAT:
+        FULL OUTER JOINs the rollup rows in scope with the DISTINCT ON
+        latest-snapshot set and classifies each key as ok / missing /
+        orphaned / mismatched on the main base measures.
+
+    WHY:
+        The rollup is maintained incrementally; this is the safety net that
+        proves it still matches what the raw-snapshot read path would return.
+
+    Args:
+        db: Database session
+        workspace_id: Restrict to one workspace (None = all workspaces)
+        start_date: First metrics_date to check (inclusive)
+        end_date: Last metrics_date to check (inclusive)
+        sample_limit: Max number of offending keys returned in `samples`
+
+    Returns:
+        RollupConsistencyReport
+    """
+    diff_predicate = " OR ".join(
+        f"l.{m} IS DISTINCT FROM r.{m}" for m in CHECKED_MEASURES
+    )
+
+    check_sql = text(f"""
+        WITH latest AS (
+            SELECT DISTINCT ON (s.entity_id, s.provider, s.metrics_date)
+                s.entity_id, s.provider, s.metrics_date,
+                {", ".join(f"s.{m}" for m in CHECKED_MEASURES)}
+            FROM metric_snapshots s
+            JOIN entities e ON e.id = s.entity_id
+            WHERE s.metrics_date IS NOT NULL
+            {_scope_clause("s", workspace_id, start_date, end_date)}
+            ORDER BY s.entity_id, s.provider, s.metrics_date, s.captured_at DESC
+        ),
+        rollups AS (
+            SELECT r.entity_id, r.provider, r.metrics_date,
+                {", ".join(f"r.{m}" for m in CHECKED_MEASURES)}
+            FROM metric_daily_rollups r
+            JOIN entities e ON e.id = r.entity_id
+            WHERE TRUE
+            {_scope_clause("r", workspace_id, start_date, end_date)}
+        )
+        SELECT
+            COALESCE(l.entity_id, r.entity_id) AS entity_id,
+            COALESCE(l.provider, r.provider) AS provider,
+            COALESCE(l.metrics_date, r.metrics_date) AS metrics_date,
+            CASE
+                WHEN r.entity_id IS NULL THEN 'missing'
+                WHEN l.entity_id IS NULL THEN 'orphaned'
+                WHEN {diff_predicate} THEN 'mismatched'
+                ELSE 'ok'
+            END AS status
+        FROM latest l
+        FULL OUTER JOIN rollups r
+          ON r.entity_id = l.entity_id
+         AND r.provider = l.provider
+         AND r.metrics_date = l.metrics_date
+    """)
+
+    report = RollupConsistencyReport()
+    rows = db.execute(check_sql, {
+        "workspace_id": workspace_id,
+        "start_date": start_date,
+        "end_date": end_date,
+    })
+
+    for row in rows:
+        report.checked += 1
+        if row.status == "ok":
+            continue
+        setattr(report, row.status, getattr(report, row.status) + 1)
+        if len(report.samples) < sample_limit:
+            report.samples.append({
+                "entity_id": str(row.entity_id),
+                "provider": row.provider,
+                "metrics_date": str(row.metrics_date),
+                "status": row.status,
+            })
+
+    logger.info(
+        "[ROLLUP] Consistency check (workspace=%s): checked=%d, missing=%d, orphaned=%d, mismatched=%d",
+        workspace_id or "all", report.checked, report.missing, report.orphaned, report.mismatched,
+    )
+    return report
@@ -0,0 +1,449 @@
+"""Pixel Event Buffer - write-behind batching for pixel event ingestion.
+
+WHAT:
+    In-process buffer that accumulates pixel events and flushes them in one
+    transaction per batch:
+    - Multi-row INSERT into pixel_events ... ON CONFLICT (workspace_id, event_id)
+      DO NOTHING (dedup via the ix_pixel_events_dedup partial unique index)
+    - One customer_journeys upsert per visitor (events coalesced per visitor)
+    - Multi-row INSERT of journey_touchpoints
+    Flushes when the buffer reaches PIXEL_BUFFER_MAX_EVENTS or every
+    PIXEL_BUFFER_FLUSH_SECONDS, whichever comes first.
+
+WHY:
+    The single-event endpoint does a workspace lookup, a dedup SELECT, an
+    insert, a journey get-or-create and a commit per browser event. During
+    Shopify flash sales that is thousands of commits per second.
+
+FAILURES:
+    A failed batch is put back at the head of the queue and retried with the
+    next flush, up to PIXEL_BUFFER_MAX_RETRIES consecutive failures (database
+    blips). After that it is written one event at a time, so only events
+    that fail on their own are dropped (logged and reported). The shutdown
+    flush has no later flush to retry with, so it goes event by event right
+    away.
+
+ORDERING:
+    Flushes are serialized and events are written and broadcast in arrival
+    order, so the WebSocket live feed sees the same order as the single-event
+    endpoint would have produced. Duplicates are never broadcast.
+
+USAGE:
+    from app.services.pixel_event_buffer import pixel_event_buffer
+    await pixel_event_buffer.add([event_values, ...])
+
+    # On shutdown
+    await pixel_event_buffer.close()
+
+REFERENCES:
+    - backend/app/routers/pixel_events.py (POST /v1/pixel-events/batch)
+    - backend/app/services/pixel_websocket_manager.py (broadcast)
+    - alembic/versions/20251130_000001_add_attribution_tables.py (ix_pixel_events_dedup)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models import CustomerJourney, JourneyTouchpoint, PixelEvent
+from app.telemetry import capture_exception
+
+logger = logging.getLogger(__name__)
+
+
+# Flush when this many events are pending...
+PIXEL_BUFFER_MAX_EVENTS = int(os.getenv("PIXEL_BUFFER_MAX_EVENTS", "500"))
+# ...or when the oldest pending event is this old
+PIXEL_BUFFER_FLUSH_SECONDS = float(os.getenv("PIXEL_BUFFER_FLUSH_SECONDS", "1.0"))
+# Failed batches are re-queued this many times before being written event by event
+PIXEL_BUFFER_MAX_RETRIES = int(os.getenv("PIXEL_BUFFER_MAX_RETRIES", "3"))
+
+# Events that create a touchpoint (first visit captures UTMs, checkout events)
+TOUCHPOINT_EVENT_TYPES = ("page_viewed", "checkout_started", "checkout_completed")
+
+# Attribution columns shared by pixel_events and journey_touchpoints
+ATTRIBUTION_FIELDS = (
+    "utm_source",
+    "utm_medium",
+    "utm_campaign",
+    "utm_content",
+    "utm_term",
+    "fbclid",
+    "gclid",
+    "ttclid",
+    "landing_page",
+)
+
+# journey last_touch_* column -> pixel event field
+LAST_TOUCH_FIELDS = {
+    "last_touch_source": "utm_source",
+    "last_touch_medium": "utm_medium",
+    "last_touch_campaign": "utm_campaign",
+}
+
+
+# =============================================================================
+# ROW HELPERS
+# =============================================================================
+
+def has_attribution(values: Dict[str, Any]) -> bool:
+    """True if pixel event values carry any UTM or click ID."""
+    return any(
+        values.get(key)
+        for key in ("utm_source", "utm_campaign", "fbclid", "gclid", "ttclid")
+    )
+
+
+def is_touchpoint(values: Dict[str, Any]) -> bool:
+    """True if the event should create a journey touchpoint."""
+    return values["event_type"] in TOUCHPOINT_EVENT_TYPES and has_attribution(values)
+
+
+def broadcast_payload(values: Dict[str, Any]) -> Dict[str, Any]:
+    """WebSocket live-feed message for a stored pixel event."""
+    created_at = values.get("created_at")
+    return {
+        "type": "pixel_event",
+        "id": str(values["id"]),
+        "event_type": values["event_type"],
+        "visitor_id": values["visitor_id"],
+        "url": values.get("url"),
+        "utm_source": values.get("utm_source"),
+        "utm_medium": values.get("utm_medium"),
+        "utm_campaign": values.get("utm_campaign"),
+        "created_at": created_at.isoformat() if created_at else None,
+    }
+
+
+def _coalesce_journeys(
+    events: List[Dict[str, Any]],
+    now: datetime,
+) -> Dict[Tuple[UUID, str], Dict[str, Any]]:
+    """Fold a batch of events into one journey upsert row per visitor.
+
+    Mirrors the single-event path applied event by event: first touch comes
+    from the visitor's first event (only used if the journey is new), last
+    touch fields keep the latest non-null value from touchpoint events, and
+    checkout_token the latest checkout_completed token.
+    """
+    journeys: Dict[Tuple[UUID, str], Dict[str, Any]] = {}
+
+    for values in events:
+        key = (values["workspace_id"], values["visitor_id"])
+        journey = journeys.get(key)
+        if journey is None:
+            first_touch = has_attribution(values)
+            journey = {
+                "workspace_id": values["workspace_id"],
+                "visitor_id": values["visitor_id"],
+                "first_seen_at": now,
+                "last_seen_at": now,
+                "touchpoint_count": 0,
+                "total_orders": 0,
+                "total_revenue": 0,
+                "first_touch_source": values.get("utm_source") if first_touch else None,
+                "first_touch_medium": values.get("utm_medium") if first_touch else None,
+                "first_touch_campaign": values.get("utm_campaign") if first_touch else None,
+                "last_touch_source": None,
+                "last_touch_medium": None,
+                "last_touch_campaign": None,
+                "checkout_token": None,
+            }
+            journeys[key] = journey
+
+        if is_touchpoint(values):
+            journey["touchpoint_count"] += 1
+            for column, field in LAST_TOUCH_FIELDS.items():
+                if values.get(field):
+                    journey[column] = values[field]
+
+        if values["event_type"] == "checkout_completed":
+            checkout_token = (values.get("event_data") or {}).get("checkout_token")
+            if checkout_token:
+                journey["checkout_token"] = checkout_token
+
+    return journeys
+
+
+# =============================================================================
+# BATCH WRITE
+# =============================================================================
+
+def write_pixel_event_batch(db: Session, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Persist a batch of pixel events, journeys and touchpoints in one transaction.
+
+    WHAT:
+        1. Multi-row insert of pixel_events, duplicates (same workspace_id +
+           event_id, in the table or earlier in the batch) skipped
+        2. One journey upsert per visitor for the newly stored events
+        3. Multi-row insert of touchpoints
+        4. Commit
+
+    Args:
+        db: Database session
+        events: PixelEvent column values in arrival order; each must carry a
+                pre-assigned "id" so inserted rows can be matched back
+
+    Returns:
+        The stored (non-duplicate) events, in arrival order
+    """
+    if not events:
+        return []
+
+    # Drop duplicates within the batch (first occurrence wins, like arrival order)
+    seen_event_ids = set()
+    unique_events = []
+    for values in events:
+        if values.get("event_id"):
+            dedup_key = (values["workspace_id"], values["event_id"])
+            if dedup_key in seen_event_ids:
+                continue
+            seen_event_ids.add(dedup_key)
+        unique_events.append(values)
+
+    try:
+        # 1. Events (ON CONFLICT targets the ix_pixel_events_dedup partial index)
+        insert_events = (
+            pg_insert(PixelEvent)
+            .values(unique_events)
+            .on_conflict_do_nothing(
+                index_elements=["workspace_id", "event_id"],
+                index_where=text("event_id IS NOT NULL"),
+            )
+            .returning(PixelEvent.id)
+        )
+        inserted_ids = {row.id for row in db.execute(insert_events)}
+        stored = [values for values in unique_events if values["id"] in inserted_ids]
+
+        if stored:
+            # 2. Journeys, coalesced per visitor
+            journey_rows = list(_coalesce_journeys(stored, datetime.utcnow()).values())
+            insert_journeys = pg_insert(CustomerJourney).values(journey_rows)
+            existing = CustomerJourney.__table__.c
+            excluded = insert_journeys.excluded
+            upsert_journeys = insert_journeys.on_conflict_do_update(
+                constraint="uq_journey_visitor",
+                set_={
+                    "last_seen_at": excluded.last_seen_at,
+                    "touchpoint_count": (
+                        func.coalesce(existing.touchpoint_count, 0) + excluded.touchpoint_count
+                    ),
+                    "last_touch_source": func.coalesce(excluded.last_touch_source, existing.last_touch_source),
+                    "last_touch_medium": func.coalesce(excluded.last_touch_medium, existing.last_touch_medium),
+                    "last_touch_campaign": func.coalesce(excluded.last_touch_campaign, existing.last_touch_campaign),
+                    "checkout_token": func.coalesce(excluded.checkout_token, existing.checkout_token),
+                },
+            ).returning(
+                CustomerJourney.id,
+                CustomerJourney.workspace_id,
+                CustomerJourney.visitor_id,
+            )
+            journey_ids = {
+                (row.workspace_id, row.visitor_id): row.id
+                for row in db.execute(upsert_journeys)
+            }
+
+            # 3. Touchpoints
+            touchpoints = [
+                {
+                    "journey_id": journey_ids[(values["workspace_id"], values["visitor_id"])],
+                    "event_type": values["event_type"],
+                    **{field: values.get(field) for field in ATTRIBUTION_FIELDS},
+                    "referrer": values.get("referrer"),
+                    "touched_at": values["created_at"],
+                }
+                for values in stored
+                if is_touchpoint(values)
+            ]
+            if touchpoints:
+                db.execute(pg_insert(JourneyTouchpoint).values(touchpoints))
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        "[PIXEL_BUFFER] Flushed %d events (%d stored, %d duplicates)",
+        len(events), len(stored), len(events) - len(stored),
+    )
+    return stored
+
+
+# =============================================================================
+# WRITE-BEHIND BUFFER
+# =============================================================================
+
+class PixelEventBuffer:
+    """Accumulates pixel events and flushes them in batches.
+
+    WHAT:
+        - add(): queue events; flushes inline once max_events are pending
+          (natural backpressure for the request that filled the buffer)
+        - background timer flushes whatever is pending every flush_seconds
+        - flush(): serialized; writes via write_pixel_event_batch in a worker
+          thread, then broadcasts stored events in arrival order. Failed
+          batches are re-queued (bounded), then written event by event
+
+    WHY:
+        One transaction per batch instead of one per browser event.
+    """
+
+    def __init__(
+        self,
+        max_events: int = PIXEL_BUFFER_MAX_EVENTS,
+        flush_seconds: float = PIXEL_BUFFER_FLUSH_SECONDS,
+        max_retries: int = PIXEL_BUFFER_MAX_RETRIES,
+        session_factory: Optional[Callable[[], Session]] = None,
+        broadcast: Optional[Callable[[UUID, Dict[str, Any]], Any]] = None,
+    ):
+        self.max_events = max_events
+        self.flush_seconds = flush_seconds
+        self.max_retries = max_retries
+        self._session_factory = session_factory
+        self._broadcast = broadcast
+        self._pending: List[Dict[str, Any]] = []
+        # Consecutive failed flushes (re-queued batches)
+        self._retries = 0
+        # Serializes flushes so batches commit and broadcast in arrival order
+        self._flush_lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def add(self, events: List[Dict[str, Any]]) -> None:
+        """Queue events (PixelEvent column values with pre-assigned ids)."""
+        if not events:
+            return
+
+        self._pending.extend(events)
+        self._ensure_timer()
+
+        if len(self._pending) >= self.max_events:
+            await self.flush()
+
+    async def flush(self, final: bool = False) -> int:
+        """Write everything pending; returns the number of events stored.
+
+        final: no later flush will run (shutdown), so a failed batch is
+            written event by event instead of being re-queued.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, []
+
+            try:
+                stored = await asyncio.to_thread(self._write, batch)
+                self._retries = 0
+            except Exception as e:
+                if not final and self._retries < self.max_retries:
+                    # Keep arrival order: the failed batch goes before newer events
+                    self._retries += 1
+                    self._pending = batch + self._pending
+                    logger.warning(
+                        "[PIXEL_BUFFER] Failed to flush %d events, re-queued (attempt %d/%d): %s",
+                        len(batch), self._retries, self.max_retries, e,
+                    )
+                    return 0
+
+                logger.exception(
+                    "[PIXEL_BUFFER] Failed to flush %d events after %d retries, writing one by one: %s",
+                    len(batch), self._retries, e,
+                )
+                capture_exception(e, extra={
+                    "operation": "pixel_event_buffer_flush",
+                    "batch_size": len(batch),
+                })
+                self._retries = 0
+                stored = await asyncio.to_thread(self._write_individually, batch)
+
+            for values in stored:
+                try:
+                    await self._get_broadcast()(values["workspace_id"], broadcast_payload(values))
+                except Exception as e:
+                    # Never let broadcast failure affect pixel ingestion
+                    logger.warning(f"[PIXEL_BUFFER] WebSocket broadcast failed: {e}")
+
+            return len(stored)
+
+    async def close(self) -> None:
+        """Stop the timer and flush what is left (app shutdown)."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush(final=True)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Write a batch with a dedicated session (runs in a worker thread)."""
+        db = self._new_session()
+        try:
+            return write_pixel_event_batch(db, batch)
+        finally:
+            db.close()
+
+    def _write_individually(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Write a batch one event per transaction, dropping events that fail."""
+        try:
+            db = self._new_session()
+        except Exception as e:
+            logger.error(
+                "[PIXEL_BUFFER] Dropped %d of %d events, no database session: %s",
+                len(batch), len(batch), e,
+            )
+            return []
+
+        stored: List[Dict[str, Any]] = []
+        dropped = 0
+        try:
+            for values in batch:
+                try:
+                    stored.extend(write_pixel_event_batch(db, [values]))
+                except Exception as e:
+                    dropped += 1
+                    logger.error(f"[PIXEL_BUFFER] Dropped pixel event {values.get('id')}: {e}")
+        finally:
+            db.close()
+
+        if dropped:
+            logger.error("[PIXEL_BUFFER] Dropped %d of %d events", dropped, len(batch))
+        return stored
+
+    def _new_session(self) -> Session:
+        session_factory = self._session_factory
+        if session_factory is None:
+            from app.database import SessionLocal
+            session_factory = SessionLocal
+        return session_factory()
+
+    def _get_broadcast(self) -> Callable[[UUID, Dict[str, Any]], Any]:
+        if self._broadcast is None:
+            from app.services.pixel_websocket_manager import pixel_ws_manager
+            self._broadcast = pixel_ws_manager.broadcast
+        return self._broadcast
+
+    def _ensure_timer(self) -> None:
+        """Start the time-based flusher on the running loop if needed."""
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.get_running_loop().create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            if self._pending:
+                await self.flush()
+
+
+# Global buffer instance (one per API process)
+pixel_event_buffer = PixelEventBuffer()
@@ -0,0 +1,346 @@
+"""Rate Limit Backend - shared API rate limiting for sync workers and live calls.
+
+WHAT:
+    Pluggable limiter backends with a non-blocking "reserve or return
+    retry-after" API:
+    - reserve(): sliding window (N calls per window), e.g. Meta 200 calls/hour
+    - reserve_token(): token bucket (burst capacity + refill rate), e.g.
+      Google Ads QPS smoothing
+    Backends:
+    - RedisRateLimitBackend: atomic Lua scripts, shared by every process
+    - InMemoryRateLimitBackend: process-local (dev, tests, Redis outages)
+
+WHY:
+    The Meta decorator and GoogleAdsRateLimiter kept their windows in process
+    memory. With max_jobs=10 per ARQ worker and several replicas, each process
+    believed it had the full per-account budget, producing 429 storms and then
+    hour-long sleeps. Keys are per ad account, so every worker draws from the
+    same budget, and callers can reschedule work instead of sleeping.
+
+USAGE:
+    backend = get_rate_limit_backend()
+    reservation = backend.reserve("meta:account:act_123", limit=200, window_seconds=3600)
+    if not reservation.allowed:
+        raise RateLimitExceededError("Meta budget exhausted", reservation.retry_after)
+
+CONFIG:
+    RATE_LIMIT_BACKEND: "redis" (default) or "memory"
+    REDIS_URL: Redis connection (same as the ARQ worker)
+
+REFERENCES:
+    - app/services/meta_ads_client.py (rate_limit decorator)
+    - app/services/google_ads_client.py (GoogleAdsRateLimiter)
+    - app/agent/rate_limiter.py (WorkspaceRateLimiter)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "redis")
+
+# After a Redis error, use the in-memory backend for this long before retrying
+REDIS_RETRY_SECONDS = 30.0
+
+# Longest rate-limit sleep inside a sync job or live call; longer waits raise
+# RateLimitExceededError so the caller can reschedule
+MAX_RATE_LIMIT_WAIT_SECONDS = 30
+
+# Prefix for all limiter keys in Redis
+KEY_PREFIX = "rate_limit"
+
+
+# =============================================================================
+# TYPES
+# =============================================================================
+
+class RateLimitExceededError(Exception):
+    """Raised when a call would exceed a rate limit and the caller won't wait.
+
+    WHAT:
+        Carries the seconds until a slot frees up (retry_seconds), like
+        google_ads_client.QuotaExhaustedError.
+
+    WHY:
+        Sync jobs set Connection.rate_limited_until from it and get
+        rescheduled, instead of holding a worker slot while sleeping.
+    """
+
+    def __init__(self, message: str, retry_seconds: float, key: Optional[str] = None):
+        super().__init__(message)
+        self.retry_seconds = retry_seconds
+        self.key = key
+
+
+@dataclass(frozen=True)
+class RateLimitReservation:
+    """Outcome of a reserve call.
+
+    allowed: a slot was reserved (make the call)
+    retry_after: seconds until a slot frees up (0 when allowed)
+    remaining: slots left after this reservation
+    """
+    allowed: bool
+    retry_after: float
+    remaining: int
+
+
+class RateLimitBackend:
+    """Interface for limiter backends (reserve is atomic per key)."""
+
+    def reserve(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: float,
+        now: Optional[float] = None,
+    ) -> RateLimitReservation:
+        """Sliding window: reserve one of `limit` slots per `window_seconds`."""
+        raise NotImplementedError
+
+    def reserve_token(
+        self,
+        key: str,
+        capacity: int,
+        refill_per_sec: float,
+        now: Optional[float] = None,
+    ) -> RateLimitReservation:
+        """Token bucket: take one token from a bucket of `capacity`."""
+        raise NotImplementedError
+
+
+# =============================================================================
+# IN-MEMORY BACKEND
+# =============================================================================
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Process-local backend (one lock for all keys).
+
+    Budgets are per process: use for dev, tests and as the Redis fallback.
+    """
+
+    def __init__(self) -> None:
+        # key -> timestamps of calls in the current window
+        self.windows: Dict[str, Deque[float]] = {}
+        # key -> (tokens, last refill timestamp)
+        self.buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: float,
+        now: Optional[float] = None,
+    ) -> RateLimitReservation:
+        now = time.time() if now is None else now
+
+        with self._lock:
+            calls = self.windows.get(key)
+            if calls is None:
+                calls = deque()
+                self.windows[key] = calls
+
+            # Drop calls that left the window
+            while calls and calls[0] <= now - window_seconds:
+                calls.popleft()
+
+            if len(calls) < limit:
+                calls.append(now)
+                return RateLimitReservation(True, 0.0, limit - len(calls))
+
+            retry_after = max(0.0, calls[0] + window_seconds - now)
+            return RateLimitReservation(False, retry_after, 0)
+
+    def reserve_token(
+        self,
+        key: str,
+        capacity: int,
+        refill_per_sec: float,
+        now: Optional[float] = None,
+    ) -> RateLimitReservation:
+        now = time.time() if now is None else now
+
+        with self._lock:
+            tokens, last = self.buckets.get(key, (float(capacity), now))
+            tokens = min(float(capacity), tokens + max(0.0, now - last) * refill_per_sec)
+
+            if tokens >= 1:
+                tokens -= 1
+                self.buckets[key] = (tokens, now)
+                return RateLimitReservation(True, 0.0, int(tokens))
+
+            self.buckets[key] = (tokens, now)
+            return RateLimitReservation(False, (1 - tokens) / refill_per_sec, 0)
+
+
+# =============================================================================
+# REDIS BACKEND
+# =============================================================================
+
+# Same layout as agent/rate_limiter.py: sorted set, score = call timestamp.
+# Returns {allowed, remaining, retry_after} (floats as strings, Lua numbers
+# would be truncated to integers in the reply).
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, math.ceil(window * 1000))
+    return {1, limit - count - 1, '0'}
+end
+
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, 0, tostring(tonumber(oldest[2]) + window - now)}
+"""
+
+_TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000) + 1000)
+return {allowed, math.floor(tokens), tostring(retry_after)}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Shared backend: one atomic Lua script call per reservation.
+
+    WHAT:
+        Check and record happen inside one script, so concurrent workers can
+        never both take the last slot.
+
+    FAILURE MODE:
+        On Redis errors the reservation is served by `fallback` (if given)
+        for REDIS_RETRY_SECONDS, so syncs degrade to per-process limits
+        instead of failing.
+
+    NOTE:
+        Timestamps come from the caller (time.time()), so worker clocks must
+        be NTP-synced, which they are on every host we deploy to.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        fallback: Optional[RateLimitBackend] = None,
+        key_prefix: str = KEY_PREFIX,
+    ) -> None:
+        self.redis = redis_client
+        self.fallback = fallback
+        self.key_prefix = key_prefix
+        self._sliding_window = redis_client.register_script(_SLIDING_WINDOW_LUA)
+        self._token_bucket = redis_client.register_script(_TOKEN_BUCKET_LUA)
+        self._unavailable_until = 0.0
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}" if self.key_prefix else key
+
+    def _run(self, script: Any, key: str, args: list) -> Optional[RateLimitReservation]:
+        """Run a script, or return None if Redis is (recently) unavailable."""
+        if time.monotonic() < self._unavailable_until and self.fallback is not None:
+            return None
+        try:
+            allowed, remaining, retry_after = script(keys=[self._key(key)], args=args)
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            logger.warning(
+                "[RATE_LIMIT] Redis unavailable, using process-local limits for %ss: %s",
+                REDIS_RETRY_SECONDS, e,
+            )
+            self._unavailable_until = time.monotonic() + REDIS_RETRY_SECONDS
+            return None
+        return RateLimitReservation(bool(int(allowed)), float(retry_after), int(remaining))
+
+    def reserve(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: float,
+        now: Optional[float] = None,
+    ) -> RateLimitReservation:
+        now = time.time() if now is None else now
+        member = f"{now}:{uuid.uuid4().hex[:8]}"
+        reservation = self._run(self._sliding_window, key, [limit, window_seconds, now, member])
+        if reservation is None:
+            return self.fallback.reserve(key, limit, window_seconds, now=now)
+        return reservation
+
+    def reserve_token(
+        self,
+        key: str,
+        capacity: int,
+        refill_per_sec: float,
+        now: Optional[float] = None,
+    ) -> RateLimitReservation:
+        now = time.time() if now is None else now
+        reservation = self._run(self._token_bucket, key, [capacity, refill_per_sec, now])
+        if reservation is None:
+            return self.fallback.reserve_token(key, capacity, refill_per_sec, now=now)
+        return reservation
+
+
+# =============================================================================
+# BACKEND SELECTION
+# =============================================================================
+
+# Process-local backend (also the Redis fallback)
+local_rate_limit_backend = InMemoryRateLimitBackend()
+
+_backend: Optional[RateLimitBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Return the process-wide backend selected by RATE_LIMIT_BACKEND."""
+    global _backend
+    if _backend is not None:
+        return _backend
+
+    with _backend_lock:
+        if _backend is None:
+            if RATE_LIMIT_BACKEND == "redis":
+                from redis import Redis
+
+                redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+                client = Redis.from_url(redis_url, socket_connect_timeout=1, socket_timeout=1)
+                _backend = RedisRateLimitBackend(client, fallback=local_rate_limit_backend)
+                logger.info("[RATE_LIMIT] Using Redis rate limit backend")
+            else:
+                _backend = local_rate_limit_backend
+                logger.info("[RATE_LIMIT] Using in-memory rate limit backend")
+    return _backend
@@ -0,0 +1,352 @@
+"""Response Cache - workspace-scoped cache for dashboard/KPI responses.
+
+WHAT:
+    Caches the JSON body of read-heavy endpoints (/dashboard, /kpis,
+    /analytics/chart, /entity-performance/list) in Redis, keyed by
+    (workspace, endpoint, normalized params) and stamped with the
+    workspace's data version.
+
+    - get_data_version / bump_data_version: per-workspace counter, bumped by
+      snapshot sync and Shopify sync after they commit new data
+      (current_data_version: fail-open read for other version-keyed caches,
+      e.g. the semantic result cache)
+    - cached_response: serve fresh entries, serve stale entries while a
+      background refresh recomputes them (stale-while-revalidate), compute
+      and store on miss
+    - get_cache_stats: hit / miss / stale / bypass counters per endpoint
+
+WHY:
+    Snapshot data only changes when the 15-minute sync runs, yet every page
+    load recomputed the same aggregates from metric_snapshots. Versioning
+    instead of deleting keys makes invalidation O(1) per workspace: a bump
+    turns every entry of the workspace stale at once.
+
+ENTRY STATES:
+    fresh  - stored under the current data version and younger than
+             RESPONSE_CACHE_TTL_SECONDS -> served as-is
+    stale  - older version, or past the TTL but within
+             RESPONSE_CACHE_STALE_SECONDS more -> served, refreshed in the
+             background (one refresh per key, guarded by a SET NX lock)
+    miss   - absent or expired -> computed inline and stored
+
+    Responses carry an X-Cache header (hit/stale/miss/bypass). Sending
+    X-Cache-Bypass: 1 skips the cache for that request (debugging).
+
+NOTE:
+    Fails open: when Redis is unavailable every request is computed inline.
+    Keys include the current date because relative presets ("last_7_days",
+    "today") resolve against it: in UTC by default, or in the reporting
+    timezone the endpoint resolves presets in (reporting_timezone), so a
+    workspace's "today" entry ends at its own local midnight.
+
+REFERENCES:
+    - app/services/snapshot_sync_service.py (bump after snapshot sync)
+    - app/services/shopify_sync_service.py (bump after order sync)
+    - app/routers/dashboard.py, dashboard_kpis.py, kpis.py, analytics.py,
+      entity_performance.py (cached endpoints)
+    - app/semantic/plan_cache.py (semantic results keyed by data version)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Callable, Dict, Mapping, Optional
+from zoneinfo import ZoneInfo
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+
+# Entries younger than this (and on the current data version) are fresh
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "900"))
+
+# How long past the TTL an entry may still be served while it refreshes
+RESPONSE_CACHE_STALE_SECONDS = int(os.getenv("RESPONSE_CACHE_STALE_SECONDS", "3600"))
+
+BYPASS_HEADER = "X-Cache-Bypass"
+STATUS_HEADER = "X-Cache"
+
+_VERSION_KEY = "data_version:{workspace_id}"
+_ENTRY_KEY = "resp_cache:{workspace_id}:{endpoint}:{digest}"
+_LOCK_KEY = "resp_cache_lock:{workspace_id}:{endpoint}:{digest}"
+_STATS_KEY = "resp_cache:stats"
+_REFRESH_LOCK_SECONDS = 60
+
+# After a Redis error, compute inline for this long instead of retrying
+_REDIS_RETRY_SECONDS = 30
+
+_redis = None
+_redis_down_until = 0.0
+_redis_lock = threading.Lock()
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="resp-cache")
+
+# Process-local counters ("<endpoint>:<outcome>" -> count)
+_local_stats: Counter = Counter()
+
+
+class CacheUnavailableError(Exception):
+    """Redis recently failed; skip the cache until the retry window ends."""
+
+
+def _get_redis():
+    """Lazily create the cache's Redis client (shared by API and workers)."""
+    global _redis
+    if time.monotonic() < _redis_down_until:
+        raise CacheUnavailableError("response cache Redis marked down")
+    if _redis is None:
+        with _redis_lock:
+            if _redis is None:
+                from redis import Redis
+
+                redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+                _redis = Redis.from_url(redis_url, socket_connect_timeout=1, socket_timeout=1)
+    return _redis
+
+
+def _mark_down() -> None:
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + _REDIS_RETRY_SECONDS
+
+
+# =============================================================================
+# DATA VERSIONS
+# =============================================================================
+
+def get_data_version(workspace_id: Any) -> int:
+    """Current data version of a workspace (0 if never bumped)."""
+    value = _get_redis().get(_VERSION_KEY.format(workspace_id=workspace_id))
+    return int(value) if value else 0
+
+
+def current_data_version(workspace_id: Any) -> Optional[int]:
+    """Data version for other caches keyed by it; None when Redis is unavailable.
+
+    Marks Redis down on errors like cached_response, so callers skip their
+    cache instead of paying the connect timeout on every request.
+    """
+    try:
+        return get_data_version(workspace_id)
+    except CacheUnavailableError:
+        return None
+    except Exception as e:
+        logger.warning("[RESPONSE_CACHE] Could not read data version for %s: %s", workspace_id, e)
+        _mark_down()
+        return None
+
+
+def bump_data_version(workspace_id: Any) -> Optional[int]:
+    """Mark every cached response of a workspace as stale.
+
+    Call after committing data that dashboards read. Never raises: a failed
+    bump only means cached responses live until their TTL.
+
+    Returns:
+        The new version, or None if Redis was unavailable
+    """
+    if workspace_id is None:
+        return None
+    try:
+        return int(_get_redis().incr(_VERSION_KEY.format(workspace_id=workspace_id)))
+    except Exception as e:
+        logger.warning("[RESPONSE_CACHE] Could not bump data version for %s: %s", workspace_id, e)
+        return None
+
+
+# =============================================================================
+# CACHED RESPONSES
+# =============================================================================
+
+def cache_digest(params: Mapping[str, Any], reporting_timezone: Optional[str] = None) -> str:
+    """Stable hash of normalized request params (order-insensitive).
+
+    Includes today's date in reporting_timezone (UTC if unset or invalid).
+    """
+    normalized = dict(jsonable_encoder(params))
+    normalized["_day"] = datetime.now(_zone(reporting_timezone)).date().isoformat()
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def cached_response(
+    workspace_id: Any,
+    endpoint: str,
+    params: Mapping[str, Any],
+    compute: Callable[[Session], Any],
+    db: Session,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+    reporting_timezone: Optional[str] = None,
+) -> Any:
+    """Return a cached response body, computing it on a miss.
+
+    WHAT:
+        Looks up (workspace, endpoint, params) and compares the entry with the
+        workspace's data version. See the module docstring for the states.
+
+    Args:
+        workspace_id: Workspace the response belongs to (authorization must
+            already have been checked by the caller)
+        endpoint: Short endpoint name (cache namespace and stats label)
+        params: Every input that affects the response
+        compute: Builds the response from a session; called with `db` inline,
+            or with a fresh SessionLocal() session for background refreshes
+        db: Request-scoped session
+        request: Used to read the bypass header
+        response: Receives the X-Cache status header
+        should_cache: Optional predicate on the computed body; False keeps it
+            out of the cache (e.g. partial results)
+        reporting_timezone: IANA timezone the endpoint resolves relative
+            presets in; entries roll over at its midnight (default UTC)
+
+    Returns:
+        The response body (JSON-compatible when served from cache)
+    """
+    if not RESPONSE_CACHE_ENABLED or _is_bypassed(request):
+        _finish(response, endpoint, "bypass")
+        return compute(db)
+
+    digest = cache_digest(params, reporting_timezone)
+    key = _ENTRY_KEY.format(workspace_id=workspace_id, endpoint=endpoint, digest=digest)
+
+    try:
+        redis = _get_redis()
+        version = get_data_version(workspace_id)
+        raw = redis.get(key)
+    except Exception as e:
+        if not isinstance(e, CacheUnavailableError):
+            logger.warning("[RESPONSE_CACHE] Redis unavailable, computing %s inline: %s", endpoint, e)
+            _mark_down()
+        _finish(response, endpoint, "bypass")
+        return compute(db)
+
+    if raw:
+        entry = json.loads(raw)
+        age = time.time() - entry["stored_at"]
+        if entry["version"] == version and age < RESPONSE_CACHE_TTL_SECONDS:
+            _finish(response, endpoint, "hit")
+            return entry["body"]
+
+        _schedule_refresh(workspace_id, endpoint, digest, key, compute, should_cache)
+        _finish(response, endpoint, "stale")
+        return entry["body"]
+
+    body = compute(db)
+    if should_cache is None or should_cache(body):
+        _store(key, version, body)
+    _finish(response, endpoint, "miss")
+    return body
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss/stale/bypass counters per endpoint.
+
+    Reads the cluster-wide counters from Redis, falling back to this
+    process's counters when Redis is unavailable.
+    """
+    try:
+        raw = _get_redis().hgetall(_STATS_KEY)
+        counters = {
+            (k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()
+        }
+    except Exception:
+        counters = dict(_local_stats)
+
+    stats: Dict[str, Dict[str, int]] = {}
+    for field, count in counters.items():
+        endpoint, _, outcome = field.rpartition(":")
+        stats.setdefault(endpoint, {})[outcome] = count
+    return stats
+
+
+# =============================================================================
+# INTERNALS
+# =============================================================================
+
+def _zone(name: Optional[str]) -> tzinfo:
+    """ZoneInfo for an IANA name; UTC when unset or unknown."""
+    if name:
+        try:
+            return ZoneInfo(name)
+        except Exception:
+            logger.debug("[RESPONSE_CACHE] Unknown timezone %r, keying on UTC", name)
+    return timezone.utc
+
+
+def _is_bypassed(request: Optional[Request]) -> bool:
+    if request is None:
+        return False
+    value = request.headers.get(BYPASS_HEADER, "")
+    return value.lower() in ("1", "true", "yes")
+
+
+def _store(key: str, version: int, body: Any) -> None:
+    entry = {"version": version, "stored_at": time.time(), "body": jsonable_encoder(body)}
+    try:
+        _get_redis().setex(
+            key,
+            RESPONSE_CACHE_TTL_SECONDS + RESPONSE_CACHE_STALE_SECONDS,
+            json.dumps(entry, separators=(",", ":")),
+        )
+    except Exception as e:
+        logger.warning("[RESPONSE_CACHE] Could not store %s: %s", key, e)
+
+
+def _schedule_refresh(workspace_id, endpoint: str, digest: str, key: str, compute, should_cache) -> None:
+    """Recompute a stale entry in the background (at most one refresh per key)."""
+    lock_key = _LOCK_KEY.format(workspace_id=workspace_id, endpoint=endpoint, digest=digest)
+    try:
+        if not _get_redis().set(lock_key, "1", nx=True, ex=_REFRESH_LOCK_SECONDS):
+            return
+    except Exception:
+        return
+    _refresh_executor.submit(_refresh, workspace_id, key, lock_key, compute, should_cache)
+
+
+def _new_session() -> Session:
+    from app.database import SessionLocal
+
+    return SessionLocal()
+
+
+def _refresh(workspace_id, key: str, lock_key: str, compute, should_cache) -> None:
+    db = _new_session()
+    try:
+        # Read the version first: a bump during compute leaves the entry stale
+        version = get_data_version(workspace_id)
+        body = compute(db)
+        if should_cache is None or should_cache(body):
+            _store(key, version, body)
+    except Exception as e:
+        logger.warning("[RESPONSE_CACHE] Background refresh of %s failed: %s", key, e)
+    finally:
+        db.close()
+        try:
+            _get_redis().delete(lock_key)
+        except Exception:
+            pass
+
+
+def _finish(response: Optional[Response], endpoint: str, outcome: str) -> None:
+    if response is not None:
+        response.headers[STATUS_HEADER] = outcome
+
+    field = f"{endpoint}:{outcome}"
+    _local_stats[field] += 1
+    try:
+        _get_redis().hincrby(_STATS_KEY, field, 1)
+    except Exception:
+        pass
@@ -54,8 +54,15 @@ TELEMETRY
 Every stage is tracked with:
 - query.started, query.completed, query.failed events
 - Per-stage timing (validation, compilation, answer_building)
+- Plan cache hits per cache stage, with the time they saved
 - Error classification and logging
 
+CACHING
+-------
+Validation, compiled plans and data results are served from the plan cache
+(app/semantic/plan_cache.py) for repeated question shapes. Results are keyed
+by the workspace data version, so new synced data is never hidden.
+
 RELATED FILES
 -------------
 - app/semantic/query.py: SemanticQuery structure
@@ -92,6 +99,7 @@ from app.semantic import (
     SEMANTIC_ANSWER_PROMPT,
 )
 from app.semantic.errors import QueryError, QueryErrorHandler, ErrorCategory
+from app.semantic.plan_cache import plan_cache, query_fingerprint
 from app.telemetry.logging import log_qa_run
 from app import state
 
@@ -146,12 +154,14 @@ class SemanticQAService:
             - validator: Multi-layer query validation
             - compiler: Query to data compilation
             - telemetry: Pipeline observability
+            - plan_cache: Validation/plan/result cache (process-wide)
             - error_handler: Error classification
         """
         self.db = db
         self.validator = SemanticValidator()
         self.compiler = SemanticCompiler(db)
         self.telemetry = get_telemetry()
+        self.plan_cache = plan_cache
         self.error_handler = QueryErrorHandler()
         # Use shared context manager for conversation history
         self.context_manager = state.context_manager
@@ -217,9 +227,12 @@ class SemanticQAService:
                     query = self._translate_question(question, context)
                     logger.info(f"[SEMANTIC_QA] Query: {query.describe()}")
 
-                # Step 3: Validate query
+                # Step 3: Validate query (cached per question shape)
+                fingerprint = query_fingerprint(query)
                 with ctx.track_stage("validation"):
-                    validation_result = self.validator.validate(query)
+                    validation_result = self.plan_cache.validate(
+                        self.validator, query, fingerprint, ctx
+                    )
                     ctx.set_validation_result(
                         valid=validation_result.valid,
                         errors=len(validation_result.errors),
@@ -241,7 +254,9 @@ class SemanticQAService:
 
                 # Step 4: Compile and execute query (THE KEY)
                 with ctx.track_stage("compilation"):
-                    result = self.compiler.compile(workspace_id, query)
+                    result = self.plan_cache.compile(
+                        self.compiler, workspace_id, query, fingerprint, ctx
+                    )
                     ctx.set_compilation_result(
                         strategy=result.compilation_strategy,
                         row_count=len(result.breakdown) if result.breakdown else 0,
@@ -18,10 +18,13 @@ REFERENCES:
 """
 
 import asyncio
+import json
 import logging
+import os
+import time
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
 import httpx
@@ -35,6 +38,89 @@ DEFAULT_API_VERSION = "2026-01"
 # We use a simple semaphore-based rate limiter
 RATE_LIMIT_DELAY = 0.5  # seconds between requests (2 req/sec)
 
+# Bulk operations: status polling and result download
+BULK_POLL_INTERVAL_SECONDS = float(os.getenv("SHOPIFY_BULK_POLL_INTERVAL_SECONDS", "5"))
+BULK_POLL_TIMEOUT_SECONDS = float(os.getenv("SHOPIFY_BULK_POLL_TIMEOUT_SECONDS", "3600"))
+BULK_DOWNLOAD_TIMEOUT_SECONDS = 300.0
+
+
+# Order / line item selections shared by the paged query and the bulk query
+ORDER_FIELDS = """
+    id
+    name
+    createdAt
+    processedAt
+    closedAt
+    cancelledAt
+    cancelReason
+    displayFinancialStatus
+    displayFulfillmentStatus
+    totalPriceSet {
+        shopMoney {
+            amount
+            currencyCode
+        }
+    }
+    subtotalPriceSet {
+        shopMoney {
+            amount
+        }
+    }
+    totalTaxSet {
+        shopMoney {
+            amount
+        }
+    }
+    totalShippingPriceSet {
+        shopMoney {
+            amount
+        }
+    }
+    totalDiscountsSet {
+        shopMoney {
+            amount
+        }
+    }
+    customer {
+        id
+    }
+    sourceName
+    app {
+        name
+    }
+    tags
+    note
+"""
+
+LINE_ITEM_FIELDS = """
+    id
+    title
+    variantTitle
+    sku
+    quantity
+    originalUnitPriceSet {
+        shopMoney {
+            amount
+        }
+    }
+    totalDiscountSet {
+        shopMoney {
+            amount
+        }
+    }
+    product {
+        id
+    }
+    variant {
+        id
+        inventoryItem {
+            unitCost {
+                amount
+            }
+        }
+    }
+"""
+
 
 class ShopifyAPIError(Exception):
     """Custom exception for Shopify API errors."""
@@ -62,6 +148,7 @@ class ShopifyClient:
         shop_domain: str,
         access_token: str,
         api_version: str = DEFAULT_API_VERSION,
+        base_url: Optional[str] = None,
     ):
         """Initialize Shopify client.
 
@@ -69,11 +156,12 @@ class ShopifyClient:
             shop_domain: Shopify store domain (e.g., "mystore.myshopify.com")
             access_token: Shopify Admin API access token
             api_version: API version to use (default: 2024-07)
+            base_url: Override the GraphQL endpoint (e.g. a local stub server)
         """
         self.shop_domain = shop_domain
         self.access_token = access_token
         self.api_version = api_version
-        self.base_url = f"https://{shop_domain}/admin/api/{api_version}/graphql.json"
+        self.base_url = base_url or f"https://{shop_domain}/admin/api/{api_version}/graphql.json"
 
         # Rate limiting
         self._last_request_time: float = 0
@@ -86,8 +174,6 @@ class ShopifyClient:
         WHAT: Wait if needed to respect 2 req/sec limit
         WHY: Shopify will return 429 errors if we exceed rate limits
         """
-        import time
-
         current_time = time.time()
         elapsed = current_time - self._last_request_time
 
@@ -479,79 +565,11 @@ class ShopifyClient:
             orders(first: $limit, after: $cursor, query: $query, sortKey: CREATED_AT) {
                 edges {
                     node {
-                        id
-                        name
-                        createdAt
-                        processedAt
-                        closedAt
-                        cancelledAt
-                        cancelReason
-                        displayFinancialStatus
-                        displayFulfillmentStatus
-                        totalPriceSet {
-                            shopMoney {
-                                amount
-                                currencyCode
-                            }
-                        }
-                        subtotalPriceSet {
-                            shopMoney {
-                                amount
-                            }
-                        }
-                        totalTaxSet {
-                            shopMoney {
-                                amount
-                            }
-                        }
-                        totalShippingPriceSet {
-                            shopMoney {
-                                amount
-                            }
-                        }
-                        totalDiscountsSet {
-                            shopMoney {
-                                amount
-                            }
-                        }
-                        customer {
-                            id
-                        }
-                        sourceName
-                        app {
-                            name
-                        }
-                        tags
-                        note
+                        %s
                         lineItems(first: 100) {
                             edges {
                                 node {
-                                    id
-                                    title
-                                    variantTitle
-                                    sku
-                                    quantity
-                                    originalUnitPriceSet {
-                                        shopMoney {
-                                            amount
-                                        }
-                                    }
-                                    totalDiscountSet {
-                                        shopMoney {
-                                            amount
-                                        }
-                                    }
-                                    product {
-                                        id
-                                    }
-                                    variant {
-                                        id
-                                        inventoryItem {
-                                            unitCost {
-                                                amount
-                                            }
-                                        }
-                                    }
+                                    %s
                                 }
                             }
                         }
@@ -564,7 +582,7 @@ class ShopifyClient:
                 }
             }
         }
-        """
+        """ % (ORDER_FIELDS, LINE_ITEM_FIELDS)
 
         variables = {
             "cursor": cursor,
@@ -580,92 +598,8 @@ class ShopifyClient:
         orders = []
         for edge in edges:
             node = edge.get("node", {})
-
-            # Parse monetary values
-            def get_amount(price_set: Optional[Dict]) -> Optional[Decimal]:
-                if not price_set:
-                    return None
-                shop_money = price_set.get("shopMoney", {})
-                amount = shop_money.get("amount")
-                return Decimal(amount) if amount else None
-
-            total_price_set = node.get("totalPriceSet", {})
-            currency = total_price_set.get("shopMoney", {}).get("currencyCode", "USD")
-
-            # Parse line items
-            line_items = []
-            for li_edge in node.get("lineItems", {}).get("edges", []):
-                li_node = li_edge.get("node", {})
-
-                # Get cost from variant inventory item
-                variant = li_node.get("variant", {})
-                inventory_item = variant.get("inventoryItem", {}) if variant else {}
-                unit_cost = inventory_item.get("unitCost", {})
-                cost_per_item = Decimal(unit_cost["amount"]) if unit_cost and unit_cost.get("amount") else None
-
-                line_items.append({
-                    "external_line_item_id": li_node.get("id"),
-                    "title": li_node.get("title"),
-                    "variant_title": li_node.get("variantTitle"),
-                    "sku": li_node.get("sku"),
-                    "quantity": li_node.get("quantity", 1),
-                    "price": get_amount(li_node.get("originalUnitPriceSet")),
-                    "total_discount": get_amount(li_node.get("totalDiscountSet")) or Decimal("0"),
-                    "external_product_id": li_node.get("product", {}).get("id") if li_node.get("product") else None,
-                    "external_variant_id": li_node.get("variant", {}).get("id") if li_node.get("variant") else None,
-                    "cost_per_item": cost_per_item,
-                    "cost_source": "inventory_item" if cost_per_item else None,
-                })
-
-            # Parse order number from name (e.g., "#1001" -> 1001)
-            order_name = node.get("name", "")
-            order_number = None
-            if order_name.startswith("#"):
-                try:
-                    order_number = int(order_name[1:])
-                except ValueError:
-                    pass
-
-            # Parse customer
-            customer = node.get("customer", {})
-            customer_id = customer.get("id") if customer else None
-
-            # NOTE: landingSite and referringSite removed in Shopify API 2024-07
-            # UTM tracking would require customerJourneySummary or metafields
-            landing_site = None
-            utms = {}
-
-            orders.append({
-                "external_order_id": node.get("id"),
-                "order_number": order_number,
-                "name": order_name,
-                "total_price": get_amount(node.get("totalPriceSet")),
-                "subtotal_price": get_amount(node.get("subtotalPriceSet")),
-                "total_tax": get_amount(node.get("totalTaxSet")),
-                "total_shipping": get_amount(node.get("totalShippingPriceSet")),
-                "total_discounts": get_amount(node.get("totalDiscountsSet")),
-                "currency": currency,
-                "financial_status": self._normalize_status(node.get("displayFinancialStatus")),
-                "fulfillment_status": self._normalize_status(node.get("displayFulfillmentStatus")),
-                "cancelled_at": node.get("cancelledAt"),
-                "cancel_reason": node.get("cancelReason"),
-                "external_customer_id": customer_id,
-                "source_name": node.get("sourceName"),
-                "landing_site": landing_site,
-                "referring_site": None,  # Removed in Shopify API 2024-07
-                "utm_source": utms.get("utm_source"),
-                "utm_medium": utms.get("utm_medium"),
-                "utm_campaign": utms.get("utm_campaign"),
-                "utm_content": utms.get("utm_content"),
-                "utm_term": utms.get("utm_term"),
-                "app_name": node.get("app", {}).get("name") if node.get("app") else None,
-                "tags": node.get("tags", []),
-                "note": node.get("note"),
-                "order_created_at": node.get("createdAt"),
-                "order_processed_at": node.get("processedAt"),
-                "order_closed_at": node.get("closedAt"),
-                "line_items": line_items,
-            })
+            line_item_nodes = [li.get("node", {}) for li in node.get("lineItems", {}).get("edges", [])]
+            orders.append(self._parse_order(node, line_item_nodes))
 
         next_cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
 
@@ -673,6 +607,97 @@ class ShopifyClient:
 
         return orders, next_cursor
 
+    def _parse_order(self, node: Dict[str, Any], line_item_nodes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Normalize an order node and its line item nodes.
+
+        WHAT: Map GraphQL order fields to the dict consumed by the sync service
+        WHY: Shared by the paged query (nested line item edges) and bulk
+             operation results (line items as separate JSONL rows)
+        """
+        # Parse monetary values
+        def get_amount(price_set: Optional[Dict]) -> Optional[Decimal]:
+            if not price_set:
+                return None
+            shop_money = price_set.get("shopMoney", {})
+            amount = shop_money.get("amount")
+            return Decimal(amount) if amount else None
+
+        total_price_set = node.get("totalPriceSet", {})
+        currency = total_price_set.get("shopMoney", {}).get("currencyCode", "USD")
+
+        # Parse line items
+        line_items = []
+        for li_node in line_item_nodes:
+            # Get cost from variant inventory item
+            variant = li_node.get("variant", {})
+            inventory_item = variant.get("inventoryItem", {}) if variant else {}
+            unit_cost = inventory_item.get("unitCost", {})
+            cost_per_item = Decimal(unit_cost["amount"]) if unit_cost and unit_cost.get("amount") else None
+
+            line_items.append({
+                "external_line_item_id": li_node.get("id"),
+                "title": li_node.get("title"),
+                "variant_title": li_node.get("variantTitle"),
+                "sku": li_node.get("sku"),
+                "quantity": li_node.get("quantity", 1),
+                "price": get_amount(li_node.get("originalUnitPriceSet")),
+                "total_discount": get_amount(li_node.get("totalDiscountSet")) or Decimal("0"),
+                "external_product_id": li_node.get("product", {}).get("id") if li_node.get("product") else None,
+                "external_variant_id": li_node.get("variant", {}).get("id") if li_node.get("variant") else None,
+                "cost_per_item": cost_per_item,
+                "cost_source": "inventory_item" if cost_per_item else None,
+            })
+
+        # Parse order number from name (e.g., "#1001" -> 1001)
+        order_name = node.get("name", "")
+        order_number = None
+        if order_name.startswith("#"):
+            try:
+                order_number = int(order_name[1:])
+            except ValueError:
+                pass
+
+        # Parse customer
+        customer = node.get("customer", {})
+        customer_id = customer.get("id") if customer else None
+
+        # NOTE: landingSite and referringSite removed in Shopify API 2024-07
+        # UTM tracking would require customerJourneySummary or metafields
+        landing_site = None
+        utms = {}
+
+        return {
+            "external_order_id": node.get("id"),
+            "order_number": order_number,
+            "name": order_name,
+            "total_price": get_amount(node.get("totalPriceSet")),
+            "subtotal_price": get_amount(node.get("subtotalPriceSet")),
+            "total_tax": get_amount(node.get("totalTaxSet")),
+            "total_shipping": get_amount(node.get("totalShippingPriceSet")),
+            "total_discounts": get_amount(node.get("totalDiscountsSet")),
+            "currency": currency,
+            "financial_status": self._normalize_status(node.get("displayFinancialStatus")),
+            "fulfillment_status": self._normalize_status(node.get("displayFulfillmentStatus")),
+            "cancelled_at": node.get("cancelledAt"),
+            "cancel_reason": node.get("cancelReason"),
+            "external_customer_id": customer_id,
+            "source_name": node.get("sourceName"),
+            "landing_site": landing_site,
+            "referring_site": None,  # Removed in Shopify API 2024-07
+            "utm_source": utms.get("utm_source"),
+            "utm_medium": utms.get("utm_medium"),
+            "utm_campaign": utms.get("utm_campaign"),
+            "utm_content": utms.get("utm_content"),
+            "utm_term": utms.get("utm_term"),
+            "app_name": node.get("app", {}).get("name") if node.get("app") else None,
+            "tags": node.get("tags", []),
+            "note": node.get("note"),
+            "order_created_at": node.get("createdAt"),
+            "order_processed_at": node.get("processedAt"),
+            "order_closed_at": node.get("closedAt"),
+            "line_items": line_items,
+        }
+
     def _extract_utms(self, landing_site: Optional[str]) -> Dict[str, Optional[str]]:
         """Extract UTM parameters from landing site URL.
 
@@ -709,65 +734,280 @@ class ShopifyClient:
     # PAGINATION HELPERS
     # =========================================================================
 
-    async def get_all_products(self) -> List[Dict[str, Any]]:
-        """Fetch all products with automatic pagination.
+    # WHAT: Async generators yielding one page at a time as (items, next_cursor)
+    # WHY: Callers persist each page as it arrives instead of holding the
+    #      whole history in memory; next_cursor lets them checkpoint and
+    #      resume an interrupted sync (pass it back as `cursor`).
+
+    async def get_all_products(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """Stream all products page by page.
 
         WHAT: Iterate through all pages of products
         WHY: Sync needs complete product catalog
         """
-        all_products = []
-        cursor = None
-
+        total = 0
         while True:
-            products, cursor = await self.get_products(cursor=cursor, limit=100)
-            all_products.extend(products)
+            products, cursor = await self.get_products(cursor=cursor, limit=page_size)
+            total += len(products)
+            yield products, cursor
 
             if not cursor:
                 break
 
-        logger.info(f"[SHOPIFY_CLIENT] Fetched all {len(all_products)} products")
-        return all_products
+        logger.info(f"[SHOPIFY_CLIENT] Fetched all {total} products")
 
-    async def get_all_customers(self) -> List[Dict[str, Any]]:
-        """Fetch all customers with automatic pagination.
+    async def get_all_customers(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """Stream all customers page by page.
 
         WHAT: Iterate through all pages of customers
         WHY: Sync needs complete customer base for LTV
         """
-        all_customers = []
-        cursor = None
-
+        total = 0
         while True:
-            customers, cursor = await self.get_customers(cursor=cursor, limit=100)
-            all_customers.extend(customers)
+            customers, cursor = await self.get_customers(cursor=cursor, limit=page_size)
+            total += len(customers)
+            yield customers, cursor
 
             if not cursor:
                 break
 
-        logger.info(f"[SHOPIFY_CLIENT] Fetched all {len(all_customers)} customers")
-        return all_customers
+        logger.info(f"[SHOPIFY_CLIENT] Fetched all {total} customers")
 
     async def get_all_orders(
         self,
         since: Optional[datetime] = None,
-    ) -> List[Dict[str, Any]]:
-        """Fetch all orders with automatic pagination.
+        cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """Stream all orders page by page.
 
         WHAT: Iterate through all pages of orders
         WHY: Sync needs complete order history
 
         Args:
             since: Only fetch orders created after this datetime
+            cursor: Resume after this page cursor (same `since` required)
+            page_size: Orders per page (Shopify max 250)
         """
-        all_orders = []
-        cursor = None
-
+        total = 0
         while True:
-            orders, cursor = await self.get_orders(since=since, cursor=cursor, limit=100)
-            all_orders.extend(orders)
+            orders, cursor = await self.get_orders(since=since, cursor=cursor, limit=page_size)
+            total += len(orders)
+            yield orders, cursor
 
             if not cursor:
                 break
 
-        logger.info(f"[SHOPIFY_CLIENT] Fetched all {len(all_orders)} orders")
-        return all_orders
+        logger.info(f"[SHOPIFY_CLIENT] Fetched all {total} orders")
+
+    # =========================================================================
+    # BULK OPERATIONS
+    # =========================================================================
+
+    async def run_bulk_query(self, query: str) -> str:
+        """Submit a bulk operation query.
+
+        WHAT: Start a bulkOperationRunQuery for the given query
+        WHY: Shopify runs bulk queries server-side without per-page rate
+             limits; the result is a single JSONL file
+
+        Returns:
+            BulkOperation GID (poll it with wait_for_bulk_operation)
+
+        Raises:
+            ShopifyAPIError: If Shopify rejects the query (userErrors), e.g.
+                another bulk operation is already running for the shop
+        """
+        mutation = """
+        mutation RunBulkQuery($query: String!) {
+            bulkOperationRunQuery(query: $query) {
+                bulkOperation {
+                    id
+                    status
+                }
+                userErrors {
+                    field
+                    message
+                }
+            }
+        }
+        """
+
+        data = await self.execute(mutation, {"query": query})
+        result = data.get("bulkOperationRunQuery") or {}
+
+        user_errors = result.get("userErrors") or []
+        if user_errors:
+            messages = [e.get("message", str(e)) for e in user_errors]
+            raise ShopifyAPIError(f"Bulk operation rejected: {', '.join(messages)}", errors=user_errors)
+
+        operation = result.get("bulkOperation") or {}
+        if not operation.get("id"):
+            raise ShopifyAPIError("Bulk operation was not created")
+
+        logger.info(f"[SHOPIFY_CLIENT] Started bulk operation {operation['id']}")
+        return operation["id"]
+
+    async def wait_for_bulk_operation(
+        self,
+        operation_id: str,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """Poll a bulk operation until it finishes.
+
+        Args:
+            operation_id: BulkOperation GID from run_bulk_query
+            poll_interval: Seconds between status checks (default: BULK_POLL_INTERVAL_SECONDS)
+            timeout: Give up after this many seconds (default: BULK_POLL_TIMEOUT_SECONDS)
+
+        Returns:
+            URL of the JSONL result file, or None if the query matched nothing
+
+        Raises:
+            ShopifyAPIError: If the operation fails, is canceled/expired, or
+                does not finish within `timeout` seconds
+        """
+        query = """
+        query BulkOperationStatus($id: ID!) {
+            node(id: $id) {
+                ... on BulkOperation {
+                    id
+                    status
+                    errorCode
+                    objectCount
+                    url
+                }
+            }
+        }
+        """
+
+        poll_interval = BULK_POLL_INTERVAL_SECONDS if poll_interval is None else poll_interval
+        timeout = BULK_POLL_TIMEOUT_SECONDS if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            data = await self.execute(query, {"id": operation_id})
+            operation = data.get("node") or {}
+            op_status = operation.get("status")
+
+            if op_status == "COMPLETED":
+                logger.info(
+                    f"[SHOPIFY_CLIENT] Bulk operation {operation_id} completed "
+                    f"({operation.get('objectCount')} objects)"
+                )
+                return operation.get("url")
+
+            if op_status in ("FAILED", "CANCELED", "CANCELING", "EXPIRED"):
+                raise ShopifyAPIError(
+                    f"Bulk operation {operation_id} {op_status.lower()} "
+                    f"(error: {operation.get('errorCode')})"
+                )
+
+            if time.monotonic() >= deadline:
+                raise ShopifyAPIError(f"Bulk operation {operation_id} did not finish within {timeout:.0f}s")
+
+            logger.debug(f"[SHOPIFY_CLIENT] Bulk operation {operation_id} is {op_status}")
+            await asyncio.sleep(poll_interval)
+
+    async def stream_bulk_results(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a bulk operation result file one JSONL row at a time.
+
+        WHAT: Download the file with a streaming GET and parse each line
+        WHY: Result files of large stores are gigabytes; only one line is
+             held in memory
+        """
+        try:
+            async with httpx.AsyncClient(timeout=BULK_DOWNLOAD_TIMEOUT_SECONDS) as client:
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if line.strip():
+                            yield json.loads(line)
+        except httpx.HTTPError as e:
+            raise ShopifyAPIError(f"Failed to download bulk operation results: {e}")
+
+    async def get_orders_bulk(
+        self,
+        since: Optional[datetime] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """Stream all orders through a bulk operation, page by page.
+
+        WHAT: Run the order query as a bulk operation, wait for it, then
+              stream the JSONL file and regroup line item rows (linked to
+              their order by `__parentId`) under their order
+        WHY: Initial historical backfills; paging orders through `execute`
+             with client-side rate limiting takes hours on large stores
+
+        Yields the same (orders, next_cursor) pages as get_all_orders;
+        next_cursor is always None (bulk results cannot be resumed).
+
+        Note:
+            Shopify writes child rows right after their parent, so only the
+            current order is buffered.
+        """
+        orders_args = "sortKey: CREATED_AT"
+        if since:
+            since_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+            orders_args += f", query: {json.dumps(f'created_at:>{since_str}')}"
+
+        bulk_query = """
+        {
+            orders(%s) {
+                edges {
+                    node {
+                        %s
+                        lineItems {
+                            edges {
+                                node {
+                                    %s
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """ % (orders_args, ORDER_FIELDS, LINE_ITEM_FIELDS)
+
+        operation_id = await self.run_bulk_query(bulk_query)
+        url = await self.wait_for_bulk_operation(operation_id)
+        if not url:
+            logger.info("[SHOPIFY_CLIENT] Bulk operation returned no orders")
+            return
+
+        total = 0
+        page: List[Dict[str, Any]] = []
+        order_node: Optional[Dict[str, Any]] = None
+        line_item_nodes: List[Dict[str, Any]] = []
+
+        async for row in self.stream_bulk_results(url):
+            parent_id = row.get("__parentId")
+            if parent_id is None:
+                if order_node is not None:
+                    page.append(self._parse_order(order_node, line_item_nodes))
+                    if len(page) >= page_size:
+                        total += len(page)
+                        yield page, None
+                        page = []
+                order_node, line_item_nodes = row, []
+            elif order_node is not None and parent_id == order_node.get("id"):
+                line_item_nodes.append(row)
+            else:
+                logger.warning(f"[SHOPIFY_CLIENT] Skipping bulk row {row.get('id')} of unknown parent {parent_id}")
+
+        if order_node is not None:
+            page.append(self._parse_order(order_node, line_item_nodes))
+        if page:
+            total += len(page)
+            yield page, None
+
+        logger.info(f"[SHOPIFY_CLIENT] Fetched all {total} orders via bulk operation")
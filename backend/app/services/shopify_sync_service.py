@@ -20,14 +20,18 @@ REFERENCES:
 from __future__ import annotations
 
 import logging
+import os
+import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Set, Tuple, Dict, Any, Iterable
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import and_, case, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
 
 from app.models import (
     Connection,
@@ -41,10 +45,21 @@ from app.models import (
     ShopifyFulfillmentStatusEnum,
 )
 from app.security import decrypt_secret
+from app.services.response_cache import bump_data_version
 from app.services.shopify_client import ShopifyClient, ShopifyAPIError
 
 logger = logging.getLogger(__name__)
 
+# Orders fetched (and upserted + checkpointed) per page during order sync
+ORDER_SYNC_PAGE_SIZE = int(os.getenv("SHOPIFY_ORDER_SYNC_PAGE_SIZE", "100"))
+
+# Initial backfills and full resyncs read orders through a Bulk Operation
+# instead of paging the orders query (incremental syncs keep the cursor path)
+BULK_BACKFILL_ENABLED = os.getenv("SHOPIFY_BULK_BACKFILL_ENABLED", "true").lower() == "true"
+
+# orders_sync_cursor value marking an unfinished bulk backfill (re-run on resume)
+BULK_RESUME_CURSOR = "bulk"
+
 
 # =============================================================================
 # RESPONSE SCHEMAS
@@ -52,7 +67,7 @@ logger = logging.getLogger(__name__)
 # WHAT: Dataclasses for sync response formatting
 # WHY: Consistent response structure across all sync operations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from typing import List
 
 
@@ -71,6 +86,8 @@ class ShopifySyncStats:
     total_revenue: Decimal = field(default_factory=lambda: Decimal("0"))
     total_profit: Decimal = field(default_factory=lambda: Decimal("0"))
     orders_missing_cost: int = 0
+    ltv_customers_updated: int = 0
+    ltv_duration_seconds: float = 0.0
     duration_seconds: float = 0.0
 
 
@@ -251,69 +268,67 @@ async def sync_shopify_products(
             access_token=access_token,
         )
 
-        products = await client.get_all_products()
-        logger.info(f"[SHOPIFY_SYNC] Fetched {len(products)} products from Shopify")
-
-        # Upsert products
-        for product_data in products:
-            try:
-                external_id = product_data["external_product_id"]
-
-                # Check if product exists
-                existing = db.query(ShopifyProduct).filter(
-                    ShopifyProduct.shop_id == shop.id,
-                    ShopifyProduct.external_product_id == external_id,
-                ).first()
-
-                if existing:
-                    # Update existing product
-                    existing.title = product_data["title"]
-                    existing.handle = product_data.get("handle")
-                    existing.status = product_data.get("status", "active")
-                    existing.vendor = product_data.get("vendor")
-                    existing.product_type = product_data.get("product_type")
-                    existing.price = product_data.get("price")
-                    existing.compare_at_price = product_data.get("compare_at_price")
-                    existing.cost_per_item = product_data.get("cost_per_item")
-                    existing.cost_source = product_data.get("cost_source")
-                    existing.total_inventory = product_data.get("total_inventory")
-                    existing.shopify_updated_at = _parse_datetime(product_data.get("shopify_updated_at"))
-                    existing.updated_at = datetime.utcnow()
-                    stats.products_updated += 1
-                else:
-                    # Create new product
-                    new_product = ShopifyProduct(
-                        workspace_id=workspace_id,
-                        shop_id=shop.id,
-                        external_product_id=external_id,
-                        title=product_data["title"],
-                        handle=product_data.get("handle"),
-                        status=product_data.get("status", "active"),
-                        vendor=product_data.get("vendor"),
-                        product_type=product_data.get("product_type"),
-                        price=product_data.get("price"),
-                        compare_at_price=product_data.get("compare_at_price"),
-                        cost_per_item=product_data.get("cost_per_item"),
-                        cost_source=product_data.get("cost_source"),
-                        total_inventory=product_data.get("total_inventory"),
-                        shopify_created_at=_parse_datetime(product_data.get("shopify_created_at")),
-                        shopify_updated_at=_parse_datetime(product_data.get("shopify_updated_at")),
-                    )
-                    db.add(new_product)
-                    stats.products_created += 1
-
-                # Track cost availability
-                if product_data.get("cost_per_item"):
-                    stats.products_with_cost += 1
-                else:
-                    stats.products_missing_cost += 1
+        # Upsert products page by page (only one page held in memory)
+        async for products, _ in client.get_all_products():
+            for product_data in products:
+                try:
+                    external_id = product_data["external_product_id"]
+
+                    # Check if product exists
+                    existing = db.query(ShopifyProduct).filter(
+                        ShopifyProduct.shop_id == shop.id,
+                        ShopifyProduct.external_product_id == external_id,
+                    ).first()
+
+                    if existing:
+                        # Update existing product
+                        existing.title = product_data["title"]
+                        existing.handle = product_data.get("handle")
+                        existing.status = product_data.get("status", "active")
+                        existing.vendor = product_data.get("vendor")
+                        existing.product_type = product_data.get("product_type")
+                        existing.price = product_data.get("price")
+                        existing.compare_at_price = product_data.get("compare_at_price")
+                        existing.cost_per_item = product_data.get("cost_per_item")
+                        existing.cost_source = product_data.get("cost_source")
+                        existing.total_inventory = product_data.get("total_inventory")
+                        existing.shopify_updated_at = _parse_datetime(product_data.get("shopify_updated_at"))
+                        existing.updated_at = datetime.utcnow()
+                        stats.products_updated += 1
+                    else:
+                        # Create new product
+                        new_product = ShopifyProduct(
+                            workspace_id=workspace_id,
+                            shop_id=shop.id,
+                            external_product_id=external_id,
+                            title=product_data["title"],
+                            handle=product_data.get("handle"),
+                            status=product_data.get("status", "active"),
+                            vendor=product_data.get("vendor"),
+                            product_type=product_data.get("product_type"),
+                            price=product_data.get("price"),
+                            compare_at_price=product_data.get("compare_at_price"),
+                            cost_per_item=product_data.get("cost_per_item"),
+                            cost_source=product_data.get("cost_source"),
+                            total_inventory=product_data.get("total_inventory"),
+                            shopify_created_at=_parse_datetime(product_data.get("shopify_created_at")),
+                            shopify_updated_at=_parse_datetime(product_data.get("shopify_updated_at")),
+                        )
+                        db.add(new_product)
+                        stats.products_created += 1
+
+                    # Track cost availability
+                    if product_data.get("cost_per_item"):
+                        stats.products_with_cost += 1
+                    else:
+                        stats.products_missing_cost += 1
 
-            except Exception as e:
-                error_msg = f"Error syncing product {product_data.get('external_product_id')}: {e}"
-                logger.error(f"[SHOPIFY_SYNC] {error_msg}")
-                errors.append(error_msg)
+                except Exception as e:
+                    error_msg = f"Error syncing product {product_data.get('external_product_id')}: {e}"
+                    logger.error(f"[SHOPIFY_SYNC] {error_msg}")
+                    errors.append(error_msg)
 
-        db.commit()
+            db.commit()
 
         # Update shop sync timestamp
         shop.last_synced_at = datetime.utcnow()
@@ -409,67 +424,65 @@ async def sync_shopify_customers(
             access_token=access_token,
         )
 
-        customers = await client.get_all_customers()
-        logger.info(f"[SHOPIFY_SYNC] Fetched {len(customers)} customers from Shopify")
-
-        # Upsert customers
-        for customer_data in customers:
-            try:
-                external_id = customer_data["external_customer_id"]
-
-                # Check if customer exists
-                existing = db.query(ShopifyCustomer).filter(
-                    ShopifyCustomer.shop_id == shop.id,
-                    ShopifyCustomer.external_customer_id == external_id,
-                ).first()
-
-                total_spent = customer_data.get("total_spent", Decimal("0"))
-                order_count = customer_data.get("order_count", 0)
-                avg_order_value = total_spent / order_count if order_count > 0 else None
-
-                if existing:
-                    # Update existing customer
-                    existing.email = customer_data.get("email")
-                    existing.first_name = customer_data.get("first_name")
-                    existing.last_name = customer_data.get("last_name")
-                    existing.phone = customer_data.get("phone")
-                    existing.state = customer_data.get("state")
-                    existing.verified_email = customer_data.get("verified_email", False)
-                    existing.accepts_marketing = customer_data.get("accepts_marketing", False)
-                    existing.total_spent = total_spent
-                    existing.order_count = order_count
-                    existing.average_order_value = avg_order_value
-                    existing.tags = customer_data.get("tags")
-                    existing.updated_at = datetime.utcnow()
-                    stats.customers_updated += 1
-                else:
-                    # Create new customer
-                    new_customer = ShopifyCustomer(
-                        workspace_id=workspace_id,
-                        shop_id=shop.id,
-                        external_customer_id=external_id,
-                        email=customer_data.get("email"),
-                        first_name=customer_data.get("first_name"),
-                        last_name=customer_data.get("last_name"),
-                        phone=customer_data.get("phone"),
-                        state=customer_data.get("state"),
-                        verified_email=customer_data.get("verified_email", False),
-                        accepts_marketing=customer_data.get("accepts_marketing", False),
-                        total_spent=total_spent,
-                        order_count=order_count,
-                        average_order_value=avg_order_value,
-                        tags=customer_data.get("tags"),
-                        shopify_created_at=_parse_datetime(customer_data.get("shopify_created_at")),
-                    )
-                    db.add(new_customer)
-                    stats.customers_created += 1
-
-            except Exception as e:
-                error_msg = f"Error syncing customer {customer_data.get('external_customer_id')}: {e}"
-                logger.error(f"[SHOPIFY_SYNC] {error_msg}")
-                errors.append(error_msg)
-
-        db.commit()
+        # Upsert customers page by page (only one page held in memory)
+        async for customers, _ in client.get_all_customers():
+            for customer_data in customers:
+                try:
+                    external_id = customer_data["external_customer_id"]
+
+                    # Check if customer exists
+                    existing = db.query(ShopifyCustomer).filter(
+                        ShopifyCustomer.shop_id == shop.id,
+                        ShopifyCustomer.external_customer_id == external_id,
+                    ).first()
+
+                    total_spent = customer_data.get("total_spent", Decimal("0"))
+                    order_count = customer_data.get("order_count", 0)
+                    avg_order_value = total_spent / order_count if order_count > 0 else None
+
+                    if existing:
+                        # Update existing customer
+                        existing.email = customer_data.get("email")
+                        existing.first_name = customer_data.get("first_name")
+                        existing.last_name = customer_data.get("last_name")
+                        existing.phone = customer_data.get("phone")
+                        existing.state = customer_data.get("state")
+                        existing.verified_email = customer_data.get("verified_email", False)
+                        existing.accepts_marketing = customer_data.get("accepts_marketing", False)
+                        existing.total_spent = total_spent
+                        existing.order_count = order_count
+                        existing.average_order_value = avg_order_value
+                        existing.tags = customer_data.get("tags")
+                        existing.updated_at = datetime.utcnow()
+                        stats.customers_updated += 1
+                    else:
+                        # Create new customer
+                        new_customer = ShopifyCustomer(
+                            workspace_id=workspace_id,
+                            shop_id=shop.id,
+                            external_customer_id=external_id,
+                            email=customer_data.get("email"),
+                            first_name=customer_data.get("first_name"),
+                            last_name=customer_data.get("last_name"),
+                            phone=customer_data.get("phone"),
+                            state=customer_data.get("state"),
+                            verified_email=customer_data.get("verified_email", False),
+                            accepts_marketing=customer_data.get("accepts_marketing", False),
+                            total_spent=total_spent,
+                            order_count=order_count,
+                            average_order_value=avg_order_value,
+                            tags=customer_data.get("tags"),
+                            shopify_created_at=_parse_datetime(customer_data.get("shopify_created_at")),
+                        )
+                        db.add(new_customer)
+                        stats.customers_created += 1
+
+                except Exception as e:
+                    error_msg = f"Error syncing customer {customer_data.get('external_customer_id')}: {e}"
+                    logger.error(f"[SHOPIFY_SYNC] {error_msg}")
+                    errors.append(error_msg)
+
+            db.commit()
 
     except ShopifyAPIError as e:
         error_msg = f"Shopify API error: {e}"
@@ -510,7 +523,14 @@ async def sync_shopify_orders(
 ) -> ShopifySyncResponse:
     """Sync orders from Shopify to database.
 
-    WHAT: Fetch orders and upsert into shopify_orders and shopify_order_line_items
+    WHAT: Stream orders page by page and upsert each page into shopify_orders
+          and shopify_order_line_items as it arrives (see _upsert_order_page).
+          The page cursor is committed with the page and the LTV update of
+          its customers, so an interrupted sync resumes from the last
+          committed page on the next run.
+          Backfills (first sync, force_full_sync) read orders from a Bulk
+          Operation result file instead (see ShopifyClient.get_orders_bulk);
+          incremental syncs keep the cursor path.
     WHY: Orders are the source of truth for:
         - Revenue metrics
         - Profit calculations (via line item costs)
@@ -558,235 +578,112 @@ async def sync_shopify_orders(
         shop = _get_shop_for_connection(db, connection)
         access_token = _get_access_token(connection)
 
-        # Determine sync start date
-        if force_full_sync:
+        # Determine sync start date (or resume an interrupted sync from its
+        # last committed page)
+        resume_cursor = None
+        first_sync = False
+        if not force_full_sync and shop.orders_sync_cursor:
+            resume_cursor = shop.orders_sync_cursor
+            sync_since = shop.orders_sync_since
+            logger.info(f"[SHOPIFY_SYNC] Resuming interrupted order sync (since={sync_since})")
+        elif force_full_sync:
             sync_since = None  # Fetch all orders
         elif since:
             sync_since = since
         else:
             # Incremental: find last order and sync from there
-            last_order = db.query(ShopifyOrder).filter(
+            last_order_at = db.query(func.max(ShopifyOrder.order_created_at)).filter(
                 ShopifyOrder.shop_id == shop.id
-            ).order_by(desc(ShopifyOrder.order_created_at)).first()
+            ).scalar()
 
-            if last_order:
+            if last_order_at:
                 # Sync from 1 day before last order (overlap to catch updates)
-                sync_since = last_order.order_created_at - timedelta(days=1)
+                sync_since = last_order_at - timedelta(days=1)
                 logger.info(f"[SHOPIFY_SYNC] Incremental sync from {sync_since}")
             else:
                 # First sync: last 90 days
+                first_sync = True
                 sync_since = datetime.utcnow() - timedelta(days=90)
                 logger.info(f"[SHOPIFY_SYNC] First sync, fetching last 90 days from {sync_since}")
 
-        # Initialize client and fetch orders
+        # Initialize client and stream orders page by page
         client = ShopifyClient(
             shop_domain=shop.shop_domain,
             access_token=access_token,
         )
 
-        orders = await client.get_all_orders(since=sync_since)
-        logger.info(f"[SHOPIFY_SYNC] Fetched {len(orders)} orders from Shopify")
-
-        # Build product lookup for cost fallback
-        product_costs: Dict[str, Decimal] = {}
-        products = db.query(ShopifyProduct).filter(
-            ShopifyProduct.shop_id == shop.id,
-            ShopifyProduct.cost_per_item.isnot(None)
-        ).all()
-        for product in products:
-            product_costs[product.external_product_id] = product.cost_per_item
+        # Backfills (first sync, full resync, unfinished bulk backfill) use a
+        # Bulk Operation; incremental syncs page the orders query
+        use_bulk = BULK_BACKFILL_ENABLED and (
+            resume_cursor == BULK_RESUME_CURSOR
+            or (not resume_cursor and (first_sync or force_full_sync))
+        )
+        if use_bulk:
+            # Bulk results can't be resumed mid-file: mark the backfill so an
+            # interrupted run starts it again (upserts are idempotent)
+            shop.orders_sync_cursor = BULK_RESUME_CURSOR
+            shop.orders_sync_since = sync_since
+            db.commit()
+            order_pages = client.get_orders_bulk(since=sync_since, page_size=ORDER_SYNC_PAGE_SIZE)
+            logger.info(f"[SHOPIFY_SYNC] Backfilling orders via bulk operation (since={sync_since})")
+        else:
+            order_pages = client.get_all_orders(
+                since=sync_since, cursor=resume_cursor, page_size=ORDER_SYNC_PAGE_SIZE
+            )
 
-        # Build customer lookup
-        customer_lookup: Dict[str, ShopifyCustomer] = {}
-        customers = db.query(ShopifyCustomer).filter(
-            ShopifyCustomer.shop_id == shop.id
-        ).all()
-        for customer in customers:
-            customer_lookup[customer.external_customer_id] = customer
-
-        # Upsert orders
-        for order_data in orders:
-            try:
-                external_order_id = order_data["external_order_id"]
-
-                # Link to customer if exists
-                customer_id = None
-                if order_data.get("external_customer_id"):
-                    customer = customer_lookup.get(order_data["external_customer_id"])
-                    if customer:
-                        customer_id = customer.id
-
-                # Check if order exists
-                existing_order = db.query(ShopifyOrder).filter(
-                    ShopifyOrder.shop_id == shop.id,
-                    ShopifyOrder.external_order_id == external_order_id,
-                ).first()
-
-                # Calculate profit from line items
-                total_cost = Decimal("0")
-                total_profit = Decimal("0")
-                has_missing_costs = False
-                line_items_data = order_data.get("line_items", [])
-
-                for li in line_items_data:
-                    quantity = li.get("quantity", 1)
-                    price = li.get("price") or Decimal("0")
-                    discount = li.get("total_discount") or Decimal("0")
-                    line_revenue = (price * quantity) - discount
-
-                    # Get cost: from line item, then product fallback
-                    cost_per_item = li.get("cost_per_item")
-                    cost_source = li.get("cost_source")
-
-                    if cost_per_item is None and li.get("external_product_id"):
-                        # Try product cost fallback
-                        product_cost = product_costs.get(li["external_product_id"])
-                        if product_cost:
-                            cost_per_item = product_cost
-                            cost_source = "product"
-
-                    if cost_per_item:
-                        line_cost = cost_per_item * quantity
-                        li["cost_per_item"] = cost_per_item
-                        li["cost_source"] = cost_source
-                        li["line_profit"] = line_revenue - line_cost
-                        total_cost += line_cost
-                        total_profit += li["line_profit"]
-                    else:
-                        has_missing_costs = True
-                        li["line_profit"] = None
-
-                # Update stats
-                if has_missing_costs:
-                    stats.orders_missing_cost += 1
-
-                order_total = order_data.get("total_price") or Decimal("0")
-                stats.total_revenue += order_total
-                stats.total_profit += total_profit
-
-                if existing_order:
-                    # Update existing order
-                    existing_order.order_number = order_data.get("order_number")
-                    existing_order.name = order_data.get("name")
-                    existing_order.total_price = order_total
-                    existing_order.subtotal_price = order_data.get("subtotal_price")
-                    existing_order.total_tax = order_data.get("total_tax")
-                    existing_order.total_shipping = order_data.get("total_shipping")
-                    existing_order.total_discounts = order_data.get("total_discounts")
-                    existing_order.currency = order_data.get("currency", "USD")
-                    existing_order.total_cost = total_cost if not has_missing_costs else None
-                    existing_order.total_profit = total_profit if not has_missing_costs else None
-                    existing_order.has_missing_costs = has_missing_costs
-                    existing_order.financial_status = _map_financial_status(order_data.get("financial_status"))
-                    existing_order.fulfillment_status = _map_fulfillment_status(order_data.get("fulfillment_status"))
-                    existing_order.cancelled_at = _parse_datetime(order_data.get("cancelled_at"))
-                    existing_order.cancel_reason = order_data.get("cancel_reason")
-                    existing_order.customer_id = customer_id
-                    existing_order.source_name = order_data.get("source_name")
-                    existing_order.landing_site = order_data.get("landing_site")
-                    existing_order.referring_site = order_data.get("referring_site")
-                    existing_order.utm_source = order_data.get("utm_source")
-                    existing_order.utm_medium = order_data.get("utm_medium")
-                    existing_order.utm_campaign = order_data.get("utm_campaign")
-                    existing_order.utm_content = order_data.get("utm_content")
-                    existing_order.utm_term = order_data.get("utm_term")
-                    existing_order.app_name = order_data.get("app_name")
-                    existing_order.tags = order_data.get("tags")
-                    existing_order.note = order_data.get("note")
-                    existing_order.order_processed_at = _parse_datetime(order_data.get("order_processed_at"))
-                    existing_order.order_closed_at = _parse_datetime(order_data.get("order_closed_at"))
-                    existing_order.updated_at = datetime.utcnow()
-
-                    order = existing_order
-                    stats.orders_updated += 1
-                else:
-                    # Create new order
-                    order = ShopifyOrder(
-                        workspace_id=workspace_id,
-                        shop_id=shop.id,
-                        customer_id=customer_id,
-                        external_order_id=external_order_id,
-                        order_number=order_data.get("order_number"),
-                        name=order_data.get("name"),
-                        total_price=order_total,
-                        subtotal_price=order_data.get("subtotal_price"),
-                        total_tax=order_data.get("total_tax"),
-                        total_shipping=order_data.get("total_shipping"),
-                        total_discounts=order_data.get("total_discounts"),
-                        currency=order_data.get("currency", "USD"),
-                        total_cost=total_cost if not has_missing_costs else None,
-                        total_profit=total_profit if not has_missing_costs else None,
-                        has_missing_costs=has_missing_costs,
-                        financial_status=_map_financial_status(order_data.get("financial_status")),
-                        fulfillment_status=_map_fulfillment_status(order_data.get("fulfillment_status")),
-                        cancelled_at=_parse_datetime(order_data.get("cancelled_at")),
-                        cancel_reason=order_data.get("cancel_reason"),
-                        source_name=order_data.get("source_name"),
-                        landing_site=order_data.get("landing_site"),
-                        referring_site=order_data.get("referring_site"),
-                        utm_source=order_data.get("utm_source"),
-                        utm_medium=order_data.get("utm_medium"),
-                        utm_campaign=order_data.get("utm_campaign"),
-                        utm_content=order_data.get("utm_content"),
-                        utm_term=order_data.get("utm_term"),
-                        app_name=order_data.get("app_name"),
-                        tags=order_data.get("tags"),
-                        note=order_data.get("note"),
-                        order_created_at=_parse_datetime(order_data.get("order_created_at")) or datetime.utcnow(),
-                        order_processed_at=_parse_datetime(order_data.get("order_processed_at")),
-                        order_closed_at=_parse_datetime(order_data.get("order_closed_at")),
+        pages = 0
+
+        try:
+            async for page, next_cursor in order_pages:
+                touched_customer_ids = _upsert_order_page_isolated(
+                    db, shop, workspace_id, page, stats, errors
+                )
+
+                # Update the LTV of the page's customers before its checkpoint,
+                # so a resumed sync never leaves committed pages with stale LTV
+                # (a full resync recalculates every customer at the end)
+                if not force_full_sync:
+                    ltv_start = datetime.utcnow()
+                    stats.ltv_customers_updated += await _update_customer_ltv(
+                        db, shop.id, customer_ids=touched_customer_ids, commit=False
                     )
-                    db.add(order)
-                    db.flush()  # Get order.id
-                    stats.orders_created += 1
-
-                # Sync line items (delete and recreate for simplicity)
-                if existing_order:
-                    db.query(ShopifyOrderLineItem).filter(
-                        ShopifyOrderLineItem.order_id == order.id
-                    ).delete()
-
-                # Get product lookup by external_id
-                product_lookup: Dict[str, ShopifyProduct] = {}
-                for product in products:
-                    product_lookup[product.external_product_id] = product
-
-                for li in line_items_data:
-                    # Link to product if exists
-                    product_id = None
-                    if li.get("external_product_id"):
-                        product = product_lookup.get(li["external_product_id"])
-                        if product:
-                            product_id = product.id
-
-                    line_item = ShopifyOrderLineItem(
-                        order_id=order.id,
-                        product_id=product_id,
-                        external_line_item_id=li["external_line_item_id"],
-                        external_product_id=li.get("external_product_id"),
-                        external_variant_id=li.get("external_variant_id"),
-                        title=li["title"],
-                        variant_title=li.get("variant_title"),
-                        sku=li.get("sku"),
-                        quantity=li.get("quantity", 1),
-                        price=li.get("price") or Decimal("0"),
-                        total_discount=li.get("total_discount") or Decimal("0"),
-                        cost_per_item=li.get("cost_per_item"),
-                        cost_source=li.get("cost_source"),
-                        line_profit=li.get("line_profit"),
-                    )
-                    db.add(line_item)
-                    stats.line_items_created += 1
-
-            except Exception as e:
-                error_msg = f"Error syncing order {order_data.get('external_order_id')}: {e}"
-                logger.error(f"[SHOPIFY_SYNC] {error_msg}")
-                errors.append(error_msg)
-
-        db.commit()
+                    stats.ltv_duration_seconds += (datetime.utcnow() - ltv_start).total_seconds()
+
+                # Checkpoint in the same transaction as the page (also when
+                # some of its orders failed, so a bad order can't stall the sync)
+                if not use_bulk:
+                    shop.orders_sync_cursor = next_cursor
+                    shop.orders_sync_since = sync_since if next_cursor else None
+                db.commit()
+                pages += 1
+
+            if use_bulk:
+                shop.orders_sync_cursor = None
+                shop.orders_sync_since = None
+                db.commit()
+        except ShopifyAPIError:
+            db.rollback()
+            if resume_cursor and resume_cursor != BULK_RESUME_CURSOR and pages == 0:
+                # The saved cursor may have expired: start over next time
+                shop.orders_sync_cursor = None
+                shop.orders_sync_since = None
+                db.commit()
+            raise
+        except Exception:
+            db.rollback()
+            raise
+
+        logger.info(
+            f"[SHOPIFY_SYNC] Upserted {stats.orders_created + stats.orders_updated} orders "
+            f"in {pages} pages"
+        )
+        bump_data_version(workspace_id)
 
-        # Update customer LTV metrics
-        await _update_customer_ltv(db, shop.id)
+        # Full resync: recalculate LTV for every customer of the shop
+        if force_full_sync:
+            ltv_start = datetime.utcnow()
+            stats.ltv_customers_updated = await _update_customer_ltv(db, shop.id, customer_ids=None)
+            stats.ltv_duration_seconds = (datetime.utcnow() - ltv_start).total_seconds()
 
     except ShopifyAPIError as e:
         error_msg = f"Shopify API error: {e}"
@@ -807,10 +704,10 @@ async def sync_shopify_orders(
 
     logger.info(
         "[SHOPIFY_SYNC] Order sync complete: created=%d, updated=%d, line_items=%d, "
-        "revenue=$%.2f, profit=$%.2f, missing_cost=%d, duration=%.2fs",
+        "revenue=$%.2f, profit=$%.2f, missing_cost=%d, ltv_customers=%d (%.2fs), duration=%.2fs",
         stats.orders_created, stats.orders_updated, stats.line_items_created,
         stats.total_revenue, stats.total_profit, stats.orders_missing_cost,
-        stats.duration_seconds
+        stats.ltv_customers_updated, stats.ltv_duration_seconds, stats.duration_seconds
     )
 
     return ShopifySyncResponse(
@@ -821,49 +718,376 @@ async def sync_shopify_orders(
     )
 
 
-async def _update_customer_ltv(db: Session, shop_id: UUID) -> None:
-    """Update customer LTV metrics from orders.
+def _upsert_order_page_isolated(
+    db: Session,
+    shop: ShopifyShop,
+    workspace_id: UUID,
+    orders: List[Dict[str, Any]],
+    stats: ShopifySyncStats,
+    errors: List[str],
+) -> Set[UUID]:
+    """Upsert a page of orders, isolating orders that fail.
+
+    WHAT: Tries the whole page in a savepoint. If that fails, retries the page
+          one order at a time, each in its own savepoint; orders that still
+          fail are skipped and reported in `errors`.
+    WHY: The multi-row upsert would otherwise let one malformed order fail
+         every order on its page, and the page would fail again on every
+         resumed run.
 
-    WHAT: Recalculate total_spent, order_count, first/last order dates
-    WHY: Keep customer metrics in sync with order data for fast LTV queries
+    Stats are only counted for orders that were written.
+
+    Returns:
+        Customer ids whose orders changed (see _upsert_order_page)
     """
-    logger.info(f"[SHOPIFY_SYNC] Updating customer LTV metrics for shop {shop_id}")
+    try:
+        return _upsert_in_savepoint(db, shop, workspace_id, orders, stats)
+    except Exception as e:
+        logger.warning(f"[SHOPIFY_SYNC] Page upsert failed, retrying order by order: {e}")
 
-    # Get all customers for this shop
-    customers = db.query(ShopifyCustomer).filter(
-        ShopifyCustomer.shop_id == shop_id
-    ).all()
+    touched: Set[UUID] = set()
+    for order_data in orders:
+        try:
+            touched |= _upsert_in_savepoint(db, shop, workspace_id, [order_data], stats)
+        except Exception as e:
+            error_msg = f"Error syncing order {order_data.get('external_order_id')}: {e}"
+            logger.error(f"[SHOPIFY_SYNC] {error_msg}")
+            errors.append(error_msg)
+    return touched
 
-    for customer in customers:
-        # Aggregate orders for this customer
-        from sqlalchemy import func
 
-        result = db.query(
-            func.count(ShopifyOrder.id).label("order_count"),
-            func.sum(ShopifyOrder.total_price).label("total_spent"),
-            func.min(ShopifyOrder.order_created_at).label("first_order"),
-            func.max(ShopifyOrder.order_created_at).label("last_order"),
-        ).filter(
-            ShopifyOrder.customer_id == customer.id,
-            ShopifyOrder.financial_status.in_([
-                ShopifyFinancialStatusEnum.paid,
-                ShopifyFinancialStatusEnum.partially_refunded,
-            ])
-        ).first()
+def _upsert_in_savepoint(
+    db: Session,
+    shop: ShopifyShop,
+    workspace_id: UUID,
+    orders: List[Dict[str, Any]],
+    stats: ShopifySyncStats,
+) -> Set[UUID]:
+    """Run _upsert_order_page in a savepoint, updating stats only if it succeeds."""
+    page_stats = replace(stats)
+    with db.begin_nested():
+        touched = _upsert_order_page(db, shop, workspace_id, orders, page_stats)
+    for stat in fields(stats):
+        setattr(stats, stat.name, getattr(page_stats, stat.name))
+    return touched
+
+
+def _upsert_order_page(
+    db: Session,
+    shop: ShopifyShop,
+    workspace_id: UUID,
+    orders: List[Dict[str, Any]],
+    stats: ShopifySyncStats,
+) -> Set[UUID]:
+    """Upsert one page of orders and their line items with multi-row statements.
+
+    WHAT:
+        1. Look up customers, products and existing orders for this page only
+        2. INSERT ... ON CONFLICT (shop_id, external_order_id) DO UPDATE for
+           all orders, RETURNING their ids
+        3. INSERT ... ON CONFLICT (order_id, external_line_item_id) DO UPDATE
+           for all line items, then delete line items no longer on the orders
+    WHY: A handful of statements per page instead of several per order, and
+         nothing but the current page is held in memory.
+
+    Does not commit (the caller commits together with the page checkpoint).
 
-        if result:
-            customer.order_count = result.order_count or 0
-            customer.total_spent = result.total_spent or Decimal("0")
-            customer.first_order_at = result.first_order
-            customer.last_order_at = result.last_order
+    Returns:
+        Customer ids whose orders changed (including previous owners of
+        reassigned orders)
+    """
+    # Shopify pages don't repeat orders, but ON CONFLICT can't touch a row twice
+    orders = list({o["external_order_id"]: o for o in orders}.values())
+    if not orders:
+        return set()
+
+    external_order_ids = [o["external_order_id"] for o in orders]
+    external_customer_ids = {o["external_customer_id"] for o in orders if o.get("external_customer_id")}
+    external_product_ids = {
+        li["external_product_id"]
+        for o in orders for li in o.get("line_items", [])
+        if li.get("external_product_id")
+    }
 
-            if customer.order_count > 0:
-                customer.average_order_value = customer.total_spent / customer.order_count
+    customer_ids: Dict[str, UUID] = {}
+    if external_customer_ids:
+        customer_ids = dict(db.query(ShopifyCustomer.external_customer_id, ShopifyCustomer.id).filter(
+            ShopifyCustomer.shop_id == shop.id,
+            ShopifyCustomer.external_customer_id.in_(external_customer_ids),
+        ).all())
+
+    products: Dict[str, Tuple[UUID, Optional[Decimal]]] = {}
+    if external_product_ids:
+        products = {
+            row.external_product_id: (row.id, row.cost_per_item)
+            for row in db.query(
+                ShopifyProduct.external_product_id, ShopifyProduct.id, ShopifyProduct.cost_per_item
+            ).filter(
+                ShopifyProduct.shop_id == shop.id,
+                ShopifyProduct.external_product_id.in_(external_product_ids),
+            )
+        }
+
+    previous_customers: Dict[str, Optional[UUID]] = dict(
+        db.query(ShopifyOrder.external_order_id, ShopifyOrder.customer_id).filter(
+            ShopifyOrder.shop_id == shop.id,
+            ShopifyOrder.external_order_id.in_(external_order_ids),
+        ).all()
+    )
+
+    now = datetime.utcnow()
+    touched: Set[UUID] = {cid for cid in previous_customers.values() if cid}
+    order_rows = []
+    line_items_by_order: Dict[str, List[Dict[str, Any]]] = {}
+
+    for order_data in orders:
+        external_order_id = order_data["external_order_id"]
+        customer_id = customer_ids.get(order_data.get("external_customer_id"))
+        if customer_id:
+            touched.add(customer_id)
+
+        # Calculate profit from line items
+        total_cost = Decimal("0")
+        total_profit = Decimal("0")
+        has_missing_costs = False
+        line_items_data = order_data.get("line_items", [])
+
+        for li in line_items_data:
+            quantity = li.get("quantity", 1)
+            price = li.get("price") or Decimal("0")
+            discount = li.get("total_discount") or Decimal("0")
+            line_revenue = (price * quantity) - discount
+
+            # Get cost: from line item, then product fallback
+            cost_per_item = li.get("cost_per_item")
+            cost_source = li.get("cost_source")
+            product_id, product_cost = products.get(li.get("external_product_id"), (None, None))
+
+            if cost_per_item is None and product_cost:
+                cost_per_item = product_cost
+                cost_source = "product"
+
+            if cost_per_item:
+                line_cost = cost_per_item * quantity
+                line_profit = line_revenue - line_cost
+                total_cost += line_cost
+                total_profit += line_profit
             else:
-                customer.average_order_value = None
+                has_missing_costs = True
+                line_profit = None
+
+            line_items_by_order.setdefault(external_order_id, []).append({
+                "product_id": product_id,
+                "external_line_item_id": li["external_line_item_id"],
+                "external_product_id": li.get("external_product_id"),
+                "external_variant_id": li.get("external_variant_id"),
+                "title": li["title"],
+                "variant_title": li.get("variant_title"),
+                "sku": li.get("sku"),
+                "quantity": quantity,
+                "price": price,
+                "total_discount": discount,
+                "cost_per_item": cost_per_item,
+                "cost_source": cost_source,
+                "line_profit": line_profit,
+                "created_at": now,
+            })
+
+        # Update stats
+        if has_missing_costs:
+            stats.orders_missing_cost += 1
+
+        order_total = order_data.get("total_price") or Decimal("0")
+        stats.total_revenue += order_total
+        stats.total_profit += total_profit
+
+        if external_order_id in previous_customers:
+            stats.orders_updated += 1
+        else:
+            stats.orders_created += 1
+
+        order_rows.append({
+            "id": uuid.uuid4(),
+            "workspace_id": workspace_id,
+            "shop_id": shop.id,
+            "customer_id": customer_id,
+            "external_order_id": external_order_id,
+            "order_number": order_data.get("order_number"),
+            "name": order_data.get("name"),
+            "total_price": order_total,
+            "subtotal_price": order_data.get("subtotal_price"),
+            "total_tax": order_data.get("total_tax"),
+            "total_shipping": order_data.get("total_shipping"),
+            "total_discounts": order_data.get("total_discounts"),
+            "currency": order_data.get("currency", "USD"),
+            "total_cost": total_cost if not has_missing_costs else None,
+            "total_profit": total_profit if not has_missing_costs else None,
+            "has_missing_costs": has_missing_costs,
+            "financial_status": _map_financial_status(order_data.get("financial_status")),
+            "fulfillment_status": _map_fulfillment_status(order_data.get("fulfillment_status")),
+            "cancelled_at": _parse_datetime(order_data.get("cancelled_at")),
+            "cancel_reason": order_data.get("cancel_reason"),
+            "source_name": order_data.get("source_name"),
+            "landing_site": order_data.get("landing_site"),
+            "referring_site": order_data.get("referring_site"),
+            "utm_source": order_data.get("utm_source"),
+            "utm_medium": order_data.get("utm_medium"),
+            "utm_campaign": order_data.get("utm_campaign"),
+            "utm_content": order_data.get("utm_content"),
+            "utm_term": order_data.get("utm_term"),
+            "app_name": order_data.get("app_name"),
+            "tags": order_data.get("tags"),
+            "note": order_data.get("note"),
+            "created_at": now,
+            "updated_at": now,
+            "order_created_at": _parse_datetime(order_data.get("order_created_at")) or now,
+            "order_processed_at": _parse_datetime(order_data.get("order_processed_at")),
+            "order_closed_at": _parse_datetime(order_data.get("order_closed_at")),
+        })
+
+    # Orders: everything except identity and first-sync timestamp is refreshed
+    insert_orders = insert(ShopifyOrder).values(order_rows)
+    order_stmt = insert_orders.on_conflict_do_update(
+        index_elements=["shop_id", "external_order_id"],
+        set_={
+            column: insert_orders.excluded[column]
+            for column in order_rows[0]
+            if column not in ("id", "workspace_id", "shop_id", "external_order_id", "created_at")
+        },
+    ).returning(ShopifyOrder.id, ShopifyOrder.external_order_id)
+    order_ids = {external_id: order_id for order_id, external_id in db.execute(order_stmt)}
+
+    # Line items: upsert the current set, then drop items no longer on the order
+    line_rows = []
+    for external_order_id, items in line_items_by_order.items():
+        for item in {li["external_line_item_id"]: li for li in items}.values():
+            line_rows.append({"id": uuid.uuid4(), "order_id": order_ids[external_order_id], **item})
+
+    if line_rows:
+        insert_lines = insert(ShopifyOrderLineItem).values(line_rows)
+        db.execute(insert_lines.on_conflict_do_update(
+            index_elements=["order_id", "external_line_item_id"],
+            set_={
+                column: insert_lines.excluded[column]
+                for column in line_rows[0]
+                if column not in ("id", "order_id", "external_line_item_id", "created_at")
+            },
+        ))
+        stats.line_items_created += len(line_rows)
+
+    stale_items = delete(ShopifyOrderLineItem).where(
+        ShopifyOrderLineItem.order_id.in_(list(order_ids.values()))
+    )
+    if line_rows:
+        stale_items = stale_items.where(
+            ShopifyOrderLineItem.external_line_item_id.notin_(
+                [row["external_line_item_id"] for row in line_rows]
+            )
+        )
+    db.execute(stale_items.execution_options(synchronize_session=False))
+
+    return touched
+
+
+# Orders that count towards customer LTV
+LTV_FINANCIAL_STATUSES = (
+    ShopifyFinancialStatusEnum.paid,
+    ShopifyFinancialStatusEnum.partially_refunded,
+)
+
+
+async def _update_customer_ltv(
+    db: Session,
+    shop_id: UUID,
+    customer_ids: Optional[Iterable[UUID]] = None,
+    commit: bool = True,
+) -> int:
+    """Update customer LTV metrics from orders.
+
+    WHAT: Recalculate total_spent, order_count, average_order_value and
+          first/last order dates in one set-based statement:
+          UPDATE shopify_customers FROM (per-customer aggregate of paid orders).
+          Customers without paid orders are reset to 0 / NULL; rows whose
+          values did not change are not rewritten.
+    WHY: Keep customer metrics in sync with order data for fast LTV queries,
+         without one aggregate query per customer after every sync.
 
-    db.commit()
-    logger.info(f"[SHOPIFY_SYNC] Updated LTV for {len(customers)} customers")
+    Args:
+        db: Database session
+        shop_id: Shop whose customers are recalculated
+        customer_ids: Incremental mode - only these customers (e.g. the ones
+            touched by the current order batch). None = every customer.
+        commit: Commit the update (False = leave it in the caller's
+            transaction, e.g. the order page and its checkpoint)
+
+    Returns:
+        Number of customer rows updated
+    """
+    if customer_ids is not None:
+        customer_ids = list(customer_ids)
+        if not customer_ids:
+            return 0
+
+    logger.info(
+        "[SHOPIFY_SYNC] Updating customer LTV metrics for shop %s (%s)",
+        shop_id, "all customers" if customer_ids is None else f"{len(customer_ids)} customers",
+    )
+
+    customer = aliased(ShopifyCustomer)
+    totals = (
+        select(
+            customer.id.label("customer_id"),
+            func.count(ShopifyOrder.id).label("order_count"),
+            func.coalesce(func.sum(ShopifyOrder.total_price), 0).label("total_spent"),
+            func.min(ShopifyOrder.order_created_at).label("first_order_at"),
+            func.max(ShopifyOrder.order_created_at).label("last_order_at"),
+        )
+        .select_from(customer)
+        .outerjoin(
+            ShopifyOrder,
+            and_(
+                ShopifyOrder.customer_id == customer.id,
+                ShopifyOrder.financial_status.in_(LTV_FINANCIAL_STATUSES),
+            ),
+        )
+        .where(customer.shop_id == shop_id)
+        .group_by(customer.id)
+    )
+    if customer_ids is not None:
+        totals = totals.where(customer.id.in_(customer_ids))
+    totals = totals.subquery("totals")
+
+    average_order_value = case(
+        (totals.c.order_count > 0, totals.c.total_spent / totals.c.order_count),
+        else_=None,
+    )
+    stmt = (
+        update(ShopifyCustomer)
+        .where(ShopifyCustomer.id == totals.c.customer_id)
+        .where(
+            # Skip rows that are already up to date
+            or_(
+                ShopifyCustomer.order_count.is_distinct_from(totals.c.order_count),
+                ShopifyCustomer.total_spent.is_distinct_from(totals.c.total_spent),
+                ShopifyCustomer.first_order_at.is_distinct_from(totals.c.first_order_at),
+                ShopifyCustomer.last_order_at.is_distinct_from(totals.c.last_order_at),
+            )
+        )
+        .values(
+            order_count=totals.c.order_count,
+            total_spent=totals.c.total_spent,
+            average_order_value=average_order_value,
+            first_order_at=totals.c.first_order_at,
+            last_order_at=totals.c.last_order_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    updated = db.execute(stmt).rowcount or 0
+    if commit:
+        db.commit()
+    logger.info(f"[SHOPIFY_SYNC] Updated LTV for {updated} customers")
+    return updated
 
 
 async def sync_shopify_all(
@@ -952,6 +1176,8 @@ async def sync_shopify_all(
     combined_stats.total_revenue = order_result.stats.total_revenue
     combined_stats.total_profit = order_result.stats.total_profit
     combined_stats.orders_missing_cost = order_result.stats.orders_missing_cost
+    combined_stats.ltv_customers_updated = order_result.stats.ltv_customers_updated
+    combined_stats.ltv_duration_seconds = order_result.stats.ltv_duration_seconds
     all_errors.extend(order_result.errors)
 
     combined_stats.duration_seconds = (datetime.utcnow() - start_time).total_seconds()
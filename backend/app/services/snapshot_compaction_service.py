@@ -0,0 +1,388 @@
+"""Snapshot Compaction Service - chunked 15-min to hourly compaction.
+
+WHAT:
+    Compacts one UTC day of 15-min metric_snapshots into hourly rows in
+    bounded batches:
+    - Batches never span workspaces and hold at most COMPACTION_BATCH_SIZE
+      entities (keyset-paginated on (workspace_id, entity_id))
+    - Each batch upserts its hourly rows and deletes its 15-min rows in one
+      statement, then commits
+    - The hourly row takes the latest 15-min snapshot of the hour, including
+      its metrics_date (snapshots are cumulative per metrics_date)
+    - When an account's day ends inside the hour (non-UTC timezones), the
+      last 15-min snapshot of the earlier metrics_date is kept as-is, so
+      that day's final values survive compaction
+    - The existing on-the-hour row competes with the 15-min rows, so an
+      hour that was already compacted keeps its newer-metrics_date row
+    - Dry-run mode estimates rows and bytes saved without writing
+
+WHY:
+    The previous single CTE aggregated, inserted and deleted the entire day
+    for all tenants in one transaction, holding locks and generating WAL
+    proportional to the whole day, and it dropped metrics_date from the
+    compacted rows (breaking daily reads on compacted days).
+
+RESUMABILITY:
+    A committed batch has no 15-min rows left besides the kept end-of-day
+    snapshots. Those are older than their hour's metrics_date, which the
+    batch scan skips (_PENDING_FIFTEEN_MIN_ROWS), so it only finds entities
+    that still need work, and compacting such an hour again is a no-op.
+    Re-running a day after a crash (or after a failed batch) continues where
+    the previous run stopped; completed batches are never redone.
+
+REFERENCES:
+    - app/workers/arq_worker.py (scheduled_compaction)
+    - app/services/snapshot_sync_service.py (compact_snapshots_to_hourly)
+    - scripts/compact_snapshots.py (CLI, dry run)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+# Maximum entities per batch (one transaction each)
+COMPACTION_BATCH_SIZE = int(os.getenv("COMPACTION_BATCH_SIZE", "500"))
+
+# 15-min rows of the day: everything not on an hour boundary
+_FIFTEEN_MIN_ROWS = """
+    captured_at >= :start_dt
+    AND captured_at < :end_dt
+    AND captured_at != date_trunc('hour', captured_at)
+"""
+
+# 15-min rows still to compact: excludes the end-of-day snapshots kept by an
+# earlier run, whose hour already holds a newer metrics_date
+_PENDING_FIFTEEN_MIN_ROWS = f"""
+    {_FIFTEEN_MIN_ROWS}
+    AND NOT EXISTS (
+        SELECT 1 FROM metric_snapshots hourly
+        WHERE hourly.entity_id = metric_snapshots.entity_id
+          AND hourly.provider = metric_snapshots.provider
+          AND hourly.captured_at = date_trunc('hour', metric_snapshots.captured_at)
+          AND hourly.metrics_date > metric_snapshots.metrics_date
+    )
+"""
+
+
+@dataclass
+class CompactionReport:
+    """Metrics of one compaction run (or dry-run estimate)."""
+
+    target_date: date
+    dry_run: bool = False
+    workspaces: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    rows_in: int = 0          # 15-min rows removed
+    rows_out: int = 0         # hourly rows written (inserted or updated)
+    rows_saved: int = 0       # net row reduction
+    duration_seconds: float = 0.0
+    estimated_bytes_saved: Optional[int] = None  # dry run only
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["target_date"] = str(self.target_date)
+        return data
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def compact_snapshots_for_date(
+    db: Session,
+    target_date: date,
+    batch_size: Optional[int] = None,
+    dry_run: bool = False,
+) -> CompactionReport:
+    """Compact one UTC day of 15-min snapshots to hourly, batch by batch.
+
+    WHAT:
+        Walks the entities that still have 15-min rows on target_date,
+        one workspace at a time, and compacts them in batches of at most
+        batch_size entities. A failing batch is rolled back and counted;
+        the remaining batches still run.
+
+    Args:
+        db: Database session (committed once per batch)
+        target_date: UTC date to compact
+        batch_size: Entities per batch (default COMPACTION_BATCH_SIZE)
+        dry_run: Only estimate savings, write nothing
+
+    Returns:
+        CompactionReport with rows-in/rows-out/duration
+    """
+    started = time.monotonic()
+    start_dt, end_dt = _day_bounds(target_date)
+    report = CompactionReport(target_date=target_date, dry_run=dry_run)
+
+    if dry_run:
+        _estimate(db, start_dt, end_dt, report)
+        report.duration_seconds = round(time.monotonic() - started, 3)
+        logger.info("[COMPACTION] Dry run for %s: %s", target_date, report.as_dict())
+        return report
+
+    batch_size = batch_size or COMPACTION_BATCH_SIZE
+    cursor: Optional[Tuple[UUID, UUID]] = None
+    current_workspace: Optional[UUID] = None
+
+    logger.info("[COMPACTION] Starting compaction for date %s (batch_size=%d)", target_date, batch_size)
+
+    while True:
+        batch = _next_batch(db, start_dt, end_dt, cursor, batch_size)
+        if not batch:
+            break
+
+        workspace_id = batch[0][0]
+        entity_ids = [entity_id for _, entity_id in batch]
+        cursor = batch[-1]
+
+        if workspace_id != current_workspace:
+            current_workspace = workspace_id
+            report.workspaces += 1
+
+        try:
+            written, inserted, deleted = _compact_batch(db, entity_ids, start_dt, end_dt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            report.failed_batches += 1
+            logger.exception(
+                "[COMPACTION] Batch failed for workspace %s (%d entities) on %s: %s",
+                workspace_id, len(entity_ids), target_date, e,
+            )
+            continue
+
+        report.batches += 1
+        report.rows_in += deleted
+        report.rows_out += written
+        report.rows_saved += deleted - inserted
+
+        logger.debug(
+            "[COMPACTION] Batch %d: workspace=%s entities=%d rows_in=%d rows_out=%d",
+            report.batches, workspace_id, len(entity_ids), deleted, written,
+        )
+
+    report.duration_seconds = round(time.monotonic() - started, 3)
+    logger.info(
+        "[COMPACTION] Compacted date %s: rows_in=%d, rows_out=%d, saved=%d, "
+        "workspaces=%d, batches=%d, failed=%d, duration=%.1fs",
+        target_date, report.rows_in, report.rows_out, report.rows_saved,
+        report.workspaces, report.batches, report.failed_batches, report.duration_seconds,
+    )
+    return report
+
+
+# =============================================================================
+# INTERNALS
+# =============================================================================
+
+def _day_bounds(target_date: date) -> Tuple[datetime, datetime]:
+    start_dt = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=timezone.utc)
+    return start_dt, start_dt + timedelta(days=1)
+
+
+def _next_batch(
+    db: Session,
+    start_dt: datetime,
+    end_dt: datetime,
+    cursor: Optional[Tuple[UUID, UUID]],
+    batch_size: int,
+) -> List[Tuple[UUID, UUID]]:
+    """Next (workspace_id, entity_id) pairs with 15-min rows, one workspace only.
+
+    Keyset pagination on (workspace_id, entity_id); the EXISTS probe uses
+    idx_snapshots_entity_captured_desc, so no full scan of the day is needed.
+    End-of-day snapshots kept by an earlier run do not count as pending.
+    """
+    after_clause = "AND (e.workspace_id, e.id) > (:after_workspace, :after_entity)" if cursor else ""
+    sql = text(f"""
+        SELECT e.workspace_id, e.id
+        FROM entities e
+        WHERE EXISTS (
+            SELECT 1 FROM metric_snapshots
+            WHERE entity_id = e.id AND {_PENDING_FIFTEEN_MIN_ROWS}
+        )
+        {after_clause}
+        ORDER BY e.workspace_id, e.id
+        LIMIT :batch_size
+    """)
+    params: Dict[str, Any] = {"start_dt": start_dt, "end_dt": end_dt, "batch_size": batch_size}
+    if cursor:
+        params["after_workspace"], params["after_entity"] = cursor
+
+    rows = [(row[0], row[1]) for row in db.execute(sql, params)]
+    if not rows:
+        return []
+
+    # Cut at the workspace boundary; the next call starts at the next workspace
+    workspace_id = rows[0][0]
+    return [row for row in rows if row[0] == workspace_id]
+
+
+def _compact_batch(
+    db: Session,
+    entity_ids: List[UUID],
+    start_dt: datetime,
+    end_dt: datetime,
+) -> Tuple[int, int, int]:
+    """Upsert hourly rows and delete the 15-min rows for a batch of entities.
+
+    The latest snapshot per (entity, provider, hour, metrics_date) survives,
+    the existing on-the-hour row included. The one with the newest
+    metrics_date becomes the hourly row; the others (a day that ended inside
+    the hour) stay at their own captured_at, because (entity_id, provider,
+    captured_at) is unique. Ranking by metrics_date rather than captured_at
+    keeps an already compacted hour as it is: its on-the-hour row holds the
+    newest day even though it sorts first in time.
+
+    Returns:
+        (hourly rows written, of which newly inserted, 15-min rows deleted)
+    """
+    compact_sql = text(f"""
+        WITH latest AS (
+            SELECT DISTINCT ON (entity_id, provider, date_trunc('hour', captured_at), metrics_date)
+                id,
+                entity_id,
+                provider,
+                captured_at,
+                date_trunc('hour', captured_at) AS hour_bucket,
+                metrics_date,
+                spend, impressions, clicks, conversions, revenue,
+                leads, purchases, installs, visitors, profit, currency
+            FROM metric_snapshots
+            WHERE entity_id = ANY(CAST(:entity_ids AS uuid[]))
+              AND captured_at >= :start_dt
+              AND captured_at < :end_dt
+            ORDER BY entity_id, provider, date_trunc('hour', captured_at), metrics_date, captured_at DESC
+        ),
+        ranked AS (
+            SELECT
+                latest.*,
+                ROW_NUMBER() OVER (
+                    PARTITION BY entity_id, provider, hour_bucket
+                    ORDER BY metrics_date DESC NULLS LAST, captured_at DESC
+                ) AS hour_rank
+            FROM latest
+        ),
+        upserted AS (
+            INSERT INTO metric_snapshots (
+                id, entity_id, provider, captured_at, metrics_date,
+                spend, impressions, clicks, conversions, revenue,
+                leads, purchases, installs, visitors, profit, currency, created_at
+            )
+            SELECT
+                gen_random_uuid(), entity_id, provider, hour_bucket, metrics_date,
+                spend, impressions, clicks, conversions, revenue,
+                leads, purchases, installs, visitors, profit, currency,
+                NOW()
+            FROM ranked
+            WHERE hour_rank = 1
+              AND captured_at != hour_bucket
+            ON CONFLICT (entity_id, provider, captured_at)
+            DO UPDATE SET
+                metrics_date = EXCLUDED.metrics_date,
+                spend = EXCLUDED.spend,
+                impressions = EXCLUDED.impressions,
+                clicks = EXCLUDED.clicks,
+                conversions = EXCLUDED.conversions,
+                revenue = EXCLUDED.revenue,
+                leads = EXCLUDED.leads,
+                purchases = EXCLUDED.purchases,
+                installs = EXCLUDED.installs,
+                visitors = EXCLUDED.visitors,
+                profit = EXCLUDED.profit,
+                currency = EXCLUDED.currency
+            RETURNING (xmax = 0) AS inserted
+        ),
+        deleted AS (
+            DELETE FROM metric_snapshots
+            WHERE entity_id = ANY(CAST(:entity_ids AS uuid[]))
+              AND {_FIFTEEN_MIN_ROWS}
+              AND id NOT IN (SELECT id FROM ranked WHERE hour_rank > 1)
+            RETURNING 1
+        )
+        SELECT
+            (SELECT COUNT(*) FROM upserted) AS written_count,
+            (SELECT COUNT(*) FROM upserted WHERE inserted) AS inserted_count,
+            (SELECT COUNT(*) FROM deleted) AS deleted_count
+    """)
+
+    row = db.execute(compact_sql, {
+        "entity_ids": [str(entity_id) for entity_id in entity_ids],
+        "start_dt": start_dt,
+        "end_dt": end_dt,
+    }).fetchone()
+
+    if not row:
+        return 0, 0, 0
+    return int(row[0] or 0), int(row[1] or 0), int(row[2] or 0)
+
+
+def _estimate(db: Session, start_dt: datetime, end_dt: datetime, report: CompactionReport) -> None:
+    """Fill a dry-run report: rows that would be removed/written and bytes saved."""
+    estimate_sql = text(f"""
+        WITH buckets AS (
+            SELECT
+                entity_id, provider, date_trunc('hour', captured_at) AS hour_bucket,
+                COUNT(*) AS n,
+                ROW_NUMBER() OVER (
+                    PARTITION BY entity_id, provider, date_trunc('hour', captured_at)
+                    ORDER BY metrics_date DESC NULLS LAST, MAX(captured_at) DESC
+                ) AS hour_rank
+            FROM metric_snapshots
+            WHERE {_PENDING_FIFTEEN_MIN_ROWS}
+            GROUP BY entity_id, provider, date_trunc('hour', captured_at), metrics_date
+        )
+        SELECT
+            COALESCE(SUM(CASE WHEN b.hour_rank = 1 THEN b.n ELSE b.n - 1 END), 0) AS rows_in,
+            COUNT(*) FILTER (WHERE b.hour_rank = 1) AS rows_out,
+            COUNT(*) FILTER (WHERE b.hour_rank = 1 AND NOT EXISTS (
+                SELECT 1 FROM metric_snapshots h
+                WHERE h.entity_id = b.entity_id
+                  AND h.provider = b.provider
+                  AND h.captured_at = b.hour_bucket
+            )) AS new_rows,
+            COUNT(DISTINCT e.workspace_id) AS workspaces
+        FROM buckets b
+        JOIN entities e ON e.id = b.entity_id
+    """)
+    row = db.execute(estimate_sql, {"start_dt": start_dt, "end_dt": end_dt}).fetchone()
+    if row:
+        report.rows_in = int(row[0] or 0)
+        report.rows_out = int(row[1] or 0)
+        report.rows_saved = report.rows_in - int(row[2] or 0)
+        report.workspaces = int(row[3] or 0)
+
+    row_bytes = _average_row_bytes(db)
+    if row_bytes is not None:
+        report.estimated_bytes_saved = int(report.rows_saved * row_bytes)
+
+
+def _average_row_bytes(db: Session) -> Optional[float]:
+    """Average on-disk snapshot row size (table + indexes) from planner statistics.
+
+    metric_snapshots is a partitioned parent without storage of its own (its
+    reltuples is -1/0), so sizes and row counts are summed over the leaf
+    partitions. pg_partition_tree also lists a plain table as its own leaf.
+    """
+    row_bytes = db.execute(text("""
+        SELECT SUM(pg_total_relation_size(tree.relid))::float
+               / GREATEST(SUM(GREATEST(c.reltuples, 0)), 1)
+        FROM pg_partition_tree('metric_snapshots') tree
+        JOIN pg_class c ON c.oid = tree.relid
+        WHERE tree.isleaf
+    """)).scalar()
+    return float(row_bytes) if row_bytes is not None else None
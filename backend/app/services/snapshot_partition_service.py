@@ -0,0 +1,222 @@
+"""Snapshot Partition Service - monthly partitions of metric_snapshots.
+
+WHAT:
+    metric_snapshots is range-partitioned by captured_at, one partition per
+    calendar month (metric_snapshots_pYYYY_MM) plus a default partition
+    (see alembic/versions/20261016_000003_partition_metric_snapshots.py).
+
+    - ensure_snapshot_partitions: create this month's and upcoming partitions
+      (scheduled daily, idempotent)
+    - list_snapshot_partitions: attached partitions with bounds and size
+    - detach_snapshot_partition: detach an old month and move it to the
+      archive schema / a cheap tablespace
+    - snapshot_pruning_clause: captured_at window for a metrics_date range,
+      so queries that filter by metrics_date still get partition pruning
+
+WHY:
+    "Last 7 days" scans touched years of history in one heap. Partitioning by
+    captured_at (not metrics_date) keeps the (entity_id, provider, captured_at)
+    unique key valid as-is: Postgres requires the partition key in every
+    unique constraint, and all snapshot upserts conflict on that key.
+    metrics_date is always within SNAPSHOT_CAPTURE_LAG_DAYS of captured_at
+    (snapshots are captured during the account day, or anchored to its
+    end-of-day for historical re-fetches).
+
+REFERENCES:
+    - app/workers/arq_worker.py (scheduled_snapshot_partitions)
+    - app/services/unified_metric_service.py, app/services/agents/evaluation_engine.py
+    - scripts/manage_snapshot_partitions.py (CLI)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+PARENT_TABLE = "metric_snapshots"
+DEFAULT_PARTITION = "metric_snapshots_default"
+
+# Months created ahead of the current one
+SNAPSHOT_PARTITION_MONTHS_AHEAD = int(os.getenv("SNAPSHOT_PARTITION_MONTHS_AHEAD", "3"))
+
+# Schema detached partitions are moved to
+SNAPSHOT_ARCHIVE_SCHEMA = os.getenv("SNAPSHOT_ARCHIVE_SCHEMA", "archive")
+
+# Max distance between a snapshot's metrics_date and its captured_at (UTC)
+SNAPSHOT_CAPTURE_LAG_DAYS = 2
+
+_PARTITION_NAME = re.compile(r"^metric_snapshots_p(\d{4})_(\d{2})$")
+
+
+@dataclass
+class SnapshotPartition:
+    """One attached monthly partition."""
+
+    name: str
+    month: date
+    total_bytes: int
+
+
+# =============================================================================
+# QUERY HELPERS
+# =============================================================================
+
+def snapshot_pruning_clause(captured_at, start_date: date, end_date: date):
+    """captured_at window covering every snapshot with a date in [start, end].
+
+    WHAT:
+        Returns captured_at >= start - LAG AND captured_at < end + 1 + LAG.
+        A superset of both metrics_date ranges and CAST(captured_at AS DATE)
+        ranges, so adding it next to those predicates never changes results.
+
+    WHY:
+        Partition pruning only works on predicates over the partition key;
+        metrics_date filters and casts of captured_at can't prune.
+
+    Args:
+        captured_at: The captured_at column (MetricSnapshot.captured_at)
+        start_date: First date of the range (inclusive)
+        end_date: Last date of the range (inclusive)
+    """
+    window_start, window_end = snapshot_capture_window(start_date, end_date)
+    return and_(captured_at >= window_start, captured_at < window_end)
+
+
+def snapshot_capture_window(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """(start, end) UTC datetimes of snapshot_pruning_clause."""
+    lag = timedelta(days=SNAPSHOT_CAPTURE_LAG_DAYS)
+    window_start = datetime.combine(start_date, time.min, tzinfo=timezone.utc) - lag
+    window_end = datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=timezone.utc) + lag
+    return window_start, window_end
+
+
+# =============================================================================
+# PARTITION MAINTENANCE
+# =============================================================================
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def create_partition_sql(month: date) -> str:
+    """CREATE TABLE ... PARTITION OF for one month (idempotent)."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+        f"PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+        f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+    )
+
+
+def ensure_snapshot_partitions(
+    db: Session,
+    months_ahead: int = SNAPSHOT_PARTITION_MONTHS_AHEAD,
+    today: Optional[date] = None,
+) -> List[str]:
+    """Create partitions from the current month through months_ahead.
+
+    WHAT:
+        Idempotent (CREATE TABLE IF NOT EXISTS). Partitions are created well
+        before any row can land in them, so the default partition stays
+        empty and attaching never has to move rows.
+
+    Returns:
+        Names of partitions that did not exist before
+    """
+    current = month_start(today or datetime.now(timezone.utc).date())
+    existing = {p.name for p in list_snapshot_partitions(db)}
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        db.execute(text(create_partition_sql(month)))
+        created.append(name)
+
+    db.commit()
+    if created:
+        logger.info("[PARTITIONS] Created snapshot partitions: %s", ", ".join(created))
+    return created
+
+
+def list_snapshot_partitions(db: Session) -> List[SnapshotPartition]:
+    """Attached monthly partitions, oldest first (default partition excluded)."""
+    rows = db.execute(text("""
+        SELECT c.relname, pg_total_relation_size(c.oid)
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = :parent
+        ORDER BY c.relname
+    """), {"parent": PARENT_TABLE}).fetchall()
+
+    partitions = []
+    for name, total_bytes in rows:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            partitions.append(SnapshotPartition(name, month, int(total_bytes or 0)))
+    return partitions
+
+
+def detach_snapshot_partition(
+    db: Session,
+    month: date,
+    archive_schema: str = SNAPSHOT_ARCHIVE_SCHEMA,
+    tablespace: Optional[str] = None,
+    min_age_months: int = 3,
+    today: Optional[date] = None,
+) -> str:
+    """Detach one month from metric_snapshots and archive it.
+
+    WHAT:
+        DETACH PARTITION, then move the table into `archive_schema` and
+        optionally onto `tablespace` (e.g. cheap/slow storage). The data is
+        kept; it just stops being visible to (and scanned by) app queries.
+        Re-attach with ALTER TABLE metric_snapshots ATTACH PARTITION.
+
+    RAISES:
+        ValueError: month is newer than min_age_months, or not attached
+    """
+    month = month_start(month)
+    current = month_start(today or datetime.now(timezone.utc).date())
+    if month > add_months(current, -min_age_months):
+        raise ValueError(
+            f"Refusing to detach {month:%Y-%m}: newer than {min_age_months} months"
+        )
+
+    name = partition_name(month)
+    if name not in {p.name for p in list_snapshot_partitions(db)}:
+        raise ValueError(f"Partition {name} is not attached to {PARENT_TABLE}")
+
+    db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+    db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+    db.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+    if tablespace:
+        db.execute(text(f"ALTER TABLE {archive_schema}.{name} SET TABLESPACE {tablespace}"))
+    db.commit()
+
+    archived = f"{archive_schema}.{name}"
+    logger.info("[PARTITIONS] Detached %s to %s", name, archived)
+    return archived
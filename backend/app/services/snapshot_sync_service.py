@@ -15,6 +15,13 @@ SYNC SCHEDULE:
     - Daily 3am: Re-fetch last 7 days with hourly granularity (attribution)
     - Daily 1am: Compact day-2 from 15-min to hourly (storage efficiency)
 
+UNCHANGED SNAPSHOTS:
+    Most entities don't move between two syncs. With SNAPSHOT_SKIP_UNCHANGED
+    (default on) a row is only written when its cumulative values differ
+    from the entity's latest stored snapshot for the same metrics_date, plus
+    one heartbeat row per hour. "Latest snapshot per day" reads return the
+    same values because the skipped row would have repeated them.
+
 REFERENCES:
     - Migration: alembic/versions/20251207_000001_add_metric_snapshots.py
     - Model: app/models.py:MetricSnapshot
@@ -24,6 +31,7 @@ REFERENCES:
 from __future__ import annotations
 
 import logging
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, date, timezone
@@ -32,7 +40,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text
+from sqlalchemy import func, literal_column
 from sqlalchemy.dialects.postgresql import insert
 
 from app.models import (
@@ -46,6 +54,12 @@ from app.models import (
 from app.security import decrypt_secret
 from app.services.meta_ads_client import MetaAdsClient, MetaAdsClientError, ensure_act_prefix
 from app.services.google_ads_client import GAdsClient, QuotaExhaustedError
+from app.services.metric_rollup_service import upsert_daily_rollups
+from app.services.rate_limit_backend import MAX_RATE_LIMIT_WAIT_SECONDS, RateLimitExceededError
+from app.services.response_cache import bump_data_version
+from app.services.snapshot_compaction_service import compact_snapshots_for_date
+from app.services.snapshot_partition_service import snapshot_pruning_clause
+from app.services.sync_comparison import has_snapshot_changed
 from app.telemetry import capture_exception
 
 logger = logging.getLogger(__name__)
@@ -57,27 +71,218 @@ RETRY_BACKOFF_SECONDS = [30, 60, 120]  # Exponential backoff
 # Parallel sync configuration
 MAX_PARALLEL_SYNCS = 5  # Max concurrent connection syncs
 
+# Snapshot rows written per multi-row INSERT ... ON CONFLICT statement
+SNAPSHOT_UPSERT_BATCH_SIZE = int(os.getenv("SNAPSHOT_UPSERT_BATCH_SIZE", "500"))
+
+# Conflict key of metric_snapshots (uq_metric_snapshots_entity_provider_time)
+SNAPSHOT_KEY_COLUMNS = ("entity_id", "provider", "captured_at")
+
+# Skip snapshots whose values match the latest stored one (hourly heartbeat kept)
+SKIP_UNCHANGED_SNAPSHOTS = os.getenv("SNAPSHOT_SKIP_UNCHANGED", "true").lower() == "true"
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
 class SnapshotSyncResult:
-    """Result of a snapshot sync operation."""
+    """Result of a snapshot sync operation.
+
+    `batches` holds one entry per upsert statement:
+    {"level": "ad", "rows": 500, "inserted": 12, "updated": 488}
+
+    `unchanged` counts rows not written because they matched the latest
+    stored snapshot (see _SnapshotBatchWriter).
+
+    `retry_after` is set (seconds) when the account's rate limit budget ran
+    out; the connection is deferred and the caller should retry after it.
+    """
 
     def __init__(self):
         self.inserted = 0
         self.updated = 0
         self.skipped = 0
+        self.unchanged = 0
         self.errors: List[str] = []
+        self.batches: List[Dict[str, Any]] = []
         self.synced_at: Optional[datetime] = None
+        self.retry_after: Optional[float] = None
 
     @property
     def success(self) -> bool:
         return len(self.errors) == 0
 
     def __repr__(self):
-        return f"SnapshotSyncResult(inserted={self.inserted}, updated={self.updated}, skipped={self.skipped}, errors={len(self.errors)})"
+        return f"SnapshotSyncResult(inserted={self.inserted}, updated={self.updated}, skipped={self.skipped}, unchanged={self.unchanged}, batches={len(self.batches)}, errors={len(self.errors)})"
+
+
+class _SnapshotBatchWriter:
+    """Buffers snapshot rows and upserts them in multi-row batches.
+
+    WHAT:
+        add() collects parsed rows; every `batch_size` rows (and on flush())
+        they are written with one INSERT ... ON CONFLICT statement, followed
+        by one statement for their daily rollups.
+
+    WHY:
+        One statement per insight row meant ~3,000 round trips per sync for a
+        3,000-ad account. Batches cut that to a handful.
+
+    NOTES:
+        - RETURNING (xmax = 0) tells inserted rows from updated ones
+        - Rows repeating a conflict key within a batch are collapsed (last
+          wins): Postgres rejects updating the same row twice in a statement
+        - Runs in the caller's transaction; the sync still commits once
+        - With `latest` (from _load_latest_snapshots) a row is dropped when
+          it matches the latest stored snapshot of its entity and
+          metrics_date and falls in the same hour (one heartbeat per hour)
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        result: SnapshotSyncResult,
+        workspace_id: UUID,
+        level: str,
+        batch_size: Optional[int] = None,
+        latest: Optional[Dict[Tuple[Any, Any], Dict[str, Any]]] = None,
+    ):
+        self.db = db
+        self.result = result
+        self.workspace_id = workspace_id
+        self.level = level
+        self.batch_size = batch_size or SNAPSHOT_UPSERT_BATCH_SIZE
+        self.latest = latest
+        self._pending: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+    def add(self, snapshot_data: Dict[str, Any]) -> None:
+        if self.latest is not None and self._is_unchanged(snapshot_data):
+            self.result.unchanged += 1
+            return
+
+        key = tuple(snapshot_data[col] for col in SNAPSHOT_KEY_COLUMNS)
+        self._pending[key] = snapshot_data
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def _is_unchanged(self, snapshot_data: Dict[str, Any]) -> bool:
+        if snapshot_data.get("metrics_date") is None:
+            return False
+
+        key = (snapshot_data["entity_id"], snapshot_data["metrics_date"])
+        existing = self.latest.get(key)
+        if (
+            existing is not None
+            and _hour_bucket(existing["captured_at"]) == _hour_bucket(snapshot_data["captured_at"])
+            and not has_snapshot_changed(existing, snapshot_data)
+        ):
+            return True
+
+        if existing is None or _as_utc(existing["captured_at"]) <= _as_utc(snapshot_data["captured_at"]):
+            self.latest[key] = snapshot_data
+        return False
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+
+        rows = list(self._pending.values())
+        self._pending = {}
+
+        stmt = insert(MetricSnapshot).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_metric_snapshots_entity_provider_time",
+            set_={
+                col: getattr(stmt.excluded, col)
+                for col in rows[0] if col not in SNAPSHOT_KEY_COLUMNS
+            },
+        ).returning(literal_column("(xmax = 0)").label("inserted"))
+
+        inserted = sum(1 for was_inserted in self.db.execute(stmt).scalars() if was_inserted)
+
+        # Keep the daily rollups (latest snapshot per entity per day) in step
+        upsert_daily_rollups(self.db, rows, self.workspace_id)
+
+        self.result.inserted += inserted
+        self.result.updated += len(rows) - inserted
+        self.result.batches.append({
+            "level": self.level,
+            "rows": len(rows),
+            "inserted": inserted,
+            "updated": len(rows) - inserted,
+        })
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Naive datetimes (SQLite, tests) are treated as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _hour_bucket(value: datetime) -> datetime:
+    return _as_utc(value).replace(minute=0, second=0, microsecond=0)
+
+
+def _load_latest_snapshots(
+    db: Session,
+    connection_id: UUID,
+    provider: str,
+    start_date: date,
+    end_date: date,
+) -> Optional[Dict[Tuple[Any, Any], Dict[str, Any]]]:
+    """Latest stored snapshot per (entity_id, metrics_date) for a connection.
+
+    WHAT:
+        One query per sync (ROW_NUMBER over entity/day, newest captured_at
+        first), restricted to the sync's date range and its partitions.
+
+    WHY:
+        Lets _SnapshotBatchWriter drop rows that would repeat the latest
+        values without a lookup per row.
+
+    Returns:
+        {(entity_id, metrics_date): {captured_at, spend, ...}}, or None when
+        SNAPSHOT_SKIP_UNCHANGED is off (every row is written)
+    """
+    if not SKIP_UNCHANGED_SNAPSHOTS:
+        return None
+
+    ranked = (
+        db.query(
+            MetricSnapshot.entity_id,
+            MetricSnapshot.metrics_date,
+            MetricSnapshot.captured_at,
+            MetricSnapshot.spend,
+            MetricSnapshot.impressions,
+            MetricSnapshot.clicks,
+            MetricSnapshot.conversions,
+            MetricSnapshot.revenue,
+            MetricSnapshot.leads,
+            MetricSnapshot.purchases,
+            MetricSnapshot.currency,
+            func.row_number().over(
+                partition_by=(MetricSnapshot.entity_id, MetricSnapshot.metrics_date),
+                order_by=MetricSnapshot.captured_at.desc(),
+            ).label("rn"),
+        )
+        .join(Entity, Entity.id == MetricSnapshot.entity_id)
+        .filter(
+            Entity.connection_id == connection_id,
+            MetricSnapshot.provider == provider,
+            MetricSnapshot.metrics_date.between(start_date, end_date),
+            snapshot_pruning_clause(MetricSnapshot.captured_at, start_date, end_date),
+        )
+        .subquery()
+    )
+
+    rows = db.query(ranked).filter(ranked.c.rn == 1).all()
+    return {
+        (row.entity_id, row.metrics_date): {
+            key: value for key, value in row._mapping.items() if key != "rn"
+        }
+        for row in rows
+    }
 
 
 # =============================================================================
@@ -191,6 +396,7 @@ def sync_snapshots_for_connection(
     )
 
     # STEP 1: Sync entity hierarchy and status
+    entities_synced = False
     if sync_entities:
         should_sync_entities, entity_sync_mode = _resolve_entity_sync_strategy(mode)
         try:
@@ -200,12 +406,17 @@ def sync_snapshots_for_connection(
                     connection,
                     entity_sync_mode=entity_sync_mode,
                 )
+                entities_synced = True
             else:
                 logger.debug(
                     "[SNAPSHOT_SYNC] Skipping entity sync for connection %s in %s mode (15-min slot without 30-min entity run)",
                     connection_id,
                     mode,
                 )
+        except RateLimitExceededError as e:
+            # The metrics sync would draw from the same exhausted budget
+            _defer_rate_limited_connection(db, connection, e, result)
+            return result
         except Exception as e:
             logger.warning("[SNAPSHOT_SYNC] Entity sync failed, continuing with metrics: %s", e)
             capture_exception(e, extra={
@@ -258,6 +469,10 @@ def sync_snapshots_for_connection(
             )
 
         db.commit()
+
+        # Invalidate cached dashboard/KPI responses of the workspace
+        if result.inserted > 0 or result.updated > 0 or entities_synced:
+            bump_data_version(connection.workspace_id)
     else:
         connection.last_sync_attempted_at = datetime.now(timezone.utc)
         connection.total_syncs_attempted = (connection.total_syncs_attempted or 0) + 1
@@ -451,6 +666,32 @@ def _update_workspace_sync_timestamps(db: Session, connections: List[Connection]
     db.commit()
 
 
+def _defer_rate_limited_connection(
+    db: Session,
+    connection: Connection,
+    error: RateLimitExceededError,
+    result: SnapshotSyncResult,
+) -> None:
+    """Skip a connection whose Meta budget is used up until a slot frees up.
+
+    WHY:
+        The budget is shared by every worker, so holding this worker in a
+        long sleep helps no one. The dispatcher skips the connection until
+        rate_limited_until; ARQ jobs reschedule after result.retry_after.
+    """
+    db.rollback()
+    logger.warning(
+        "[SNAPSHOT_SYNC] Meta rate limit reached for connection %s, deferring %ds",
+        connection.id, error.retry_seconds
+    )
+    connection.rate_limited_until = datetime.now(timezone.utc) + timedelta(seconds=error.retry_seconds)
+    connection.sync_status = "rate_limited"
+    connection.last_sync_error = f"Rate limited. Cooldown until {connection.rate_limited_until.isoformat()}"
+    db.commit()
+    result.errors.append(str(error))
+    result.retry_after = error.retry_seconds
+
+
 # =============================================================================
 # META SYNC - ACCOUNT LEVEL (BATCHED)
 # =============================================================================
@@ -487,7 +728,12 @@ def _sync_meta_snapshots(
     try:
         # Get access token
         access_token = _get_meta_access_token(connection)
-        client = MetaAdsClient(access_token=access_token)
+        # Charge the account's shared budget; defer long waits to a later sync
+        client = MetaAdsClient(
+            access_token=access_token,
+            account_id=connection.external_account_id,
+            max_rate_limit_wait=MAX_RATE_LIMIT_WAIT_SECONDS,
+        )
 
         # Determine date range based on mode, using account's timezone
         # CRITICAL: Meta reports data in the account's configured timezone.
@@ -520,6 +766,9 @@ def _sync_meta_snapshots(
             microsecond=0
         )
 
+        # Latest stored values per entity/day, to skip unchanged rows
+        latest = _load_latest_snapshots(db, connection.id, "meta", start_date, end_date)
+
         # ===================================================================
         # PART 0: Sync campaign-level metrics (SOURCE OF TRUTH for KPI totals)
         # ===================================================================
@@ -546,6 +795,7 @@ def _sync_meta_snapshots(
                 end_date=end_date
             )
 
+            writer = _SnapshotBatchWriter(db, result, connection.workspace_id, level="campaign", latest=latest)
             for insight in campaign_insights:
                 campaign_id = insight.get("campaign_id")
                 if not campaign_id:
@@ -569,18 +819,13 @@ def _sync_meta_snapshots(
                     account_today=today,
                 )
 
-                snapshot_result = _upsert_meta_snapshot(
-                    db=db,
+                writer.add(_build_meta_snapshot(
                     entity=entity,
                     insight=insight,
                     captured_at=snap_time
-                )
-
-                if snapshot_result == "inserted":
-                    result.inserted += 1
-                else:
-                    result.updated += 1
+                ))
 
+            writer.flush()
             logger.info(
                 "[SNAPSHOT_SYNC] Meta campaign-level sync: %d entities processed",
                 result.inserted + result.updated
@@ -618,7 +863,8 @@ def _sync_meta_snapshots(
             logger.info("[SNAPSHOT_SYNC] No insights returned for account %s", ad_account_id)
             return result
 
-        # Process each insight (one per ad per day)
+        # Process each insight (one per ad per day), written in batches
+        writer = _SnapshotBatchWriter(db, result, connection.workspace_id, level="ad", latest=latest)
         for insight in insights:
             ad_id = insight.get("ad_id")
             if not ad_id:
@@ -642,26 +888,24 @@ def _sync_meta_snapshots(
                 account_today=today,
             )
 
-            snapshot_result = _upsert_meta_snapshot(
-                db=db,
+            writer.add(_build_meta_snapshot(
                 entity=entity,
                 insight=insight,
                 captured_at=snap_time
-            )
-
-            if snapshot_result == "inserted":
-                result.inserted += 1
-            else:
-                result.updated += 1
+            ))
 
+        writer.flush()
         db.commit()
         result.synced_at = datetime.now(timezone.utc)
 
         logger.info(
-            "[SNAPSHOT_SYNC] Meta sync complete: inserted=%d, updated=%d, skipped=%d",
-            result.inserted, result.updated, result.skipped
+            "[SNAPSHOT_SYNC] Meta sync complete: inserted=%d, updated=%d, unchanged=%d, skipped=%d",
+            result.inserted, result.updated, result.unchanged, result.skipped
         )
 
+    except RateLimitExceededError as e:
+        _defer_rate_limited_connection(db, connection, e, result)
+
     except Exception as e:
         logger.error("[SNAPSHOT_SYNC] Meta sync failed: %s", e)
         capture_exception(e, extra={
@@ -879,16 +1123,15 @@ def _parse_meta_actions(insight: Dict[str, Any]) -> Dict[str, Any]:
     return {"purchases": purchases, "revenue": revenue, "leads": leads}
 
 
-def _upsert_meta_snapshot(
-    db: Session,
+def _build_meta_snapshot(
     entity: Entity,
     insight: Dict[str, Any],
     captured_at: datetime
-) -> str:
-    """Upsert a single Meta snapshot.
+) -> Dict[str, Any]:
+    """Build the metric_snapshots row for one Meta insight.
 
     Returns:
-        "inserted" or "updated"
+        Column values for _SnapshotBatchWriter.add()
     """
     # Parse actions using shared logic (deduplication + fallback)
     parsed = _parse_meta_actions(insight)
@@ -923,25 +1166,7 @@ def _upsert_meta_snapshot(
         "currency": insight.get("account_currency", "USD"),
     }
 
-    # Use PostgreSQL UPSERT (INSERT ... ON CONFLICT)
-    stmt = insert(MetricSnapshot).values(**snapshot_data)
-    stmt = stmt.on_conflict_do_update(
-        constraint="uq_metric_snapshots_entity_provider_time",
-        set_={
-            "spend": stmt.excluded.spend,
-            "impressions": stmt.excluded.impressions,
-            "clicks": stmt.excluded.clicks,
-            "conversions": stmt.excluded.conversions,
-            "revenue": stmt.excluded.revenue,
-            "leads": stmt.excluded.leads,
-            "purchases": stmt.excluded.purchases,
-            "currency": stmt.excluded.currency,
-            "metrics_date": stmt.excluded.metrics_date,
-        }
-    )
-
-    db.execute(stmt)
-    return "updated"
+    return snapshot_data
 
 
 # =============================================================================
@@ -1007,6 +1232,9 @@ def _sync_google_snapshots(
             microsecond=0
         )
 
+        # Latest stored values per entity/day, to skip unchanged rows
+        latest = _load_latest_snapshots(db, connection.id, "google", start_date, end_date)
+
         # ===================================================================
         # PART 0: Sync campaign-level metrics (SOURCE OF TRUTH for KPI totals)
         # ===================================================================
@@ -1029,6 +1257,7 @@ def _sync_google_snapshots(
 
             rows = _fetch_google_metrics_with_retry(client, customer_id, start_date, end_date, level="campaign")
 
+            writer = _SnapshotBatchWriter(db, result, connection.workspace_id, level="campaign", latest=latest)
             for row in rows:
                 try:
                     raw = row.get("_raw")
@@ -1054,19 +1283,19 @@ def _sync_google_snapshots(
                         account_today=today,
                     )
 
-                    _upsert_google_snapshot(
-                        db=db,
+                    writer.add(_build_google_snapshot(
                         entity=entity,
                         row=row,
                         captured_at=snap_time,
                         currency=connection.currency_code or "USD"
-                    )
-                    result.updated += 1
+                    ))
 
                 except Exception as e:
                     logger.error("[SNAPSHOT_SYNC] Error processing campaign row: %s", e)
                     result.errors.append(str(e))
 
+            writer.flush()
+
         # ===================================================================
         # PART 1: Sync ad-level metrics (for drill-down into traditional campaigns)
         # ===================================================================
@@ -1084,6 +1313,7 @@ def _sync_google_snapshots(
 
             rows = _fetch_google_metrics_with_retry(client, customer_id, start_date, end_date, level="ad")
 
+            writer = _SnapshotBatchWriter(db, result, connection.workspace_id, level="ad", latest=latest)
             for row in rows:
                 try:
                     raw = row.get("_raw")
@@ -1109,19 +1339,19 @@ def _sync_google_snapshots(
                         account_today=today,
                     )
 
-                    _upsert_google_snapshot(
-                        db=db,
+                    writer.add(_build_google_snapshot(
                         entity=entity,
                         row=row,
                         captured_at=snap_time,
                         currency=connection.currency_code or "USD"
-                    )
-                    result.updated += 1
+                    ))
 
                 except Exception as e:
                     logger.error("[SNAPSHOT_SYNC] Error processing ad row: %s", e)
                     result.errors.append(str(e))
 
+            writer.flush()
+
         # ===================================================================
         # PART 2: Sync asset_group-level metrics (for drill-down into PMax campaigns)
         # ===================================================================
@@ -1139,6 +1369,7 @@ def _sync_google_snapshots(
 
             rows = _fetch_google_metrics_with_retry(client, customer_id, start_date, end_date, level="asset_group")
 
+            writer = _SnapshotBatchWriter(db, result, connection.workspace_id, level="asset_group", latest=latest)
             for row in rows:
                 try:
                     raw = row.get("_raw")
@@ -1164,19 +1395,19 @@ def _sync_google_snapshots(
                         account_today=today,
                     )
 
-                    _upsert_google_snapshot(
-                        db=db,
+                    writer.add(_build_google_snapshot(
                         entity=entity,
                         row=row,
                         captured_at=snap_time,
                         currency=connection.currency_code or "USD"
-                    )
-                    result.updated += 1
+                    ))
 
                 except Exception as e:
                     logger.error("[SNAPSHOT_SYNC] Error processing asset_group row: %s", e)
                     result.errors.append(str(e))
 
+            writer.flush()
+
         if not campaign_map and not ad_entity_map and not asset_group_map:
             logger.warning("[SNAPSHOT_SYNC] No campaign, ad, or asset_group entities for Google connection %s", connection.id)
 
@@ -1184,8 +1415,8 @@ def _sync_google_snapshots(
         result.synced_at = datetime.now(timezone.utc)
 
         logger.info(
-            "[SNAPSHOT_SYNC] Google sync complete: inserted=%d, updated=%d, skipped=%d",
-            result.inserted, result.updated, result.skipped
+            "[SNAPSHOT_SYNC] Google sync complete: inserted=%d, updated=%d, unchanged=%d, skipped=%d",
+            result.inserted, result.updated, result.unchanged, result.skipped
         )
 
     except QuotaExhaustedError as e:
@@ -1259,17 +1490,15 @@ def _fetch_google_metrics_with_retry(
     return []
 
 
-def _upsert_google_snapshot(
-    db: Session,
+def _build_google_snapshot(
     entity: Entity,
     row: Dict[str, Any],
     captured_at: datetime,
     currency: str = "USD"
-) -> str:
-    """Upsert a single Google snapshot.
+) -> Dict[str, Any]:
+    """Build the metric_snapshots row for one Google metrics row.
 
     Args:
-        db: Database session
         entity: The entity to attach the snapshot to
         row: Metric data from Google Ads API
         captured_at: Timestamp for the snapshot
@@ -1299,34 +1528,20 @@ def _upsert_google_snapshot(
         "currency": currency,
     }
 
-    stmt = insert(MetricSnapshot).values(**snapshot_data)
-    stmt = stmt.on_conflict_do_update(
-        constraint="uq_metric_snapshots_entity_provider_time",
-        set_={
-            "spend": stmt.excluded.spend,
-            "impressions": stmt.excluded.impressions,
-            "clicks": stmt.excluded.clicks,
-            "conversions": stmt.excluded.conversions,
-            "revenue": stmt.excluded.revenue,
-            "currency": stmt.excluded.currency,
-            "metrics_date": stmt.excluded.metrics_date,
-        }
-    )
-
-    db.execute(stmt)
-    return "updated"
+    return snapshot_data
 
 
 # =============================================================================
-# COMPACTION (ATOMIC)
+# COMPACTION
 # =============================================================================
 
 def compact_snapshots_to_hourly(db: Session, target_date: date) -> int:
     """Compact 15-min snapshots to hourly for a specific date.
 
     WHAT:
-        Aggregates 15-min snapshots into hourly buckets and removes the
-        original 15-min rows in a SINGLE ATOMIC transaction.
+        Thin wrapper around snapshot_compaction_service, which compacts the
+        day in bounded per-workspace batches (one transaction each) and
+        keeps metrics_date on the hourly rows.
 
     WHY:
         - Storage efficiency: 24 rows/day instead of 96 rows/day
@@ -1340,94 +1555,9 @@ def compact_snapshots_to_hourly(db: Session, target_date: date) -> int:
         target_date: Date to compact
 
     Returns:
-        Number of hourly snapshots created
+        Number of hourly snapshots written
     """
-    logger.info("[COMPACTION] Starting compaction for date %s", target_date)
-
-    # Start and end of target date
-    start_dt = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-    end_dt = datetime.combine(target_date + timedelta(days=1), datetime.min.time()).replace(tzinfo=timezone.utc)
-
-    # ATOMIC: Use a single CTE-based operation to avoid race conditions
-    # This creates hourly aggregates and deletes 15-min rows in one statement
-    compact_sql = text("""
-        WITH hourly_aggregates AS (
-            SELECT
-                entity_id,
-                provider,
-                date_trunc('hour', captured_at) as hour_bucket,
-                MAX(spend) as spend,
-                MAX(impressions) as impressions,
-                MAX(clicks) as clicks,
-                MAX(conversions) as conversions,
-                MAX(revenue) as revenue,
-                MAX(leads) as leads,
-                MAX(purchases) as purchases,
-                MAX(installs) as installs,
-                MAX(visitors) as visitors,
-                MAX(profit) as profit,
-                MAX(currency) as currency
-            FROM metric_snapshots
-            WHERE captured_at >= :start_dt
-              AND captured_at < :end_dt
-              AND captured_at != date_trunc('hour', captured_at)
-            GROUP BY entity_id, provider, date_trunc('hour', captured_at)
-        ),
-        inserted AS (
-            INSERT INTO metric_snapshots (
-                id, entity_id, provider, captured_at,
-                spend, impressions, clicks, conversions, revenue,
-                leads, purchases, installs, visitors, profit, currency, created_at
-            )
-            SELECT
-                gen_random_uuid(),
-                entity_id,
-                provider,
-                hour_bucket,
-                spend, impressions, clicks, conversions, revenue,
-                leads, purchases, installs, visitors, profit, currency,
-                NOW()
-            FROM hourly_aggregates
-            ON CONFLICT (entity_id, provider, captured_at)
-            DO UPDATE SET
-                spend = EXCLUDED.spend,
-                impressions = EXCLUDED.impressions,
-                clicks = EXCLUDED.clicks,
-                conversions = EXCLUDED.conversions,
-                revenue = EXCLUDED.revenue,
-                leads = EXCLUDED.leads,
-                purchases = EXCLUDED.purchases,
-                installs = EXCLUDED.installs,
-                visitors = EXCLUDED.visitors,
-                profit = EXCLUDED.profit
-            RETURNING 1
-        ),
-        deleted AS (
-            DELETE FROM metric_snapshots
-            WHERE captured_at >= :start_dt
-              AND captured_at < :end_dt
-              AND captured_at != date_trunc('hour', captured_at)
-            RETURNING 1
-        )
-        SELECT
-            (SELECT COUNT(*) FROM inserted) as inserted_count,
-            (SELECT COUNT(*) FROM deleted) as deleted_count
-    """)
-
-    result = db.execute(compact_sql, {"start_dt": start_dt, "end_dt": end_dt})
-    row = result.fetchone()
-
-    hourly_count = row[0] if row else 0
-    deleted_count = row[1] if row else 0
-
-    db.commit()
-
-    logger.info(
-        "[COMPACTION] Compacted date %s: created %d hourly, deleted %d 15-min rows",
-        target_date, hourly_count, deleted_count
-    )
-
-    return hourly_count
+    return compact_snapshots_for_date(db, target_date).rows_out
 
 
 # =============================================================================
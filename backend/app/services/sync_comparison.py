@@ -10,12 +10,13 @@ WHY:
 
 REFERENCES:
     - docs/living-docs/REALTIME_SYNC_STATUS.md
+    - app/services/snapshot_sync_service.py (skip unchanged 15-min snapshots)
 """
 
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
-from typing import Iterable
+from typing import Any, Iterable, Mapping
 
 from app.models import MetricFact
 from app.schemas import MetricFactCreate
@@ -70,3 +71,23 @@ def has_metrics_changed(existing: MetricFact, new_fact: MetricFactCreate) -> boo
     return False
 
 
+def has_snapshot_changed(existing: Mapping[str, Any], new_snapshot: Mapping[str, Any]) -> bool:
+    """Return True if any metric field of a snapshot row has changed.
+
+    Same comparison as has_metrics_changed, for the plain dicts the snapshot
+    sync builds. Only fields present in `new_snapshot` are compared, so a
+    provider that doesn't report e.g. installs never counts as changed.
+    """
+    for field in DECIMAL_FIELDS:
+        if field in new_snapshot and _to_decimal(existing.get(field)) != _to_decimal(new_snapshot[field]):
+            return True
+
+    for field in INT_FIELDS:
+        if field in new_snapshot and _to_int(existing.get(field)) != _to_int(new_snapshot[field]):
+            return True
+
+    for field in OTHER_FIELDS:
+        if field in new_snapshot and existing.get(field) != new_snapshot[field]:
+            return True
+
+    return False
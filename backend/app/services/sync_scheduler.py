@@ -89,6 +89,7 @@ from app.workers.arq_worker import (
     scheduled_realtime_sync,
     scheduled_attribution_sync,
     scheduled_compaction,
+    scheduled_snapshot_partitions,
     scheduled_agent_evaluation,   # lightweight: just enqueues worker_agent_evaluation
     scheduled_agent_check,        # lightweight: just enqueues worker_agent_check
 )
@@ -111,6 +112,7 @@ async def scheduler_startup(ctx: Dict) -> None:
     logger.info("[SCHEDULER]   - Realtime sync: every 15 min (:00, :15, :30, :45) -> enqueued to worker")
     logger.info("[SCHEDULER]   - Agent evaluation: every 15 min (:05, :20, :35, :50) -> enqueued to worker")
     logger.info("[SCHEDULER]   - Scheduled agent check: every minute -> enqueued to worker")
+    logger.info("[SCHEDULER]   - Snapshot partitions: daily at 00:30 UTC")
     logger.info("[SCHEDULER]   - Compaction: daily at 01:00 UTC")
     logger.info("[SCHEDULER]   - Attribution: daily at 03:00 UTC")
     logger.info("=" * 60)
@@ -155,6 +157,7 @@ class SchedulerSettings:
         scheduled_realtime_sync,
         scheduled_attribution_sync,
         scheduled_compaction,
+        scheduled_snapshot_partitions,
         scheduled_agent_evaluation,
         scheduled_agent_check,
     ]
@@ -164,6 +167,9 @@ class SchedulerSettings:
         # Every 15 minutes: realtime sync for today's data
         cron(scheduled_realtime_sync, minute={0, 15, 30, 45}, run_at_startup=False),
 
+        # Daily at 00:30 UTC: create upcoming monthly snapshot partitions
+        cron(scheduled_snapshot_partitions, hour=0, minute=30, run_at_startup=True),
+
         # Daily at 01:00 UTC: compact 2-day-old snapshots to hourly
         cron(scheduled_compaction, hour=1, minute=0, run_at_startup=False),
 
@@ -37,19 +37,44 @@ from __future__ import annotations
 
 from datetime import date, datetime, timedelta
 from typing import Optional, List, Dict, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 import logging
+import os
 
 from sqlalchemy.orm import Session, aliased
-from sqlalchemy import func, cast, Date, desc, asc, and_
+from sqlalchemy import func, cast, Date, desc, asc, and_, true
 
 from app import models
 from app.metrics.registry import compute_metric, get_required_bases, is_base_measure
 from app.dsl.schema import TimeRange
-from app.dsl.hierarchy import campaign_ancestor_cte, adset_ancestor_cte
+from app.dsl.hierarchy import adset_ancestors, descendant_ids as hierarchy_descendant_ids
+from app.services.snapshot_partition_service import snapshot_pruning_clause
 
 logger = logging.getLogger(__name__)
 
+# Serve daily reads from metric_daily_rollups instead of raw snapshots.
+# Enable once the rollup table is backfilled (scripts/rebuild_metric_rollups.py).
+METRIC_ROLLUPS_ENABLED = os.getenv("METRIC_ROLLUPS_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+
+# Base measures summed by every aggregate query (order matches result dicts)
+BASE_MEASURES = (
+    "spend",
+    "revenue",
+    "clicks",
+    "impressions",
+    "conversions",
+    "leads",
+    "installs",
+    "purchases",
+    "visitors",
+    "profit",
+)
+
 
 @dataclass
 class MetricFilters:
@@ -98,6 +123,20 @@ class MetricSummary:
     workspace_avg: Optional[float] = None
 
 
+@dataclass
+class SummaryRequest:
+    """One (metrics, time range, filters) combination for get_summaries_batch.
+
+    Mirrors the arguments of UnifiedMetricService.get_summary.
+    """
+
+    metrics: List[str]
+    time_range: TimeRange
+    filters: MetricFilters = field(default_factory=MetricFilters)
+    compare_to_previous: bool = False
+    include_workspace_avg: bool = True  # workspace_avg for metrics[0], as get_summary
+
+
 @dataclass
 class MetricTimePoint:
     """Single time point in a timeseries."""
@@ -127,6 +166,18 @@ class MetricBreakdownItem:
     media_type: Optional[str] = None  # "image", "video", "carousel", "unknown"
 
 
+@dataclass
+class RankedComparisonItem:
+    """One ranked entity with its value in the current and previous window.
+
+    `previous` is None when the entity has no data in the previous window.
+    """
+
+    current: MetricBreakdownItem
+    previous: Optional[MetricBreakdownItem] = None
+    delta_pct: Optional[float] = None
+
+
 class UnifiedMetricService:
     """
     Unified metric aggregation service.
@@ -137,15 +188,26 @@ class UnifiedMetricService:
     NOTE: As of 2025-12-07, this service queries from metric_snapshots table
     (15-min granularity) instead of metric_facts (daily granularity).
     The snapshot table uses 'captured_at' instead of 'event_date'.
+
+    Daily reads (summaries, daily timeseries, breakdowns) can instead be served
+    from metric_daily_rollups, which already holds the latest snapshot per
+    entity per day (see app/services/metric_rollup_service.py).
     """
 
-    def __init__(self, db: Session, use_snapshots: bool = True):
+    def __init__(
+        self,
+        db: Session,
+        use_snapshots: bool = True,
+        use_rollups: Optional[bool] = None,
+    ):
         """Initialize the service.
 
         Args:
             db: Database session
             use_snapshots: Always True - uses MetricSnapshot table (15-min granularity).
                           MetricFact is deprecated.
+            use_rollups: Serve daily reads from MetricDailyRollup.
+                         None = follow the METRIC_ROLLUPS_ENABLED env flag.
         """
         self.db = db
         self.use_snapshots = use_snapshots
@@ -154,6 +216,12 @@ class UnifiedMetricService:
         self.MF = models.MetricSnapshot
         self.date_field = models.MetricSnapshot.captured_at
 
+        # Pre-aggregated latest snapshot per entity per day
+        self.R = models.MetricDailyRollup
+        self.use_rollups = (
+            METRIC_ROLLUPS_ENABLED if use_rollups is None else use_rollups
+        )
+
         self.E = models.Entity
 
     def get_summary(
@@ -219,6 +287,230 @@ class UnifiedMetricService:
             logger.info(f"[UNIFIED_METRICS] Previous period totals: {previous_totals}")
 
         # Calculate all requested metrics
+        metric_results = self._compute_metric_values(
+            metrics, current_totals, previous_totals
+        )
+
+        # Calculate workspace average for primary metric
+        workspace_avg = None
+        if metrics:
+            workspace_avg = self.get_workspace_average(
+                workspace_id, metrics[0], time_range
+            )
+
+        logger.info(f"[UNIFIED_METRICS] Calculated metrics: {metric_results}")
+        logger.info(f"[UNIFIED_METRICS] Workspace average: {workspace_avg}")
+
+        return MetricSummary(metrics=metric_results, workspace_avg=workspace_avg)
+
+    def get_summaries_batch(
+        self,
+        workspace_id: str,
+        requests: List[SummaryRequest],
+    ) -> List[MetricSummary]:
+        """
+        Get summaries for many (time range, filters) combinations in one round trip.
+
+        WHAT:
+            Equivalent to calling get_summary once per request, but every period
+            (current, previous) of every request becomes a set of
+            SUM(...) FILTER (WHERE metrics_date BETWEEN ... AND <filters>) columns
+            over a single latest-snapshot-per-day scan. Workspace averages are
+            computed the same way over raw snapshots and cross-joined in, so the
+            whole batch is one SQL statement.
+
+        WHY:
+            get_summary costs 2-3 queries (current, previous, workspace average).
+            A dashboard with several KPIs and comparison windows multiplied that
+            into a dozen round trips over the same rows.
+
+        Args:
+            workspace_id: Workspace UUID for scoping
+            requests: Summary requests (metrics, time range, filters, comparison)
+
+        Returns:
+            One MetricSummary per request, in request order
+
+        Example:
+            >>> current, last_month = service.get_summaries_batch(
+            ...     workspace_id="...",
+            ...     requests=[
+            ...         SummaryRequest(["roas", "spend"], TimeRange(last_n_days=7),
+            ...                        compare_to_previous=True),
+            ...         SummaryRequest(["roas"], TimeRange(last_n_days=30)),
+            ...     ],
+            ... )
+            >>> current.metrics["roas"].delta_pct
+            0.12
+        """
+        if not requests:
+            return []
+
+        src = self._daily_source()
+
+        # Period windows: (start, end, predicates). Identical windows are shared,
+        # e.g. several KPIs requested separately for the same range and filters.
+        windows: List[tuple] = []
+        window_index: Dict[tuple, int] = {}
+        clause_cache: Dict[str, List[Any]] = {}
+        levels = set()
+
+        # Workspace-average windows: (start, end) -> base measures needed
+        avg_windows: Dict[tuple, set] = {}
+
+        plans = []
+        for req in requests:
+            start_date, end_date = self._resolve_time_range(req.time_range)
+            level = req.filters.level if req.filters.level else "campaign"
+            levels.add(level)
+
+            filters_key = f"{level}|{req.filters!r}"
+            if filters_key not in clause_cache:
+                clause_cache[filters_key] = [self.E.level == level] + self._filter_clauses(
+                    req.filters, workspace_id, src=src
+                )
+
+            periods = [(start_date, end_date)]
+            if req.compare_to_previous:
+                periods.append(self._get_previous_period(start_date, end_date))
+
+            period_windows = []
+            for period_start, period_end in periods:
+                key = (period_start, period_end, filters_key)
+                if key not in window_index:
+                    window_index[key] = len(windows)
+                    windows.append((period_start, period_end, clause_cache[filters_key]))
+                period_windows.append(window_index[key])
+
+            avg_metric = None
+            if req.include_workspace_avg and req.metrics:
+                avg_metric = req.metrics[0]
+                dependencies = get_required_bases(avg_metric)
+                if dependencies:
+                    avg_windows.setdefault((start_date, end_date), set()).update(
+                        dependencies
+                    )
+                else:
+                    logger.warning(f"[UNIFIED_METRICS] Unknown metric: {avg_metric}")
+
+            plans.append((req, period_windows, (start_date, end_date), avg_metric))
+
+        logger.info(
+            f"[UNIFIED_METRICS] Batched summary: {len(requests)} requests, "
+            f"{len(windows)} period windows, {len(avg_windows)} average windows"
+        )
+
+        # Latest-snapshot-per-day totals, one FILTER column per window x measure
+        totals_cols = []
+        for w, (period_start, period_end, clauses) in enumerate(windows):
+            condition = and_(
+                src.metrics_date.between(period_start, period_end), *clauses
+            )
+            for measure in BASE_MEASURES:
+                totals_cols.append(
+                    func.coalesce(
+                        func.sum(getattr(src, measure)).filter(condition), 0
+                    ).label(f"w{w}_{measure}")
+                )
+
+        span_start = min(window[0] for window in windows)
+        span_end = max(window[1] for window in windows)
+        totals_query = self.db.query(*totals_cols).join(
+            self.E, self.E.id == src.entity_id
+        )
+        totals_query = self._restrict_to_latest_daily(
+            totals_query,
+            src,
+            workspace_id,
+            next(iter(levels)) if len(levels) == 1 else sorted(levels),
+            span_start,
+            span_end,
+        ).filter(self.E.workspace_id == workspace_id)
+        totals_sq = totals_query.subquery("totals")
+
+        # Workspace averages: same semantics as get_workspace_average
+        # (all levels, no filters, raw snapshots)
+        avg_keys = list(avg_windows)
+        if avg_keys:
+            avg_day = cast(self.date_field, Date)
+            avg_cols = [
+                func.coalesce(
+                    func.sum(getattr(self.MF, dep)).filter(
+                        avg_day.between(avg_start, avg_end)
+                    ),
+                    0,
+                ).label(f"a{a}_{dep}")
+                for a, (avg_start, avg_end) in enumerate(avg_keys)
+                for dep in sorted(avg_windows[(avg_start, avg_end)])
+            ]
+            avg_sq = (
+                self.db.query(*avg_cols)
+                .join(self.E, self.E.id == self.MF.entity_id)
+                .filter(self.E.workspace_id == workspace_id)
+                .filter(
+                    avg_day.between(
+                        min(k[0] for k in avg_keys), max(k[1] for k in avg_keys)
+                    )
+                )
+                .filter(
+                    snapshot_pruning_clause(
+                        self.date_field,
+                        min(k[0] for k in avg_keys),
+                        max(k[1] for k in avg_keys),
+                    )
+                )
+                .subquery("workspace_avg")
+            )
+            row = (
+                self.db.query(*totals_sq.c, *avg_sq.c)
+                .select_from(totals_sq)
+                .join(avg_sq, true())
+                .first()
+            )
+        else:
+            row = self.db.query(*totals_sq.c).first()
+
+        values = row._asdict() if row else {}
+
+        def window_totals(w: int) -> Dict[str, Any]:
+            return {m: values.get(f"w{w}_{m}", 0) for m in BASE_MEASURES}
+
+        summaries = []
+        for req, period_windows, avg_range, avg_metric in plans:
+            current_totals = window_totals(period_windows[0])
+            previous_totals = (
+                window_totals(period_windows[1]) if len(period_windows) > 1 else None
+            )
+
+            workspace_avg = None
+            if avg_metric and avg_range in avg_windows:
+                a = avg_keys.index(avg_range)
+                workspace_avg = compute_metric(
+                    avg_metric,
+                    {
+                        dep: values.get(f"a{a}_{dep}") or 0
+                        for dep in get_required_bases(avg_metric)
+                    },
+                )
+
+            summaries.append(
+                MetricSummary(
+                    metrics=self._compute_metric_values(
+                        req.metrics, current_totals, previous_totals
+                    ),
+                    workspace_avg=workspace_avg,
+                )
+            )
+
+        return summaries
+
+    def _compute_metric_values(
+        self,
+        metrics: List[str],
+        current_totals: Dict[str, Any],
+        previous_totals: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, MetricValue]:
+        """Compute requested metrics (and deltas) from base measure totals."""
         metric_results = {}
         for metric_name in metrics:
             current_value = compute_metric(metric_name, current_totals)
@@ -237,18 +529,7 @@ class UnifiedMetricService:
             metric_results[metric_name] = MetricValue(
                 value=current_value, previous=previous_value, delta_pct=delta_pct
             )
-
-        # Calculate workspace average for primary metric
-        workspace_avg = None
-        if metrics:
-            workspace_avg = self.get_workspace_average(
-                workspace_id, metrics[0], time_range
-            )
-
-        logger.info(f"[UNIFIED_METRICS] Calculated metrics: {metric_results}")
-        logger.info(f"[UNIFIED_METRICS] Workspace average: {workspace_avg}")
-
-        return MetricSummary(metrics=metric_results, workspace_avg=workspace_avg)
+        return metric_results
 
     def get_timeseries(
         self,
@@ -291,57 +572,25 @@ class UnifiedMetricService:
         # For daily granularity, use latest-snapshot-per-entity-per-day pattern
         # This is CRITICAL to avoid summing duplicate snapshots from 15-min syncs
         if granularity == "day":
-            # Subquery to get latest snapshot per entity per metrics_date
-            latest_snapshots = (
-                self.db.query(
-                    self.MF.entity_id,
-                    self.MF.metrics_date,
-                    func.max(self.MF.captured_at).label("max_captured_at"),
-                )
-                .join(self.E, self.E.id == self.MF.entity_id)
-                .filter(self.E.workspace_id == workspace_id)
-                .filter(self.E.level == level_filter)
-                .filter(self.MF.metrics_date.between(start_date, end_date))
-                .group_by(self.MF.entity_id, self.MF.metrics_date)
-                .subquery()
-            )
-
             # Main query - sum from latest snapshots only, grouped by date
+            src = self._daily_source()
+            query = self.db.query(
+                src.metrics_date.label("date"), *self._sum_base_measures(src)
+            ).join(self.E, self.E.id == src.entity_id)
             query = (
-                self.db.query(
-                    self.MF.metrics_date.label("date"),
-                    func.coalesce(func.sum(self.MF.spend), 0).label("spend"),
-                    func.coalesce(func.sum(self.MF.revenue), 0).label("revenue"),
-                    func.coalesce(func.sum(self.MF.clicks), 0).label("clicks"),
-                    func.coalesce(func.sum(self.MF.impressions), 0).label(
-                        "impressions"
-                    ),
-                    func.coalesce(func.sum(self.MF.conversions), 0).label(
-                        "conversions"
-                    ),
-                    func.coalesce(func.sum(self.MF.leads), 0).label("leads"),
-                    func.coalesce(func.sum(self.MF.installs), 0).label("installs"),
-                    func.coalesce(func.sum(self.MF.purchases), 0).label("purchases"),
-                    func.coalesce(func.sum(self.MF.visitors), 0).label("visitors"),
-                    func.coalesce(func.sum(self.MF.profit), 0).label("profit"),
-                )
-                .join(self.E, self.E.id == self.MF.entity_id)
-                .join(
-                    latest_snapshots,
-                    and_(
-                        self.MF.entity_id == latest_snapshots.c.entity_id,
-                        self.MF.metrics_date == latest_snapshots.c.metrics_date,
-                        self.MF.captured_at == latest_snapshots.c.max_captured_at,
-                    ),
+                self._restrict_to_latest_daily(
+                    query, src, workspace_id, level_filter, start_date, end_date
                 )
                 .filter(self.E.workspace_id == workspace_id)
-                .group_by(self.MF.metrics_date)
-                .order_by(self.MF.metrics_date)
+                .group_by(src.metrics_date)
+                .order_by(src.metrics_date)
             )
         else:
             # Hourly granularity - use datetime grouping (less common, keep original logic)
             from datetime import datetime as dt, time
 
+            src = self.MF
+
             start_datetime = dt.combine(start_date, time.min)
             end_datetime = dt.combine(end_date, time.max)
 
@@ -372,7 +621,7 @@ class UnifiedMetricService:
             )
 
         # Apply filters
-        query = self._apply_filters(query, filters, workspace_id)
+        query = self._apply_filters(query, filters, workspace_id, src=src)
 
         # Execute query
         rows = query.all()
@@ -436,59 +685,24 @@ class UnifiedMetricService:
                 )
             else:
                 # Use latest-snapshot-per-entity-per-day pattern for previous period too
-                prev_latest_snapshots = (
-                    self.db.query(
-                        self.MF.entity_id,
-                        self.MF.metrics_date,
-                        func.max(self.MF.captured_at).label("max_captured_at"),
-                    )
-                    .join(self.E, self.E.id == self.MF.entity_id)
-                    .filter(self.E.workspace_id == workspace_id)
-                    .filter(self.E.level == level_filter)
-                    .filter(
-                        self.MF.metrics_date.between(prev_start_date, prev_end_date)
-                    )
-                    .group_by(self.MF.entity_id, self.MF.metrics_date)
-                    .subquery()
-                )
-
+                prev_query = self.db.query(
+                    src.metrics_date.label("date"), *self._sum_base_measures(src)
+                ).join(self.E, self.E.id == src.entity_id)
                 prev_query = (
-                    self.db.query(
-                        self.MF.metrics_date.label("date"),
-                        func.coalesce(func.sum(self.MF.spend), 0).label("spend"),
-                        func.coalesce(func.sum(self.MF.revenue), 0).label("revenue"),
-                        func.coalesce(func.sum(self.MF.clicks), 0).label("clicks"),
-                        func.coalesce(func.sum(self.MF.impressions), 0).label(
-                            "impressions"
-                        ),
-                        func.coalesce(func.sum(self.MF.conversions), 0).label(
-                            "conversions"
-                        ),
-                        func.coalesce(func.sum(self.MF.leads), 0).label("leads"),
-                        func.coalesce(func.sum(self.MF.installs), 0).label("installs"),
-                        func.coalesce(func.sum(self.MF.purchases), 0).label(
-                            "purchases"
-                        ),
-                        func.coalesce(func.sum(self.MF.visitors), 0).label("visitors"),
-                        func.coalesce(func.sum(self.MF.profit), 0).label("profit"),
-                    )
-                    .join(self.E, self.E.id == self.MF.entity_id)
-                    .join(
-                        prev_latest_snapshots,
-                        and_(
-                            self.MF.entity_id == prev_latest_snapshots.c.entity_id,
-                            self.MF.metrics_date
-                            == prev_latest_snapshots.c.metrics_date,
-                            self.MF.captured_at
-                            == prev_latest_snapshots.c.max_captured_at,
-                        ),
+                    self._restrict_to_latest_daily(
+                        prev_query,
+                        src,
+                        workspace_id,
+                        level_filter,
+                        prev_start_date,
+                        prev_end_date,
                     )
                     .filter(self.E.workspace_id == workspace_id)
-                    .group_by(self.MF.metrics_date)
-                    .order_by(self.MF.metrics_date)
+                    .group_by(src.metrics_date)
+                    .order_by(src.metrics_date)
                 )
 
-            prev_query = self._apply_filters(prev_query, filters, workspace_id)
+            prev_query = self._apply_filters(prev_query, filters, workspace_id, src=src)
             prev_rows = prev_query.all()
 
             for metric in metrics:
@@ -570,6 +784,7 @@ class UnifiedMetricService:
             .filter(self.E.workspace_id == workspace_id)
             .filter(self.MF.entity_id.in_(entity_ids))
             .filter(cast(self.date_field, Date).between(start_date, end_date))
+            .filter(snapshot_pruning_clause(self.date_field, start_date, end_date))
             .group_by(self.MF.entity_id, time_bucket)
             .order_by(self.MF.entity_id, time_bucket)
         )
@@ -661,6 +876,7 @@ class UnifiedMetricService:
 
         # Special handling: named entity + same-level breakdown → route to child-level
         query = None
+        src = self.MF
         if filters.entity_name and breakdown_dimension in ["campaign", "adset", "ad"]:
             named_entity = self._resolve_entity_by_name(
                 workspace_id, filters.entity_name
@@ -682,6 +898,7 @@ class UnifiedMetricService:
 
         # Regular path
         if query is None:
+            src = self._daily_source()
             if breakdown_dimension == "provider":
                 query = self._build_provider_breakdown_query(
                     workspace_id, start_date, end_date, filters
@@ -697,9 +914,9 @@ class UnifiedMetricService:
 
         # Apply ordering and limit
         if sort_order == "asc":
-            query = query.order_by(asc(self._get_order_expression(metric)))
+            query = query.order_by(asc(self._get_order_expression(metric, src)))
         else:
-            query = query.order_by(desc(self._get_order_expression(metric)))
+            query = query.order_by(desc(self._get_order_expression(metric, src)))
 
         # Execute query to get all results first
         rows = query.all()
@@ -717,37 +934,263 @@ class UnifiedMetricService:
                 ):
                     continue
 
-            # Extract creative fields if available (ad-level only, Meta only)
-            thumbnail_url = totals.get("thumbnail_url")
-            image_url = totals.get("image_url")
-            media_type_val = totals.get("media_type")
-            # Convert enum to string if needed
-            media_type = (
-                media_type_val.value
-                if hasattr(media_type_val, "value")
-                else (str(media_type_val) if media_type_val else None)
+            breakdown.append(self._to_breakdown_item(row.group_name, value, totals))
+
+        # Apply top_n limit after filtering
+        return breakdown[:top_n]
+
+    def get_ranked_comparison(
+        self,
+        workspace_id: str,
+        metric: str,
+        time_range: TimeRange,
+        filters: MetricFilters,
+        breakdown_dimension: str,
+        top_n: int = 5,
+        sort_order: str = "desc",
+        compare_to_previous: bool = True,
+    ) -> List[RankedComparisonItem]:
+        """
+        Rank entities on the current window together with their previous-window values.
+
+        WHAT:
+            Top N entities (campaign/adset/ad) by `metric` over `time_range`,
+            each with its totals for the previous period of equal length. One
+            latest-snapshot-per-day scan covers both windows; every base measure
+            becomes SUM(...) FILTER (WHERE metrics_date BETWEEN ...) per window,
+            and ranking, LIMIT and the previous values come from that single
+            statement.
+
+        WHY:
+            Entity comparisons used to run get_breakdown for the current window
+            and then again for the previous window, filtered to the winners'
+            IDs: two scans of the same rows plus a round trip in between.
+
+        Args:
+            workspace_id: Workspace UUID for scoping
+            metric: Metric name to rank by
+            time_range: Current window
+            filters: Filtering criteria (as get_breakdown)
+            breakdown_dimension: Entity level to group by (campaign, adset, ad)
+            top_n: Number of entities to return
+            sort_order: Sort order ("asc" or "desc")
+            compare_to_previous: Also return previous-window values. Without it
+                this is get_breakdown for entity levels.
+
+        Returns:
+            List of RankedComparisonItem in rank order
+
+        Example:
+            >>> items = service.get_ranked_comparison(
+            ...     workspace_id="...",
+            ...     metric="cpc",
+            ...     time_range=TimeRange(last_n_days=7),
+            ...     filters=MetricFilters(),
+            ...     breakdown_dimension="ad",
+            ...     top_n=3,
+            ... )
+            >>> items[0].current.value, items[0].previous.value
+            (1.5, 1.8)
+        """
+        if breakdown_dimension not in ("campaign", "adset", "ad"):
+            raise ValueError(
+                f"Unsupported ranked comparison dimension: {breakdown_dimension}"
             )
 
-            breakdown.append(
-                MetricBreakdownItem(
-                    label=str(row.group_name),
-                    value=value,
-                    spend=totals.get("spend"),
-                    clicks=totals.get("clicks"),
-                    conversions=totals.get("conversions"),
-                    revenue=totals.get("revenue"),
-                    impressions=totals.get("impressions"),
-                    entity_id=str(totals.get("entity_id"))
-                    if totals.get("entity_id")
+        start_date, end_date = self._resolve_time_range(time_range)
+        prev_start, prev_end = self._get_previous_period(start_date, end_date)
+        logger.info(
+            f"[UNIFIED_METRICS] Ranked comparison for {metric} by {breakdown_dimension}: "
+            f"{start_date}..{end_date} vs {prev_start}..{prev_end}, top {top_n}"
+        )
+
+        # Named entity at the breakdown level is routed to its children by
+        # get_breakdown's hierarchy query; compose that case from breakdowns.
+        if filters.entity_name:
+            named_entity = self._resolve_entity_by_name(
+                workspace_id, filters.entity_name
+            )
+            if named_entity is not None and named_entity.level == breakdown_dimension:
+                return self._ranked_comparison_from_breakdowns(
+                    workspace_id,
+                    metric,
+                    (start_date, end_date),
+                    (prev_start, prev_end),
+                    filters,
+                    breakdown_dimension,
+                    top_n,
+                    sort_order,
+                    compare_to_previous,
+                )
+
+        src = self._daily_source()
+        current = src.metrics_date.between(start_date, end_date)
+        previous = src.metrics_date.between(prev_start, prev_end)
+
+        columns = [
+            self.E.id.label("entity_id"),
+            self.E.name.label("group_name"),
+            *self._sum_base_measures(src, condition=current, prefix="cur_"),
+            self.E.thumbnail_url.label("thumbnail_url"),
+            self.E.image_url.label("image_url"),
+            self.E.media_type.label("media_type"),
+        ]
+        if compare_to_previous:
+            columns += [
+                *self._sum_base_measures(src, condition=previous, prefix="prev_"),
+                func.count(src.entity_id).filter(previous).label("prev_rows"),
+            ]
+
+        query = self.db.query(*columns).join(self.E, self.E.id == src.entity_id)
+        query = (
+            self._restrict_to_latest_daily(
+                query,
+                src,
+                workspace_id,
+                breakdown_dimension,
+                prev_start if compare_to_previous else start_date,
+                end_date,
+            )
+            .filter(self.E.workspace_id == workspace_id)
+            .filter(self.E.level == breakdown_dimension)
+            .group_by(
+                self.E.id,
+                self.E.name,
+                self.E.thumbnail_url,
+                self.E.image_url,
+                self.E.media_type,
+            )
+        )
+        query = self._apply_filters(query, filters, workspace_id, src=src)
+
+        if compare_to_previous:
+            # Only entities with data in the current window are ranked
+            query = query.having(func.count(src.entity_id).filter(current) > 0)
+
+        order_expression = self._get_order_expression(metric, src, condition=current)
+        query = query.order_by(
+            asc(order_expression) if sort_order == "asc" else desc(order_expression)
+        )
+        # Metric filters apply to computed values, so they can't be limited in SQL
+        if not filters.metric_filters:
+            query = query.limit(top_n)
+
+        ranked = []
+        for row in query.all():
+            values = row._asdict()
+            current_totals = {m: values.get(f"cur_{m}", 0) for m in BASE_MEASURES}
+            value = compute_metric(metric, current_totals)
+
+            if filters.metric_filters:
+                if not self._passes_metric_filters(
+                    metric, value, filters.metric_filters
+                ):
+                    continue
+
+            item = RankedComparisonItem(
+                current=self._to_breakdown_item(
+                    row.group_name, value, {**values, **current_totals}
+                )
+            )
+            if compare_to_previous and values.get("prev_rows"):
+                previous_totals = {
+                    m: values.get(f"prev_{m}", 0) for m in BASE_MEASURES
+                }
+                item.previous = self._to_breakdown_item(
+                    row.group_name,
+                    compute_metric(metric, previous_totals),
+                    {**previous_totals, "entity_id": values.get("entity_id")},
+                )
+                item.delta_pct = self._delta_pct(value, item.previous.value)
+            ranked.append(item)
+
+        return ranked[:top_n]
+
+    def _ranked_comparison_from_breakdowns(
+        self,
+        workspace_id: str,
+        metric: str,
+        current_range: tuple[date, date],
+        previous_range: tuple[date, date],
+        filters: MetricFilters,
+        breakdown_dimension: str,
+        top_n: int,
+        sort_order: str,
+        compare_to_previous: bool,
+    ) -> List[RankedComparisonItem]:
+        """get_ranked_comparison via two get_breakdown calls (hierarchy-routed queries)."""
+        current = self.get_breakdown(
+            workspace_id,
+            metric,
+            TimeRange(start=current_range[0], end=current_range[1]),
+            filters,
+            breakdown_dimension,
+            top_n=top_n,
+            sort_order=sort_order,
+        )
+        entity_ids = [item.entity_id for item in current if item.entity_id]
+        previous_by_id = {}
+        if compare_to_previous and entity_ids:
+            previous = self.get_breakdown(
+                workspace_id,
+                metric,
+                TimeRange(start=previous_range[0], end=previous_range[1]),
+                replace(filters, entity_ids=entity_ids, metric_filters=None),
+                breakdown_dimension,
+                top_n=len(entity_ids),
+                sort_order=sort_order,
+            )
+            previous_by_id = {item.entity_id: item for item in previous}
+
+        ranked = []
+        for item in current:
+            prev_item = previous_by_id.get(item.entity_id)
+            ranked.append(
+                RankedComparisonItem(
+                    current=item,
+                    previous=prev_item,
+                    delta_pct=self._delta_pct(item.value, prev_item.value)
+                    if prev_item
                     else None,
-                    thumbnail_url=thumbnail_url,
-                    image_url=image_url,
-                    media_type=media_type,
                 )
             )
+        return ranked
 
-        # Apply top_n limit after filtering
-        return breakdown[:top_n]
+    @staticmethod
+    def _delta_pct(
+        current: Optional[float], previous: Optional[float]
+    ) -> Optional[float]:
+        """Relative change from `previous` to `current` (None when undefined)."""
+        if current is None or previous is None or previous == 0:
+            return None
+        return (current - previous) / previous
+
+    def _to_breakdown_item(
+        self, label: Any, value: Optional[float], totals: Dict[str, Any]
+    ) -> MetricBreakdownItem:
+        """Build a MetricBreakdownItem from an aggregate row's totals."""
+        # Extract creative fields if available (ad-level only, Meta only)
+        media_type_val = totals.get("media_type")
+        # Convert enum to string if needed
+        media_type = (
+            media_type_val.value
+            if hasattr(media_type_val, "value")
+            else (str(media_type_val) if media_type_val else None)
+        )
+
+        return MetricBreakdownItem(
+            label=str(label),
+            value=value,
+            spend=totals.get("spend"),
+            clicks=totals.get("clicks"),
+            conversions=totals.get("conversions"),
+            revenue=totals.get("revenue"),
+            impressions=totals.get("impressions"),
+            entity_id=str(totals.get("entity_id")) if totals.get("entity_id") else None,
+            thumbnail_url=totals.get("thumbnail_url"),
+            image_url=totals.get("image_url"),
+            media_type=media_type,
+        )
 
     def get_workspace_average(
         self, workspace_id: str, metric: str, time_range: TimeRange
@@ -799,6 +1242,7 @@ class UnifiedMetricService:
             .join(self.E, self.E.id == self.MF.entity_id)
             .filter(self.E.workspace_id == workspace_id)
             .filter(cast(self.date_field, Date).between(start_date, end_date))
+            .filter(snapshot_pruning_clause(self.date_field, start_date, end_date))
         )
 
         # Execute query
@@ -852,60 +1296,21 @@ class UnifiedMetricService:
         2. Uses only the LATEST snapshot per entity per day to avoid
            double-counting when multiple snapshots exist (15-min sync creates many).
         """
-        from sqlalchemy import literal_column
-        from sqlalchemy.dialects.postgresql import aggregate_order_by
-
         # Default to campaign-level to avoid double/triple counting across hierarchy levels
         # The same spend appears at campaign, adset, and ad levels - we only want campaign
         level_filter = filters.level if filters.level else "campaign"
 
-        # Subquery to get latest snapshot per entity per metrics_date
-        # This avoids summing duplicate snapshots from 15-min syncs
-        latest_snapshots = (
-            self.db.query(
-                self.MF.entity_id,
-                self.MF.metrics_date,
-                func.max(self.MF.captured_at).label("max_captured_at"),
-            )
-            .join(self.E, self.E.id == self.MF.entity_id)
-            .filter(self.E.workspace_id == workspace_id)
-            .filter(
-                self.E.level == level_filter
-            )  # CRITICAL: Only campaign level by default
-            .filter(self.MF.metrics_date.isnot(None))  # Exclude NULL dates
-            .filter(self.MF.metrics_date.between(start_date, end_date))
-            .group_by(self.MF.entity_id, self.MF.metrics_date)
-            .subquery()
-        )
-
         # Main query - only sum from the latest snapshots
-        query = (
-            self.db.query(
-                func.coalesce(func.sum(self.MF.spend), 0).label("spend"),
-                func.coalesce(func.sum(self.MF.revenue), 0).label("revenue"),
-                func.coalesce(func.sum(self.MF.clicks), 0).label("clicks"),
-                func.coalesce(func.sum(self.MF.impressions), 0).label("impressions"),
-                func.coalesce(func.sum(self.MF.conversions), 0).label("conversions"),
-                func.coalesce(func.sum(self.MF.leads), 0).label("leads"),
-                func.coalesce(func.sum(self.MF.installs), 0).label("installs"),
-                func.coalesce(func.sum(self.MF.purchases), 0).label("purchases"),
-                func.coalesce(func.sum(self.MF.visitors), 0).label("visitors"),
-                func.coalesce(func.sum(self.MF.profit), 0).label("profit"),
-            )
-            .join(self.E, self.E.id == self.MF.entity_id)
-            .join(
-                latest_snapshots,
-                and_(
-                    self.MF.entity_id == latest_snapshots.c.entity_id,
-                    self.MF.metrics_date == latest_snapshots.c.metrics_date,
-                    self.MF.captured_at == latest_snapshots.c.max_captured_at,
-                ),
-            )
-            .filter(self.E.workspace_id == workspace_id)
+        src = self._daily_source()
+        query = self.db.query(*self._sum_base_measures(src)).join(
+            self.E, self.E.id == src.entity_id
         )
+        query = self._restrict_to_latest_daily(
+            query, src, workspace_id, level_filter, start_date, end_date
+        ).filter(self.E.workspace_id == workspace_id)
 
         # Apply filters
-        query = self._apply_filters(query, filters, workspace_id)
+        query = self._apply_filters(query, filters, workspace_id, src=src)
 
         # Execute query
         row = query.first()
@@ -918,7 +1323,7 @@ class UnifiedMetricService:
         self, workspace_id: str, entity_name: str
     ) -> Optional[List[str]]:
         """
-        Resolve entity name to descendant entity IDs using hierarchy CTEs.
+        Resolve entity name to descendant entity IDs using the hierarchy closure table.
 
         When a user queries by entity name (e.g., "Product Launch Teaser campaign"),
         we need to roll up metrics from all descendant entities, NOT include the
@@ -936,7 +1341,7 @@ class UnifiedMetricService:
             ['adset-id-1', 'adset-id-2', 'ad-id-1', 'ad-id-2', ...]
 
         References:
-        - app/dsl/hierarchy.py: campaign_ancestor_cte, adset_ancestor_cte
+        - app/dsl/hierarchy.py: descendant_ids (entity_ancestors closure table)
         """
         logger.info(f"[UNIFIED_METRICS] Resolving entity name: '{entity_name}'")
 
@@ -961,43 +1366,22 @@ class UnifiedMetricService:
             logger.info(f"[UNIFIED_METRICS] Entity is ad level, returning itself only")
             return [str(entity.id)]
 
-        # Use hierarchy CTE to find all descendants
-        if entity.level == "campaign":
-            mapping_cte = campaign_ancestor_cte(self.db)
-            logger.info(f"[UNIFIED_METRICS] Using campaign hierarchy CTE")
-        elif entity.level == "adset":
-            mapping_cte = adset_ancestor_cte(self.db)
-            logger.info(f"[UNIFIED_METRICS] Using adset hierarchy CTE")
-        else:
+        if entity.level not in ("campaign", "adset"):
             logger.warning(f"[UNIFIED_METRICS] Unknown entity level: {entity.level}")
             return [str(entity.id)]
 
-        # Find all leaf entities that roll up to this ancestor
-        descendants = (
-            self.db.query(mapping_cte.c.leaf_id)
-            .filter(mapping_cte.c.ancestor_id == entity.id)
-            .all()
-        )
-
-        descendant_ids = [str(row.leaf_id) for row in descendants]
+        # Find all entities below this one via the entity_ancestors closure table
+        # CRITICAL: Exclude the parent entity itself (depth 0) - we only want
+        # facts from children, not the parent's own fact
+        descendant_ids = hierarchy_descendant_ids(self.db, entity.id)
         logger.info(
             f"[UNIFIED_METRICS] Found {len(descendant_ids)} descendants for {entity.name}"
         )
-
-        # CRITICAL: Exclude the parent entity itself from descendants
-        # We only want facts from children, not the parent's own fact
-        if str(entity.id) in descendant_ids:
-            descendant_ids.remove(str(entity.id))
-            logger.info(
-                f"[UNIFIED_METRICS] Excluded parent entity {entity.id} from descendants"
-            )
-
-        logger.info(
-            f"[UNIFIED_METRICS] Returning {len(descendant_ids)} descendant IDs for rollup"
-        )
         return descendant_ids
 
-    def _apply_filters(self, query, filters: MetricFilters, workspace_id: str = None):
+    def _apply_filters(
+        self, query, filters: MetricFilters, workspace_id: str = None, src=None
+    ):
         """
         Apply filters to a query.
 
@@ -1005,11 +1389,41 @@ class UnifiedMetricService:
             query: SQLAlchemy query object
             filters: MetricFilters object with filter criteria
             workspace_id: Workspace UUID (required for entity_name hierarchy resolution)
+            src: Metric model the query reads from (MetricSnapshot or MetricDailyRollup).
+                 Defaults to MetricSnapshot.
         """
+        clauses = self._filter_clauses(filters, workspace_id, src)
+        if clauses:
+            query = query.filter(*clauses)
+        return query
+
+    def _filter_clauses(
+        self, filters: MetricFilters, workspace_id: str = None, src=None
+    ) -> List[Any]:
+        """
+        Build the WHERE predicates for a MetricFilters object.
+
+        Shared by _apply_filters (plain WHERE) and get_summaries_batch, which
+        uses the same predicates inside per-request FILTER (WHERE ...) clauses.
+
+        Args:
+            filters: MetricFilters object with filter criteria
+            workspace_id: Workspace UUID (required for entity_name hierarchy resolution)
+            src: Metric model the query reads from (MetricSnapshot or MetricDailyRollup).
+                 Defaults to MetricSnapshot.
+
+        Returns:
+            List of SQLAlchemy boolean clauses (empty when no filters are set)
+        """
+        if src is None:
+            src = self.MF
+
+        clauses = []
+
         # Provider filter
         if filters.provider:
             provider_value = filters.normalize_provider()
-            query = query.filter(self.MF.provider == provider_value)
+            clauses.append(src.provider == provider_value)
             logger.debug(f"[UNIFIED_METRICS] Applied provider filter: {provider_value}")
 
         # Level filter (use E.level, not MF.level)
@@ -1017,17 +1431,17 @@ class UnifiedMetricService:
         # constrain by E.level here, because we will restrict by descendants and/or
         # grouping level separately. Applying both can over-constrain to empty.
         if filters.level and not filters.entity_name:
-            query = query.filter(self.E.level == filters.level)
+            clauses.append(self.E.level == filters.level)
             logger.debug(f"[UNIFIED_METRICS] Applied level filter: {filters.level}")
 
         # Status filter (default: include all entities)
         if filters.status:
-            query = query.filter(self.E.status == filters.status)
+            clauses.append(self.E.status == filters.status)
             logger.debug(f"[UNIFIED_METRICS] Applied status filter: {filters.status}")
 
         # Entity IDs filter
         if filters.entity_ids:
-            query = query.filter(self.MF.entity_id.in_(filters.entity_ids))
+            clauses.append(src.entity_id.in_(filters.entity_ids))
             logger.debug(
                 f"[UNIFIED_METRICS] Applied entity_ids filter: {len(filters.entity_ids)} entities"
             )
@@ -1043,23 +1457,23 @@ class UnifiedMetricService:
                     logger.info(
                         f"[UNIFIED_METRICS] Using hierarchy rollup for '{filters.entity_name}': {len(descendant_ids)} descendants"
                     )
-                    query = query.filter(self.MF.entity_id.in_(descendant_ids))
+                    clauses.append(src.entity_id.in_(descendant_ids))
                 else:
                     # Fallback to simple name match if hierarchy resolution fails
                     logger.warning(
                         f"[UNIFIED_METRICS] Hierarchy resolution failed, falling back to name match"
                     )
                     pattern = f"%{filters.entity_name}%"
-                    query = query.filter(self.E.name.ilike(pattern))
+                    clauses.append(self.E.name.ilike(pattern))
             else:
                 # No workspace_id provided, use simple name match
                 logger.warning(
                     f"[UNIFIED_METRICS] No workspace_id provided for entity_name filter, using simple match"
                 )
                 pattern = f"%{filters.entity_name}%"
-                query = query.filter(self.E.name.ilike(pattern))
+                clauses.append(self.E.name.ilike(pattern))
 
-        return query
+        return clauses
 
     def _resolve_entity_by_name(self, workspace_id: str, entity_name: str):
         """
@@ -1118,10 +1532,7 @@ class UnifiedMetricService:
 
         if named_entity.level == "campaign" and child_level == "adset":
             # For campaign→adset breakdown, filter by campaign descendants and group by adset ancestors
-            from app.dsl.hierarchy import adset_ancestor_cte
-
-            # Create unique CTE by creating a new session-bound one
-            adset_cte = adset_ancestor_cte(self.db)
+            adset_cte = adset_ancestors(self.db, workspace_id)
             adset_alias = aliased(self.E)
 
             query = (
@@ -1143,6 +1554,7 @@ class UnifiedMetricService:
                 .join(adset_alias, adset_alias.id == adset_cte.c.ancestor_id)
                 .filter(self.E.workspace_id == workspace_id)
                 .filter(cast(self.date_field, Date).between(start_date, end_date))
+                .filter(snapshot_pruning_clause(self.date_field, start_date, end_date))
                 .group_by(adset_alias.name)
             )
 
@@ -1176,6 +1588,7 @@ class UnifiedMetricService:
                 .join(self.E, self.E.id == self.MF.entity_id)
                 .filter(self.E.workspace_id == workspace_id)
                 .filter(cast(self.date_field, Date).between(start_date, end_date))
+                .filter(snapshot_pruning_clause(self.date_field, start_date, end_date))
                 .group_by(self.E.name)
             )
 
@@ -1210,6 +1623,7 @@ class UnifiedMetricService:
                 .filter(self.E.id == named_entity.id)
                 .filter(self.E.workspace_id == workspace_id)
                 .filter(cast(self.date_field, Date).between(start_date, end_date))
+                .filter(snapshot_pruning_clause(self.date_field, start_date, end_date))
                 .group_by(self.E.name)
             )
         else:
@@ -1237,52 +1651,20 @@ class UnifiedMetricService:
         # Default to campaign-level to avoid double/triple counting across hierarchy levels
         level_filter = filters.level if filters.level else "campaign"
 
-        # Subquery to get latest snapshot per entity per metrics_date
-        # This avoids summing duplicate snapshots from 15-min syncs
-        latest_snapshots = (
-            self.db.query(
-                self.MF.entity_id,
-                self.MF.metrics_date,
-                func.max(self.MF.captured_at).label("max_captured_at"),
-            )
-            .join(self.E, self.E.id == self.MF.entity_id)
-            .filter(self.E.workspace_id == workspace_id)
-            .filter(self.E.level == level_filter)
-            .filter(self.MF.metrics_date.isnot(None))  # Exclude NULL dates
-            .filter(self.MF.metrics_date.between(start_date, end_date))
-            .group_by(self.MF.entity_id, self.MF.metrics_date)
-            .subquery()
-        )
-
         # Main query - only sum from the latest snapshots
+        src = self._daily_source()
+        query = self.db.query(
+            src.provider.label("group_name"), *self._sum_base_measures(src)
+        ).join(self.E, self.E.id == src.entity_id)
         query = (
-            self.db.query(
-                self.MF.provider.label("group_name"),
-                func.coalesce(func.sum(self.MF.spend), 0).label("spend"),
-                func.coalesce(func.sum(self.MF.revenue), 0).label("revenue"),
-                func.coalesce(func.sum(self.MF.clicks), 0).label("clicks"),
-                func.coalesce(func.sum(self.MF.impressions), 0).label("impressions"),
-                func.coalesce(func.sum(self.MF.conversions), 0).label("conversions"),
-                func.coalesce(func.sum(self.MF.leads), 0).label("leads"),
-                func.coalesce(func.sum(self.MF.installs), 0).label("installs"),
-                func.coalesce(func.sum(self.MF.purchases), 0).label("purchases"),
-                func.coalesce(func.sum(self.MF.visitors), 0).label("visitors"),
-                func.coalesce(func.sum(self.MF.profit), 0).label("profit"),
-            )
-            .join(self.E, self.E.id == self.MF.entity_id)
-            .join(
-                latest_snapshots,
-                and_(
-                    self.MF.entity_id == latest_snapshots.c.entity_id,
-                    self.MF.metrics_date == latest_snapshots.c.metrics_date,
-                    self.MF.captured_at == latest_snapshots.c.max_captured_at,
-                ),
+            self._restrict_to_latest_daily(
+                query, src, workspace_id, level_filter, start_date, end_date
             )
             .filter(self.E.workspace_id == workspace_id)
-            .group_by(self.MF.provider)
+            .group_by(src.provider)
         )
 
-        return self._apply_filters(query, filters, workspace_id)
+        return self._apply_filters(query, filters, workspace_id, src=src)
 
     def _build_entity_breakdown_query(
         self,
@@ -1301,8 +1683,82 @@ class UnifiedMetricService:
         IMPORTANT: Uses only the LATEST snapshot per entity per day to avoid
         double-counting when multiple snapshots exist (15-min sync creates many).
         """
-        # Subquery to get latest snapshot per entity per metrics_date
-        # This avoids summing duplicate snapshots from 15-min syncs
+        # Main query - only sum from the latest snapshots
+        src = self._daily_source()
+        query = self.db.query(
+            self.E.id.label("entity_id"),  # Include entity_id for timeseries lookup
+            self.E.name.label("group_name"),
+            *self._sum_base_measures(src),
+            # Creative fields for ad-level breakdowns (Meta only for now)
+            self.E.thumbnail_url.label("thumbnail_url"),
+            self.E.image_url.label("image_url"),
+            self.E.media_type.label("media_type"),
+        ).join(self.E, self.E.id == src.entity_id)
+        query = (
+            self._restrict_to_latest_daily(
+                query, src, workspace_id, level, start_date, end_date
+            )
+            .filter(self.E.workspace_id == workspace_id)
+            .filter(self.E.level == level)
+            .group_by(
+                self.E.id,
+                self.E.name,
+                self.E.thumbnail_url,
+                self.E.image_url,
+                self.E.media_type,
+            )
+        )
+
+        return self._apply_filters(query, filters, workspace_id, src=src)
+
+    def _daily_source(self):
+        """Model that daily (latest-snapshot-per-day) reads aggregate over."""
+        return self.R if self.use_rollups else self.MF
+
+    def _sum_base_measures(self, src, condition=None, prefix: str = "") -> List[Any]:
+        """COALESCE(SUM(measure), 0) columns for every base measure of `src`.
+
+        With `condition`, each sum becomes SUM(...) FILTER (WHERE condition),
+        labelled `<prefix><measure>`.
+        """
+        columns = []
+        for measure in BASE_MEASURES:
+            total = func.sum(getattr(src, measure))
+            if condition is not None:
+                total = total.filter(condition)
+            columns.append(func.coalesce(total, 0).label(f"{prefix}{measure}"))
+        return columns
+
+    def _restrict_to_latest_daily(
+        self,
+        query,
+        src,
+        workspace_id: str,
+        level: Union[str, List[str]],
+        start_date: date,
+        end_date: date,
+    ):
+        """Restrict a query to the latest snapshot per entity per metrics_date.
+
+        With rollups the table already holds exactly one row per entity per day,
+        so this is a plain level + date range predicate. Against raw snapshots we
+        join a max(captured_at) subquery to avoid summing duplicate 15-min rows.
+
+        `level` may be a list when one scan serves several levels (batched
+        summaries); each caller then narrows per level itself.
+
+        The query must already be joined to Entity (self.E) on src.entity_id.
+        """
+        if isinstance(level, str):
+            level_clause = self.E.level == level
+        else:
+            level_clause = self.E.level.in_(sorted(set(level)))
+
+        if src is self.R:
+            return query.filter(level_clause).filter(
+                src.metrics_date.between(start_date, end_date)
+            )
+
         latest_snapshots = (
             self.db.query(
                 self.MF.entity_id,
@@ -1311,89 +1767,70 @@ class UnifiedMetricService:
             )
             .join(self.E, self.E.id == self.MF.entity_id)
             .filter(self.E.workspace_id == workspace_id)
-            .filter(self.E.level == level)
+            .filter(level_clause)  # CRITICAL: Only campaign level by default
             .filter(self.MF.metrics_date.isnot(None))  # Exclude NULL dates
             .filter(self.MF.metrics_date.between(start_date, end_date))
+            # Partition pruning (metrics_date alone can't prune)
+            .filter(snapshot_pruning_clause(self.MF.captured_at, start_date, end_date))
             .group_by(self.MF.entity_id, self.MF.metrics_date)
             .subquery()
         )
 
-        # Main query - only sum from the latest snapshots
-        query = (
-            self.db.query(
-                self.E.id.label("entity_id"),  # Include entity_id for timeseries lookup
-                self.E.name.label("group_name"),
-                func.coalesce(func.sum(self.MF.spend), 0).label("spend"),
-                func.coalesce(func.sum(self.MF.revenue), 0).label("revenue"),
-                func.coalesce(func.sum(self.MF.clicks), 0).label("clicks"),
-                func.coalesce(func.sum(self.MF.impressions), 0).label("impressions"),
-                func.coalesce(func.sum(self.MF.conversions), 0).label("conversions"),
-                func.coalesce(func.sum(self.MF.leads), 0).label("leads"),
-                func.coalesce(func.sum(self.MF.installs), 0).label("installs"),
-                func.coalesce(func.sum(self.MF.purchases), 0).label("purchases"),
-                func.coalesce(func.sum(self.MF.visitors), 0).label("visitors"),
-                func.coalesce(func.sum(self.MF.profit), 0).label("profit"),
-                # Creative fields for ad-level breakdowns (Meta only for now)
-                self.E.thumbnail_url.label("thumbnail_url"),
-                self.E.image_url.label("image_url"),
-                self.E.media_type.label("media_type"),
-            )
-            .join(self.E, self.E.id == self.MF.entity_id)
-            .join(
-                latest_snapshots,
-                and_(
-                    self.MF.entity_id == latest_snapshots.c.entity_id,
-                    self.MF.metrics_date == latest_snapshots.c.metrics_date,
-                    self.MF.captured_at == latest_snapshots.c.max_captured_at,
-                ),
-            )
-            .filter(self.E.workspace_id == workspace_id)
-            .filter(self.E.level == level)
-            .group_by(
-                self.E.id,
-                self.E.name,
-                self.E.thumbnail_url,
-                self.E.image_url,
-                self.E.media_type,
-            )
-        )
+        return query.join(
+            latest_snapshots,
+            and_(
+                self.MF.entity_id == latest_snapshots.c.entity_id,
+                self.MF.metrics_date == latest_snapshots.c.metrics_date,
+                self.MF.captured_at == latest_snapshots.c.max_captured_at,
+            ),
+        ).filter(snapshot_pruning_clause(self.MF.captured_at, start_date, end_date))
 
-        return self._apply_filters(query, filters, workspace_id)
+    def _get_order_expression(self, metric: str, src=None, condition=None):
+        """Get SQL expression for ordering by metric.
+
+        Args:
+            metric: Metric name to order by
+            src: Metric model the query reads from (defaults to MetricSnapshot)
+            condition: Optional predicate; sums become SUM(...) FILTER (WHERE condition)
+        """
+        MF = self.MF if src is None else src
+
+        def total(column):
+            expr = func.sum(column)
+            return expr.filter(condition) if condition is not None else expr
 
-    def _get_order_expression(self, metric: str):
-        """Get SQL expression for ordering by metric."""
         if metric == "roas":
-            return func.coalesce(func.sum(self.MF.revenue), 0) / func.nullif(
-                func.coalesce(func.sum(self.MF.spend), 0), 0
+            return func.coalesce(total(MF.revenue), 0) / func.nullif(
+                func.coalesce(total(MF.spend), 0), 0
             )
         elif metric == "cpc":
-            return func.coalesce(func.sum(self.MF.spend), 0) / func.nullif(
-                func.coalesce(func.sum(self.MF.clicks), 0), 0
+            return func.coalesce(total(MF.spend), 0) / func.nullif(
+                func.coalesce(total(MF.clicks), 0), 0
             )
         elif metric == "cpa":
-            return func.coalesce(func.sum(self.MF.spend), 0) / func.nullif(
-                func.coalesce(func.sum(self.MF.conversions), 0), 0
+            return func.coalesce(total(MF.spend), 0) / func.nullif(
+                func.coalesce(total(MF.conversions), 0), 0
             )
         elif metric == "ctr":
-            return func.coalesce(func.sum(self.MF.clicks), 0) / func.nullif(
-                func.coalesce(func.sum(self.MF.impressions), 0), 0
+            return func.coalesce(total(MF.clicks), 0) / func.nullif(
+                func.coalesce(total(MF.impressions), 0), 0
             )
         elif metric == "cpm":
             return (
-                func.coalesce(func.sum(self.MF.spend), 0)
-                / func.nullif(func.coalesce(func.sum(self.MF.impressions), 0), 0)
+                func.coalesce(total(MF.spend), 0)
+                / func.nullif(func.coalesce(total(MF.impressions), 0), 0)
             ) * 1000
         elif metric == "spend":
-            return func.coalesce(func.sum(self.MF.spend), 0)
+            return func.coalesce(total(MF.spend), 0)
         elif metric == "revenue":
-            return func.coalesce(func.sum(self.MF.revenue), 0)
+            return func.coalesce(total(MF.revenue), 0)
         elif metric == "clicks":
-            return func.coalesce(func.sum(self.MF.clicks), 0)
+            return func.coalesce(total(MF.clicks), 0)
         elif metric == "conversions":
-            return func.coalesce(func.sum(self.MF.conversions), 0)
+            return func.coalesce(total(MF.conversions), 0)
         else:
             # Fallback to spend
-            return func.coalesce(func.sum(self.MF.spend), 0)
+            return func.coalesce(total(MF.spend), 0)
 
     def _passes_metric_filters(
         self, metric: str, value: Optional[float], metric_filters: List[Dict[str, Any]]
@@ -1583,15 +2020,16 @@ class UnifiedMetricService:
         query = self._build_time_breakdown_query(
             workspace_id, start_date, end_date, filters, breakdown_dimension
         )
+        src = self._daily_source()
 
         # Apply ordering and limit
         if sort_order == "asc":
             query = query.order_by(
-                asc(self._get_time_order_expression(metric, breakdown_dimension))
+                asc(self._get_time_order_expression(metric, breakdown_dimension, src))
             )
         else:
             query = query.order_by(
-                desc(self._get_time_order_expression(metric, breakdown_dimension))
+                desc(self._get_time_order_expression(metric, breakdown_dimension, src))
             )
 
         # Execute query to get all results first
@@ -1715,15 +2153,18 @@ class UnifiedMetricService:
         2. Uses only the LATEST snapshot per entity per day to avoid
            double-counting when multiple snapshots exist (15-min sync creates many).
         """
+        src = self._daily_source()
+        date_field = src.captured_at
+
         if breakdown_dimension == "day":
-            group_expr = cast(self.date_field, Date)
-            label_expr = cast(self.date_field, Date)
+            group_expr = cast(date_field, Date)
+            label_expr = cast(date_field, Date)
         elif breakdown_dimension == "week":
-            group_expr = func.date_trunc("week", self.date_field)
-            label_expr = func.date_trunc("week", self.date_field)
+            group_expr = func.date_trunc("week", date_field)
+            label_expr = func.date_trunc("week", date_field)
         elif breakdown_dimension == "month":
-            group_expr = func.date_trunc("month", self.date_field)
-            label_expr = func.date_trunc("month", self.date_field)
+            group_expr = func.date_trunc("month", date_field)
+            label_expr = func.date_trunc("month", date_field)
         else:
             raise ValueError(
                 f"Unsupported time breakdown dimension: {breakdown_dimension}"
@@ -1732,85 +2173,55 @@ class UnifiedMetricService:
         # Default to campaign-level to avoid double/triple counting across hierarchy levels
         level_filter = filters.level if filters.level else "campaign"
 
-        # Subquery to get latest snapshot per entity per metrics_date
-        # This avoids summing duplicate snapshots from 15-min syncs
-        latest_snapshots = (
-            self.db.query(
-                self.MF.entity_id,
-                self.MF.metrics_date,
-                func.max(self.MF.captured_at).label("max_captured_at"),
-            )
-            .join(self.E, self.E.id == self.MF.entity_id)
-            .filter(self.E.workspace_id == workspace_id)
-            .filter(self.E.level == level_filter)
-            .filter(self.MF.metrics_date.isnot(None))  # Exclude NULL dates
-            .filter(self.MF.metrics_date.between(start_date, end_date))
-            .group_by(self.MF.entity_id, self.MF.metrics_date)
-            .subquery()
-        )
-
         # Main query - only sum from the latest snapshots
+        query = self.db.query(
+            label_expr.label("group_name"), *self._sum_base_measures(src)
+        ).join(self.E, self.E.id == src.entity_id)
         query = (
-            self.db.query(
-                label_expr.label("group_name"),
-                func.coalesce(func.sum(self.MF.spend), 0).label("spend"),
-                func.coalesce(func.sum(self.MF.revenue), 0).label("revenue"),
-                func.coalesce(func.sum(self.MF.clicks), 0).label("clicks"),
-                func.coalesce(func.sum(self.MF.impressions), 0).label("impressions"),
-                func.coalesce(func.sum(self.MF.conversions), 0).label("conversions"),
-                func.coalesce(func.sum(self.MF.leads), 0).label("leads"),
-                func.coalesce(func.sum(self.MF.installs), 0).label("installs"),
-                func.coalesce(func.sum(self.MF.purchases), 0).label("purchases"),
-                func.coalesce(func.sum(self.MF.visitors), 0).label("visitors"),
-                func.coalesce(func.sum(self.MF.profit), 0).label("profit"),
-            )
-            .join(self.E, self.E.id == self.MF.entity_id)
-            .join(
-                latest_snapshots,
-                and_(
-                    self.MF.entity_id == latest_snapshots.c.entity_id,
-                    self.MF.metrics_date == latest_snapshots.c.metrics_date,
-                    self.MF.captured_at == latest_snapshots.c.max_captured_at,
-                ),
+            self._restrict_to_latest_daily(
+                query, src, workspace_id, level_filter, start_date, end_date
             )
             .filter(self.E.workspace_id == workspace_id)
             .group_by(group_expr)
         )
 
-        return self._apply_filters(query, filters, workspace_id)
+        return self._apply_filters(query, filters, workspace_id, src=src)
 
-    def _get_time_order_expression(self, metric: str, breakdown_dimension: str):
+    def _get_time_order_expression(
+        self, metric: str, breakdown_dimension: str, src=None
+    ):
         """Get SQL expression for ordering by metric in time-based breakdowns."""
+        MF = self.MF if src is None else src
         # Use the same logic as _get_order_expression but for time-based queries
         if metric == "roas":
-            return func.coalesce(func.sum(self.MF.revenue), 0) / func.nullif(
-                func.coalesce(func.sum(self.MF.spend), 0), 0
+            return func.coalesce(func.sum(MF.revenue), 0) / func.nullif(
+                func.coalesce(func.sum(MF.spend), 0), 0
             )
         elif metric == "cpc":
-            return func.coalesce(func.sum(self.MF.spend), 0) / func.nullif(
-                func.coalesce(func.sum(self.MF.clicks), 0), 0
+            return func.coalesce(func.sum(MF.spend), 0) / func.nullif(
+                func.coalesce(func.sum(MF.clicks), 0), 0
             )
         elif metric == "cpa":
-            return func.coalesce(func.sum(self.MF.spend), 0) / func.nullif(
-                func.coalesce(func.sum(self.MF.conversions), 0), 0
+            return func.coalesce(func.sum(MF.spend), 0) / func.nullif(
+                func.coalesce(func.sum(MF.conversions), 0), 0
             )
         elif metric == "ctr":
-            return func.coalesce(func.sum(self.MF.clicks), 0) / func.nullif(
-                func.coalesce(func.sum(self.MF.impressions), 0), 0
+            return func.coalesce(func.sum(MF.clicks), 0) / func.nullif(
+                func.coalesce(func.sum(MF.impressions), 0), 0
             )
         elif metric == "cpm":
             return (
-                func.coalesce(func.sum(self.MF.spend), 0)
-                / func.nullif(func.coalesce(func.sum(self.MF.impressions), 0), 0)
+                func.coalesce(func.sum(MF.spend), 0)
+                / func.nullif(func.coalesce(func.sum(MF.impressions), 0), 0)
             ) * 1000
         elif metric == "spend":
-            return func.coalesce(func.sum(self.MF.spend), 0)
+            return func.coalesce(func.sum(MF.spend), 0)
         elif metric == "revenue":
-            return func.coalesce(func.sum(self.MF.revenue), 0)
+            return func.coalesce(func.sum(MF.revenue), 0)
         elif metric == "clicks":
-            return func.coalesce(func.sum(self.MF.clicks), 0)
+            return func.coalesce(func.sum(MF.clicks), 0)
         elif metric == "conversions":
-            return func.coalesce(func.sum(self.MF.conversions), 0)
+            return func.coalesce(func.sum(MF.conversions), 0)
         else:
             # Fallback to spend
-            return func.coalesce(func.sum(self.MF.spend), 0)
+            return func.coalesce(func.sum(MF.spend), 0)
@@ -0,0 +1,129 @@
+"""Workspace Cache - in-process existence cache for hot ingestion paths.
+
+WHAT:
+    Bounded LRU of workspace_id -> exists with a TTL for known workspaces and
+    a shorter TTL for unknown ones (negative cache). Misses for a whole batch
+    are resolved with one IN query.
+
+WHY:
+    Every pixel hit queried workspaces just to confirm the id exists, although
+    workspaces are almost never created or deleted. Unknown-workspace floods
+    (stale pixel installs, bots) hit Postgres on every request too.
+
+INVALIDATION:
+    Workspace create (services/workspace_factory.py) and delete paths
+    (routers/workspaces.py, routers/auth.py, routers/clerk_webhooks.py) call
+    workspace_cache.invalidate(). The cache is per process, so other API
+    processes see a deletion once their entry expires (WORKSPACE_CACHE_TTL_SECONDS).
+
+USAGE:
+    from app.services.workspace_cache import workspace_cache
+
+    if not workspace_cache.exists(db, workspace_id):
+        raise HTTPException(400, "Invalid workspace")
+
+REFERENCES:
+    - backend/app/routers/pixel_events.py (single + batch ingestion)
+    - backend/app/routers/ingest.py
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models import Workspace
+
+logger = logging.getLogger(__name__)
+
+
+WORKSPACE_CACHE_MAX_SIZE = int(os.getenv("WORKSPACE_CACHE_MAX_SIZE", "10000"))
+WORKSPACE_CACHE_TTL_SECONDS = float(os.getenv("WORKSPACE_CACHE_TTL_SECONDS", "300"))
+WORKSPACE_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("WORKSPACE_CACHE_NEGATIVE_TTL_SECONDS", "60"))
+
+
+class WorkspaceExistenceCache:
+    """Thread-safe LRU of workspace existence with positive/negative TTLs.
+
+    WHAT:
+        - exists(): single id lookup
+        - filter_existing(): batch lookup, one query for all misses
+        - invalidate(): drop one id (or everything)
+
+    WHY:
+        Sync endpoints run in FastAPI's threadpool, so access is guarded by a
+        lock; the DB query itself runs outside the lock.
+    """
+
+    def __init__(
+        self,
+        max_size: int = WORKSPACE_CACHE_MAX_SIZE,
+        ttl_seconds: float = WORKSPACE_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: float = WORKSPACE_CACHE_NEGATIVE_TTL_SECONDS,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        # workspace_id -> (exists, expires_at monotonic)
+        self._entries: "OrderedDict[UUID, Tuple[bool, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def exists(self, db: Session, workspace_id: UUID) -> bool:
+        """True if the workspace exists (cached)."""
+        return workspace_id in self.filter_existing(db, [workspace_id])
+
+    def filter_existing(self, db: Session, workspace_ids: Iterable[UUID]) -> Set[UUID]:
+        """Return the subset of workspace_ids that exist (cached)."""
+        now = time.monotonic()
+        existing: Set[UUID] = set()
+        misses: Set[UUID] = set()
+
+        with self._lock:
+            for workspace_id in set(workspace_ids):
+                entry = self._entries.get(workspace_id)
+                if entry is None or entry[1] <= now:
+                    misses.add(workspace_id)
+                    continue
+                self._entries.move_to_end(workspace_id)
+                if entry[0]:
+                    existing.add(workspace_id)
+
+        if not misses:
+            return existing
+
+        found = {
+            row.id
+            for row in db.query(Workspace.id).filter(Workspace.id.in_(misses)).all()
+        }
+        existing |= found
+
+        with self._lock:
+            for workspace_id in misses:
+                is_known = workspace_id in found
+                ttl = self.ttl_seconds if is_known else self.negative_ttl_seconds
+                self._entries[workspace_id] = (is_known, now + ttl)
+                self._entries.move_to_end(workspace_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return existing
+
+    def invalidate(self, workspace_id: Optional[UUID] = None) -> None:
+        """Forget one workspace (created/deleted), or all entries if None."""
+        with self._lock:
+            if workspace_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(workspace_id, None)
+        logger.debug("[WORKSPACE_CACHE] Invalidated %s", workspace_id or "all")
+
+
+# Global cache instance (one per process)
+workspace_cache = WorkspaceExistenceCache()
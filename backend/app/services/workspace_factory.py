@@ -26,6 +26,7 @@ from ..models import (
     BillingPlanEnum,
     RoleEnum,
 )
+from .workspace_cache import workspace_cache
 
 # Trial configuration constants
 TRIAL_DURATION_DAYS = 7
@@ -75,6 +76,9 @@ def create_workspace_with_trial(
     db.add(workspace)
     db.flush()  # Get workspace.id without committing
 
+    # Drop any negative cache entry for the new id (pixel/ingest validation)
+    workspace_cache.invalidate(workspace.id)
+
     # Create owner membership if user_id provided
     if owner_user_id:
         membership = WorkspaceMember(
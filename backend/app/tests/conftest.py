@@ -34,6 +34,8 @@ os.environ.setdefault("TOKEN_ENCRYPTION_KEY", "MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwM
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 os.environ.setdefault("OPENAI_API_KEY", "test-api-key")
 os.environ.setdefault("REDIS_URL", "redis://localhost:6379")
+# Keep API rate limit windows in process memory (never the Redis above)
+os.environ.setdefault("RATE_LIMIT_BACKEND", "memory")
 
 
 # ============================================================================
@@ -74,6 +76,20 @@ def test_db_session(test_db_engine) -> Generator[Session, None, None]:
     session.close()
 
 
+# ============================================================================
+# Rate Limit Fixtures
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def rate_limit_backend(monkeypatch):
+    """Fresh in-memory rate limit backend per test (no windows left over)."""
+    from app.services import rate_limit_backend as module
+
+    backend = module.InMemoryRateLimitBackend()
+    monkeypatch.setattr(module, "_backend", backend)
+    return backend
+
+
 # ============================================================================
 # Application & Client Fixtures
 # ============================================================================
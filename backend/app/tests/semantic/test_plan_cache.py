@@ -0,0 +1,153 @@
+"""
+Tests for the semantic plan cache.
+
+Tests:
+- Fingerprints ignore dict ordering and distinguish query shapes
+- Validation and plans are cached per fingerprint; results per data version
+- Without a data version results are computed every time
+- The LRU evicts least recently used entries and expires results
+- Cache hits are recorded per stage with the time they saved
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.semantic import plan_cache as plan_cache_module
+from app.semantic.compiler import CompilationResult, CompiledPlan, SemanticCompiler
+from app.semantic.plan_cache import LRUCache, SemanticPlanCache, query_fingerprint
+from app.semantic.query import Breakdown, SemanticQuery, TimeRange
+from app.semantic.telemetry import TelemetryCollector, read_merged_cache_stats
+from app.semantic.validator import SemanticValidator, ValidationResult
+from app.services.unified_metric_service import MetricFilters
+
+
+def _query(limit=5):
+    return SemanticQuery(
+        metrics=["roas"],
+        time_range=TimeRange(last_n_days=7),
+        breakdown=Breakdown(dimension="entity", level="campaign", limit=limit),
+    )
+
+
+@pytest.fixture
+def compiler():
+    compiler = Mock(spec=SemanticCompiler)
+    compiler.plan.side_effect = lambda query: CompiledPlan(
+        strategy="entity_breakdown", filters=MetricFilters(), time_range_resolved={}
+    )
+    compiler.compile.side_effect = lambda workspace_id, query, plan: CompilationResult(
+        query=query, compilation_strategy=plan.strategy
+    )
+    return compiler
+
+
+@pytest.fixture
+def data_version():
+    with patch.object(plan_cache_module, "current_data_version", return_value=1) as version:
+        yield version
+
+
+def test_fingerprint_is_canonical():
+    assert query_fingerprint(_query()) == query_fingerprint(SemanticQuery.from_dict(_query().to_dict()))
+    assert query_fingerprint(_query()) != query_fingerprint(_query(limit=10))
+
+
+def test_validation_is_cached_and_copied():
+    validator = Mock(spec=SemanticValidator)
+    validator.validate.return_value = ValidationResult()
+    cache = SemanticPlanCache()
+
+    first = cache.validate(validator, _query())
+    first.add_warning("mutated by caller")
+    second = cache.validate(validator, _query())
+
+    assert validator.validate.call_count == 1
+    assert second.warnings == []
+
+
+def test_results_are_cached_per_data_version(compiler, data_version):
+    cache = SemanticPlanCache()
+
+    cache.compile(compiler, "ws-1", _query())
+    result = cache.compile(compiler, "ws-1", query := _query())
+    assert compiler.compile.call_count == 1
+    assert result.query is query
+
+    cache.compile(compiler, "ws-2", _query())
+    data_version.return_value = 2
+    cache.compile(compiler, "ws-1", _query())
+
+    assert compiler.compile.call_count == 3
+    assert compiler.plan.call_count == 1  # plans are shared across workspaces
+
+
+def test_results_are_not_cached_without_data_version(compiler):
+    cache = SemanticPlanCache()
+
+    with patch.object(plan_cache_module, "current_data_version", return_value=None):
+        cache.compile(compiler, "ws-1", _query())
+        cache.compile(compiler, "ws-1", _query())
+
+    assert compiler.compile.call_count == 2
+    assert compiler.plan.call_count == 1
+
+
+def test_disabled_cache_always_computes(compiler, data_version):
+    cache = SemanticPlanCache(enabled=False)
+
+    cache.compile(compiler, "ws-1", _query())
+    cache.compile(compiler, "ws-1", _query())
+
+    assert compiler.compile.call_count == 2
+    assert len(cache.plans) == 0
+
+
+def test_lru_evicts_and_expires():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1, cost_ms=1.0)
+    cache.put("b", 2, cost_ms=1.0)
+    cache.get("a")
+    cache.put("c", 3, cost_ms=1.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a").value == 1
+
+    expiring = LRUCache(max_size=2, ttl_seconds=10)
+    with patch.object(plan_cache_module.time, "monotonic", return_value=100.0):
+        expiring.put("a", 1, cost_ms=1.0)
+    with patch.object(plan_cache_module.time, "monotonic", return_value=111.0):
+        assert expiring.get("a") is None
+
+
+def test_hits_are_recorded_with_saved_time(compiler, data_version):
+    collector = TelemetryCollector()
+    cache = SemanticPlanCache()
+    cache.results.put(("ws-1", query_fingerprint(_query()), plan_cache_module.date.today(), 1),
+                      CompilationResult(), cost_ms=40.0)
+
+    with collector.track_query("ws-1") as ctx:
+        cache.compile(compiler, "ws-1", _query(), ctx=ctx)
+    with collector.track_query("ws-1") as ctx:
+        cache.compile(compiler, "ws-1", _query(limit=3), ctx=ctx)
+
+    stats = collector.get_stats()["cache"]
+    assert stats["result"] == {"hits": 1, "misses": 1, "hit_rate": 0.5, "saved_ms": 40.0}
+    assert stats["plan"]["misses"] == 1
+    assert collector.get_recent_metrics(2)[1]["cache_hits"] == {"result": 40.0}
+
+
+def test_cache_counters_merge_in_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis_client = fakeredis.FakeRedis()
+    replicas = [TelemetryCollector(redis_client=redis_client, flush_interval=3600) for _ in range(2)]
+    for replica, saved_ms in zip(replicas, (10.0, 30.0)):
+        with replica.track_query("ws-1") as ctx:
+            ctx.record_cache("validation", hit=True, saved_ms=saved_ms)
+            ctx.record_cache("result", hit=False)
+        replica.flush_to_redis()
+
+    merged = read_merged_cache_stats(redis_client)
+
+    assert merged["validation"] == {"hits": 2, "misses": 0, "hit_rate": 1.0, "saved_ms": 40.0}
+    assert merged["result"]["misses"] == 2
@@ -0,0 +1,103 @@
+"""
+Tests for semantic telemetry buffering and latency percentiles.
+
+Tests:
+- RingBuffer keeps the newest `capacity` items in order
+- LatencySketch quantiles stay within the relative accuracy and merge
+- The collector records per-stage latency and flushes it to Redis
+- Flushes of several replicas merge into one distribution
+"""
+
+import pytest
+
+from app.semantic.telemetry import (
+    LatencySketch,
+    QueryMetrics,
+    RingBuffer,
+    TelemetryCollector,
+    read_merged_latency,
+)
+
+
+@pytest.fixture
+def redis_client():
+    try:
+        from fakeredis import FakeRedis
+    except ImportError:
+        pytest.skip("fakeredis not installed")
+    return FakeRedis()
+
+
+def _metrics(query_id, stages, total_ms):
+    return QueryMetrics(query_id=query_id, start_time=0.0, end_time=total_ms / 1000, stages=stages)
+
+
+def test_ring_buffer_overwrites_oldest():
+    buffer = RingBuffer(3)
+    for i in range(5):
+        buffer.append(i)
+
+    assert len(buffer) == 3
+    assert list(buffer) == [2, 3, 4]
+    assert buffer.recent(2) == [4, 3]
+    assert buffer.recent(10) == [4, 3, 2]
+
+    buffer.clear()
+    assert buffer.recent(10) == []
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    sketch = LatencySketch()
+    for value in range(1, 1001):
+        sketch.add(float(value))
+
+    for q, exact in [(0.5, 500), (0.95, 950), (0.99, 990)]:
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+    assert LatencySketch().quantile(0.5) is None
+
+
+def test_sketches_merge_like_one_stream():
+    combined, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+    for value in range(1, 501):
+        left.add(float(value))
+        combined.add(float(value))
+    for value in range(501, 1001):
+        right.add(float(value))
+        combined.add(float(value))
+
+    left.merge(right)
+
+    assert left.buckets == combined.buckets
+    assert left.quantile(0.95) == combined.quantile(0.95)
+
+
+def test_collector_tracks_stage_latency():
+    collector = TelemetryCollector(buffer_size=2)
+    for i in range(3):
+        collector.record_metrics(_metrics(f"q{i}", {"compilation": 10.0 * (i + 1)}, 50.0))
+
+    stats = collector.get_stats()
+
+    assert [m["query_id"] for m in collector.get_recent_metrics()] == ["q2", "q1"]
+    assert stats["latency"]["compilation"]["count"] == 3
+    assert stats["latency"]["compilation"]["p99_ms"] == pytest.approx(30.0, rel=0.02)
+    assert stats["latency"]["total"]["p50_ms"] == pytest.approx(50.0, rel=0.02)
+
+
+def test_replica_flushes_merge_in_redis(redis_client):
+    replicas = [
+        TelemetryCollector(redis_client=redis_client, flush_interval=3600) for _ in range(2)
+    ]
+    replicas[0].record_metrics(_metrics("a", {"data_fetch": 100.0}, 120.0))
+    replicas[1].record_metrics(_metrics("b", {"data_fetch": 300.0}, 320.0))
+    replicas[1].record_metrics(_metrics("c", {"data_fetch": 300.0}, 320.0))
+
+    assert [r.flush_to_redis() for r in replicas] == [2, 2]
+    assert replicas[0].flush_to_redis() == 0  # nothing pending
+
+    merged = read_merged_latency(redis_client)
+
+    assert merged["data_fetch"]["count"] == 3
+    assert merged["data_fetch"]["p50_ms"] == pytest.approx(300.0, rel=0.02)
+    assert merged["data_fetch"]["avg_ms"] == pytest.approx(700.0 / 3)
+    assert sum(b["count"] for b in merged["total"]["histogram"]) == 3
@@ -0,0 +1,118 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Entity, LevelEnum, MetricSnapshot, Workspace
+from app.services.agents.evaluation_engine import AgentEvaluationEngine
+
+
+def _setup_db(tmp_path):
+    db_file = tmp_path / "agent_observations.db"
+    engine = create_engine(
+        f"sqlite:///{db_file}",
+        connect_args={"check_same_thread": False},
+    )
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    Base.metadata.create_all(bind=engine)
+    return engine, SessionLocal
+
+
+def _seed(session):
+    workspace_id = uuid.uuid4()
+    session.add(Workspace(id=workspace_id, name="Obs test"))
+
+    entities = [
+        Entity(
+            id=uuid.uuid4(),
+            level=LevelEnum.ad,
+            external_id=f"ad-{i}",
+            name=f"Ad {i}",
+            status="active",
+            workspace_id=workspace_id,
+        )
+        for i in range(3)
+    ]
+    session.add_all(entities)
+
+    now = datetime.now(timezone.utc)
+    today = now.date()
+
+    def snapshot(entity, captured_at, spend, revenue, clicks, impressions):
+        return MetricSnapshot(
+            entity_id=entity.id,
+            provider="meta",
+            captured_at=captured_at,
+            metrics_date=today,
+            spend=spend,
+            revenue=revenue,
+            clicks=clicks,
+            impressions=impressions,
+            conversions=2,
+        )
+
+    session.add_all([
+        # Cumulative snapshots: only the latest one per day counts
+        snapshot(entities[0], now - timedelta(minutes=30), 10, 20, 10, 1000),
+        snapshot(entities[0], now - timedelta(minutes=15), 40, 100, 20, 2000),
+        snapshot(entities[1], now - timedelta(minutes=15), 25, 0, 0, 0),
+        # entities[2] has no data
+    ])
+    session.commit()
+    return entities
+
+
+def test_bulk_observations_match_per_entity_path(tmp_path):
+    engine, SessionLocal = _setup_db(tmp_path)
+    try:
+        with SessionLocal() as db:
+            entities = _seed(db)
+            engine_obj = AgentEvaluationEngine(db)
+
+            bulk = asyncio.run(
+                engine_obj._fetch_observations_bulk(entities, date_range_type="today")
+            )
+            per_entity = {
+                e.id: asyncio.run(
+                    engine_obj._fetch_observations(e, date_range_type="today")
+                )
+                for e in entities
+            }
+
+        assert bulk == per_entity
+        assert bulk[entities[0].id]["spend"] == 40.0
+        assert bulk[entities[0].id]["roas"] == 2.5
+        assert bulk[entities[0].id]["cpc"] == 2.0
+        assert bulk[entities[0].id]["ctr"] == 1.0
+        assert bulk[entities[1].id]["roas"] == 0.0
+        assert bulk[entities[2].id]["spend"] == 0.0
+    finally:
+        engine.dispose()
+
+
+def test_bulk_observations_use_a_single_query(tmp_path):
+    engine, SessionLocal = _setup_db(tmp_path)
+    try:
+        with SessionLocal() as db:
+            entities = _seed(db)
+            engine_obj = AgentEvaluationEngine(db)
+            entity_ids = {e.id for e in entities}  # load expired attributes first
+
+            statements = []
+            event.listen(
+                engine,
+                "before_cursor_execute",
+                lambda *args: statements.append(args[2]),
+            )
+            bulk = asyncio.run(
+                engine_obj._fetch_observations_bulk(entities, date_range_type="rolling_24h")
+            )
+
+        assert len(statements) == 1
+        assert set(bulk) == entity_ids
+        assert max(obs["spend"] for obs in bulk.values()) == 40.0
+    finally:
+        engine.dispose()
@@ -0,0 +1,126 @@
+"""
+Tests for concurrent tool execution in the agent loop.
+
+Tests:
+- Tool calls of one LLM turn run concurrently, results come back in call order
+- Read-only tools get their own session; writing tools use the request session
+- tool_start/tool_end events carry the call id
+- The per-turn concurrency cap is respected
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.agent import nodes
+
+
+def _tool_call(call_id, name, args="{}"):
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=args))
+
+
+def _completion(tool_calls=None, content=None):
+    message = SimpleNamespace(tool_calls=tool_calls, content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeOpenAI:
+    """Returns the given completions in order and records the messages sent."""
+
+    def __init__(self, *completions):
+        self.completions = list(completions)
+        self.sent = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, messages, **kwargs):
+        self.sent.append(list(messages))
+        return self.completions.pop(0)
+
+
+class RecordingPublisher:
+    def __init__(self):
+        self.events = []
+
+    def thinking(self, text):
+        pass
+
+    def tool_start(self, tool_name, args, call_id=None):
+        self.events.append(("start", call_id))
+
+    def tool_end(self, tool_name, preview, call_id=None, **kwargs):
+        self.events.append(("end", call_id))
+
+    def answer_token(self, token):
+        pass
+
+
+def _run(tool_calls, execute):
+    openai = FakeOpenAI(_completion(tool_calls=tool_calls), _completion(content="Done"))
+    publisher = RecordingPublisher()
+    db = sessionmaker(bind=create_engine("sqlite://"))()
+    state = {"workspace_id": "ws-1", "user_id": "u-1", "current_question": "How are we doing?"}
+
+    with patch.object(nodes, "get_async_openai_client", return_value=openai), \
+            patch.object(nodes, "_fetch_workspace_context", return_value=None), \
+            patch.object(nodes, "execute_tool_async", side_effect=execute):
+        result = asyncio.run(nodes.agent_loop_node(state, db, publisher))
+
+    tool_messages = [m for m in openai.sent[1] if m["role"] == "tool"]
+    return result, tool_messages, publisher.events, db
+
+
+def test_tool_calls_run_concurrently_in_call_order():
+    sessions = {}
+
+    async def execute(tool_name, tool_args, db, workspace_id, user_id):
+        await asyncio.sleep(0.3 if tool_args["n"] == 1 else 0.1)
+        sessions[tool_args["n"]] = db
+        return {"success": True, "n": tool_args["n"]}
+
+    calls = [
+        _tool_call("call_1", "list_entities", '{"n": 1}'),
+        _tool_call("call_2", "list_entities", '{"n": 2}'),
+        _tool_call("call_3", "create_agent", '{"n": 3}'),
+    ]
+
+    started = time.monotonic()
+    result, tool_messages, events, db = _run(calls, execute)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert [m["tool_call_id"] for m in tool_messages] == ["call_1", "call_2", "call_3"]
+    assert [call["args"]["n"] for call in result["tool_calls_made"]] == [1, 2, 3]
+    # Read-only tools get their own session, writes go through the request one
+    assert sessions[1] is not sessions[2] and db not in (sessions[1], sessions[2])
+    assert sessions[3] is db
+    # Every call starts and ends once, ends pair with starts by call id
+    assert sorted(events) == sorted(
+        [(kind, f"call_{n}") for kind in ("start", "end") for n in (1, 2, 3)]
+    )
+    assert events.index(("end", "call_2")) < events.index(("end", "call_1"))
+
+
+def test_concurrency_cap_and_skipped_calls():
+    running = {"now": 0, "max": 0}
+
+    async def execute(tool_name, tool_args, db, workspace_id, user_id):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await asyncio.sleep(0.05)
+        running["now"] -= 1
+        return {"success": True}
+
+    calls = [_tool_call(f"call_{n}", "query_metrics") for n in range(4)]
+
+    with patch.object(nodes, "MAX_CONCURRENT_TOOL_CALLS", 2):
+        result, tool_messages, _, _ = _run(calls, execute)
+
+    assert running["max"] == 2
+    assert len(result["tool_calls_made"]) == nodes.MAX_TOOL_CALLS_PER_ITERATION
+    # Calls over the per-turn limit still get a response message
+    assert [m["tool_call_id"] for m in tool_messages] == ["call_0", "call_1", "call_2", "call_3"]
+    assert "Skipped" in tool_messages[-1]["content"]
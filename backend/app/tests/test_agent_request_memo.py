@@ -0,0 +1,122 @@
+"""
+Tests for the per-job agent memo.
+
+Tests:
+- Lookups are computed once per scope and counted as hits afterwards
+- Values are copied, failures are not cached, no scope means no caching
+- The scope reaches asyncio.to_thread workers
+- Agent helpers (workspace context, snapshot time, providers) share the memo
+- Hit counts end up in the agent result / done event
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.agent import graph, nodes
+from app.agent.connection_resolver import ConnectionResolver
+from app.agent.request_memo import memoized, request_memo_scope
+from app.models import ProviderEnum
+
+
+class TestRequestMemo:
+    """Test the memo scope itself."""
+
+    def test_computes_once_per_scope(self):
+        compute = Mock(return_value={"a": 1})
+
+        with request_memo_scope() as memo:
+            first = memoized("thing", "ws-1", compute)
+            first["a"] = 2  # callers may mutate their copy
+            second = memoized("thing", "ws-1", compute)
+            memoized("thing", "ws-2", compute)
+
+        assert second == {"a": 1}
+        assert compute.call_count == 2
+        assert memo.stats() == {"hits": 1, "misses": 2, "by_name": {"thing": {"hits": 1, "misses": 2}}}
+
+    def test_no_scope_and_new_scope_recompute(self):
+        compute = Mock(return_value=1)
+
+        memoized("thing", "ws-1", compute)
+        with request_memo_scope():
+            memoized("thing", "ws-1", compute)
+        with request_memo_scope():
+            memoized("thing", "ws-1", compute)
+
+        assert compute.call_count == 3
+
+    def test_failures_are_not_cached(self):
+        compute = Mock(side_effect=[RuntimeError("db down"), 5])
+
+        with request_memo_scope():
+            with pytest.raises(RuntimeError):
+                memoized("thing", "ws-1", compute)
+            assert memoized("thing", "ws-1", compute) == 5
+
+    def test_scope_reaches_worker_threads(self):
+        compute = Mock(return_value=1)
+
+        async def run():
+            with request_memo_scope() as memo:
+                await asyncio.gather(*[
+                    asyncio.to_thread(memoized, "thing", "ws-1", compute) for _ in range(3)
+                ])
+                memoized("thing", "ws-1", compute)
+            return memo.stats()
+
+        stats = asyncio.run(run())
+
+        assert stats["hits"] + stats["misses"] == 4
+        assert stats["hits"] >= 1
+
+
+def _db_with_connections(*providers):
+    db = Mock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        Mock(provider=provider) for provider in providers
+    ]
+    return db
+
+
+class TestAgentLookups:
+    """Test the helpers that consult the memo."""
+
+    def test_snapshot_time_is_queried_once_per_scope(self):
+        db = Mock()
+        db.query.return_value.join.return_value.filter.return_value.scalar.return_value = date(2026, 10, 15)
+
+        with request_memo_scope():
+            for _ in range(6):
+                assert nodes._get_latest_snapshot_time(db, "ws-1") == date(2026, 10, 15)
+
+        assert db.query.call_count == 1
+
+    def test_resolver_and_context_share_active_providers(self):
+        db = _db_with_connections(ProviderEnum.google, ProviderEnum.shopify)
+
+        with request_memo_scope() as memo:
+            assert ConnectionResolver(db, "ws-1").get_available_providers() == ["google"]
+            assert ConnectionResolver(db, "ws-1").get_available_providers() == ["google"]
+            with pytest.raises(Exception):
+                ConnectionResolver(db, "ws-1").get_connection("meta")
+
+        assert db.query.call_count == 1
+        assert memo.stats()["by_name"]["active_providers"] == {"hits": 2, "misses": 1}
+
+
+def test_memo_stats_are_returned_with_the_result():
+    async def fake_loop(state, db, publisher):
+        nodes._fetch_workspace_context(db, state["workspace_id"])
+        nodes._fetch_workspace_context(db, state["workspace_id"])
+        return {"answer_chunks": ["ok"], "tool_calls_made": [], "iterations": 1}
+
+    publisher = Mock()
+    with patch("app.agent.nodes.agent_loop_node", side_effect=fake_loop), \
+            patch.object(nodes, "_load_workspace_context", return_value={"company_name": "Acme"}):
+        result = asyncio.run(graph.run_agent_async("q", "ws-1", "u-1", Mock(), publisher=publisher))
+
+    assert result["memo"]["by_name"]["workspace_context"] == {"hits": 1, "misses": 1}
+    assert publisher.done.call_args[0][0]["memo"]["hits"] == 1
@@ -1,5 +1,7 @@
+import asyncio
 import uuid
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -122,3 +124,67 @@ def test_should_run_handles_naive_last_scheduled_run_at(tmp_path):
         db.close()
         Base.metadata.drop_all(bind=engine)
         engine.dispose()
+
+
+def test_concurrent_scheduled_evaluation_claims_each_run_once(tmp_path):
+    engine, SessionLocal = _setup_db(tmp_path)
+    now = datetime.now(timezone.utc)
+
+    seed = SessionLocal()
+    agent_ids = [_seed_agent(seed, now) for _ in range(3)]
+    seed.close()
+
+    db1 = SessionLocal()
+    db2 = SessionLocal()
+    try:
+        engine1 = AgentEvaluationEngine(db1, session_factory=SessionLocal)
+        engine2 = AgentEvaluationEngine(db2, session_factory=SessionLocal)
+
+        first = asyncio.run(engine1.evaluate_scheduled_agents(concurrency=3))
+        second = asyncio.run(engine2.evaluate_scheduled_agents(concurrency=3))
+
+        assert first["agents_evaluated"] == len(agent_ids)
+        assert first["errors"] == 0
+        assert second["agents_evaluated"] == 0
+    finally:
+        db1.close()
+        db2.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def test_concurrent_realtime_evaluation_aggregates_summary(tmp_path):
+    engine, SessionLocal = _setup_db(tmp_path)
+    now = datetime.now(timezone.utc)
+
+    seed = SessionLocal()
+    agent_ids = [_seed_agent(seed, now) for _ in range(3)]
+    seed.query(Agent).update({Agent.schedule_type: "realtime"})
+    seed.commit()
+    seed.close()
+
+    failing_id = agent_ids[0]
+    original_evaluate = AgentEvaluationEngine.evaluate_agent
+
+    async def evaluate_agent(self, agent, skip_condition=False):
+        if agent.id == failing_id:
+            raise RuntimeError("boom")
+        return await original_evaluate(self, agent, skip_condition=skip_condition)
+
+    db = SessionLocal()
+    try:
+        engine_obj = AgentEvaluationEngine(db, session_factory=SessionLocal)
+        with patch.object(AgentEvaluationEngine, "evaluate_agent", evaluate_agent):
+            results = asyncio.run(engine_obj.evaluate_all_agents(concurrency=3))
+
+        assert results["agents_evaluated"] == 2
+        assert results["errors"] == 1
+
+        db.expire_all()
+        statuses = {a.id: a.status for a in db.query(Agent).all()}
+        assert statuses[failing_id] == AgentStatusEnum.error
+        assert all(statuses[a] == AgentStatusEnum.active for a in agent_ids[1:])
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
@@ -0,0 +1,109 @@
+"""
+Tests for the Redis Streams transport of agent events.
+
+Tests:
+- Answer tokens are coalesced into batches; other events flush the batch
+- A batch is flushed at its deadline even when no further token arrives
+- Late subscribers replay from the start; offsets resume after an entry id
+- The stream is capped and expires
+- AGENT_STREAM_TRANSPORT=pubsub keeps the Pub/Sub publisher
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.agent import stream
+from app.agent.stream import (
+    EventType,
+    RedisStreamPublisher,
+    RedisStreamSubscriber,
+    StreamPublisher,
+)
+
+
+@pytest.fixture
+def redis_client():
+    try:
+        from fakeredis import FakeRedis
+    except ImportError:
+        pytest.skip("fakeredis not installed")
+    return FakeRedis()
+
+
+def _publisher(redis_client, **kwargs):
+    kwargs.setdefault("batch_window_ms", 60_000)
+    return RedisStreamPublisher(redis_client, "job-1", **kwargs)
+
+
+def _events(redis_client, offset=None):
+    return list(RedisStreamSubscriber(redis_client, "job-1", timeout=0.1, offset=offset).listen())
+
+
+def test_tokens_are_batched_and_flushed_before_other_events(redis_client):
+    publisher = _publisher(redis_client, batch_max_chars=10)
+    publisher.thinking("Analyzing")
+    for token in ["Your", " ROAS", " is", " 2.1"]:
+        publisher.answer_token(token)
+    publisher.visual({"type": "line"})
+    publisher.done({"answer": "Your ROAS is 2.1"})
+
+    events = _events(redis_client)
+
+    assert [e.type for e in events] == [
+        EventType.THINKING, EventType.ANSWER, EventType.ANSWER, EventType.VISUAL, EventType.DONE,
+    ]
+    # First batch hit the size cap, the rest was flushed by the visual event
+    assert [e.data["token"] for e in events[1:3]] == ["Your ROAS is", " 2.1"]
+    assert redis_client.xlen("qa:job-1:events") == 5
+
+
+def test_elapsed_window_flushes_batch(redis_client):
+    publisher = _publisher(redis_client, batch_window_ms=0)
+    publisher.answer_token("a")
+    publisher.answer_token("b")
+
+    assert redis_client.xlen("qa:job-1:events") == 2
+
+
+def test_stalled_batch_is_flushed_at_its_deadline(redis_client):
+    publisher = _publisher(redis_client, batch_window_ms=20)
+    publisher.answer_token("a")
+    publisher.answer_token("b")
+
+    assert redis_client.xlen("qa:job-1:events") == 0
+    time.sleep(0.2)
+    assert redis_client.xlen("qa:job-1:events") == 1
+
+    publisher.done({})
+    assert [e.data.get("token") for e in _events(redis_client)] == ["ab", None]
+
+
+def test_late_subscriber_replays_and_offset_resumes(redis_client):
+    publisher = _publisher(redis_client)
+    publisher.thinking("one")
+    publisher.thinking("two")
+    publisher.done({})
+
+    replay = _events(redis_client)
+    resumed = _events(redis_client, offset=replay[0].event_id)
+
+    assert [e.data.get("text") for e in replay] == ["one", "two", None]
+    assert [e.event_id for e in resumed] == [e.event_id for e in replay[1:]]
+    assert resumed[-1].is_final
+
+
+def test_stream_is_capped_and_expires(redis_client):
+    publisher = _publisher(redis_client, max_len=3)
+    for i in range(20):
+        publisher.thinking(str(i))
+
+    assert redis_client.xlen("qa:job-1:events") < 20
+    assert redis_client.ttl("qa:job-1:events") > 0
+
+
+def test_transport_switch():
+    with patch.object(stream, "STREAM_TRANSPORT", "pubsub"):
+        assert type(stream.create_publisher("job-1")) is StreamPublisher
+    assert isinstance(stream.create_publisher("job-1"), RedisStreamPublisher)
@@ -0,0 +1,101 @@
+"""Tests for concurrent section loading in the unified dashboard.
+
+WHAT: Exercises _load_dashboard_sections with stub sections
+WHY: Sections must overlap, respect their time budgets and degrade to
+     partial results instead of failing the whole dashboard
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.routers import dashboard
+
+
+@pytest.fixture(autouse=True)
+def _stub_sessions():
+    """Each section gets its own (mock) session."""
+    with patch.object(dashboard, "SessionLocal", side_effect=lambda: MagicMock()):
+        yield
+
+
+def _slow(value, seconds):
+    def section(session):
+        time.sleep(seconds)
+        return value
+    return section
+
+
+def test_sections_run_concurrently_on_separate_sessions():
+    sessions = []
+    lock = threading.Lock()
+
+    def section(session):
+        with lock:
+            sessions.append(session)
+        time.sleep(0.2)
+        return len(sessions)
+
+    db = MagicMock()
+    started = time.perf_counter()
+    values, timings, incomplete = dashboard._load_dashboard_sections(
+        db,
+        {"a": section, "b": section, "c": section},
+        {"a": None, "b": None, "c": None},
+        concurrent=True,
+    )
+
+    assert time.perf_counter() - started < 0.5
+    assert len({id(s) for s in sessions}) == 3
+    assert incomplete == []
+    assert set(timings) == {"a", "b", "c"}
+    assert all(ms >= 150 for ms in timings.values())
+    # The request's own connection is released during the fan-out
+    db.close.assert_called_once()
+
+
+def test_section_past_its_deadline_does_not_take_a_session():
+    section = MagicMock()
+
+    with patch.object(dashboard, "SessionLocal") as session_factory:
+        with pytest.raises(dashboard.FutureTimeoutError):
+            dashboard._run_section_in_own_session(section, time.perf_counter() - 1)
+
+    session_factory.assert_not_called()
+    section.assert_not_called()
+
+
+def test_timed_out_and_failed_sections_return_fallbacks():
+    def broken(session):
+        raise RuntimeError("boom")
+
+    with patch.dict(dashboard.SECTION_TIMEOUTS, {"slow": 0.05}):
+        values, timings, incomplete = dashboard._load_dashboard_sections(
+            MagicMock(),
+            {"fast": _slow("ok", 0), "slow": _slow("late", 0.5), "broken": broken},
+            {"fast": None, "slow": [], "broken": "fallback"},
+            concurrent=True,
+        )
+
+    assert values == {"fast": "ok", "slow": [], "broken": "fallback"}
+    assert incomplete == ["slow", "broken"]
+    assert timings["slow"] < 500
+
+
+def test_sequential_mode_uses_request_session():
+    db = MagicMock()
+    seen = []
+
+    values, timings, incomplete = dashboard._load_dashboard_sections(
+        db,
+        {"a": lambda session: seen.append(session) or 1},
+        {"a": 0},
+        concurrent=False,
+    )
+
+    assert seen == [db]
+    assert values == {"a": 1}
+    assert incomplete == []
+    assert "a" in timings
@@ -217,16 +217,33 @@ class TestWorkspaceRateLimiter:
         WHY: Single method for check + record pattern.
         """
         mock_redis = Mock()
-        mock_redis.zcard.return_value = 15  # At limit
-        mock_redis.zrange.return_value = [("1234567890", 1234567890)]
+        # Sliding window script: not allowed, 0 remaining, slot frees in 12.5s
+        mock_redis.register_script.return_value = Mock(return_value=[0, 0, b"12.5"])
 
         limiter = WorkspaceRateLimiter(
             redis_client=mock_redis,
             workspace_id="test-workspace",
         )
 
-        with pytest.raises(WorkspaceRateLimitError):
+        with pytest.raises(WorkspaceRateLimitError) as exc_info:
             limiter.check_and_record("google")
+        assert exc_info.value.retry_after == 13
+
+    def test_reserve_falls_back_to_local_limits_on_redis_errors(self):
+        """WHAT: reserve should use process-local limits when Redis fails.
+        WHY: A Redis outage must not fail every live API call.
+        """
+        mock_redis = Mock()
+        mock_redis.register_script.return_value = Mock(side_effect=ConnectionError("down"))
+
+        limiter = WorkspaceRateLimiter(
+            redis_client=mock_redis,
+            workspace_id=f"test-workspace-{uuid4()}",
+        )
+
+        reservation = limiter.reserve("google")
+        assert reservation.allowed is True
+        assert reservation.remaining == RATE_LIMITS["google"] - 1
 
     def test_get_key_format(self):
         """WHAT: Key should include workspace and provider.
@@ -465,8 +482,9 @@ class TestLiveApiTools:
 
         mock_db = Mock()
         mock_rate_limiter = Mock()
-        mock_rate_limiter.can_make_call.return_value = False
-        mock_rate_limiter.get_retry_after.return_value = 45
+        mock_rate_limiter.check_and_record.side_effect = WorkspaceRateLimitError(
+            retry_after=45, workspace_id="test-workspace", provider="google"
+        )
 
         tools = LiveApiTools(
             db=mock_db,
@@ -485,6 +503,7 @@ class TestLiveApiTools:
 
         assert result["success"] is False
         assert "rate limit" in result["error"].lower()
+        mock_rate_limiter.check_and_record.assert_called_once_with("google")
 
     @patch('app.agent.live_api_tools.ConnectionResolver')
     def test_get_live_metrics_provider_not_connected(self, mock_resolver_class):
@@ -500,7 +519,6 @@ class TestLiveApiTools:
 
         mock_db = Mock()
         mock_rate_limiter = Mock()
-        mock_rate_limiter.can_make_call.return_value = True
 
         tools = LiveApiTools(
             db=mock_db,
@@ -542,7 +560,6 @@ class TestLiveApiTools:
 
         mock_db = Mock()
         mock_rate_limiter = Mock()
-        mock_rate_limiter.can_make_call.return_value = True
 
         tools = LiveApiTools(
             db=mock_db,
@@ -91,9 +91,6 @@ class TestRateLimiting:
         """WHAT: Different decorated methods should share one budget per client token.
         WHY: Meta rate limits apply across API endpoints for the same client/account.
         """
-        from app.services import meta_ads_client as module
-
-        module._rate_limit_call_times.clear()
         mock_time.side_effect = [0.0, 0.0, 0.0, 3602.0]
 
         class FakeClient:
@@ -107,7 +107,7 @@ def test_sync_meta_entities_fetches_ads_per_adset(monkeypatch):
 
     fake_client_holder = {}
 
-    def _fake_client_factory(access_token: str):
+    def _fake_client_factory(access_token: str, **kwargs):
         client = _FakeMetaClient(access_token)
         fake_client_holder["client"] = client
         return client
@@ -178,7 +178,7 @@ def test_sync_meta_entities_active_only_filters_non_active(monkeypatch):
 
     fake_client_holder = {}
 
-    def _fake_client_factory(access_token: str):
+    def _fake_client_factory(access_token: str, **kwargs):
         client = _FakeMetaClientActiveOnly(access_token)
         fake_client_holder["client"] = client
         return client
@@ -43,7 +43,7 @@ from datetime import datetime, timedelta, date, timezone
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from arq import cron
+from arq import Retry, cron
 from arq.connections import RedisSettings
 
 from app.database import SessionLocal
@@ -107,6 +107,8 @@ async def process_sync_job(
 
     WHAT:
         Syncs entities and metrics for one connection to MetricSnapshot table.
+        When the Meta account's rate limit budget is used up, the job is
+        re-enqueued (arq Retry) for when a slot frees up, instead of sleeping.
 
     WHY:
         Individual connection jobs allow parallel processing across connections.
@@ -190,7 +192,18 @@ async def process_sync_job(
                 "inserted": result.inserted,
                 "updated": result.updated,
                 "skipped": result.skipped,
+                "batches": result.batches,
             }
+        elif result.retry_after is not None:
+            # Account budget used up: the service marked the connection
+            # rate_limited; run this job again once a slot frees up
+            if ctx.get("job_try", 1) < WorkerSettings.max_tries:
+                logger.info(
+                    "[ARQ] Rate limited, rescheduling sync for %s in %.0fs",
+                    connection_id, result.retry_after,
+                )
+                raise Retry(defer=result.retry_after + 1)
+            return {"success": False, "rate_limited": True, "errors": result.errors}
         else:
             connection.sync_status = "error"
             connection.last_sync_error = "; ".join(result.errors[:3])
@@ -199,6 +212,8 @@ async def process_sync_job(
             logger.error("[ARQ] Sync failed for %s: %s", connection_id, result.errors)
             return {"success": False, "errors": result.errors}
 
+    except Retry:
+        raise
     except Exception as e:
         logger.exception("[ARQ] Sync job failed for %s: %s", connection_id, e)
         capture_exception(e, extra={
@@ -437,7 +452,7 @@ async def scheduled_attribution_sync(ctx: Dict) -> Dict:
         db.close()
 
 
-async def scheduled_compaction(ctx: Dict) -> Dict:
+async def scheduled_compaction(ctx: Dict, target_date: Optional[str] = None) -> Dict:
     """Scheduled job: compact 15-min snapshots to hourly for day-2.
 
     WHAT:
@@ -445,35 +460,34 @@ async def scheduled_compaction(ctx: Dict) -> Dict:
         Deletes the original 15-min rows to save storage.
 
     WHEN:
-        Daily at 01:00 UTC.
+        Daily at 01:00 UTC. Can be enqueued manually with target_date
+        (YYYY-MM-DD) to resume a day whose run failed part-way.
 
     WHY:
         - Storage efficiency: 24 rows/day instead of 96 rows/day
         - Historical data doesn't need 15-min granularity
-        - Atomic operation prevents data loss
+        - Per-workspace batches keep transactions short; committed batches
+          are never redone, so re-running a day resumes it
     """
     logger.info("[ARQ] Starting scheduled compaction")
 
     db = SessionLocal()
     try:
-        from app.services.snapshot_sync_service import compact_snapshots_to_hourly
+        from app.services.snapshot_compaction_service import compact_snapshots_for_date
 
-        # Compact data from 2 days ago
-        target_date = date.today() - timedelta(days=2)
+        # Compact data from 2 days ago (unless a specific day was requested)
+        day = date.fromisoformat(target_date) if target_date else date.today() - timedelta(days=2)
 
-        hourly_count = await asyncio.to_thread(
-            compact_snapshots_to_hourly, db, target_date
-        )
+        report = await asyncio.to_thread(compact_snapshots_for_date, db, day)
 
         logger.info(
-            "[ARQ] Compaction complete: date=%s, hourly_snapshots=%d",
-            target_date, hourly_count
+            "[ARQ] Compaction complete: date=%s, rows_in=%d, rows_out=%d, duration=%.1fs",
+            day, report.rows_in, report.rows_out, report.duration_seconds
         )
 
-        return {
-            "target_date": str(target_date),
-            "hourly_snapshots": hourly_count,
-        }
+        result = report.as_dict()
+        result["hourly_snapshots"] = report.rows_out
+        return result
 
     except Exception as e:
         logger.exception("[ARQ] Compaction failed: %s", e)
@@ -483,6 +497,35 @@ async def scheduled_compaction(ctx: Dict) -> Dict:
         db.close()
 
 
+async def scheduled_snapshot_partitions(ctx: Dict) -> Dict:
+    """Scheduled job: create upcoming monthly metric_snapshots partitions.
+
+    WHAT:
+        Ensures partitions exist for the current month and the next
+        SNAPSHOT_PARTITION_MONTHS_AHEAD months. Idempotent, takes milliseconds.
+
+    WHEN:
+        Daily at 00:30 UTC.
+
+    WHY:
+        Rows without a matching partition land in the default partition,
+        which makes every later partition creation scan and lock it.
+    """
+    db = SessionLocal()
+    try:
+        from app.services.snapshot_partition_service import ensure_snapshot_partitions
+
+        created = await asyncio.to_thread(ensure_snapshot_partitions, db)
+        return {"created": created}
+
+    except Exception as e:
+        logger.exception("[ARQ] Snapshot partition maintenance failed: %s", e)
+        capture_exception(e, extra={"operation": "scheduled_snapshot_partitions"})
+        return {"error": str(e)}
+    finally:
+        db.close()
+
+
 # =============================================================================
 # AGENT EVALUATION (Autonomous monitoring)
 # =============================================================================
@@ -545,6 +588,10 @@ async def scheduled_agent_check(ctx: Dict) -> Dict:
 
 # --- Heavy worker functions (run in worker, do the actual work) ---
 
+# Agents evaluated at once per cycle (thread pool, one DB session each).
+# Keep below the DB pool size (app/database.py); 1 = sequential.
+AGENT_EVALUATION_CONCURRENCY = int(os.getenv("AGENT_EVALUATION_CONCURRENCY", "5"))
+
 async def worker_agent_evaluation(ctx: Dict) -> Dict:
     """Worker job: evaluate all active realtime agents.
 
@@ -555,19 +602,24 @@ async def worker_agent_evaluation(ctx: Dict) -> Dict:
     WHY:
         Runs in the worker (not scheduler) to avoid blocking cron jobs.
         Agents need fresh data to evaluate accurately.
+        Agents fan out over AGENT_EVALUATION_CONCURRENCY threads so the cycle
+        fits in its 15-minute slot.
 
     REFERENCES:
         - Agent System Implementation Plan
         - backend/app/services/agents/evaluation_engine.py
     """
-    logger.info("[ARQ] Starting agent evaluation (worker)")
+    logger.info(
+        "[ARQ] Starting agent evaluation (worker, concurrency=%d)",
+        AGENT_EVALUATION_CONCURRENCY,
+    )
 
     db = SessionLocal()
     try:
         from app.services.agents.evaluation_engine import AgentEvaluationEngine
 
-        engine = AgentEvaluationEngine(db)
-        results = await engine.evaluate_all_agents()
+        engine = AgentEvaluationEngine(db, session_factory=SessionLocal)
+        results = await engine.evaluate_all_agents(concurrency=AGENT_EVALUATION_CONCURRENCY)
 
         logger.info(
             "[ARQ] Agent evaluation complete: agents=%d, entities=%d, triggers=%d, errors=%d",
@@ -609,8 +661,8 @@ async def worker_agent_check(ctx: Dict) -> Dict:
     try:
         from app.services.agents.evaluation_engine import AgentEvaluationEngine
 
-        engine = AgentEvaluationEngine(db)
-        results = await engine.evaluate_scheduled_agents()
+        engine = AgentEvaluationEngine(db, session_factory=SessionLocal)
+        results = await engine.evaluate_scheduled_agents(concurrency=AGENT_EVALUATION_CONCURRENCY)
 
         if results.get("agents_evaluated", 0) > 0:
             logger.info(
@@ -763,6 +815,7 @@ class WorkerSettings:
         worker_realtime_sync_dispatch,
         scheduled_attribution_sync,
         scheduled_compaction,
+        scheduled_snapshot_partitions,
         worker_agent_evaluation,
         worker_agent_check,
     ]
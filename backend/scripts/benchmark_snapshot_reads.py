@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Benchmark for latest-snapshot-per-day read paths.
+
+WHAT:
+    Seeds a synthetic workspace (campaigns > ads, 15-min cumulative
+    snapshots generated with seed_mock's metric generator), then times the
+    read paths that select the latest snapshot per entity per metrics_date:
+
+    - entity_performance._base_query (campaign and ad level)
+    - entity_performance._fetch_trend (ad sparklines)
+    - dashboard._get_provider_totals / _get_top_campaigns
+    - UnifiedMetricService.get_summary (raw snapshots, no rollups)
+
+    Each path runs --iterations times per phase and p50/p95 are reported.
+    Phases: "before" drops idx_snapshots_entity_day_latest, "after" creates
+    it (same DDL as migration 20261016_000005), both ANALYZE first.
+
+WHY:
+    Index changes on metric_snapshots should come with numbers. A fixed
+    --seed makes runs reproducible across machines and branches.
+
+USAGE:
+    # Default scale: 20 campaigns x 10 ads, 30 days, 96 snapshots/day
+    python scripts/benchmark_snapshot_reads.py
+
+    # Larger workspace, keep the data for EXPLAIN ANALYZE afterwards
+    python scripts/benchmark_snapshot_reads.py --campaigns 50 --ads-per-campaign 20 \\
+        --days 60 --keep
+
+    # Only measure the current schema, write results as JSON
+    python scripts/benchmark_snapshot_reads.py --phases current --json out.json
+
+NOTE:
+    Needs Postgres (DISTINCT ON). The "before" phase drops the index on
+    the target database; never point this at production.
+
+REFERENCES:
+    - alembic/versions/20261016_000005_snapshot_latest_per_day_index.py
+    - app/seed_mock.py (generate_random_metrics, generate_hourly_curve)
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "idx_snapshots_entity_day_latest"
+
+# Keep in sync with alembic/versions/20261016_000005_snapshot_latest_per_day_index.py
+CREATE_INDEX_SQL = f"""
+    CREATE INDEX IF NOT EXISTS {INDEX_NAME}
+    ON metric_snapshots (entity_id, metrics_date, captured_at DESC)
+    INCLUDE (provider, spend, revenue, clicks, impressions, conversions, leads, purchases, currency)
+"""
+DROP_INDEX_SQL = f"DROP INDEX IF EXISTS {INDEX_NAME}"
+
+SNAPSHOT_INSERT_CHUNK = 5000
+
+
+# =============================================================================
+# SEEDING
+# =============================================================================
+
+def seed_workspace(db, args) -> Dict:
+    """Create the synthetic workspace and its snapshots. Returns ids for the readers."""
+    from sqlalchemy import insert
+
+    from app import models
+    from app.seed_mock import generate_hourly_curve, generate_random_metrics
+
+    rng_state = random.getstate()
+    random.seed(args.seed)
+
+    workspace = models.Workspace(id=uuid.uuid4(), name=f"Snapshot benchmark {args.seed}")
+    db.add(workspace)
+    db.flush()
+
+    connections = []
+    for provider in (models.ProviderEnum.meta, models.ProviderEnum.google):
+        connection = models.Connection(
+            workspace_id=workspace.id,
+            provider=provider,
+            external_account_id=f"bench-{provider.value}-{uuid.uuid4().hex[:8]}",
+            name=f"Benchmark {provider.value}",
+            status="active",
+        )
+        db.add(connection)
+        connections.append(connection)
+    db.flush()
+
+    campaigns, ads = [], []
+    for c in range(args.campaigns):
+        connection = connections[c % len(connections)]
+        campaign = models.Entity(
+            workspace_id=workspace.id,
+            connection_id=connection.id,
+            level=models.LevelEnum.campaign,
+            external_id=f"bench-c{c}",
+            name=f"Campaign {c}",
+            status="active",
+        )
+        db.add(campaign)
+        db.flush()
+        campaigns.append((campaign, connection.provider.value))
+
+        for a in range(args.ads_per_campaign):
+            ad = models.Entity(
+                workspace_id=workspace.id,
+                connection_id=connection.id,
+                level=models.LevelEnum.ad,
+                external_id=f"bench-c{c}-a{a}",
+                name=f"Ad {c}.{a}",
+                status="active",
+                parent_id=campaign.id,
+            )
+            db.add(ad)
+            ads.append((ad, connection.provider.value))
+    db.flush()
+
+    today = datetime.now(timezone.utc).date()
+    interval = timedelta(minutes=24 * 60 // args.snapshots_per_day)
+    rows: List[Dict] = []
+    total = 0
+
+    for entity, provider in campaigns + ads:
+        for day_offset in range(args.days):
+            metrics_date = today - timedelta(days=day_offset)
+            day_start = datetime.combine(metrics_date, datetime.min.time(), tzinfo=timezone.utc)
+            totals = {"spend": 0.0, "impressions": 0, "clicks": 0, "conversions": 0.0, "revenue": 0.0}
+
+            for slot in range(args.snapshots_per_day):
+                captured_at = day_start + interval * slot
+                if captured_at > datetime.now(timezone.utc):
+                    break
+
+                # Cumulative values, like the 15-min sync writes them
+                step = generate_random_metrics("purchases", provider, is_hourly=True)
+                weight = generate_hourly_curve(captured_at.hour) / 4
+                for key in totals:
+                    totals[key] += step[key] * weight
+
+                rows.append({
+                    "entity_id": entity.id,
+                    "provider": provider,
+                    "captured_at": captured_at,
+                    "metrics_date": metrics_date,
+                    "spend": round(totals["spend"], 2),
+                    "impressions": int(totals["impressions"]),
+                    "clicks": int(totals["clicks"]),
+                    "conversions": round(totals["conversions"], 2),
+                    "revenue": round(totals["revenue"], 2),
+                    "currency": "USD",
+                })
+
+                if len(rows) >= SNAPSHOT_INSERT_CHUNK:
+                    db.execute(insert(models.MetricSnapshot), rows)
+                    total += len(rows)
+                    rows = []
+
+    if rows:
+        db.execute(insert(models.MetricSnapshot), rows)
+        total += len(rows)
+    db.commit()
+    random.setstate(rng_state)
+
+    logger.info(
+        "Seeded workspace %s: %d campaigns, %d ads, %d snapshots",
+        workspace.id, len(campaigns), len(ads), total,
+    )
+    return {
+        "workspace_id": workspace.id,
+        "ad_ids": [ad.id for ad, _ in ads],
+        "start": today - timedelta(days=args.days - 1),
+        "end": today,
+        "snapshots": total,
+    }
+
+
+def drop_workspace(db, workspace_id) -> None:
+    from sqlalchemy import text
+
+    params = {"workspace_id": workspace_id}
+    db.execute(text("""
+        DELETE FROM metric_snapshots
+        WHERE entity_id IN (SELECT id FROM entities WHERE workspace_id = :workspace_id)
+    """), params)
+    db.execute(text("DELETE FROM entities WHERE workspace_id = :workspace_id AND parent_id IS NOT NULL"), params)
+    db.execute(text("DELETE FROM entities WHERE workspace_id = :workspace_id"), params)
+    db.execute(text("DELETE FROM connections WHERE workspace_id = :workspace_id"), params)
+    db.execute(text("DELETE FROM workspaces WHERE id = :workspace_id"), params)
+    db.commit()
+    logger.info("Removed benchmark workspace %s", workspace_id)
+
+
+# =============================================================================
+# READ PATHS
+# =============================================================================
+
+def build_read_paths(db, seeded) -> Dict[str, Callable[[], object]]:
+    """Read paths under test, bound to the seeded workspace."""
+    from app import models
+    from app.dsl.schema import TimeRange
+    from app.routers import dashboard, entity_performance
+    from app.services.unified_metric_service import MetricFilters, UnifiedMetricService
+
+    workspace_id = seeded["workspace_id"]
+    start, end = seeded["start"], seeded["end"]
+    start_dt = datetime.combine(start, datetime.min.time(), tzinfo=timezone.utc)
+    end_dt = datetime.combine(end, datetime.max.time(), tzinfo=timezone.utc)
+    trend_ids = seeded["ad_ids"][:50]
+
+    def base_query(level):
+        return lambda: entity_performance._base_query(
+            db, str(workspace_id), level, start, end, None, None, None
+        )
+
+    return {
+        "entity_performance.base_query[campaign]": base_query(models.LevelEnum.campaign),
+        "entity_performance.base_query[ad]": base_query(models.LevelEnum.ad),
+        "entity_performance.fetch_trend[ad]": lambda: entity_performance._fetch_trend(
+            db, trend_ids, "spend", start, end, models.LevelEnum.ad
+        ),
+        "dashboard.provider_totals": lambda: dashboard._get_provider_totals(
+            db, workspace_id, start_dt, end_dt, None
+        ),
+        "dashboard.top_campaigns": lambda: dashboard._get_top_campaigns(db, workspace_id),
+        "unified_metric_service.get_summary": lambda: UnifiedMetricService(
+            db, use_rollups=False
+        ).get_summary(
+            str(workspace_id),
+            ["spend", "revenue", "roas"],
+            TimeRange(start=start, end=end),
+            MetricFilters(),
+        ),
+    }
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def index_exists(db) -> bool:
+    from sqlalchemy import text
+
+    return db.execute(
+        text("SELECT 1 FROM pg_indexes WHERE indexname = :name"), {"name": INDEX_NAME}
+    ).first() is not None
+
+
+def run_phase(db, name: str, paths: Dict[str, Callable], iterations: int, warmup: int) -> Dict:
+    from sqlalchemy import text
+
+    if name == "before":
+        db.execute(text(DROP_INDEX_SQL))
+    elif name == "after":
+        db.execute(text(CREATE_INDEX_SQL))
+    db.execute(text("ANALYZE metric_snapshots"))
+    db.commit()
+
+    results = {}
+    for label, read in paths.items():
+        for _ in range(warmup):
+            read()
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            read()
+            samples.append((time.perf_counter() - started) * 1000)
+        db.rollback()  # release snapshots between paths
+        results[label] = {
+            "p50_ms": round(percentile(samples, 0.50), 2),
+            "p95_ms": round(percentile(samples, 0.95), 2),
+        }
+        logger.info("[%s] %-42s p50=%8.2fms p95=%8.2fms", name, label,
+                    results[label]["p50_ms"], results[label]["p95_ms"])
+    return results
+
+
+def print_report(report: Dict) -> None:
+    phases = list(report["phases"])
+    header = f"{'read path':<42}" + "".join(f"{p + ' p50':>14}{p + ' p95':>14}" for p in phases)
+    print()
+    print(header)
+    print("-" * len(header))
+    for label in report["phases"][phases[0]]:
+        line = f"{label:<42}"
+        for phase in phases:
+            stats = report["phases"][phase][label]
+            line += f"{stats['p50_ms']:>14.2f}{stats['p95_ms']:>14.2f}"
+        print(line)
+    print()
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark latest-snapshot-per-day reads")
+    parser.add_argument("--campaigns", type=int, default=20, help="Campaigns to seed")
+    parser.add_argument("--ads-per-campaign", type=int, default=10, help="Ads per campaign")
+    parser.add_argument("--days", type=int, default=30, help="Days of history")
+    parser.add_argument("--snapshots-per-day", type=int, default=96, help="Snapshots per entity per day (96 = every 15 min)")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs per read path and phase")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed runs before measuring")
+    parser.add_argument("--phases", default="before,after", help="Comma-separated: before, after, current")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic data")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded workspace")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    phases = [p.strip() for p in args.phases.split(",") if p.strip()]
+    if not set(phases) <= {"before", "after", "current"}:
+        parser.error("--phases accepts before, after, current")
+
+    from app.database import get_sync_session
+
+    with get_sync_session() as db:
+        if db.get_bind().dialect.name != "postgresql":
+            logger.error("The benchmark needs Postgres (DISTINCT ON read paths)")
+            return 2
+
+        had_index = index_exists(db)
+        seeded = seed_workspace(db, args)
+        try:
+            paths = build_read_paths(db, seeded)
+            report = {
+                "scale": {
+                    "campaigns": args.campaigns,
+                    "ads_per_campaign": args.ads_per_campaign,
+                    "days": args.days,
+                    "snapshots_per_day": args.snapshots_per_day,
+                    "snapshots": seeded["snapshots"],
+                    "seed": args.seed,
+                },
+                "iterations": args.iterations,
+                "phases": {
+                    phase: run_phase(db, phase, paths, args.iterations, args.warmup)
+                    for phase in phases
+                },
+            }
+        finally:
+            # Leave the index as we found it
+            from sqlalchemy import text
+            db.rollback()
+            db.execute(text(CREATE_INDEX_SQL if had_index else DROP_INDEX_SQL))
+            db.commit()
+            if not args.keep:
+                drop_workspace(db, seeded["workspace_id"])
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(report, fh, indent=2)
+        logger.info("Results written to %s", args.json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
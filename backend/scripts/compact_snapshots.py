@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Snapshot compaction script.
+
+WHAT:
+    Compacts one UTC day of 15-min metric_snapshots to hourly rows, or
+    estimates the savings without writing (--dry-run). Re-running a day
+    resumes it: batches that already committed have nothing left to do.
+
+USAGE:
+    # Estimate rows/bytes saved for a day
+    python scripts/compact_snapshots.py --date 2026-01-05 --dry-run
+
+    # Compact a day (e.g. resume after a failed scheduled run)
+    python scripts/compact_snapshots.py --date 2026-01-05 --batch-size 200
+
+REFERENCES:
+    - backend/app/services/snapshot_compaction_service.py
+    - backend/app/workers/arq_worker.py (scheduled_compaction)
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import date
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compact 15-min metric snapshots to hourly")
+    parser.add_argument("--date", type=date.fromisoformat, required=True, help="UTC date to compact (YYYY-MM-DD)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Entities per batch")
+    parser.add_argument("--dry-run", action="store_true", help="Estimate savings without writing")
+    args = parser.parse_args()
+
+    from app.database import get_sync_session
+    from app.services.snapshot_compaction_service import compact_snapshots_for_date
+
+    with get_sync_session() as db:
+        report = compact_snapshots_for_date(
+            db, args.date, batch_size=args.batch_size, dry_run=args.dry_run
+        )
+
+    for key, value in report.as_dict().items():
+        logger.info("  %s: %s", key, value)
+
+    return 1 if report.failed_batches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
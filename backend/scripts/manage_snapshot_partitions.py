@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+metric_snapshots partition maintenance script.
+
+WHAT:
+    Lists, creates and detaches the monthly partitions of metric_snapshots.
+    Detached partitions move to the archive schema (and optionally a cheap
+    tablespace); they can be re-attached with ALTER TABLE ... ATTACH PARTITION.
+
+USAGE:
+    # List attached partitions and their sizes
+    python scripts/manage_snapshot_partitions.py list
+
+    # Create partitions through 6 months ahead
+    python scripts/manage_snapshot_partitions.py ensure --months-ahead 6
+
+    # Archive January 2025 onto a cheap tablespace
+    python scripts/manage_snapshot_partitions.py detach --month 2025-01 --tablespace cold_storage
+
+REFERENCES:
+    - backend/app/services/snapshot_partition_service.py
+    - backend/alembic/versions/20261016_000003_partition_metric_snapshots.py
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import date
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _month(value: str) -> date:
+    return date.fromisoformat(f"{value}-01")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Maintain metric_snapshots partitions")
+    subparsers = parser.add_subparsers(dest="command", help="Command")
+
+    subparsers.add_parser("list", help="List attached partitions")
+
+    ensure_parser = subparsers.add_parser("ensure", help="Create upcoming partitions")
+    ensure_parser.add_argument("--months-ahead", type=int, default=None, help="Months after the current one")
+
+    detach_parser = subparsers.add_parser("detach", help="Detach and archive one month")
+    detach_parser.add_argument("--month", type=_month, required=True, help="Month to detach (YYYY-MM)")
+    detach_parser.add_argument("--schema", default=None, help="Archive schema (default: SNAPSHOT_ARCHIVE_SCHEMA)")
+    detach_parser.add_argument("--tablespace", default=None, help="Move the archived table to this tablespace")
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return 2
+
+    from app.database import get_sync_session
+    from app.services import snapshot_partition_service as partitions
+
+    with get_sync_session() as db:
+        if args.command == "list":
+            for partition in partitions.list_snapshot_partitions(db):
+                logger.info("  %s  %s  %.1f MB", partition.name, partition.month, partition.total_bytes / 1e6)
+            return 0
+
+        if args.command == "ensure":
+            months_ahead = args.months_ahead
+            if months_ahead is None:
+                months_ahead = partitions.SNAPSHOT_PARTITION_MONTHS_AHEAD
+            created = partitions.ensure_snapshot_partitions(db, months_ahead=months_ahead)
+            logger.info("Created %d partitions: %s", len(created), created)
+            return 0
+
+        try:
+            archived = partitions.detach_snapshot_partition(
+                db,
+                args.month,
+                archive_schema=args.schema or partitions.SNAPSHOT_ARCHIVE_SCHEMA,
+                tablespace=args.tablespace,
+            )
+        except ValueError as e:
+            logger.error("%s", e)
+            return 1
+        logger.info("Archived to %s", archived)
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
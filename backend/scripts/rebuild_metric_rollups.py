@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Metric Daily Rollup maintenance script.
+
+WHAT:
+    Backfills/rebuilds metric_daily_rollups from metric_snapshots and checks
+    that the incrementally maintained rollups still match the raw snapshots.
+
+USAGE:
+    # Rebuild everything (initial backfill)
+    python scripts/rebuild_metric_rollups.py rebuild
+
+    # Rebuild one workspace for a date range
+    python scripts/rebuild_metric_rollups.py rebuild --workspace-id <uuid> \\
+        --start 2026-01-01 --end 2026-01-31
+
+    # Check consistency (exit code 1 when drift is found)
+    python scripts/rebuild_metric_rollups.py check --workspace-id <uuid>
+
+    # Check and repair the checked scope if drift is found
+    python scripts/rebuild_metric_rollups.py check --repair
+
+REFERENCES:
+    - backend/app/services/metric_rollup_service.py
+    - backend/app/models.py:MetricDailyRollup
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import date
+from uuid import UUID
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _add_scope_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--workspace-id", type=UUID, default=None, help="Workspace UUID (default: all)")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="First metrics_date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="Last metrics_date (YYYY-MM-DD)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Maintain metric_daily_rollups")
+    subparsers = parser.add_subparsers(dest="command", help="Command")
+
+    rebuild_parser = subparsers.add_parser("rebuild", help="Rebuild rollups from raw snapshots")
+    _add_scope_args(rebuild_parser)
+
+    check_parser = subparsers.add_parser("check", help="Compare rollups against raw snapshots")
+    _add_scope_args(check_parser)
+    check_parser.add_argument("--repair", action="store_true", help="Rebuild the scope if drift is found")
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return 2
+
+    from app.database import get_sync_session
+    from app.services.metric_rollup_service import (
+        check_rollup_consistency,
+        rebuild_daily_rollups,
+    )
+
+    with get_sync_session() as db:
+        if args.command == "rebuild":
+            counts = rebuild_daily_rollups(db, args.workspace_id, args.start, args.end)
+            logger.info("Rebuild complete: %s", counts)
+            return 0
+
+        report = check_rollup_consistency(db, args.workspace_id, args.start, args.end)
+        logger.info(
+            "Checked %d keys: missing=%d, orphaned=%d, mismatched=%d",
+            report.checked, report.missing, report.orphaned, report.mismatched,
+        )
+        for sample in report.samples:
+            logger.info("  %s", sample)
+
+        if report.consistent:
+            return 0
+
+        if args.repair:
+            counts = rebuild_daily_rollups(db, args.workspace_id, args.start, args.end)
+            logger.info("Repair complete: %s", counts)
+            return 0
+
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
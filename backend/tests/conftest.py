@@ -13,6 +13,7 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
 from cryptography.fernet import Fernet
 
 # Make sure the backend package (containing `app/`) is importable.
@@ -23,3 +24,16 @@ if str(BACKEND_ROOT) not in sys.path:
 # Ensure JWT + token encryption secrets exist for the test process.
 os.environ.setdefault("JWT_SECRET", "test-jwt-secret")
 os.environ.setdefault("TOKEN_ENCRYPTION_KEY", Fernet.generate_key().decode())
+
+# Keep API rate limit windows in process memory (never a real Redis).
+os.environ.setdefault("RATE_LIMIT_BACKEND", "memory")
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_backend(monkeypatch):
+    """Fresh in-memory rate limit backend per test (no windows left over)."""
+    from app.services import rate_limit_backend as module
+
+    backend = module.InMemoryRateLimitBackend()
+    monkeypatch.setattr(module, "_backend", backend)
+    return backend
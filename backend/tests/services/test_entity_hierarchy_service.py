@@ -0,0 +1,112 @@
+"""
+Unit tests for the entity_ancestors closure table maintenance and readers.
+
+Tests:
+- sync_entity_ancestors no-op detection and re-link writes
+- Hierarchy readers use indexed closure-table joins (no recursive CTE)
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.dsl.hierarchy import adset_ancestors, campaign_ancestors
+from app.models import LevelEnum
+from app.services.entity_hierarchy_service import sync_entity_ancestors
+
+
+def _db_with_closure_rows(rows):
+    db = Mock(spec=Session)
+    db.query.return_value.filter.return_value.filter.return_value.all.return_value = rows
+    return db
+
+
+def _row(ancestor_id, level, depth):
+    return SimpleNamespace(ancestor_id=ancestor_id, ancestor_level=level, depth=depth)
+
+
+class TestSyncEntityAncestors:
+    """Test incremental closure maintenance on entity upsert."""
+
+    def test_unchanged_entity_is_a_noop(self):
+        entity_id, parent_id = uuid.uuid4(), uuid.uuid4()
+        db = _db_with_closure_rows([
+            _row(entity_id, LevelEnum.ad, 0),
+            _row(parent_id, LevelEnum.adset, 1),
+        ])
+
+        wrote = sync_entity_ancestors(db, entity_id, parent_id, LevelEnum.ad, uuid.uuid4())
+
+        assert wrote is False
+        db.execute.assert_not_called()
+
+    def test_new_entity_is_linked(self):
+        db = _db_with_closure_rows([])
+
+        wrote = sync_entity_ancestors(
+            db, uuid.uuid4(), uuid.uuid4(), LevelEnum.ad, uuid.uuid4()
+        )
+
+        assert wrote is True
+        assert db.execute.call_count == 2  # detach subtree, attach subtree
+
+    def test_reparented_entity_is_relinked(self):
+        entity_id = uuid.uuid4()
+        db = _db_with_closure_rows([
+            _row(entity_id, LevelEnum.adset, 0),
+            _row(uuid.uuid4(), LevelEnum.campaign, 1),
+        ])
+
+        wrote = sync_entity_ancestors(
+            db, entity_id, uuid.uuid4(), LevelEnum.adset, uuid.uuid4()
+        )
+
+        assert wrote is True
+
+    def test_level_change_is_relinked(self):
+        entity_id = uuid.uuid4()
+        db = _db_with_closure_rows([_row(entity_id, LevelEnum.adset, 0)])
+
+        wrote = sync_entity_ancestors(
+            db, entity_id, None, LevelEnum.asset_group, uuid.uuid4()
+        )
+
+        assert wrote is True
+
+
+class TestHierarchyReaders:
+    """Test the closure-table backed ancestor maps."""
+
+    def test_campaign_map_is_workspace_scoped_closure_join(self):
+        subquery = campaign_ancestors(Session(), "00000000-0000-0000-0000-000000000001")
+        sql = str(subquery.select().compile(dialect=postgresql.dialect()))
+
+        assert "FROM entity_ancestors JOIN entities" in sql
+        assert "entity_ancestors.workspace_id =" in sql
+        assert "RECURSIVE" not in sql
+        assert {"leaf_id", "ancestor_id", "ancestor_name"} <= set(subquery.c.keys())
+
+    def test_adset_map_filters_on_ancestor_level(self):
+        sql = str(adset_ancestors(Session()).select().compile(dialect=postgresql.dialect()))
+
+        assert "entity_ancestors.ancestor_level =" in sql
+        assert "entity_ancestors.workspace_id" not in sql
+
+
+class TestPlaceholderEntities:
+    """Entities created outside the sync services get closure rows too."""
+
+    def test_ingest_placeholder_is_linked(self):
+        from app.routers import ingest
+
+        workspace_id = uuid.uuid4()
+        db = Mock(spec=Session)
+        db.query.return_value.filter.return_value.first.return_value = None
+
+        with patch.object(ingest, "sync_entity_ancestors") as sync:
+            entity = ingest._get_or_create_entity(db, workspace_id, "meta", "123", "ad")
+
+        sync.assert_called_once_with(db, entity.id, None, "ad", workspace_id)
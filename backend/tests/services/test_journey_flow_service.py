@@ -0,0 +1,198 @@
+"""
+Unit tests for journey flow (Sankey) aggregation.
+
+Tests:
+- Streaming walk de-duplicates stages and links source -> stages -> outcome
+- Source falls back to the first touchpoint when the journey has none
+- Pre-aggregated SQL rows fold into the same nodes/links as the walk
+- The Postgres statement matches the walk on the same data (needs
+  TEST_POSTGRES_URL, skipped otherwise)
+"""
+
+import os
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, CustomerJourney, JourneyTouchpoint, Workspace
+from app.services.journey_flow_service import (
+    _aggregate_from_rows,
+    _aggregate_in_sql,
+    _aggregate_streaming,
+    aggregate_journey_flow,
+    classify_source,
+)
+
+
+WORKSPACE_ID = uuid.uuid4()
+NOW = datetime(2026, 10, 16, 12, 0)
+
+# Postgres for the SQL path, e.g. postgresql://localhost/metricx_test
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    tables = [CustomerJourney.__table__, JourneyTouchpoint.__table__]
+    CustomerJourney.metadata.create_all(engine, tables=tables)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def pg_db():
+    """Session on a throwaway schema of TEST_POSTGRES_URL."""
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL not set")
+
+    schema = f"test_journey_flow_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(TEST_POSTGRES_URL)
+    with admin.begin() as conn:
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+
+    engine = create_engine(TEST_POSTGRES_URL, connect_args={"options": f"-csearch_path={schema}"})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Workspace(id=WORKSPACE_ID, name="Test"))
+    session.commit()
+    yield session
+
+    session.close()
+    engine.dispose()
+    with admin.begin() as conn:
+        conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+    admin.dispose()
+
+
+def _journey(db, source=None, medium=None, orders=0, revenue=0, events=(), utm=(None, None)):
+    journey = CustomerJourney(
+        workspace_id=WORKSPACE_ID,
+        visitor_id=str(uuid.uuid4()),
+        first_touch_source=source,
+        first_touch_medium=medium,
+        first_seen_at=NOW - timedelta(days=1),
+        last_seen_at=NOW,
+        total_orders=orders,
+        total_revenue=Decimal(revenue),
+    )
+    db.add(journey)
+    db.flush()
+    for minute, event_type in enumerate(events):
+        db.add(JourneyTouchpoint(
+            journey_id=journey.id,
+            event_type=event_type,
+            utm_source=utm[0],
+            utm_medium=utm[1],
+            touched_at=NOW - timedelta(hours=12) + timedelta(minutes=minute),
+        ))
+    db.commit()
+    return journey
+
+
+def _flow(db):
+    return aggregate_journey_flow(db, WORKSPACE_ID, NOW - timedelta(days=30))
+
+
+class TestStreamingAggregation:
+    """Test the per-journey walk used outside Postgres."""
+
+    def test_stages_are_deduplicated_and_linked(self, db):
+        _journey(
+            db, source="facebook", orders=1, revenue=100,
+            events=["page_viewed", "page_viewed", "product_added_to_cart",
+                    "page_viewed", "checkout_completed"],
+        )
+
+        flow = _flow(db)
+
+        assert flow.total_journeys == 1
+        assert flow.total_revenue == 100
+        assert flow.node_counts["stage_page_view"]["count"] == 1
+        assert set(flow.link_counts) == {
+            ("source_meta", "stage_page_view"),
+            ("stage_page_view", "stage_atc"),
+            ("stage_atc", "stage_purchase"),
+            ("stage_purchase", "outcome_purchased"),
+        }
+
+    def test_journey_without_touchpoints_links_source_to_outcome(self, db):
+        _journey(db, source="google", medium="cpc")
+        _journey(db, source="google", medium="cpc", events=["unmapped_event"])
+
+        flow = _flow(db)
+
+        assert flow.link_counts == {("source_google", "outcome_dropped"): {"value": 2, "revenue": 0}}
+
+    def test_source_falls_back_to_first_touchpoint(self, db):
+        _journey(db, events=["page_viewed"], utm=("newsletter", None))
+
+        flow = _flow(db)
+
+        assert "source_email" in flow.node_counts
+
+
+class TestSqlRowFolding:
+    """Test folding of the pre-aggregated rows returned on Postgres."""
+
+    def test_rows_fold_like_the_walk(self, db):
+        _journey(db, source="facebook", orders=1, revenue=100,
+                 events=["page_viewed", "product_added_to_cart"])
+        _journey(db, source="fb", revenue=0, events=["page_viewed"])
+        _journey(db, source="direct")
+        expected = _flow(db)
+
+        rows = [
+            ("source_link", "facebook", "", "stage_page_view", 1, Decimal("100")),
+            ("source_link", "fb", "", "stage_page_view", 1, Decimal("0")),
+            ("source_link", "direct", "", "outcome_dropped", 1, Decimal("0")),
+            ("stage_link", "stage_page_view", "stage_atc", None, 1, Decimal("100")),
+            ("stage", "stage_page_view", None, None, 2, Decimal("100")),
+            ("stage", "stage_atc", None, None, 1, Decimal("100")),
+            ("exit_link", "stage_atc", "outcome_purchased", None, 1, Decimal("100")),
+            ("exit_link", "stage_page_view", "outcome_dropped", None, 1, Decimal("0")),
+            ("outcome", "outcome_purchased", None, None, 1, Decimal("100")),
+            ("outcome", "outcome_dropped", None, None, 2, Decimal("0")),
+        ]
+
+        folded = _aggregate_from_rows(rows)
+
+        assert folded.node_counts == expected.node_counts
+        assert folded.link_counts == expected.link_counts
+        assert (folded.total_journeys, folded.total_revenue) == (3, 100)
+
+
+class TestSqlMatchesStreaming:
+    """Test the Postgres statement against the walk on the same rows."""
+
+    def test_sql_path_matches_streaming_walk(self, pg_db):
+        _journey(
+            pg_db, source="facebook", orders=1, revenue=100,
+            events=["page_viewed", "page_viewed", "product_added_to_cart",
+                    "page_viewed", "checkout_completed"],
+        )
+        _journey(pg_db, source="fb", orders=2, revenue=50, events=["product_viewed", "page_viewed"])
+        _journey(pg_db, source="google", medium="cpc", events=["unmapped_event"])
+        _journey(pg_db, events=["page_viewed", "checkout_started"], utm=("newsletter", None))
+        _journey(pg_db, source="direct")
+        period_start = NOW - timedelta(days=30)
+
+        in_sql = _aggregate_in_sql(pg_db, WORKSPACE_ID, period_start)
+        streamed = _aggregate_streaming(pg_db, WORKSPACE_ID, period_start)
+
+        assert in_sql.node_counts == streamed.node_counts
+        assert in_sql.link_counts == streamed.link_counts
+        assert (in_sql.total_journeys, in_sql.total_revenue) == (5, 150)
+        assert (streamed.total_journeys, streamed.total_revenue) == (5, 150)
+
+
+def test_classify_source():
+    assert classify_source("Instagram", None) == "meta"
+    assert classify_source("bing", "cpc") == "unknown"
+    assert classify_source("", "organic") == "organic"
+    assert classify_source(None, None) == "direct"
@@ -0,0 +1,102 @@
+"""
+Unit tests for the metric daily rollup write and read paths.
+
+Tests:
+- Rollup upsert statement (latest-captured_at guard, provider-specific measures)
+- Skipping snapshots without metrics_date
+- UnifiedMetricService daily queries reading from metric_daily_rollups
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+from unittest.mock import Mock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.services.metric_rollup_service import (
+    build_rollup_upsert,
+    upsert_daily_rollup,
+)
+from app.services.unified_metric_service import UnifiedMetricService, MetricFilters
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _snapshot_data(**overrides):
+    data = {
+        "entity_id": uuid.uuid4(),
+        "provider": "meta",
+        "captured_at": datetime(2026, 1, 5, 10, 15, tzinfo=timezone.utc),
+        "metrics_date": date(2026, 1, 5),
+        "spend": 12.5,
+        "impressions": 1000,
+        "clicks": 40,
+        "currency": "USD",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestRollupUpsert:
+    """Test the incremental rollup write."""
+
+    def test_upsert_only_overwrites_with_newer_snapshot(self):
+        sql = _compile(build_rollup_upsert(_snapshot_data(), uuid.uuid4()))
+
+        assert "ON CONFLICT ON CONSTRAINT uq_metric_daily_rollups_entity_provider_date" in sql
+        assert "WHERE metric_daily_rollups.captured_at <= excluded.captured_at" in sql
+
+    def test_upsert_only_updates_measures_present_in_snapshot(self):
+        sql = _compile(build_rollup_upsert(_snapshot_data(), uuid.uuid4()))
+
+        assert "spend = excluded.spend" in sql
+        # Meta snapshots do not carry installs; never null out existing values
+        assert "installs = excluded.installs" not in sql
+
+    def test_upsert_skips_snapshot_without_metrics_date(self):
+        db = Mock(spec=Session)
+
+        wrote = upsert_daily_rollup(db, _snapshot_data(metrics_date=None), uuid.uuid4())
+
+        assert wrote is False
+        db.execute.assert_not_called()
+
+    def test_upsert_executes_in_caller_session(self):
+        db = Mock(spec=Session)
+
+        wrote = upsert_daily_rollup(db, _snapshot_data(), uuid.uuid4())
+
+        assert wrote is True
+        db.execute.assert_called_once()
+
+
+class TestRollupReadPath:
+    """Test UnifiedMetricService daily queries against the rollup table."""
+
+    def _entity_breakdown_sql(self, use_rollups: bool) -> str:
+        service = UnifiedMetricService(Session(), use_rollups=use_rollups)
+        query = service._build_entity_breakdown_query(
+            "00000000-0000-0000-0000-000000000001",
+            date(2026, 1, 1),
+            date(2026, 1, 7),
+            MetricFilters(provider="meta"),
+            "campaign",
+        )
+        query = query.order_by(service._get_order_expression("roas", service._daily_source()))
+        return _compile(query.statement)
+
+    def test_rollup_mode_reads_rollup_table_without_max_subquery(self):
+        sql = self._entity_breakdown_sql(use_rollups=True)
+
+        assert "metric_daily_rollups" in sql
+        assert "metric_snapshots" not in sql
+        assert "max(" not in sql
+
+    def test_snapshot_mode_keeps_latest_snapshot_join(self):
+        sql = self._entity_breakdown_sql(use_rollups=False)
+
+        assert "metric_daily_rollups" not in sql
+        assert "max(metric_snapshots.captured_at)" in sql
@@ -0,0 +1,235 @@
+"""
+Unit tests for batched pixel event ingestion.
+
+Tests:
+- Journey coalescing per visitor (first/last touch, touchpoint count)
+- Batch write statements (multi-row ON CONFLICT DO NOTHING, journey upsert)
+- Write-behind buffer size/time flushing and broadcast ordering
+- Failed flushes are re-queued, then written event by event
+- A failed shutdown flush is written event by event and drops are logged
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.services import pixel_event_buffer as pixel_event_buffer_module
+from app.services.pixel_event_buffer import (
+    PixelEventBuffer,
+    _coalesce_journeys,
+    write_pixel_event_batch,
+)
+
+
+WORKSPACE_ID = uuid.uuid4()
+
+
+def _event(visitor_id="v1", event_type="page_viewed", event_id=None, **fields):
+    values = {
+        "id": uuid.uuid4(),
+        "workspace_id": WORKSPACE_ID,
+        "visitor_id": visitor_id,
+        "event_id": event_id,
+        "event_type": event_type,
+        "event_data": {},
+        "utm_source": None,
+        "utm_medium": None,
+        "utm_campaign": None,
+        "created_at": datetime(2026, 1, 5, 12, 0),
+    }
+    values.update(fields)
+    return values
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestCoalesceJourneys:
+    """Test folding a batch into one journey row per visitor."""
+
+    def test_one_row_per_visitor_with_touch_attribution(self):
+        events = [
+            _event("v1", utm_source="meta", utm_campaign="spring"),
+            _event("v1", "product_viewed", utm_source="google"),
+            _event("v1", "checkout_started", utm_source="google", utm_campaign="brand"),
+            _event("v2"),
+        ]
+
+        journeys = _coalesce_journeys(events, datetime(2026, 1, 5))
+
+        assert len(journeys) == 2
+        v1 = journeys[(WORKSPACE_ID, "v1")]
+        assert v1["first_touch_source"] == "meta"
+        assert v1["touchpoint_count"] == 2  # product_viewed is not a touchpoint event
+        assert v1["last_touch_source"] == "google"
+        assert v1["last_touch_campaign"] == "brand"
+        assert journeys[(WORKSPACE_ID, "v2")]["first_touch_source"] is None
+
+    def test_checkout_token_linked_from_checkout_completed(self):
+        events = [_event("v1", "checkout_completed", event_data={"checkout_token": "tok"})]
+
+        journeys = _coalesce_journeys(events, datetime(2026, 1, 5))
+
+        assert journeys[(WORKSPACE_ID, "v1")]["checkout_token"] == "tok"
+
+
+class TestWritePixelEventBatch:
+    """Test the multi-row statements of a buffer flush."""
+
+    def test_batch_uses_multi_row_inserts_and_skips_duplicates(self):
+        events = [
+            _event("v1", event_id="e1", utm_source="meta"),
+            _event("v1", event_id="e1", utm_source="meta"),  # duplicate in batch
+            _event("v2", event_id="e2"),
+        ]
+        journey_rows = [
+            SimpleNamespace(id=uuid.uuid4(), workspace_id=WORKSPACE_ID, visitor_id="v1"),
+        ]
+        db = Mock(spec=Session)
+        # e2 already stored by an earlier request
+        db.execute.side_effect = [
+            [SimpleNamespace(id=events[0]["id"])],
+            journey_rows,
+            None,
+        ]
+
+        stored = write_pixel_event_batch(db, events)
+
+        assert stored == [events[0]]
+        event_sql, journey_sql, touchpoint_sql = (
+            _compile(call.args[0]) for call in db.execute.call_args_list
+        )
+        assert "ON CONFLICT (workspace_id, event_id) WHERE event_id IS NOT NULL DO NOTHING" in event_sql
+        assert "ON CONFLICT ON CONSTRAINT uq_journey_visitor DO UPDATE" in journey_sql
+        assert "INSERT INTO journey_touchpoints" in touchpoint_sql
+        db.commit.assert_called_once()
+
+    def test_all_duplicates_skip_journey_writes(self):
+        db = Mock(spec=Session)
+        db.execute.return_value = []
+
+        stored = write_pixel_event_batch(db, [_event(event_id="e1")])
+
+        assert stored == []
+        db.execute.assert_called_once()
+        db.commit.assert_called_once()
+
+
+class TestPixelEventBuffer:
+    """Test size/time flushing and broadcast ordering."""
+
+    def _buffer(self, written, broadcasts, **kwargs):
+        buffer = PixelEventBuffer(
+            session_factory=lambda: Mock(spec=Session),
+            broadcast=lambda ws, payload: _record(broadcasts, payload),
+            **kwargs,
+        )
+        buffer._write = lambda batch: written.append(batch) or batch
+        return buffer
+
+    def test_flushes_when_size_threshold_reached(self):
+        written, broadcasts = [], []
+
+        async def run():
+            buffer = self._buffer(written, broadcasts, max_events=3, flush_seconds=60)
+            await buffer.add([_event() for _ in range(2)])
+            assert buffer.pending_count == 2
+            await buffer.add([_event()])
+            assert buffer.pending_count == 0
+            await buffer.close()
+
+        asyncio.run(run())
+
+        assert [len(batch) for batch in written] == [3]
+
+    def test_flushes_on_timer_and_preserves_broadcast_order(self):
+        written, broadcasts = [], []
+        events = [_event(f"v{i}") for i in range(5)]
+
+        async def run():
+            buffer = self._buffer(written, broadcasts, max_events=100, flush_seconds=0.01)
+            await buffer.add(events[:2])
+            await buffer.add(events[2:])
+            await asyncio.sleep(0.05)
+            assert buffer.pending_count == 0
+            await buffer.close()
+
+        asyncio.run(run())
+
+        assert [payload["id"] for payload in broadcasts] == [str(e["id"]) for e in events]
+
+    def test_failed_flush_is_requeued_in_arrival_order(self):
+        written, broadcasts = [], []
+        events = [_event(f"v{i}") for i in range(3)]
+
+        async def run():
+            buffer = self._buffer(written, broadcasts, max_events=100, flush_seconds=60)
+            write, failures = buffer._write, [Exception("db down")]
+            buffer._write = lambda batch: write(batch) if not failures else _raise(failures.pop())
+            await buffer.add(events[:2])
+            assert await buffer.flush() == 0
+            assert buffer.pending_count == 2
+            await buffer.add(events[2:])
+            assert await buffer.flush() == 3
+
+        asyncio.run(run())
+
+        assert [payload["id"] for payload in broadcasts] == [str(e["id"]) for e in events]
+
+    def test_exhausted_retries_write_events_one_by_one(self):
+        written, broadcasts = [], []
+        good, poison = _event("v1"), _event("v2")
+
+        def write_one(db, batch):
+            if batch[0] is poison:
+                raise ValueError("bad event")
+            return batch
+
+        async def run():
+            buffer = self._buffer(written, broadcasts, max_retries=1, flush_seconds=60)
+            buffer._write = Mock(side_effect=Exception("bad batch"))
+            await buffer.add([good, poison])
+            assert await buffer.flush() == 0
+            with patch.object(pixel_event_buffer_module, "write_pixel_event_batch", write_one):
+                assert await buffer.flush() == 1
+            assert buffer.pending_count == 0
+
+        asyncio.run(run())
+
+        assert [payload["id"] for payload in broadcasts] == [str(good["id"])]
+
+    def test_failed_final_flush_writes_events_one_by_one(self, caplog):
+        written, broadcasts = [], []
+        good, poison = _event("v1"), _event("v2")
+
+        def write_one(db, batch):
+            if batch[0] is poison:
+                raise ValueError("bad event")
+            return batch
+
+        async def run():
+            buffer = self._buffer(written, broadcasts, max_retries=3, flush_seconds=60)
+            buffer._write = Mock(side_effect=Exception("db down"))
+            await buffer.add([good, poison])
+            with patch.object(pixel_event_buffer_module, "write_pixel_event_batch", write_one):
+                await buffer.close()
+            assert buffer.pending_count == 0
+
+        asyncio.run(run())
+
+        assert [payload["id"] for payload in broadcasts] == [str(good["id"])]
+        assert "Dropped 1 of 2 events" in caplog.text
+
+
+async def _record(broadcasts, payload):
+    broadcasts.append(payload)
+
+
+def _raise(error):
+    raise error
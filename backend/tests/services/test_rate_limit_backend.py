@@ -0,0 +1,182 @@
+"""
+Unit tests for the shared rate limit backends.
+
+Tests:
+- In-memory sliding window and token bucket (reserve or retry-after)
+- Redis backend fallback on connection errors
+- Meta decorator: per-account keys, RateLimitExceededError instead of long sleeps
+- Sync paths charge the account budget and defer the connection when it is used up
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.models import ProviderEnum
+from app.services import meta_ads_client, meta_sync_service, snapshot_sync_service
+from app.services.rate_limit_backend import (
+    MAX_RATE_LIMIT_WAIT_SECONDS,
+    InMemoryRateLimitBackend,
+    RateLimitExceededError,
+    RedisRateLimitBackend,
+)
+
+
+class TestInMemoryBackend:
+    """Test process-local reservations."""
+
+    def test_sliding_window_returns_retry_after_when_full(self):
+        backend = InMemoryRateLimitBackend()
+
+        first = backend.reserve("k", limit=2, window_seconds=60, now=100.0)
+        second = backend.reserve("k", limit=2, window_seconds=60, now=110.0)
+        denied = backend.reserve("k", limit=2, window_seconds=60, now=120.0)
+
+        assert (first.allowed, first.remaining) == (True, 1)
+        assert (second.allowed, second.remaining) == (True, 0)
+        assert not denied.allowed
+        assert denied.retry_after == 40.0  # first call leaves the window at 160
+        assert backend.reserve("k", limit=2, window_seconds=60, now=160.0).allowed
+
+    def test_keys_have_independent_windows(self):
+        backend = InMemoryRateLimitBackend()
+
+        assert backend.reserve("a", limit=1, window_seconds=60, now=0.0).allowed
+        assert backend.reserve("b", limit=1, window_seconds=60, now=0.0).allowed
+        assert not backend.reserve("a", limit=1, window_seconds=60, now=1.0).allowed
+
+    def test_token_bucket_refills(self):
+        backend = InMemoryRateLimitBackend()
+
+        assert backend.reserve_token("g", capacity=1, refill_per_sec=2.0, now=0.0).allowed
+        denied = backend.reserve_token("g", capacity=1, refill_per_sec=2.0, now=0.0)
+        assert not denied.allowed
+        assert denied.retry_after == 0.5
+        assert backend.reserve_token("g", capacity=1, refill_per_sec=2.0, now=0.5).allowed
+
+
+class TestRedisBackend:
+    """Test script wiring and degradation when Redis is down."""
+
+    def test_parses_script_reply(self):
+        redis_client = Mock()
+        script = Mock(return_value=[0, 0, b"12.5"])
+        redis_client.register_script.return_value = script
+        backend = RedisRateLimitBackend(redis_client)
+
+        reservation = backend.reserve("meta:account:act_1", limit=5, window_seconds=60, now=1.0)
+
+        assert not reservation.allowed
+        assert reservation.retry_after == 12.5
+        assert script.call_args.kwargs["keys"] == ["rate_limit:meta:account:act_1"]
+
+    def test_falls_back_to_local_backend_on_error(self):
+        redis_client = Mock()
+        script = Mock(side_effect=ConnectionError("refused"))
+        redis_client.register_script.return_value = script
+        fallback = InMemoryRateLimitBackend()
+        backend = RedisRateLimitBackend(redis_client, fallback=fallback)
+
+        assert backend.reserve("k", limit=1, window_seconds=60, now=0.0).allowed
+        assert not backend.reserve("k", limit=1, window_seconds=60, now=1.0).allowed
+        # Redis isn't retried until REDIS_RETRY_SECONDS passed
+        assert script.call_count == 1
+        assert "k" in fallback.windows
+
+    def test_raises_without_fallback(self):
+        redis_client = Mock()
+        redis_client.register_script.return_value = Mock(side_effect=ConnectionError("refused"))
+        backend = RedisRateLimitBackend(redis_client)
+
+        with pytest.raises(ConnectionError):
+            backend.reserve("k", limit=1, window_seconds=60)
+
+
+class TestMetaRateLimitDecorator:
+    """Test account-scoped keys and bounded waits in the Meta decorator."""
+
+    def _call(self, backend, client, calls_per_hour=1):
+        @meta_ads_client.rate_limit(calls_per_hour=calls_per_hour)
+        def fetch(self, account_id):
+            return account_id
+
+        with patch.object(meta_ads_client, "get_rate_limit_backend", return_value=backend):
+            return fetch(client, "123")
+
+    def test_budget_is_keyed_by_ad_account(self):
+        backend = InMemoryRateLimitBackend()
+        client = Mock(max_rate_limit_wait=0, account_id=None)
+
+        assert self._call(backend, client) == "123"
+        assert list(backend.windows) == ["meta:account:act_123:1"]
+
+    def test_raises_instead_of_waiting_past_max_wait(self):
+        backend = InMemoryRateLimitBackend()
+        client = Mock(max_rate_limit_wait=30, account_id=None)
+        self._call(backend, client)
+
+        with patch.object(meta_ads_client, "sleep") as mock_sleep:
+            with pytest.raises(RateLimitExceededError) as exc_info:
+                self._call(backend, client)
+
+        mock_sleep.assert_not_called()
+        assert exc_info.value.retry_seconds > 30
+
+
+class TestSyncRateLimits:
+    """Test that sync paths share the account budget and reschedule."""
+
+    def _connection(self):
+        return SimpleNamespace(
+            id=uuid.uuid4(),
+            workspace_id=uuid.uuid4(),
+            provider=ProviderEnum.meta,
+            external_account_id="123",
+        )
+
+    def _db(self, connection):
+        db = Mock()
+        db.query.return_value.filter.return_value.first.return_value = connection
+        return db
+
+    def test_entity_sync_charges_account_and_propagates_rate_limit(self):
+        connection = self._connection()
+        created = []
+
+        def client_factory(**kwargs):
+            created.append(kwargs)
+            return Mock(get_campaigns=Mock(side_effect=RateLimitExceededError("full", 120)))
+
+        with patch.object(meta_sync_service, "MetaAdsClient", client_factory), \
+                patch.object(meta_sync_service, "_get_access_token", return_value="token"):
+            with pytest.raises(RateLimitExceededError):
+                meta_sync_service.sync_meta_entities(
+                    self._db(connection), connection.workspace_id, connection.id
+                )
+
+        assert created == [{
+            "access_token": "token",
+            "account_id": "123",
+            "max_rate_limit_wait": MAX_RATE_LIMIT_WAIT_SECONDS,
+        }]
+
+    def test_rate_limited_entity_sync_defers_connection(self):
+        connection = self._connection()
+        db = self._db(connection)
+
+        with patch.object(
+            snapshot_sync_service, "_sync_entities_for_connection",
+            side_effect=RateLimitExceededError("full", 120),
+        ), patch.object(snapshot_sync_service, "_sync_meta_snapshots") as sync_metrics:
+            result = snapshot_sync_service.sync_snapshots_for_connection(
+                db, connection.id, mode="attribution"
+            )
+
+        sync_metrics.assert_not_called()
+        db.rollback.assert_called_once()
+        assert result.retry_after == 120
+        assert not result.success
+        assert connection.sync_status == "rate_limited"
+        assert connection.rate_limited_until is not None
@@ -0,0 +1,199 @@
+"""
+Unit tests for the workspace response cache.
+
+Tests:
+- Miss computes and stores, the next call is a hit
+- A data version bump serves the stale body and refreshes it in the background
+- Bypass header and Redis outages compute inline
+- Hit/miss counters per endpoint
+- Keys roll over at midnight in the reporting timezone, not in UTC
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services import response_cache
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.hashes = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = bucket.get(field, 0) + amount
+
+    def hgetall(self, key):
+        return self.hashes.get(key, {})
+
+
+class InlineExecutor:
+    """Runs background refreshes synchronously."""
+
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch.object(response_cache, "_redis", fake), \
+            patch.object(response_cache, "_redis_down_until", 0.0), \
+            patch.object(response_cache, "_refresh_executor", InlineExecutor()), \
+            patch.object(response_cache, "_new_session", Mock()):
+        yield fake
+
+
+def _request(headers=None):
+    return Mock(headers=headers or {})
+
+
+def _get(compute, params=None, request=None, response=None):
+    return response_cache.cached_response(
+        "ws-1", "kpis", params or {"timeframe": "last_7_days"}, compute, Mock(),
+        request or _request(), response or Mock(headers={}),
+    )
+
+
+class TestCachedResponse:
+    """Test fresh / stale / miss handling."""
+
+    def test_miss_then_hit(self, redis):
+        compute = Mock(return_value={"value": 1})
+        first, second = Mock(headers={}), Mock(headers={})
+
+        assert _get(compute, response=first) == {"value": 1}
+        assert _get(compute, response=second) == {"value": 1}
+
+        compute.assert_called_once()
+        assert first.headers["X-Cache"] == "miss"
+        assert second.headers["X-Cache"] == "hit"
+
+    def test_params_are_part_of_the_key(self, redis):
+        compute = Mock(return_value=[])
+
+        _get(compute, params={"a": 1, "b": 2})
+        _get(compute, params={"b": 2, "a": 1})
+        _get(compute, params={"a": 1, "b": 3})
+
+        assert compute.call_count == 2
+
+    def test_version_bump_serves_stale_and_refreshes(self, redis):
+        compute = Mock(side_effect=[{"value": 1}, {"value": 2}])
+        _get(compute)
+
+        assert response_cache.bump_data_version("ws-1") == 1
+        response = Mock(headers={})
+
+        assert _get(compute, response=response) == {"value": 1}
+        assert response.headers["X-Cache"] == "stale"
+        # Background refresh stored the new body under the new version
+        assert _get(compute) == {"value": 2}
+        assert compute.call_count == 2
+
+    def test_expired_entry_is_recomputed(self, redis):
+        compute = Mock(return_value={"value": 1})
+        _get(compute)
+        key = next(k for k in redis.data if k.startswith("resp_cache:ws-1:kpis:"))
+        entry = json.loads(redis.data[key])
+        entry["stored_at"] = time.time() - response_cache.RESPONSE_CACHE_TTL_SECONDS - 1
+        redis.data[key] = json.dumps(entry)
+
+        response = Mock(headers={})
+        _get(compute, response=response)
+
+        assert response.headers["X-Cache"] == "stale"
+        assert compute.call_count == 2
+
+    def test_should_cache_false_skips_store(self, redis):
+        compute = Mock(return_value={"partial": True})
+
+        for _ in range(2):
+            response_cache.cached_response(
+                "ws-1", "dashboard", {}, compute, Mock(), _request(), Mock(headers={}),
+                should_cache=lambda body: not body["partial"],
+            )
+
+        assert compute.call_count == 2
+
+
+class TestBypassAndFailures:
+    """Test the debug bypass header and fail-open behaviour."""
+
+    def test_bypass_header_skips_cache(self, redis):
+        compute = Mock(return_value={"value": 1})
+        _get(compute)
+        response = Mock(headers={})
+
+        _get(compute, request=_request({"X-Cache-Bypass": "1"}), response=response)
+
+        assert compute.call_count == 2
+        assert response.headers["X-Cache"] == "bypass"
+
+    def test_redis_outage_computes_inline(self, redis):
+        redis.get = Mock(side_effect=ConnectionError("refused"))
+        compute = Mock(return_value={"value": 1})
+
+        assert _get(compute) == {"value": 1}
+        assert _get(compute) == {"value": 1}
+        # Second call skipped Redis entirely (marked down)
+        assert redis.get.call_count == 1
+
+    def test_stats_count_outcomes_per_endpoint(self, redis):
+        compute = Mock(return_value={})
+        _get(compute)
+        _get(compute)
+
+        assert response_cache.get_cache_stats()["kpis"] == {"miss": 1, "hit": 1}
+
+
+class TestCacheDigest:
+    """Test the date part of the key."""
+
+    def _digest_at(self, instant, reporting_timezone=None):
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return instant.astimezone(tz)
+
+        with patch.object(response_cache, "datetime", FrozenDatetime):
+            return response_cache.cache_digest({"timeframe": "today"}, reporting_timezone)
+
+    def test_key_rolls_over_at_reporting_timezone_midnight(self):
+        # 23:30 and 00:30 in Auckland (UTC+13); the same UTC day
+        before = datetime(2026, 10, 16, 10, 30, tzinfo=timezone.utc)
+        after = datetime(2026, 10, 16, 11, 30, tzinfo=timezone.utc)
+
+        assert self._digest_at(before) == self._digest_at(after)
+        assert self._digest_at(before, "Pacific/Auckland") != self._digest_at(after, "Pacific/Auckland")
+
+    def test_unknown_timezone_keys_on_utc(self):
+        instant = datetime(2026, 10, 16, 10, 30, tzinfo=timezone.utc)
+
+        assert self._digest_at(instant, "Not/AZone") == self._digest_at(instant)
@@ -0,0 +1,203 @@
+"""
+Unit tests for the Shopify Bulk Operations backfill.
+
+Runs ShopifyClient against a local stub server that answers the bulk
+operation mutation / status query and serves a canned JSONL result file.
+
+Tests:
+- JSONL rows are regrouped into orders with their line items, page by page
+- Failed bulk operations raise ShopifyAPIError
+- First sync backfills through the bulk path and clears its checkpoint
+"""
+
+import asyncio
+import json
+import threading
+import uuid
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    Connection,
+    ProviderEnum,
+    ShopifyCustomer,
+    ShopifyOrder,
+    ShopifyOrderLineItem,
+    ShopifyProduct,
+    ShopifyShop,
+)
+from app.services import shopify_client, shopify_sync_service
+from app.services.shopify_client import ShopifyAPIError, ShopifyClient
+
+
+WORKSPACE_ID = uuid.uuid4()
+
+
+def _order_row(n, customer=None):
+    return {
+        "id": f"gid://shopify/Order/{n}",
+        "name": f"#{1000 + n}",
+        "createdAt": f"2024-01-0{n}T10:00:00Z",
+        "displayFinancialStatus": "PAID",
+        "totalPriceSet": {"shopMoney": {"amount": "30.00", "currencyCode": "EUR"}},
+        "customer": {"id": customer} if customer else None,
+        "tags": [],
+    }
+
+
+def _line_row(n, order_n):
+    return {
+        "id": f"gid://shopify/LineItem/{n}",
+        "title": "Shirt",
+        "quantity": 3,
+        "originalUnitPriceSet": {"shopMoney": {"amount": "10.00"}},
+        "variant": {"id": "gid://shopify/ProductVariant/1", "inventoryItem": {"unitCost": {"amount": "4.00"}}},
+        "__parentId": f"gid://shopify/Order/{order_n}",
+    }
+
+
+CANNED_JSONL = "\n".join(json.dumps(row) for row in [
+    _order_row(1),
+    _line_row(11, 1),
+    _line_row(12, 1),
+    _order_row(2),
+    _order_row(3),
+    _line_row(31, 3),
+]) + "\n"
+
+
+class StubShopify(BaseHTTPRequestHandler):
+    """GraphQL endpoint + result file. `server.bulk_status` drives the poll."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.queries.append(body)
+        if "bulkOperationRunQuery" in body["query"]:
+            data = {"bulkOperationRunQuery": {
+                "bulkOperation": {"id": "gid://shopify/BulkOperation/1", "status": "CREATED"},
+                "userErrors": [],
+            }}
+        else:
+            status = self.server.bulk_status.pop(0) if len(self.server.bulk_status) > 1 else self.server.bulk_status[0]
+            data = {"node": {
+                "id": "gid://shopify/BulkOperation/1",
+                "status": status,
+                "errorCode": "INTERNAL_SERVER_ERROR" if status == "FAILED" else None,
+                "objectCount": "6",
+                "url": f"http://127.0.0.1:{self.server.server_port}/results.jsonl",
+            }}
+        self._send("application/json", json.dumps({"data": data}))
+
+    def do_GET(self):
+        self._send("application/jsonl", CANNED_JSONL)
+
+    def _send(self, content_type, payload):
+        encoded = payload.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubShopify)
+    server.queries = []
+    server.bulk_status = ["RUNNING", "COMPLETED"]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with patch.object(shopify_client, "RATE_LIMIT_DELAY", 0), \
+            patch.object(shopify_client, "BULK_POLL_INTERVAL_SECONDS", 0):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server):
+    return ShopifyClient(
+        shop_domain="test.myshopify.com",
+        access_token="token",
+        base_url=f"http://127.0.0.1:{server.server_port}/graphql.json",
+    )
+
+
+async def _collect(client, **kwargs):
+    return [page async for page in client.get_orders_bulk(**kwargs)]
+
+
+class TestGetOrdersBulk:
+    """Test the client side of the bulk backfill."""
+
+    def test_rows_are_regrouped_into_pages(self, stub_server):
+        pages = asyncio.run(_collect(_client(stub_server), page_size=2))
+
+        assert [len(orders) for orders, _ in pages] == [2, 1]
+        assert all(cursor is None for _, cursor in pages)
+        first, second, third = [order for orders, _ in pages for order in orders]
+        assert [li["external_line_item_id"] for li in first["line_items"]] == [
+            "gid://shopify/LineItem/11", "gid://shopify/LineItem/12",
+        ]
+        assert second["line_items"] == []
+        assert third["order_number"] == 1003
+        assert first["line_items"][0]["cost_per_item"] == 4
+
+    def test_since_is_passed_as_search_filter(self, stub_server):
+        asyncio.run(_collect(_client(stub_server), since=datetime(2024, 1, 1)))
+
+        bulk_query = stub_server.queries[0]["variables"]["query"]
+        assert 'query: "created_at:>2024-01-01T00:00:00Z"' in bulk_query
+        assert "lineItems {" in bulk_query
+
+    def test_failed_operation_raises(self, stub_server):
+        stub_server.bulk_status = ["FAILED"]
+
+        with pytest.raises(ShopifyAPIError, match="failed"):
+            asyncio.run(_collect(_client(stub_server)))
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    tables = [
+        Connection.__table__, ShopifyShop.__table__, ShopifyCustomer.__table__,
+        ShopifyProduct.__table__, ShopifyOrder.__table__, ShopifyOrderLineItem.__table__,
+    ]
+    ShopifyShop.metadata.create_all(engine, tables=tables)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_first_sync_backfills_through_bulk_operation(db, stub_server):
+    connection = Connection(
+        workspace_id=WORKSPACE_ID, provider=ProviderEnum.shopify,
+        external_account_id="test.myshopify.com", name="Test", status="active",
+    )
+    db.add(connection)
+    db.flush()
+    shop = ShopifyShop(
+        workspace_id=WORKSPACE_ID, connection_id=connection.id,
+        external_shop_id="gid://shopify/Shop/1", shop_domain="test.myshopify.com", shop_name="Test",
+    )
+    db.add(shop)
+    db.commit()
+
+    with patch.object(shopify_sync_service, "ShopifyClient", lambda **kwargs: _client(stub_server)), \
+            patch.object(shopify_sync_service, "_get_access_token", lambda c: "token"), \
+            patch.object(shopify_sync_service, "bump_data_version"):
+        result = asyncio.run(shopify_sync_service.sync_shopify_orders(db, WORKSPACE_ID, connection.id))
+
+    assert result.success, result.errors
+    assert result.stats.orders_created == 3
+    assert db.query(ShopifyOrderLineItem).count() == 3
+    assert "bulkOperationRunQuery" in stub_server.queries[0]["query"]
+    assert shop.orders_sync_cursor is None
@@ -0,0 +1,110 @@
+"""
+Unit tests for the set-based customer LTV update.
+
+Tests:
+- One UPDATE recomputes every customer of the shop (paid orders only)
+- Customers without paid orders are reset
+- Incremental mode only touches the given customers
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import ShopifyCustomer, ShopifyFinancialStatusEnum, ShopifyOrder
+from app.services.shopify_sync_service import _update_customer_ltv
+
+
+WORKSPACE_ID = uuid.uuid4()
+SHOP_ID = uuid.uuid4()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    ShopifyCustomer.metadata.create_all(
+        engine, tables=[ShopifyCustomer.__table__, ShopifyOrder.__table__]
+    )
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+    event.listen(
+        engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: session.statements.append(statement),
+    )
+    yield session
+    session.close()
+
+
+def _customer(db, order_count=0, total_spent=0):
+    customer = ShopifyCustomer(
+        workspace_id=WORKSPACE_ID,
+        shop_id=SHOP_ID,
+        external_customer_id=str(uuid.uuid4()),
+        order_count=order_count,
+        total_spent=Decimal(total_spent),
+    )
+    db.add(customer)
+    db.flush()
+    return customer
+
+
+def _order(db, customer, total, day, status=ShopifyFinancialStatusEnum.paid):
+    db.add(ShopifyOrder(
+        workspace_id=WORKSPACE_ID,
+        shop_id=SHOP_ID,
+        customer_id=customer.id,
+        external_order_id=str(uuid.uuid4()),
+        total_price=Decimal(total),
+        financial_status=status,
+        order_created_at=datetime(2026, 10, day),
+    ))
+
+
+def _run(db, customer_ids=None):
+    db.commit()
+    db.statements.clear()
+    updated = asyncio.run(_update_customer_ltv(db, SHOP_ID, customer_ids=customer_ids))
+    db.expire_all()
+    return updated
+
+
+def test_full_recompute_in_one_statement(db):
+    buyer = _customer(db)
+    _order(db, buyer, "100", 1)
+    _order(db, buyer, "50", 3)
+    _order(db, buyer, "999", 4, status=ShopifyFinancialStatusEnum.refunded)
+    lapsed = _customer(db, order_count=2, total_spent=80)
+
+    updated = _run(db)
+
+    assert updated == 2
+    assert sum(sql.lstrip().upper().startswith("UPDATE") for sql in db.statements) == 1
+    assert (buyer.order_count, buyer.total_spent) == (2, Decimal("150"))
+    assert buyer.average_order_value == Decimal("75")
+    assert (buyer.first_order_at.day, buyer.last_order_at.day) == (1, 3)
+    assert (lapsed.order_count, lapsed.total_spent, lapsed.average_order_value) == (0, 0, None)
+
+
+def test_unchanged_customers_are_not_rewritten(db):
+    buyer = _customer(db)
+    _order(db, buyer, "100", 1)
+    _run(db)
+
+    assert _run(db) == 0
+
+
+def test_incremental_mode_only_touches_given_customers(db):
+    touched = _customer(db)
+    untouched = _customer(db)
+    _order(db, touched, "10", 1)
+    _order(db, untouched, "20", 1)
+
+    assert _run(db, customer_ids={touched.id}) == 1
+    assert touched.order_count == 1
+    assert untouched.order_count == 0
+    assert _run(db, customer_ids=set()) == 0
@@ -0,0 +1,231 @@
+"""
+Unit tests for streamed Shopify order sync.
+
+Tests:
+- A page is upserted with multi-row statements (no per-order queries)
+- Re-syncing a page updates orders and replaces removed line items
+- Each page is committed with its cursor; an interrupted sync resumes from it
+- Customer LTV is committed with each page, so a resumed sync leaves no
+  customer of an earlier page stale
+- A failing order is skipped and reported without blocking its page
+"""
+
+import asyncio
+import uuid
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    Connection,
+    ProviderEnum,
+    ShopifyCustomer,
+    ShopifyOrder,
+    ShopifyOrderLineItem,
+    ShopifyProduct,
+    ShopifyShop,
+)
+from app.services import shopify_sync_service
+from app.services.shopify_client import ShopifyAPIError
+from app.services.shopify_sync_service import ShopifySyncStats, _upsert_order_page
+
+
+WORKSPACE_ID = uuid.uuid4()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    tables = [
+        Connection.__table__, ShopifyShop.__table__, ShopifyCustomer.__table__, ShopifyProduct.__table__,
+        ShopifyOrder.__table__, ShopifyOrderLineItem.__table__,
+    ]
+    ShopifyShop.metadata.create_all(engine, tables=tables)
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+    event.listen(
+        engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: session.statements.append(statement),
+    )
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def shop(db):
+    connection = Connection(
+        workspace_id=WORKSPACE_ID,
+        provider=ProviderEnum.shopify,
+        external_account_id="test.myshopify.com",
+        name="Test",
+        status="active",
+    )
+    db.add(connection)
+    db.flush()
+    shop = ShopifyShop(
+        workspace_id=WORKSPACE_ID,
+        connection_id=connection.id,
+        external_shop_id="gid://shopify/Shop/1",
+        shop_domain="test.myshopify.com",
+        shop_name="Test",
+    )
+    db.add(shop)
+    db.flush()
+    db.add(ShopifyProduct(
+        workspace_id=WORKSPACE_ID, shop_id=shop.id, external_product_id="p1",
+        title="Shirt", cost_per_item=Decimal("4"),
+    ))
+    db.commit()
+    return shop
+
+
+def _order(external_id, line_ids=("l1",), customer=None):
+    return {
+        "external_order_id": external_id,
+        "external_customer_id": customer,
+        "name": f"#{external_id}",
+        "total_price": Decimal("20"),
+        "financial_status": "PAID",
+        "order_created_at": "2026-10-01T10:00:00Z",
+        "line_items": [
+            {
+                "external_line_item_id": line_id,
+                "external_product_id": "p1",
+                "title": "Shirt",
+                "quantity": 2,
+                "price": Decimal("10"),
+            }
+            for line_id in line_ids
+        ],
+    }
+
+
+class TestUpsertOrderPage:
+    """Test the per-page bulk upsert."""
+
+    def test_page_is_written_with_multi_row_statements(self, db, shop):
+        stats = ShopifySyncStats()
+        db.statements.clear()
+
+        _upsert_order_page(db, shop, WORKSPACE_ID, [_order(str(i)) for i in range(20)], stats)
+        db.commit()
+
+        inserts = [s for s in db.statements if s.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 2
+        assert stats.orders_created == 20
+        assert db.query(ShopifyOrderLineItem).count() == 20
+        order = db.query(ShopifyOrder).filter_by(external_order_id="0").one()
+        # Product cost fallback: 2 * (10 - 4)
+        assert order.total_profit == Decimal("12")
+
+    def test_resync_updates_and_replaces_line_items(self, db, shop):
+        _upsert_order_page(db, shop, WORKSPACE_ID, [_order("1", line_ids=("l1", "l2"))], ShopifySyncStats())
+        db.commit()
+        order_id = db.query(ShopifyOrder.id).scalar()
+
+        stats = ShopifySyncStats()
+        refreshed = _order("1", line_ids=("l2", "l3"))
+        refreshed["financial_status"] = "REFUNDED"
+        _upsert_order_page(db, shop, WORKSPACE_ID, [refreshed], stats)
+        db.commit()
+
+        order = db.query(ShopifyOrder).one()
+        assert order.id == order_id
+        assert order.financial_status.value == "refunded"
+        assert (stats.orders_created, stats.orders_updated) == (0, 1)
+        assert sorted(li.external_line_item_id for li in db.query(ShopifyOrderLineItem)) == ["l2", "l3"]
+
+    def test_touched_customers_are_returned(self, db, shop):
+        customer = ShopifyCustomer(workspace_id=WORKSPACE_ID, shop_id=shop.id, external_customer_id="c1")
+        db.add(customer)
+        db.commit()
+
+        touched = _upsert_order_page(
+            db, shop, WORKSPACE_ID, [_order("1", customer="c1"), _order("2")], ShopifySyncStats()
+        )
+
+        assert touched == {customer.id}
+
+
+class FakeClient:
+    """Streams fixed pages and optionally fails after a number of pages."""
+
+    calls = []
+
+    def __init__(self, pages, fail_after=None):
+        self.pages = pages
+        self.fail_after = fail_after
+
+    async def get_all_orders(self, since=None, cursor=None, page_size=100):
+        FakeClient.calls.append(cursor)
+        start = int(cursor) if cursor else 0
+        for index in range(start, len(self.pages)):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise ShopifyAPIError("throttled")
+            next_cursor = str(index + 1) if index + 1 < len(self.pages) else None
+            yield self.pages[index], next_cursor
+
+
+def _sync(db, shop, client):
+    with patch.object(shopify_sync_service, "ShopifyClient", lambda **kwargs: client), \
+            patch.object(shopify_sync_service, "_get_access_token", lambda connection: "token"), \
+            patch.object(shopify_sync_service, "bump_data_version"), \
+            patch.object(shopify_sync_service, "BULK_BACKFILL_ENABLED", False):
+        return asyncio.run(shopify_sync_service.sync_shopify_orders(
+            db, WORKSPACE_ID, shop.connection_id,
+        ))
+
+
+def test_interrupted_sync_resumes_from_last_committed_page(db, shop):
+    pages = [[_order("1")], [_order("2")], [_order("3")]]
+    FakeClient.calls = []
+
+    result = _sync(db, shop, FakeClient(pages, fail_after=2))
+
+    assert not result.success
+    assert db.query(ShopifyOrder).count() == 2
+    assert shop.orders_sync_cursor == "2"
+
+    result = _sync(db, shop, FakeClient(pages))
+
+    assert result.success
+    assert FakeClient.calls == [None, "2"]
+    assert db.query(ShopifyOrder).count() == 3
+    assert shop.orders_sync_cursor is None
+
+
+def test_resumed_sync_keeps_ltv_of_committed_pages(db, shop):
+    db.add_all([
+        ShopifyCustomer(workspace_id=WORKSPACE_ID, shop_id=shop.id, external_customer_id=external_id)
+        for external_id in ("c1", "c2")
+    ])
+    db.commit()
+    pages = [[_order("1", customer="c1")], [_order("2", customer="c2")], [_order("3", customer="c1")]]
+    FakeClient.calls = []
+
+    assert not _sync(db, shop, FakeClient(pages, fail_after=2)).success
+    assert _sync(db, shop, FakeClient(pages)).success
+
+    customers = {c.external_customer_id: c for c in db.query(ShopifyCustomer)}
+    assert FakeClient.calls == [None, "2"]
+    # c2 only appears on a page committed before the interruption
+    assert (customers["c2"].order_count, customers["c2"].total_spent) == (1, Decimal("20"))
+    assert (customers["c1"].order_count, customers["c1"].total_spent) == (2, Decimal("40"))
+
+
+def test_failing_order_is_skipped_and_page_is_checkpointed(db, shop):
+    broken = _order("2")
+    del broken["line_items"][0]["title"]
+    pages = [[_order("1"), broken, _order("3")], [_order("4")]]
+    FakeClient.calls = []
+
+    result = _sync(db, shop, FakeClient(pages, fail_after=1))
+
+    assert not result.success
+    assert sorted(o.external_order_id for o in db.query(ShopifyOrder)) == ["1", "3"]
+    assert shop.orders_sync_cursor == "1"
+    assert result.stats.orders_created == 2
+    assert any("Error syncing order 2" in error for error in result.errors)
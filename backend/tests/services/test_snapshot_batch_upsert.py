@@ -0,0 +1,115 @@
+"""
+Unit tests for batched snapshot upserts in the snapshot sync.
+
+Tests:
+- Rows are written with one multi-row upsert (plus one rollup upsert) per batch
+- Inserted/updated counts per batch come from RETURNING (xmax = 0)
+- Repeated conflict keys within a batch are collapsed
+- Rollup batches keep the latest snapshot per entity and day
+"""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.metric_rollup_service import upsert_daily_rollups
+from app.services.snapshot_sync_service import SnapshotSyncResult, _SnapshotBatchWriter
+
+
+WORKSPACE_ID = uuid.uuid4()
+CAPTURED_AT = datetime(2026, 10, 16, 10, 15, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    def __init__(self, flags):
+        self.flags = flags
+
+    def scalars(self):
+        return iter(self.flags)
+
+
+class FakeSession:
+    """Records compiled statements; snapshot upserts report every other row as new."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append(str(compiled))
+        rows = len(stmt._multi_values[0]) if stmt._multi_values else 1
+        return FakeResult([i % 2 == 0 for i in range(rows)])
+
+    def snapshot_upserts(self):
+        return [sql for sql in self.statements if sql.startswith("INSERT INTO metric_snapshots")]
+
+    def rollup_upserts(self):
+        return [sql for sql in self.statements if sql.startswith("INSERT INTO metric_daily_rollups")]
+
+
+def _snapshot(entity_id=None, captured_at=CAPTURED_AT, spend=10, metrics_date=date(2026, 10, 16)):
+    return {
+        "entity_id": entity_id or uuid.uuid4(),
+        "provider": "meta",
+        "captured_at": captured_at,
+        "metrics_date": metrics_date,
+        "spend": spend,
+        "impressions": 100,
+        "clicks": 5,
+        "currency": "USD",
+    }
+
+
+def _write(snapshots, batch_size):
+    db, result = FakeSession(), SnapshotSyncResult()
+    writer = _SnapshotBatchWriter(db, result, WORKSPACE_ID, level="ad", batch_size=batch_size)
+    for snapshot in snapshots:
+        writer.add(snapshot)
+    writer.flush()
+    return db, result
+
+
+def test_rows_are_upserted_in_multi_row_batches():
+    db, result = _write([_snapshot() for _ in range(5)], batch_size=2)
+
+    assert len(db.snapshot_upserts()) == 3
+    assert len(db.rollup_upserts()) == 3
+    assert [b["rows"] for b in result.batches] == [2, 2, 1]
+    assert result.batches[0] == {"level": "ad", "rows": 2, "inserted": 1, "updated": 1}
+    assert (result.inserted, result.updated) == (3, 2)
+
+
+def test_upsert_statement_shape():
+    db, _ = _write([_snapshot(), _snapshot()], batch_size=10)
+    sql = db.snapshot_upserts()[0]
+
+    assert sql.count("VALUES") == 1 and "), (" in sql
+    assert "ON CONFLICT ON CONSTRAINT uq_metric_snapshots_entity_provider_time" in sql
+    assert "spend = excluded.spend" in sql
+    assert "captured_at = excluded.captured_at" not in sql
+    assert "RETURNING (xmax = 0)" in sql
+
+
+def test_repeated_conflict_key_is_collapsed():
+    entity_id = uuid.uuid4()
+    db, result = _write([_snapshot(entity_id, spend=1), _snapshot(entity_id, spend=2)], batch_size=10)
+
+    assert result.batches == [{"level": "ad", "rows": 1, "inserted": 1, "updated": 0}]
+    assert len(db.snapshot_upserts()) == 1
+
+
+def test_rollup_batch_keeps_latest_snapshot_per_day():
+    db = FakeSession()
+    entity_id = uuid.uuid4()
+    snapshots = [
+        _snapshot(entity_id, captured_at=CAPTURED_AT),
+        _snapshot(entity_id, captured_at=CAPTURED_AT - timedelta(minutes=15)),
+        _snapshot(entity_id, metrics_date=date(2026, 10, 15)),
+        _snapshot(metrics_date=None),
+    ]
+
+    assert upsert_daily_rollups(db, snapshots, WORKSPACE_ID) == 2
+    assert len(db.rollup_upserts()) == 1
+    assert upsert_daily_rollups(db, [_snapshot(metrics_date=None)], WORKSPACE_ID) == 0
+    assert len(db.statements) == 1
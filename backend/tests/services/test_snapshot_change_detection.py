@@ -0,0 +1,131 @@
+"""
+Unit tests for skipping unchanged 15-min snapshots.
+
+Tests:
+- The latest stored snapshot per entity and day is loaded in one query
+- Unchanged rows are skipped within the hour; changes and hourly heartbeats are written
+- has_snapshot_changed only compares the fields the provider reports
+- SNAPSHOT_SKIP_UNCHANGED=false writes every row
+"""
+
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Entity, LevelEnum, MetricSnapshot
+from app.services import snapshot_sync_service
+from app.services.snapshot_sync_service import (
+    SnapshotSyncResult,
+    _load_latest_snapshots,
+    _SnapshotBatchWriter,
+)
+from app.services.sync_comparison import has_snapshot_changed
+
+
+WORKSPACE_ID = uuid.uuid4()
+CONNECTION_ID = uuid.uuid4()
+DAY = date(2026, 10, 16)
+NOON = datetime(2026, 10, 16, 12, 0)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Entity.metadata.create_all(engine, tables=[Entity.__table__, MetricSnapshot.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _entity(db, connection_id=CONNECTION_ID):
+    entity = Entity(
+        workspace_id=WORKSPACE_ID,
+        connection_id=connection_id,
+        level=LevelEnum.ad,
+        external_id=str(uuid.uuid4()),
+        name="Ad",
+        status="active",
+    )
+    db.add(entity)
+    db.flush()
+    return entity
+
+
+def _stored(db, entity, captured_at, spend, metrics_date=DAY):
+    db.add(MetricSnapshot(
+        entity_id=entity.id,
+        provider="meta",
+        captured_at=captured_at,
+        metrics_date=metrics_date,
+        spend=Decimal(spend),
+        impressions=100,
+        clicks=5,
+        currency="USD",
+    ))
+
+
+def _incoming(entity_id, captured_at, spend):
+    return {
+        "entity_id": entity_id,
+        "provider": "meta",
+        "captured_at": captured_at,
+        "metrics_date": DAY,
+        "spend": Decimal(spend),
+        "impressions": 100,
+        "clicks": 5,
+        "currency": "USD",
+    }
+
+
+def _load(db):
+    db.commit()
+    return _load_latest_snapshots(db, CONNECTION_ID, "meta", DAY, DAY)
+
+
+def test_loads_latest_snapshot_per_entity_and_day(db):
+    entity = _entity(db)
+    other_connection = _entity(db, connection_id=uuid.uuid4())
+    _stored(db, entity, NOON - timedelta(minutes=30), "5")
+    _stored(db, entity, NOON - timedelta(minutes=15), "7")
+    _stored(db, entity, NOON - timedelta(days=1), "3", metrics_date=DAY - timedelta(days=1))
+    _stored(db, other_connection, NOON, "9")
+
+    latest = _load(db)
+
+    assert list(latest) == [(entity.id, DAY)]
+    assert latest[(entity.id, DAY)]["spend"] == Decimal("7")
+
+
+def test_unchanged_rows_are_skipped_within_the_hour(db):
+    entity = _entity(db)
+    _stored(db, entity, NOON, "7")
+    result = SnapshotSyncResult()
+    writer = _SnapshotBatchWriter(db, result, WORKSPACE_ID, level="ad", latest=_load(db))
+
+    with patch.object(writer, "flush"):
+        writer.add(_incoming(entity.id, NOON + timedelta(minutes=15), "7"))   # same values
+        writer.add(_incoming(entity.id, NOON + timedelta(minutes=30), "8"))   # changed
+        writer.add(_incoming(entity.id, NOON + timedelta(minutes=45), "8"))   # same as the new row
+        writer.add(_incoming(entity.id, NOON + timedelta(minutes=60), "8"))   # hourly heartbeat
+        writer.add(_incoming(uuid.uuid4(), NOON, "1"))                        # first row of the day
+
+    assert result.unchanged == 2
+    assert [row["captured_at"].minute for row in writer._pending.values()] == [30, 0, 0]
+
+
+def test_comparison_ignores_fields_the_provider_does_not_send():
+    existing = {"spend": Decimal("7.0"), "impressions": 100, "installs": 4, "currency": "USD"}
+
+    assert not has_snapshot_changed(existing, {"spend": 7, "impressions": 100, "currency": "USD"})
+    assert has_snapshot_changed(existing, {"spend": 7, "impressions": 101})
+    assert has_snapshot_changed(existing, {"currency": "EUR"})
+
+
+def test_skipping_can_be_disabled(db):
+    with patch.object(snapshot_sync_service, "SKIP_UNCHANGED_SNAPSHOTS", False):
+        assert _load(db) is None
@@ -0,0 +1,224 @@
+"""
+Unit tests for chunked snapshot compaction.
+
+Tests:
+- Batches never span workspaces and respect batch_size (keyset cursor)
+- A failed batch is rolled back while the remaining batches still run
+- Dry run estimates savings without writing
+- Compaction keeps metrics_date and the end of an earlier day, and a second
+  run leaves the rows unchanged (needs TEST_POSTGRES_URL, skipped otherwise)
+- The dry-run row size is measured on the leaf partitions of a partitioned
+  metric_snapshots (needs TEST_POSTGRES_URL)
+"""
+
+import os
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Entity, LevelEnum, MetricSnapshot, Workspace
+from app.services.snapshot_compaction_service import _average_row_bytes, compact_snapshots_for_date
+from app.services.snapshot_partition_service import create_partition_sql
+
+
+WS_A = uuid.UUID("00000000-0000-0000-0000-00000000000a")
+WS_B = uuid.UUID("00000000-0000-0000-0000-00000000000b")
+PENDING = [(WS_A, uuid.UUID(int=i)) for i in range(1, 4)] + [(WS_B, uuid.UUID(int=9))]
+
+# Postgres for the compaction statement, e.g. postgresql://localhost/metricx_test
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+class FakeSession:
+    """Routes statements by SQL text and records compacted entity batches."""
+
+    def __init__(self, pending, fail_on=None):
+        self.pending = list(pending)
+        self.fail_on = fail_on
+        self.compacted = []
+        self.statements = []
+        self.commit = Mock()
+        self.rollback = Mock()
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt)
+        self.statements.append(sql)
+        params = params or {}
+
+        if "ORDER BY e.workspace_id, e.id" in sql:
+            rows = self.pending
+            if "after_workspace" in params:
+                cursor = (params["after_workspace"], params["after_entity"])
+                rows = [row for row in rows if row > cursor]
+            return rows[: params["batch_size"]]
+
+        if "upserted AS" in sql:
+            ids = params["entity_ids"]
+            if self.fail_on and self.fail_on in ids:
+                raise RuntimeError("deadlock detected")
+            self.compacted.append(ids)
+            # 24 hourly rows per entity (2 new), 72 15-min rows removed
+            n = len(ids)
+            return Mock(fetchone=Mock(return_value=(24 * n, 2 * n, 72 * n)))
+
+        if "WITH buckets AS" in sql:
+            return Mock(fetchone=Mock(return_value=(720, 240, 20, 2)))
+
+        if "pg_total_relation_size" in sql:
+            return Mock(scalar=Mock(return_value=100.0))
+
+        raise AssertionError(f"Unexpected statement: {sql}")
+
+
+class TestCompactSnapshotsForDate:
+    """Test batch boundaries, resumability and metrics."""
+
+    def test_batches_split_by_workspace_and_size(self):
+        db = FakeSession(PENDING)
+
+        report = compact_snapshots_for_date(db, date(2026, 1, 5), batch_size=2)
+
+        assert db.compacted == [
+            [str(uuid.UUID(int=1)), str(uuid.UUID(int=2))],
+            [str(uuid.UUID(int=3))],
+            [str(uuid.UUID(int=9))],
+        ]
+        assert db.commit.call_count == 3
+        assert (report.workspaces, report.batches, report.failed_batches) == (2, 3, 0)
+        assert report.rows_in == 72 * 4
+        assert report.rows_out == 24 * 4
+        assert report.rows_saved == (72 - 2) * 4
+
+    def test_failed_batch_is_rolled_back_and_skipped(self):
+        db = FakeSession(PENDING, fail_on=str(uuid.UUID(int=3)))
+
+        report = compact_snapshots_for_date(db, date(2026, 1, 5), batch_size=2)
+
+        db.rollback.assert_called_once()
+        assert report.failed_batches == 1
+        assert report.batches == 2
+        assert db.compacted[-1] == [str(uuid.UUID(int=9))]
+
+    def test_dry_run_estimates_without_writing(self):
+        db = FakeSession(PENDING)
+
+        report = compact_snapshots_for_date(db, date(2026, 1, 5), dry_run=True)
+
+        assert report.dry_run
+        assert db.compacted == []
+        db.commit.assert_not_called()
+        assert report.rows_in == 720
+        assert report.rows_out == 240
+        assert report.rows_saved == 700
+        assert report.estimated_bytes_saved == 70000
+        assert report.as_dict()["target_date"] == "2026-01-05"
+
+
+@pytest.fixture
+def pg_db():
+    """Session on a throwaway schema of TEST_POSTGRES_URL."""
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL not set")
+
+    schema = f"test_compaction_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(TEST_POSTGRES_URL)
+    with admin.begin() as conn:
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+
+    engine = create_engine(TEST_POSTGRES_URL, connect_args={"options": f"-csearch_path={schema}"})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+
+    session.close()
+    engine.dispose()
+    with admin.begin() as conn:
+        conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+    admin.dispose()
+
+
+def _snapshot(entity_id, hour, minute, metrics_date, spend):
+    return MetricSnapshot(
+        entity_id=entity_id,
+        provider="meta",
+        captured_at=datetime(2026, 1, 5, hour, minute, tzinfo=timezone.utc),
+        metrics_date=metrics_date,
+        spend=Decimal(spend),
+    )
+
+
+def _rows(db):
+    return sorted(
+        (row.captured_at.strftime("%H:%M"), row.metrics_date, row.spend)
+        for row in db.query(MetricSnapshot).all()
+    )
+
+
+class TestCompactionOnPostgres:
+    """Test the compaction statement on real rows, including a re-run."""
+
+    def test_compacting_a_day_twice_leaves_rows_unchanged(self, pg_db):
+        day_one, day_two = date(2026, 1, 5), date(2026, 1, 6)
+        workspace = Workspace(id=WS_A, name="Test")
+        entity = Entity(
+            workspace_id=WS_A, level=LevelEnum.campaign,
+            external_id="c1", name="Campaign", status="active",
+        )
+        pg_db.add_all([workspace, entity])
+        pg_db.flush()
+        pg_db.add_all([
+            # The account's day ends inside the 10:00 hour
+            _snapshot(entity.id, 10, 0, day_one, "10"),
+            _snapshot(entity.id, 10, 15, day_one, "15"),
+            _snapshot(entity.id, 10, 30, day_two, "1"),
+            _snapshot(entity.id, 10, 45, day_two, "2"),
+            _snapshot(entity.id, 11, 0, day_two, "3"),
+            _snapshot(entity.id, 11, 15, day_two, "4"),
+            _snapshot(entity.id, 11, 30, day_two, "5"),
+        ])
+        pg_db.commit()
+
+        first = compact_snapshots_for_date(pg_db, date(2026, 1, 5))
+        after_first = _rows(pg_db)
+        second = compact_snapshots_for_date(pg_db, date(2026, 1, 5))
+
+        assert after_first == [
+            ("10:00", day_two, Decimal("2")),
+            ("10:15", day_one, Decimal("15")),
+            ("11:00", day_two, Decimal("5")),
+        ]
+        assert _rows(pg_db) == after_first
+        assert (first.batches, first.rows_in, first.rows_out) == (1, 4, 2)
+        assert (second.batches, second.rows_in, second.rows_out) == (0, 0, 0)
+
+    def test_row_size_is_measured_on_leaf_partitions(self, pg_db):
+        # Partitioned like the 20261016_000003 migration leaves it
+        pg_db.execute(text("DROP TABLE metric_snapshots CASCADE"))
+        pg_db.execute(text("""
+            CREATE TABLE metric_snapshots (
+                id uuid NOT NULL,
+                captured_at timestamptz NOT NULL,
+                payload text
+            ) PARTITION BY RANGE (captured_at)
+        """))
+        for month in (date(2026, 1, 1), date(2026, 2, 1)):
+            pg_db.execute(text(create_partition_sql(month)))
+        pg_db.execute(text("""
+            INSERT INTO metric_snapshots (id, captured_at, payload)
+            SELECT gen_random_uuid(),
+                   TIMESTAMPTZ '2026-01-01 00:00+00' + n * INTERVAL '1 hour',
+                   repeat('x', 100)
+            FROM generate_series(0, 999) AS n
+        """))
+        pg_db.commit()
+        pg_db.execute(text("ANALYZE metric_snapshots"))
+
+        row_bytes = _average_row_bytes(pg_db)
+
+        # The parent alone has no storage and would give 0
+        assert 100 < row_bytes < 1000
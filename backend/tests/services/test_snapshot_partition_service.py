@@ -0,0 +1,97 @@
+"""
+Unit tests for metric_snapshots partition maintenance.
+
+Tests:
+- Pruning window covers every snapshot of a metrics_date range
+- Monthly partition naming/bounds and idempotent creation
+- Detach guard against recent months
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import MetricSnapshot
+from app.services.snapshot_partition_service import (
+    create_partition_sql,
+    detach_snapshot_partition,
+    ensure_snapshot_partitions,
+    snapshot_capture_window,
+    snapshot_pruning_clause,
+)
+
+
+def _session(partition_names):
+    """Session whose pg_inherits lookup returns the given partitions."""
+    db = Mock()
+    executed = []
+
+    def execute(stmt, params=None):
+        sql = str(stmt)
+        executed.append(sql)
+        if "pg_inherits" in sql:
+            return Mock(fetchall=Mock(return_value=[(name, 8192) for name in partition_names]))
+        return Mock()
+
+    db.execute.side_effect = execute
+    db.executed = executed
+    return db
+
+
+class TestPruningClause:
+    """Test the captured_at window added to metrics_date queries."""
+
+    def test_window_brackets_the_account_day_in_any_timezone(self):
+        start, end = snapshot_capture_window(date(2026, 3, 1), date(2026, 3, 7))
+
+        # Captured during Mar 1 in UTC+14 (Feb 28 UTC) and anchored to the
+        # end of Mar 7 in UTC-12 (Mar 8 UTC) both fall inside
+        assert start <= datetime(2026, 2, 28, 10, 0, tzinfo=timezone.utc)
+        assert end > datetime(2026, 3, 8, 11, 59, 59, tzinfo=timezone.utc)
+        assert (end - start).days < 14
+
+    def test_clause_targets_partition_key(self):
+        clause = snapshot_pruning_clause(MetricSnapshot.captured_at, date(2026, 3, 1), date(2026, 3, 1))
+
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        assert sql.count("metric_snapshots.captured_at") == 2
+
+
+class TestPartitionMaintenance:
+    """Test monthly partition creation and detaching."""
+
+    def test_create_partition_sql_covers_one_month(self):
+        sql = create_partition_sql(date(2026, 12, 1))
+
+        assert "metric_snapshots_p2026_12 PARTITION OF metric_snapshots" in sql
+        assert "FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')" in sql
+
+    def test_ensure_only_creates_missing_months(self):
+        db = _session(["metric_snapshots_p2026_10", "metric_snapshots_default"])
+
+        created = ensure_snapshot_partitions(db, months_ahead=2, today=date(2026, 10, 16))
+
+        assert created == ["metric_snapshots_p2026_11", "metric_snapshots_p2026_12"]
+        assert sum("CREATE TABLE IF NOT EXISTS" in sql for sql in db.executed) == 2
+        db.commit.assert_called_once()
+
+    def test_detach_refuses_recent_months(self):
+        db = _session(["metric_snapshots_p2026_09"])
+
+        with pytest.raises(ValueError):
+            detach_snapshot_partition(db, date(2026, 9, 1), today=date(2026, 10, 16))
+        db.commit.assert_not_called()
+
+    def test_detach_moves_partition_to_archive(self):
+        db = _session(["metric_snapshots_p2025_01"])
+
+        archived = detach_snapshot_partition(
+            db, date(2025, 1, 15), tablespace="cold", today=date(2026, 10, 16)
+        )
+
+        assert archived == "archive.metric_snapshots_p2025_01"
+        assert any("DETACH PARTITION metric_snapshots_p2025_01" in sql for sql in db.executed)
+        assert any("SET TABLESPACE cold" in sql for sql in db.executed)
+        db.commit.assert_called_once()
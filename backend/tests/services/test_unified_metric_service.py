@@ -11,9 +11,12 @@ Tests the core functionality of the unified metric service including:
 """
 
 import pytest
-from datetime import date, timedelta
+import uuid
+from datetime import date, datetime, timedelta
 from unittest.mock import Mock, patch
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session, sessionmaker
 
 from app.services.unified_metric_service import (
     UnifiedMetricService,
@@ -21,8 +24,10 @@ from app.services.unified_metric_service import (
     MetricValue,
     MetricSummary,
     MetricTimePoint,
-    MetricBreakdownItem
+    MetricBreakdownItem,
+    SummaryRequest,
 )
+from app import models
 from app.dsl.schema import TimeRange
 
 
@@ -369,6 +374,176 @@ class TestUnifiedMetricService:
         assert expr is not None
 
 
+class TestGetSummariesBatch:
+    """Test the single-statement batched summary API."""
+
+    WEEK = TimeRange(start=date(2025, 10, 1), end=date(2025, 10, 7))
+
+    def _run(self, requests, values):
+        """Run a batch against a real (unbound) Session, capturing the SQL."""
+        service = UnifiedMetricService(Session(), use_rollups=True)
+        statements = []
+
+        def fake_first(query):
+            statements.append(str(query.statement.compile(dialect=postgresql.dialect())))
+            row = Mock()
+            row._asdict.return_value = values
+            return row
+
+        with patch.object(Query, "first", autospec=True, side_effect=fake_first):
+            result = service.get_summaries_batch("test-workspace", requests)
+        return result, statements
+
+    def test_empty_batch_issues_no_query(self):
+        service = UnifiedMetricService(Mock(spec=Session))
+
+        assert service.get_summaries_batch("test-workspace", []) == []
+        service.db.query.assert_not_called()
+
+    def test_current_previous_and_average_in_one_statement(self):
+        values = {
+            "w0_spend": 100.0, "w0_revenue": 300.0,
+            "w1_spend": 50.0, "w1_revenue": 100.0,
+            "a0_spend": 300.0, "a0_revenue": 600.0,
+        }
+
+        (summary,), statements = self._run(
+            [SummaryRequest(["roas", "spend"], self.WEEK, compare_to_previous=True)],
+            values,
+        )
+
+        assert len(statements) == 1
+        sql = statements[0]
+        assert "FILTER (WHERE metric_daily_rollups.metrics_date BETWEEN" in sql
+        assert "AS workspace_avg" in sql
+        assert summary.metrics["roas"].value == 3.0
+        assert summary.metrics["roas"].previous == 2.0
+        assert summary.metrics["roas"].delta_pct == 0.5
+        assert summary.metrics["spend"].value == 100.0
+        assert summary.workspace_avg == 2.0
+
+    def test_requests_map_to_their_own_windows(self):
+        values = {
+            "w0_spend": 100.0, "w0_revenue": 300.0,
+            "w1_spend": 40.0, "w1_revenue": 20.0,
+        }
+
+        meta, google = self._run(
+            [
+                SummaryRequest(["roas"], self.WEEK, MetricFilters(provider="meta"),
+                               include_workspace_avg=False),
+                SummaryRequest(["roas"], self.WEEK, MetricFilters(provider="google"),
+                               include_workspace_avg=False),
+            ],
+            values,
+        )[0]
+
+        assert meta.metrics["roas"].value == 3.0
+        assert google.metrics["roas"].value == 0.5
+        assert meta.workspace_avg is None
+
+    def test_identical_windows_are_computed_once(self):
+        _, statements = self._run(
+            [
+                SummaryRequest(["spend"], self.WEEK, include_workspace_avg=False),
+                SummaryRequest(["clicks"], self.WEEK, include_workspace_avg=False),
+            ],
+            {},
+        )
+
+        sql = statements[0]
+        assert "w0_spend" in sql
+        assert "w1_spend" not in sql
+        assert "workspace_avg" not in sql
+
+
+class TestGetRankedComparison:
+    """Test ranking entities with their previous-window values in one statement."""
+
+    WEEK = TimeRange(start=date(2025, 10, 8), end=date(2025, 10, 14))
+    WORKSPACE_ID = uuid.uuid4()
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://")
+        models.Base.metadata.create_all(
+            engine, tables=[models.Entity.__table__, models.MetricSnapshot.__table__]
+        )
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def _ad(self, db, name, days):
+        """An ad with one (spend, revenue) per metrics_date; the day's older snapshot is stale."""
+        ad = models.Entity(
+            workspace_id=self.WORKSPACE_ID,
+            level=models.LevelEnum.ad,
+            external_id=name,
+            name=name,
+            status="active",
+        )
+        db.add(ad)
+        db.flush()
+        for day, (spend, revenue) in days.items():
+            captured = datetime(day.year, day.month, day.day, 23, 0)
+            for captured_at, factor in ((captured - timedelta(hours=1), 10), (captured, 1)):
+                db.add(models.MetricSnapshot(
+                    entity_id=ad.id,
+                    provider="meta",
+                    captured_at=captured_at,
+                    metrics_date=day,
+                    spend=spend * factor,
+                    revenue=revenue * factor,
+                ))
+        return ad
+
+    def test_ranks_current_window_with_previous_values(self, db):
+        this_week, last_week = date(2025, 10, 10), date(2025, 10, 3)
+        self._ad(db, "Ad A", {this_week: (100, 400), last_week: (100, 200)})
+        self._ad(db, "Ad B", {this_week: (100, 300)})
+        self._ad(db, "Ad C", {this_week: (100, 100), last_week: (50, 100)})
+        self._ad(db, "Old ad", {last_week: (100, 900)})
+        db.commit()
+
+        statements = []
+        event.listen(db.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        items = UnifiedMetricService(db).get_ranked_comparison(
+            self.WORKSPACE_ID, "roas", self.WEEK, MetricFilters(), "ad", top_n=2
+        )
+
+        assert len(statements) == 1
+        assert "FILTER (WHERE" in statements[0]
+        assert [item.current.label for item in items] == ["Ad A", "Ad B"]
+        assert items[0].current.value == 4.0
+        assert items[0].current.spend == 100
+        assert items[0].previous.value == 2.0
+        assert items[0].delta_pct == 1.0
+        assert items[1].previous is None
+        assert items[1].delta_pct is None
+
+    def test_ranking_only_reads_current_window(self, db):
+        self._ad(db, "Ad A", {date(2025, 10, 10): (100, 100), date(2025, 10, 3): (100, 900)})
+        self._ad(db, "Ad B", {date(2025, 10, 10): (100, 200)})
+        db.commit()
+
+        items = UnifiedMetricService(db).get_ranked_comparison(
+            self.WORKSPACE_ID, "roas", self.WEEK, MetricFilters(), "ad",
+            sort_order="asc", compare_to_previous=False,
+        )
+
+        assert [(item.current.label, item.current.value) for item in items] == [
+            ("Ad A", 1.0), ("Ad B", 2.0)
+        ]
+        assert all(item.previous is None for item in items)
+
+    def test_rejects_provider_dimension(self):
+        service = UnifiedMetricService(Mock(spec=Session))
+
+        with pytest.raises(ValueError):
+            service.get_ranked_comparison(
+                "test-workspace", "spend", self.WEEK, MetricFilters(), "provider"
+            )
 class TestMetricValue:
     """Test MetricValue dataclass."""
     
@@ -0,0 +1,84 @@
+"""
+Unit tests for the workspace existence cache.
+
+Tests:
+- Positive and negative entries served without a query
+- Batch lookups resolve all misses with one query
+- TTL expiry, LRU bound and invalidation
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from sqlalchemy.orm import Session
+
+from app.services.workspace_cache import WorkspaceExistenceCache
+
+
+def _db_with_workspaces(*workspace_ids):
+    db = Mock(spec=Session)
+    db.query.return_value.filter.return_value.all.return_value = [
+        SimpleNamespace(id=workspace_id) for workspace_id in workspace_ids
+    ]
+    return db
+
+
+class TestWorkspaceExistenceCache:
+    """Test cached workspace validation."""
+
+    def test_known_workspace_is_cached(self):
+        workspace_id = uuid.uuid4()
+        db = _db_with_workspaces(workspace_id)
+        cache = WorkspaceExistenceCache()
+
+        assert cache.exists(db, workspace_id) is True
+        assert cache.exists(db, workspace_id) is True
+        assert db.query.call_count == 1
+
+    def test_unknown_workspace_is_negative_cached(self):
+        db = _db_with_workspaces()
+        cache = WorkspaceExistenceCache()
+        unknown_id = uuid.uuid4()
+
+        for _ in range(100):
+            assert cache.exists(db, unknown_id) is False
+        assert db.query.call_count == 1
+
+    def test_batch_resolves_misses_in_one_query(self):
+        known_id, unknown_id = uuid.uuid4(), uuid.uuid4()
+        db = _db_with_workspaces(known_id)
+        cache = WorkspaceExistenceCache()
+
+        assert cache.filter_existing(db, [known_id, unknown_id, known_id]) == {known_id}
+        assert cache.filter_existing(db, [known_id, unknown_id]) == {known_id}
+        assert db.query.call_count == 1
+
+    def test_expired_entries_are_refetched(self):
+        workspace_id = uuid.uuid4()
+        db = _db_with_workspaces()
+        cache = WorkspaceExistenceCache(negative_ttl_seconds=0)
+
+        cache.exists(db, workspace_id)
+        cache.exists(db, workspace_id)
+
+        assert db.query.call_count == 2
+
+    def test_invalidate_drops_negative_entry_for_new_workspace(self):
+        workspace_id = uuid.uuid4()
+        cache = WorkspaceExistenceCache()
+        assert cache.exists(_db_with_workspaces(), workspace_id) is False
+
+        cache.invalidate(workspace_id)
+
+        assert cache.exists(_db_with_workspaces(workspace_id), workspace_id) is True
+
+    def test_lru_bound_evicts_oldest(self):
+        cache = WorkspaceExistenceCache(max_size=2)
+        ids = [uuid.uuid4() for _ in range(3)]
+        db = _db_with_workspaces(*ids)
+
+        for workspace_id in ids:
+            cache.exists(db, workspace_id)
+
+        assert list(cache._entries) == ids[1:]
@@ -173,13 +173,15 @@ function StepItem({ step, isLast }) {
  */
 function groupSteps(steps) {
   const grouped = [];
-  const pending = new Map(); // tool_name -> start event
+  const pending = new Map(); // call_id (or tool name) -> start event
 
   for (const step of steps) {
+    // Tools of one turn run concurrently: pair events by call id
+    const key = step.call_id || step.tool;
     if (step.type === "tool_start") {
-      pending.set(step.tool, step);
+      pending.set(key, step);
     } else if (step.type === "tool_end") {
-      const start = pending.get(step.tool);
+      const start = pending.get(key);
       if (start) {
         grouped.push({
           tool: step.tool,
@@ -189,7 +191,7 @@ function groupSteps(steps) {
           duration_ms: step.duration_ms,
           data_source: step.data_source,
         });
-        pending.delete(step.tool);
+        pending.delete(key);
       } else {
         // No matching start, just add the end
         grouped.push(step);
@@ -198,9 +200,9 @@ function groupSteps(steps) {
   }
 
   // Add any pending starts that haven't finished
-  for (const [tool, start] of pending) {
+  for (const start of pending.values()) {
     grouped.push({
-      tool,
+      tool: start.tool,
       description: start.description,
       success: null, // Still running
     });
@@ -331,6 +331,7 @@ export async function fetchQAAgent({ workspaceId, question, context = {}, onStag
                   const toolEvent = {
                     type: 'tool_start',
                     tool: event.data.tool,
+                    call_id: event.data.call_id,
                     args: event.data.args,
                     description: event.data.description,
                     timestamp: Date.now(),
@@ -346,6 +347,7 @@ export async function fetchQAAgent({ workspaceId, question, context = {}, onStag
                   const toolEvent = {
                     type: 'tool_end',
                     tool: event.data.tool,
+                    call_id: event.data.call_id,
                     preview: event.data.preview,
                     success: event.data.success,
                     duration_ms: event.data.duration_ms,